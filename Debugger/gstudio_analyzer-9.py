@@ -21,6 +21,7 @@ All previous features integrated:
   • Archive manager (zip + metadata, dry‑run)
   • Git intelligence (commit count, authors, recency)
   • Parallel processing with batching
+  • Watch mode – in-memory graph, incremental re-analysis of edited files
   • Rich HTML/JSON/CSV reports with detailed guidance
 
 All features are fully integrated; optional dependencies degrade gracefully.
@@ -33,13 +34,15 @@ License: MIT
 # =============================================================================
 # IMPORTS – Standard library + optional with graceful fallback
 # =============================================================================
+import time
+_IMPORTS_STARTED = time.perf_counter()
 import os
 import sys
 import json
 import hashlib
+import importlib
 import zipfile
 import argparse
-import time
 import subprocess
 import re
 import csv
@@ -48,37 +51,71 @@ import pickle
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter, deque
-from typing import Dict, List, Set, Tuple, Optional, Any, Union, Callable
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Set, Tuple, Optional, Any, Union, Callable, Sequence
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from difflib import SequenceMatcher
 import itertools
 
-# Optional: tree‑sitter
-try:
-    from tree_sitter import Language, Parser, Node, Tree
-    import tree_sitter_typescript as ts_typescript
-    import tree_sitter_javascript as ts_javascript
-    TREE_SITTER_AVAILABLE = True
-except ImportError:
-    TREE_SITTER_AVAILABLE = False
+if TYPE_CHECKING:
+    from tree_sitter import Node, Parser, Tree
 
-# Optional: networkx
-try:
-    import networkx as nx
-    NETWORKX_AVAILABLE = True
-except ImportError:
-    NETWORKX_AVAILABLE = False
 
-# Optional: numpy & sklearn
-try:
-    import numpy as np
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+class Capabilities:
+    """Optional heavy dependencies, imported on first use.
+
+    A ``--since-last-commit`` run never needs sklearn, networkx or numpy, so it
+    should not pay for importing them. ``available()`` imports a capability's
+    modules once and remembers the outcome and how long the import took.
+    """
+
+    def __init__(self):
+        self.modules: Dict[str, Tuple[str, ...]] = {}
+        self.loaded: Dict[str, bool] = {}
+        self.load_ms: Dict[str, float] = {}
+
+    def register(self, name: str, *modules: str):
+        self.modules[name] = modules or (name,)
+
+    def available(self, name: str) -> bool:
+        if name not in self.loaded:
+            started = time.perf_counter()
+            try:
+                for module in self.modules[name]:
+                    importlib.import_module(module)
+                self.loaded[name] = True
+            except ImportError:
+                self.loaded[name] = False
+            self.load_ms[name] = (time.perf_counter() - started) * 1000
+        return self.loaded[name]
+
+
+class _LazyModule:
+    """Module-level stand-in for ``np``/``nx``: imports on first attribute
+    access, then rebinds the global to the real module."""
+    __slots__ = ('_capability', '_module', '_alias')
+
+    def __init__(self, capability: str, module: str, alias: str):
+        self._capability = capability
+        self._module = module
+        self._alias = alias
+
+    def __getattr__(self, attr: str):
+        if not CAPABILITIES.available(self._capability):
+            raise ImportError(f"{self._module} is not installed")
+        module = sys.modules[self._module]
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+CAPABILITIES = Capabilities()
+CAPABILITIES.register('tree_sitter', 'tree_sitter', 'tree_sitter_typescript', 'tree_sitter_javascript')
+CAPABILITIES.register('networkx')
+CAPABILITIES.register('numpy')            # batch unused scoring
+CAPABILITIES.register('sklearn', 'sklearn.feature_extraction.text', 'sklearn.metrics.pairwise')
+np = _LazyModule('numpy', 'numpy', 'np')
+nx = _LazyModule('networkx', 'networkx', 'nx')
 
 # Optional: tqdm
 try:
@@ -91,6 +128,57 @@ except ImportError:
             print(f"{desc}...")
         return iterable
 
+# Optional: compact integer-indexed graph, phase tracing, the structural
+# token normalizer and the --watch file watcher shared with tools/ (repo checkout)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+try:
+    from compact_graph import CompactGraph
+    COMPACT_GRAPH_AVAILABLE = True
+except ImportError:
+    COMPACT_GRAPH_AVAILABLE = False
+try:
+    from phase_trace import Tracer, count, traced
+    PHASE_TRACE_AVAILABLE = True
+except ImportError:
+    PHASE_TRACE_AVAILABLE = False
+    import contextlib
+
+    class Tracer:
+        """Stand-in when tools/phase_trace.py is missing: phases run untimed."""
+        def __init__(self, detail: bool = False, memory: bool = False):
+            self.counters: Dict[str, int] = {}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return None
+
+        def span(self, name: str, cat: str = 'phase', **args):
+            return contextlib.nullcontext()
+
+        def summary(self) -> List[Dict[str, Any]]:
+            return []
+
+    def count(name: str, n: int = 1) -> None:
+        pass
+
+    def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+        return lambda fn: fn
+try:
+    from structural_tokens import TOKENIZER_VERSION, diff_summary as token_diff_summary, structural_hash, tokenize
+    STRUCTURAL_TOKENS_AVAILABLE = True
+except ImportError:
+    TOKENIZER_VERSION = 0  # cached structural hashes come from the AST node-type fallback
+    STRUCTURAL_TOKENS_AVAILABLE = False
+try:
+    from project_watch import ProjectWatcher
+    PROJECT_WATCH_AVAILABLE = True
+except ImportError:
+    PROJECT_WATCH_AVAILABLE = False
+finally:
+    sys.path.pop(0)
+
 # Optional: colorama
 try:
     import colorama
@@ -99,6 +187,7 @@ try:
 except ImportError:
     COLORS_AVAILABLE = False
 
+_IMPORTS_MS = (time.perf_counter() - _IMPORTS_STARTED) * 1000
 
 # =============================================================================
 # TERMINAL COLOURS & LOGGING
@@ -142,6 +231,9 @@ class Config:
     
     # File extensions
     VALID_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.py'}
+    # Import resolution order (TypeScript's); a set would pick between
+    # foo.ts and foo.tsx twins by hash order
+    RESOLVE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.py')
     IGNORE_DIRS = {
         'node_modules', 'dist', 'build', '__tests__', '__test__', 'coverage',
         '.git', '.vscode', 'test', 'tests', '.cache', '__pycache__', '.pytest_cache',
@@ -248,8 +340,15 @@ class Config:
     CHUNK_SIZE = 100
     SMALL_FILE_SIZE = 50 * 1024   # 50KB
 
+    # Watch mode
+    WATCH_POLL_INTERVAL = 0.5     # seconds between mtime sweeps without watchdog
+    WATCH_DEBOUNCE = 0.2          # quiet period before a batch of edits is applied
+    WATCH_LATENCY_BUDGET = 1.0    # seconds from applied batch to rewritten JSON
+
     # Cache
     CACHE_FILE = '.gstudio_cache.db'
+    # Bump when _resolve_import rules change so persisted edges are re-resolved
+    EDGE_RESOLVER_VERSION = '2'
 
 
 # =============================================================================
@@ -360,7 +459,14 @@ class RecommendedAction(Enum):
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
-@dataclass
+# Per-file records (FileInfo and everything it holds) are slotted, so no
+# per-instance __dict__, and intern the strings repeated across files: paths,
+# import sources and specifiers, export, hook and context names.
+def _intern(value):
+    # None from a partial parse passes through
+    return sys.intern(value) if type(value) is str else value
+
+@dataclass(slots=True)
 class GitHistoryInfo:
     has_history: bool
     commit_count: int
@@ -368,7 +474,7 @@ class GitHistoryInfo:
     last_commit_date: Optional[str] = None
     authors: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class CodeIssue:
     type: IssueType
     severity: RiskLevel
@@ -376,7 +482,7 @@ class CodeIssue:
     line: Optional[int] = None
     suggestion: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class WiringSuggestion:
     target_file: str
     similarity_score: float
@@ -404,7 +510,7 @@ class ArchiveDecision:
     reasons: List[str]
     blockers: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class ImportInfo:
     source: str
     specifiers: List[str] = field(default_factory=list)
@@ -412,14 +518,21 @@ class ImportInfo:
     is_side_effect: bool = False
     line: int = 0
 
-@dataclass
+    def __post_init__(self):
+        self.source = _intern(self.source)
+        self.specifiers = [_intern(s) for s in self.specifiers]
+
+@dataclass(slots=True)
 class ExportInfo:
     name: str
     is_default: bool = False
     is_re_export: bool = False
     line: int = 0
 
-@dataclass
+    def __post_init__(self):
+        self.name = _intern(self.name)
+
+@dataclass(slots=True)
 class ASTFeatures:
     tree_depth: int = 0
     node_types: Dict[str, int] = field(default_factory=dict)
@@ -427,7 +540,7 @@ class ASTFeatures:
     function_count: int = 0
     class_count: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CFGNode:
     id: int
     type: str
@@ -435,21 +548,21 @@ class CFGNode:
     successors: List[int] = field(default_factory=list)
     predecessors: List[int] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class DFGNode:
     id: int
     variable: str
     definition_line: int
     uses: List[int] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class PDGNode:
     id: int
     cfg_node_id: int
     data_deps: Set[int] = field(default_factory=set)
     control_deps: Set[int] = field(default_factory=set)
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     # Core
     path: str
@@ -493,8 +606,8 @@ class FileInfo:
     # Dependencies (filled after graph building)
     depends_on: List[str] = field(default_factory=list)          # direct
     dependents: List[str] = field(default_factory=list)          # direct
-    transitive_dependents: Set[str] = field(default_factory=set) # all dependents (recursive)
-    indirect_dependencies: Set[str] = field(default_factory=set) # all dependencies (recursive)
+    transitive_dependents: AbstractSet[str] = field(default_factory=set) # all dependents (recursive)
+    indirect_dependencies: AbstractSet[str] = field(default_factory=set) # all dependencies (recursive)
 
     # Entry point / barrel
     is_entry_point: bool = False
@@ -543,6 +656,12 @@ class FileInfo:
     # Value score
     value_score: float = 0.0
 
+    def __post_init__(self):
+        self.path = _intern(self.path)
+        self.relative_path = _intern(self.relative_path)
+        self.hooks_used = [_intern(h) for h in self.hooks_used]
+        self.contexts_used = [_intern(c) for c in self.contexts_used]
+
 @dataclass
 class ValuableComponent:
     name: str
@@ -587,6 +706,11 @@ class CircularDependency:
     cycle: List[str]
     severity: str
 
+@dataclass
+class DeadIsland:
+    files: List[str]
+    total_lines: int
+
 @dataclass
 class CloneGroup:
     files: List[str]
@@ -628,12 +752,16 @@ class AnalysisResult:
     analysis_duration_seconds: float = 0.0
     cache_hit_rate: float = 0.0
     git_available: bool = False
+    phase_timings: List[Dict[str, Any]] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
     framework: Framework = Framework.UNKNOWN
     clones: List[CloneGroup] = field(default_factory=list)
     circular_deps: List[CircularDependency] = field(default_factory=list)
     potentially_unused_files: List[UnusedFileDetail] = field(default_factory=list)
     unused_confidence_summary: Dict[str, float] = field(default_factory=dict)
     unused_classification_counts: Dict[str, int] = field(default_factory=dict)
+    unreachable_files: List[str] = field(default_factory=list)
+    dead_islands: List[DeadIsland] = field(default_factory=list)
 
 
 # =============================================================================
@@ -730,6 +858,14 @@ class SQLiteCache:
                 PRIMARY KEY (source, target)
             )
         """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_edges (
+                path TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                index_version TEXT NOT NULL,
+                edges BLOB
+            )
+        """)
         self.conn.commit()
 
     def get(self, file_path: str, file_hash: str) -> Optional[Dict]:
@@ -766,6 +902,26 @@ class SQLiteCache:
         )
         self.conn.commit()
 
+    def get_edges(self, file_path: str, file_hash: str, index_version: str) -> Optional[Tuple[List[str], List[str]]]:
+        """(resolved targets, unresolved local specifiers) stored for this
+        content under this resolution index, or None."""
+        if not self.use_cache or not self.conn:
+            return None
+        row = self.conn.execute(
+            "SELECT edges FROM file_edges WHERE path = ? AND hash = ? AND index_version = ?",
+            (file_path, file_hash, index_version)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def set_edges(self, rows: List[Tuple[str, str, str, Tuple[List[str], List[str]]]]):
+        if not self.use_cache or not self.conn or not rows:
+            return
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO file_edges (path, hash, index_version, edges) VALUES (?, ?, ?, ?)",
+            [(path, file_hash, version, pickle.dumps(edges)) for path, file_hash, version, edges in rows]
+        )
+        self.conn.commit()
+
     def store_dependency(self, source: str, target: str):
         if not self.use_cache or not self.conn:
             return
@@ -950,8 +1106,11 @@ class TreeSitterParser:
         self._init_tree_sitter()
 
     def _init_tree_sitter(self):
-        if not TREE_SITTER_AVAILABLE:
+        if not CAPABILITIES.available('tree_sitter'):
             return
+        from tree_sitter import Language
+        import tree_sitter_typescript as ts_typescript
+        import tree_sitter_javascript as ts_javascript
         try:
             ts_lang = Language(ts_typescript.language_typescript())
             tsx_lang = Language(ts_typescript.language_tsx())
@@ -975,6 +1134,7 @@ class TreeSitterParser:
                 log_warning(f"Tree‑sitter init failed: {e}")
 
     def _make_parser(self, lang):
+        from tree_sitter import Parser
         parser = Parser()
         try:
             parser.set_language(lang)
@@ -982,7 +1142,7 @@ class TreeSitterParser:
             parser.language = lang
         return parser
 
-    def parse(self, file_path: Path, content: str, old_tree: Optional[Tree] = None) -> Tuple[ParsedData, Optional[Tree]]:
+    def parse(self, file_path: Path, content: str, old_tree: Optional['Tree'] = None) -> Tuple[ParsedData, Optional['Tree']]:
         ext = file_path.suffix
         result = ParsedData()
 
@@ -1004,9 +1164,9 @@ class TreeSitterParser:
         self.regex_parser.parse(content, ext, result)
         return result, None
 
-    def _extract_all(self, node: Node, content: str, result: ParsedData, ext: str):
+    def _extract_all(self, node: 'Node', content: str, result: ParsedData, ext: str):
         """Full extraction from AST – merged from v7.3.2."""
-        def walk(n: Node):
+        def walk(n: 'Node'):
             # Imports
             if n.type == 'import_statement':
                 source_node = None
@@ -1142,10 +1302,12 @@ class TreeSitterParser:
         if self.compute_structural_hash:
             result.cyclomatic_complexity = self._calculate_complexity(node)
             result.any_count = self._count_any(node, content)
-            norm = self._normalize_ast(node)
-            result.structural_hash = compute_hash(norm)
+            if STRUCTURAL_TOKENS_AVAILABLE:
+                result.structural_hash = structural_hash(content)
+            else:
+                result.structural_hash = compute_hash(self._normalize_ast(node))
 
-    def _find_identifier_node(self, node: Node) -> Optional[Node]:
+    def _find_identifier_node(self, node: 'Node') -> Optional['Node']:
         if node.type == 'identifier':
             return node
         for child in node.children:
@@ -1154,25 +1316,25 @@ class TreeSitterParser:
                 return res
         return None
 
-    def _find_identifier_text(self, node: Node, content: str) -> Optional[str]:
+    def _find_identifier_text(self, node: 'Node', content: str) -> Optional[str]:
         n = self._find_identifier_node(node)
         if n:
             return content[n.start_byte:n.end_byte]
         return None
 
-    def _has_jsx(self, node: Node) -> bool:
+    def _has_jsx(self, node: 'Node') -> bool:
         if node.type in {'jsx_element', 'jsx_self_closing_element', 'jsx_fragment'}:
             return True
         return any(self._has_jsx(c) for c in node.children)
 
-    def _calculate_complexity(self, node: Node) -> int:
+    def _calculate_complexity(self, node: 'Node') -> int:
         complexity = 1
         decision_nodes = {
             'if_statement', 'while_statement', 'for_statement',
             'for_in_statement', 'do_statement', 'switch_case',
             'catch_clause', 'ternary_expression', 'binary_expression'
         }
-        def walk(n: Node):
+        def walk(n: 'Node'):
             nonlocal complexity
             if n.type in decision_nodes:
                 if n.type == 'binary_expression':
@@ -1187,9 +1349,9 @@ class TreeSitterParser:
         walk(node)
         return complexity
 
-    def _count_any(self, node: Node, content: str) -> int:
+    def _count_any(self, node: 'Node', content: str) -> int:
         count = 0
-        def walk(n: Node):
+        def walk(n: 'Node'):
             nonlocal count
             if n.type == 'predefined_type':
                 text = content[n.start_byte:n.end_byte]
@@ -1200,9 +1362,9 @@ class TreeSitterParser:
         walk(node)
         return count
 
-    def _normalize_ast(self, node: Node) -> str:
+    def _normalize_ast(self, node: 'Node') -> str:
         tokens = []
-        def walk(n: Node):
+        def walk(n: 'Node'):
             if n.type in {'identifier', 'string', 'number', 'template_string'}:
                 tokens.append(n.type)
             elif n.type not in {'comment', 'whitespace'}:
@@ -1257,10 +1419,10 @@ class CFGBuilder:
         self.nodes: List[CFGNode] = []
         self.node_id = 0
 
-    def build(self, tree: Tree) -> List[CFGNode]:
+    def build(self, tree: 'Tree') -> List[CFGNode]:
         self.nodes = []
         self.node_id = 0
-        def traverse(node: Node, parent_id: Optional[int] = None):
+        def traverse(node: 'Node', parent_id: Optional[int] = None):
             current_id = self.node_id
             self.node_id += 1
             cfg_node = CFGNode(
@@ -1298,10 +1460,10 @@ class DFGBuilder:
         self.nodes: List[DFGNode] = []
         self.defs: Dict[str, int] = {}
 
-    def build(self, tree: Tree) -> List[DFGNode]:
+    def build(self, tree: 'Tree') -> List[DFGNode]:
         self.nodes = []
         self.defs = {}
-        def traverse(node: Node):
+        def traverse(node: 'Node'):
             if node.type == 'variable_declarator':
                 var_name = None
                 for child in node.children:
@@ -1386,20 +1548,27 @@ class ASTDuplicateDetector:
         self.threshold = threshold
         self.project_path = project_path
         self.file_content_cache = file_content_cache or {}
-        self.vectorizer = TfidfVectorizer(token_pattern='(?u)\\b\\w+\\b') if SKLEARN_AVAILABLE else None
+        self.vectorizer = None
+        if CAPABILITIES.available('sklearn'):
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self.vectorizer = TfidfVectorizer(token_pattern='(?u)\\b\\w+\\b')
 
     def extract_ast_features(self, content: str) -> str:
+        if STRUCTURAL_TOKENS_AVAILABLE:
+            # Token shingles: identifiers/literals collapsed, order kept locally
+            return tokenize(content).feature_text()
         content = re.sub(r'//.*?$|/\*.*?\*/', '', content, flags=re.MULTILINE|re.DOTALL)
         content = re.sub(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', 'ID', content)
         content = re.sub(r'\s+', ' ', content).strip()
         return content
 
     def detect(self) -> List[DuplicateCluster]:
-        if not SKLEARN_AVAILABLE:
+        if self.vectorizer is None:
             return self._hash_based_detect()
 
         corpus = []
         paths = []
+        contents = {}
         for path, fi in self.files.items():
             if fi.duplicate_of:
                 continue
@@ -1410,12 +1579,14 @@ class ASTDuplicateDetector:
                     features = self.extract_ast_features(content)
                     corpus.append(features)
                     paths.append(path)
+                    contents[path] = content
             except Exception:
                 continue
 
         if len(corpus) < 2:
             return []
 
+        from sklearn.metrics.pairwise import cosine_similarity
         X = self.vectorizer.fit_transform(corpus)
         sim_matrix = cosine_similarity(X)
 
@@ -1432,13 +1603,17 @@ class ASTDuplicateDetector:
             if len(group) > 1:
                 base = min(group, key=lambda p: (len(p), p))
                 avg_sim = sum(sim_matrix[i][paths.index(f)] for f in group if f != path_i) / (len(group)-1)
+                summary = "Structural duplicate (AST‑based)"
+                if STRUCTURAL_TOKENS_AVAILABLE:
+                    other = next(f for f in group if f != base)
+                    summary = token_diff_summary(tokenize(contents[base]), tokenize(contents[other]))
                 cluster = DuplicateCluster(
                     cluster_id=f"ast_{hashlib.md5(group[0].encode()).hexdigest()[:8]}",
                     similarity_score=avg_sim,
                     files=group,
                     base_file=base,
                     merge_target=base,
-                    diff_summary="Structural duplicate (AST‑based)",
+                    diff_summary=summary,
                     estimated_savings_lines=sum(self.files[f].lines for f in group[1:]),
                     confidence=avg_sim * 100
                 )
@@ -1476,29 +1651,142 @@ class ASTDuplicateDetector:
 # =============================================================================
 # DEPENDENCY GRAPH (with Tarjan, transitive closure)
 # =============================================================================
+# Files the reachability sweep treats as roots when they sit at the source root
+SWEEP_ROOT_STEMS = ('main', 'App', 'app', 'index')
+SWEEP_ROOT_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+
+
 class DependencyGraph:
-    def __init__(self, files: Dict[str, FileInfo], project_path: Path, src_path: Path):
+    def __init__(self, files: Dict[str, FileInfo], project_path: Path, src_path: Path,
+                 cache: Optional[SQLiteCache] = None):
         self.files = files
         self.project_path = project_path
         self.src_path = src_path
+        self.cache = cache
+        self.resolved_count = 0
+        self._compact = None
         self.graph: Dict[str, Set[str]] = defaultdict(set)
         self.reverse: Dict[str, Set[str]] = defaultdict(set)
+        # importer -> local import specifiers that did not resolve (yet)
+        self.unresolved: Dict[str, Set[str]] = defaultdict(set)
 
     def build(self):
+        """Link every file, reusing persisted edges for files whose content
+        and the resolution index are unchanged."""
+        index_version = self.index_version()
+        fresh = []
         for path, fi in self.files.items():
-            for imp in fi.imports:
-                # imp is ImportInfo object
-                source = imp.source if isinstance(imp, ImportInfo) else imp
-                resolved = self._resolve_import(path, source)
-                if resolved and resolved in self.files:
-                    self.graph[path].add(resolved)
-                    self.reverse[resolved].add(path)
+            cached = self.cache.get_edges(path, fi.hash, index_version) if self.cache else None
+            if cached is None:
+                self._link(path)
+                self.resolved_count += 1
+                fresh.append((path, fi.hash, index_version,
+                              (sorted(self.graph.get(path, ())), sorted(self.unresolved.get(path, ())))))
+                continue
+            targets, unresolved = cached
+            self._compact = None
+            for target in targets:
+                if target in self.files:
+                    target = _intern(target)
+                    self.graph[path].add(target)
+                    self.reverse[target].add(path)
+            if unresolved:
+                self.unresolved[path] = set(unresolved)
+        if self.cache:
+            self.cache.set_edges(fresh)
 
         for path, deps in self.graph.items():
             self.files[path].depends_on = list(deps)
         for path, deps in self.reverse.items():
             self.files[path].dependents = list(deps)
 
+    def index_version(self) -> str:
+        """Fingerprint of everything import resolution depends on besides the
+        importing file itself: the resolver rules, the source root and the set
+        of analyzed paths. Adding or removing a file changes it."""
+        h = hashlib.sha256(Config.EDGE_RESOLVER_VERSION.encode())
+        h.update(normalize_path(self.src_path, self.project_path).encode())
+        for path in sorted(self.files):
+            h.update(b'\0' + path.encode())
+        return h.hexdigest()[:16]
+
+    def compact(self) -> 'CompactGraph':
+        """Integer-indexed snapshot of the current edges, rebuilt after changes."""
+        if self._compact is None:
+            self._compact = CompactGraph.from_adjacency(self.files, self.graph)
+        return self._compact
+
+    def _link(self, path: str):
+        self._compact = None
+        for imp in self.files[path].imports:
+            # imp is ImportInfo object
+            source = imp.source if isinstance(imp, ImportInfo) else imp
+            resolved = self._resolve_import(path, source)
+            if resolved and resolved in self.files:
+                resolved = _intern(resolved)
+                self.graph[path].add(resolved)
+                self.reverse[resolved].add(path)
+            elif isinstance(source, str) and (source.startswith('.') or source.startswith('@/')):
+                self.unresolved[path].add(source)
+
+    def _unlink(self, path: str) -> Set[str]:
+        self._compact = None
+        old_deps = self.graph.pop(path, set())
+        for dep in old_deps:
+            if dep in self.reverse:
+                self.reverse[dep].discard(path)
+        self.unresolved.pop(path, None)
+        return old_deps
+
+    def update(self, changed: Set[str], added: Set[str], removed: Set[str]) -> Set[str]:
+        """Re-link only the edges that can differ after an edit batch.
+
+        ``self.files`` must already reflect the batch. Changed files are
+        re-resolved; importers of removed files are re-resolved (they may
+        now hit another extension or an index file); files with dangling
+        local imports are retried when something was added. Returns every
+        file whose direct edges changed.
+        """
+        relink = set(changed)
+        touched = set(changed) | set(removed)
+        for path in removed:
+            importers = self.reverse.pop(path, set())
+            relink |= importers
+            touched |= self._unlink(path)
+        if added:
+            relink |= set(self.unresolved)
+        relink -= set(removed)
+
+        for path in relink:
+            touched |= self._unlink(path)
+            self._link(path)
+            touched |= self.graph.get(path, set())
+        touched |= relink
+
+        for path in touched:
+            fi = self.files.get(path)
+            if fi is not None:
+                fi.depends_on = list(self.graph.get(path, ()))
+                fi.dependents = list(self.reverse.get(path, ()))
+        return touched & self.files.keys()
+
+    def affected_by(self, seeds: Set[str]) -> Set[str]:
+        """Seeds plus every file upstream or downstream of them, i.e. every
+        file whose transitive closure can change when the seeds' edges do."""
+        affected = set()
+        for adjacency in (self.graph, self.reverse):
+            seen = set()
+            stack = list(seeds)
+            while stack:
+                node = stack.pop()
+                if node in seen:
+                    continue
+                seen.add(node)
+                stack.extend(adjacency.get(node, ()))
+            affected |= seen
+        return affected & self.files.keys()
+
+    @traced()
     def _resolve_import(self, from_file: str, import_path: str) -> Optional[str]:
         if not isinstance(import_path, str):
             # Should not happen if we converted properly
@@ -1513,7 +1801,7 @@ class DependencyGraph:
             else:
                 from_dir = Path(from_file).parent
                 base_path = (self.project_path / from_dir / import_path).resolve()
-            for ext in Config.VALID_EXTENSIONS:
+            for ext in Config.RESOLVE_EXTENSIONS:
                 test_path = base_path.with_suffix(ext)
                 try:
                     rel_path = str(test_path.relative_to(self.project_path))
@@ -1521,7 +1809,7 @@ class DependencyGraph:
                         return rel_path
                 except ValueError:
                     continue
-            for ext in Config.VALID_EXTENSIONS:
+            for ext in Config.RESOLVE_EXTENSIONS:
                 test_path = base_path / f'index{ext}'
                 try:
                     rel_path = str(test_path.relative_to(self.project_path))
@@ -1533,7 +1821,16 @@ class DependencyGraph:
         except Exception:
             return None
 
-    def compute_transitive_closure(self):
+    def compute_transitive_closure(self, paths: Optional[Set[str]] = None):
+        if COMPACT_GRAPH_AVAILABLE:
+            compact = self.compact()
+            for path in (self.files if paths is None else paths):
+                node = compact.id_of(path)
+                # Sorted id arrays over the graph's path table, not sets of paths
+                self.files[path].transitive_dependents = compact.closure_set(node, reverse=True)
+                self.files[path].indirect_dependencies = compact.closure_set(node)
+            return
+
         def dfs(node, graph, visited):
             if node in visited:
                 return
@@ -1541,7 +1838,7 @@ class DependencyGraph:
             for neighbor in graph.get(node, []):
                 dfs(neighbor, graph, visited)
 
-        for path in self.files:
+        for path in (self.files if paths is None else paths):
             visited = set()
             dfs(path, self.reverse, visited)
             visited.discard(path)
@@ -1553,7 +1850,15 @@ class DependencyGraph:
             self.files[path].indirect_dependencies = visited
 
     def detect_cycles_tarjan(self) -> List[CircularDependency]:
-        if not NETWORKX_AVAILABLE:
+        if COMPACT_GRAPH_AVAILABLE:
+            compact = self.compact()
+            cycles = []
+            for comp in compact.strongly_connected_components():
+                if len(comp) > 1:
+                    severity = 'critical' if len(comp) >= 10 else 'high' if len(comp) >= 5 else 'medium'
+                    cycles.append(CircularDependency(cycle=compact.paths_of(comp), severity=severity))
+            return cycles
+        if not CAPABILITIES.available('networkx'):
             return self._simple_cycle_detection()
 
         G = nx.DiGraph()
@@ -1590,7 +1895,47 @@ class DependencyGraph:
             dfs(node, [node])
         return cycles
 
+    def find_unreachable(self, entry_points: List[str]) -> Tuple[List[str], List[DeadIsland]]:
+        """Mark-and-sweep: one multi-source BFS from every entry point.
+
+        Roots are the framework entries, JS/TS main.* / App.* / index.* at
+        the source root and dynamic import targets. Unreached files are dead even
+        when other dead files import them; they come back grouped into
+        islands, largest first.
+        """
+        compact = self.compact()
+        roots = set(entry_points)
+        for path, fi in self.files.items():
+            if fi.is_dynamic_imported or self._is_sweep_root(path):
+                roots.add(path)
+            for imp in fi.imports:
+                if imp.is_dynamic:
+                    resolved = self._resolve_import(path, imp.source)
+                    if resolved:
+                        roots.add(resolved)
+        reached = compact.reachable(compact.id_of(p) for p in roots if compact.id_of(p) is not None)
+        dead = bytearray(not hit for hit in reached)
+
+        islands = []
+        for component in compact.weak_components(dead):
+            files = sorted(compact.paths_of(component))
+            islands.append(DeadIsland(files=files, total_lines=sum(self.files[p].lines for p in files)))
+        islands.sort(key=lambda island: (-island.total_lines, island.files[0]))
+        return [path for i, path in enumerate(compact.paths) if dead[i]], islands
+
+    def _is_sweep_root(self, path: str) -> bool:
+        # JS/TS main/App/index at the source root only; deeper index files are
+        # barrels and must earn reachability, and a types/app.ts or main.py
+        # elsewhere is no entry point
+        p = Path(path)
+        if p.suffix not in SWEEP_ROOT_SUFFIXES or p.stem not in SWEEP_ROOT_STEMS:
+            return False
+        return (self.project_path / p).parent == self.src_path
+
     def topological_sort_kahn(self) -> List[str]:
+        if COMPACT_GRAPH_AVAILABLE:
+            compact = self.compact()
+            return compact.paths_of(compact.topological_order())
         in_degree = defaultdict(int)
         for node in self.graph:
             for neighbor in self.graph[node]:
@@ -1763,18 +2108,36 @@ class UsageAnalyzer:
         }
         return sum(signals.values()) >= Config.UNUSED_SIGNAL_THRESHOLD
 
+    def update(self, paths: Set[str], unused: List[str], unwired: List[str]) -> Tuple[List[str], List[str]]:
+        """Re-judge only ``paths``; every other file keeps its previous verdict."""
+        unused_set = {p for p in unused if p in self.files and p not in paths}
+        unwired_set = {p for p in unwired if p in self.files and p not in paths}
+        for path in paths:
+            fi = self.files[path]
+            fi.unwired_type = None
+            if self._is_truly_unused(fi):
+                unused_set.add(path)
+            if self._is_unwired(fi):
+                fi.unwired_type = self._classify_unwired(fi)
+                unwired_set.add(path)
+        return ([p for p in self.files if p in unused_set],
+                [p for p in self.files if p in unwired_set])
+
     def _find_unwired_features(self) -> List[str]:
         unwired = []
         for path, fi in self.files.items():
-            if (len(fi.dependents) == 0 and not fi.is_barrel_exported and
-                not fi.is_entry_point and len(fi.exports) >= Config.MIN_EXPORTS_FOR_UNWIRED and
-                fi.lines >= Config.MIN_LINES_FOR_UNWIRED and
-                fi.category not in {FileCategory.TEST, FileCategory.CONFIGURATION,
-                                    FileCategory.ASSET, FileCategory.STYLE}):
+            if self._is_unwired(fi):
                 fi.unwired_type = self._classify_unwired(fi)
                 unwired.append(path)
         return unwired
 
+    def _is_unwired(self, fi: FileInfo) -> bool:
+        return (len(fi.dependents) == 0 and not fi.is_barrel_exported and
+                not fi.is_entry_point and len(fi.exports) >= Config.MIN_EXPORTS_FOR_UNWIRED and
+                fi.lines >= Config.MIN_LINES_FOR_UNWIRED and
+                fi.category not in {FileCategory.TEST, FileCategory.CONFIGURATION,
+                                    FileCategory.ASSET, FileCategory.STYLE})
+
     def _classify_unwired(self, fi: FileInfo) -> UnwiredType:
         if not fi.git_history or not fi.git_history.has_history:
             return UnwiredType.NEW_FEATURE if fi.days_since_modified <= Config.RECENT_CHANGE_DAYS else UnwiredType.DEAD_CODE
@@ -1812,11 +2175,19 @@ class WiringIssueDetector:
                     pass
         return ctx_map
 
+    def refresh_context_hook_map(self):
+        self.ctx_to_hook_map = self._build_context_hook_map()
+
+    def forget(self, file_path: str):
+        """Drop per-file state before ``file_path`` is re-checked or deleted."""
+        self._ai_sdk_files.pop(file_path, None)
+
     @staticmethod
     def _severity_to_score(severity: Severity) -> int:
         low, high = Config.SEVERITY_SCORES[severity.value]
         return (low + high) // 2
 
+    @traced()
     def detect_issues(self, file_path: str, content: str) -> List[WiringIssue]:
         issues = []
         import_pattern = r"import\s+(?:{[^}]+}|[\w\s,*]+)\s+from\s+['\"]([^'\"]+)['\"]"
@@ -2650,6 +3021,16 @@ class ArchiveManager:
 # UNUSED DETECTION ENGINE (advanced)
 # =============================================================================
 class UnusedSignalCollector:
+    # Column order of collect_matrix()
+    SIGNALS = (
+        'no_direct_dependents', 'no_transitive_dependents', 'not_entry_point',
+        'not_dynamic_imported', 'not_barrel_exported', 'has_exports',
+        'complexity_high', 'lines_gt_min', 'not_test', 'not_config',
+        'not_framework_reserved', 'git_old', 'git_few_commits',
+        'structural_similarity_to_active', 'value_score_low', 'has_side_effects',
+    )
+    COLUMN = {name: i for i, name in enumerate(SIGNALS)}
+
     def __init__(self, files: Dict[str, FileInfo], graph: Dict[str, List[str]],
                  git_analyzer: Optional[GitAnalyzer] = None,
                  fast_mode: bool = False):
@@ -2661,6 +3042,63 @@ class UnusedSignalCollector:
         for path, fi in files.items():
             if fi.dependents or fi.is_entry_point or fi.is_barrel_exported:
                 self.active_files.add(path)
+        self._active_sample: Optional[List[Tuple[str, Set[str]]]] = None
+
+    @property
+    def similarity_enabled(self) -> bool:
+        return not self.fast_mode and bool(self.active_files)
+
+    def _features(self, path: str) -> Set[str]:
+        fi = self.files[path]
+        return {e.name for e in fi.exports} | {i.source for i in fi.imports}
+
+    def most_similar_active(self, path: str) -> Tuple[Optional[str], float]:
+        """Closest of (up to) 100 active files by export/import Jaccard."""
+        if self._active_sample is None:
+            self._active_sample = [(a, self._features(a)) for a in list(self.active_files)[:100]]
+        features = self._features(path)
+        best_path, best_sim = None, 0.0
+        for active, active_features in self._active_sample:
+            if active == path:
+                continue
+            sim = jaccard_similarity(features, active_features)
+            if sim > best_sim:
+                best_path, best_sim = active, sim
+        return best_path, best_sim
+
+    def collect_matrix(self, paths: List[str]) -> 'np.ndarray':
+        """Signals for ``paths`` as a bool matrix (rows = paths, columns =
+        SIGNALS). structural_similarity_to_active is left False: it is the one
+        pairwise signal, so callers fill it in only for rows that need it."""
+        fis = [self.files[p] for p in paths]
+        n = len(fis)
+
+        def column(values, dtype=bool):
+            return np.fromiter(values, dtype=dtype, count=n)
+
+        has_git = column(not self.fast_mode and bool(self.git_analyzer) and bool(fi.git_history)
+                         and fi.git_history.has_history for fi in fis)
+        commits = column((fi.git_history.commit_count if fi.git_history else 0 for fi in fis), np.int64)
+
+        m = np.zeros((n, len(self.SIGNALS)), dtype=bool)
+        col = self.COLUMN
+        m[:, col['no_direct_dependents']] = column((len(fi.dependents) for fi in fis), np.int64) == 0
+        m[:, col['no_transitive_dependents']] = column((len(fi.transitive_dependents) for fi in fis), np.int64) == 0
+        m[:, col['not_entry_point']] = ~column(fi.is_entry_point for fi in fis)
+        m[:, col['not_dynamic_imported']] = ~column(fi.is_dynamic_imported for fi in fis)
+        m[:, col['not_barrel_exported']] = ~column(fi.is_barrel_exported for fi in fis)
+        m[:, col['has_exports']] = column((len(fi.exports) for fi in fis), np.int64) > 0
+        m[:, col['complexity_high']] = column((fi.cyclomatic_complexity for fi in fis), np.int64) > 10
+        m[:, col['lines_gt_min']] = column((fi.lines for fi in fis), np.int64) > Config.MIN_LINES_FOR_UNWIRED
+        m[:, col['not_test']] = ~column(fi.is_test_file for fi in fis)
+        m[:, col['not_config']] = column(fi.category != FileCategory.CONFIGURATION for fi in fis)
+        m[:, col['not_framework_reserved']] = ~column(fi.path.startswith(('pages/', 'app/')) or
+                                                      'main.' in fi.path or 'index.' in fi.path for fi in fis)
+        m[:, col['git_old']] = has_git & (column((fi.days_since_modified for fi in fis), np.int64) > 180)
+        m[:, col['git_few_commits']] = has_git & (commits <= 2)
+        m[:, col['value_score_low']] = column((fi.value_score for fi in fis), np.float64) < Config.VALUE_MIN_SCORE
+        m[:, col['has_side_effects']] = column(fi.has_side_effects for fi in fis)
+        return m
 
     def collect(self, path: str) -> Dict[str, bool]:
         fi = self.files[path]
@@ -2687,20 +3125,8 @@ class UnusedSignalCollector:
             signals['git_old'] = False
             signals['git_few_commits'] = False
 
-        if not self.fast_mode and self.active_files:
-            max_sim = 0.0
-            sample_active = list(self.active_files)[:100]
-            for active in sample_active:
-                if active == path:
-                    continue
-                fi_active = self.files[active]
-                a_exports = {e.name for e in fi.exports}
-                a_imports = {i.source for i in fi.imports}
-                b_exports = {e.name for e in fi_active.exports}
-                b_imports = {i.source for i in fi_active.imports}
-                sim = jaccard_similarity(a_exports | a_imports, b_exports | b_imports)
-                if sim > max_sim:
-                    max_sim = sim
+        if self.similarity_enabled:
+            _, max_sim = self.most_similar_active(path)
             signals['structural_similarity_to_active'] = max_sim > Config.STRUCTURAL_SIMILARITY_THRESHOLD
         else:
             signals['structural_similarity_to_active'] = False
@@ -2721,7 +3147,37 @@ class UnusedConfidenceModel:
                 score += self.weights.get(signal, 0)
         return max(0, min(100, score))
 
+    def weight_vector(self, names: Sequence[str]) -> 'np.ndarray':
+        return np.array([self.weights.get(name, 0) for name in names], dtype=np.float64)
+
+    def compute_batch(self, matrix: 'np.ndarray',
+                      names: Sequence[str] = UnusedSignalCollector.SIGNALS) -> 'np.ndarray':
+        """compute() for every row of a collect_matrix() result at once."""
+        return np.clip(matrix @ self.weight_vector(names), 0, 100)
+
 class UnusedClassifier:
+    # classify_batch() returns indices into this table, in classify() precedence order
+    OUTCOMES = (
+        (UnusedClassification.HIGH_VALUE_UNWIRED, RecommendedAction.INTEGRATE),
+        (UnusedClassification.DEAD_CODE, RecommendedAction.DELETE),
+        (UnusedClassification.LEGACY_LEFTOVER, RecommendedAction.MERGE_WITH),
+        (UnusedClassification.ORPHANED_FEATURE, RecommendedAction.REVIEW),
+        (UnusedClassification.ARCHIVE_CANDIDATE, RecommendedAction.ARCHIVE),
+    )
+
+    @staticmethod
+    def classify_batch(matrix: 'np.ndarray', lines: 'np.ndarray', value_scores: 'np.ndarray') -> 'np.ndarray':
+        col = UnusedSignalCollector.COLUMN
+        has_exports = matrix[:, col['has_exports']]
+        git_old = matrix[:, col['git_old']]
+        conditions = [
+            has_exports & (lines > 100) & (value_scores >= 50),
+            ~has_exports & git_old & matrix[:, col['git_few_commits']],
+            matrix[:, col['structural_similarity_to_active']],
+            has_exports & ~git_old,
+        ]
+        return np.select(conditions, range(len(conditions)), default=len(conditions))
+
     @staticmethod
     def classify(path: str, fi: FileInfo, signals: Dict[str, bool], confidence: float) -> Tuple[UnusedClassification, RecommendedAction, Optional[str]]:
         classification = UnusedClassification.DEAD_CODE
@@ -2883,6 +3339,28 @@ class HTMLReportGenerator:
                 </tr>"""
             return rows
 
+        def performance_rows():
+            rows = ""
+            total_ms = result.analysis_duration_seconds * 1000 or 1.0
+            for t in result.phase_timings:
+                name = t['name'] if t['cat'] == 'phase' else f"<code>{t['name']}</code>"
+                peak = f"{t['peak_kb']:,.0f} KB" if t['peak_kb'] is not None else '–'
+                rows += f"""
+                <tr>
+                    <td>{name}</td>
+                    <td>{t['cat']}</td>
+                    <td>{t['calls']:,}</td>
+                    <td>{t['total_ms']:,.1f}</td>
+                    <td>{t['total_ms'] / total_ms:.0%}</td>
+                    <td>{t['max_ms']:,.1f}</td>
+                    <td>{peak}</td>
+                </tr>"""
+            return rows
+
+        def counter_summary():
+            return ' · '.join(f"{k.replace('_', ' ')}: <strong>{v:,}</strong>"
+                              for k, v in sorted(result.counters.items()))
+
         def cycle_rows():
             rows = ""
             for c in result.circular_deps[:30]:
@@ -3052,6 +3530,18 @@ class HTMLReportGenerator:
                     <li><strong>Wire:</strong> {sum(1 for f in result.files.values() if f.recommendation == Recommendation.WIRE)} files</li>
                 </ul>
             </div>
+
+            <!-- Performance -->
+            {f'''
+            <div class="section">
+                <h2 class="section-title">⏱️ Performance</h2>
+                <p>{counter_summary()}</p>
+                <table>
+                    <thead><tr><th>Span</th><th>Kind</th><th>Calls</th><th>Total (ms)</th><th>Share</th><th>Max (ms)</th><th>Peak memory</th></tr></thead>
+                    <tbody>{performance_rows()}</tbody>
+                </table>
+            </div>
+            ''' if result.phase_timings else ''}
         </div>
         <div class="footer">
             Generated by G-Studio Enterprise Code Intelligence v{Config.VERSION}<br>
@@ -3066,7 +3556,7 @@ class HTMLReportGenerator:
 # =============================================================================
 # JSON & CSV EXPORTERS
 # =============================================================================
-def export_json_report(result: AnalysisResult, output_path: Path):
+def export_json_report(result: AnalysisResult, output_path: Path, quiet: bool = False):
     data = {
         'version': Config.VERSION,
         'timestamp': datetime.now().isoformat(),
@@ -3078,6 +3568,8 @@ def export_json_report(result: AnalysisResult, output_path: Path):
             'duration': result.analysis_duration_seconds,
             'cache_hit_rate': result.cache_hit_rate,
         },
+        'phase_timings': result.phase_timings,
+        'counters': result.counters,
         'valuable_unused': [asdict(c) for c in result.valuable_unused],
         'wiring_issues': [asdict(i) for i in result.wiring_issues],
         'insights': [asdict(i) for i in result.insights],
@@ -3092,10 +3584,15 @@ def export_json_report(result: AnalysisResult, output_path: Path):
         'potentially_unused_files': [asdict(u) for u in result.potentially_unused_files],
         'unused_confidence_summary': result.unused_confidence_summary,
         'unused_classification_counts': result.unused_classification_counts,
+        'unreachable_files': result.unreachable_files,
+        'dead_islands': [asdict(i) for i in result.dead_islands],
     }
-    with open(output_path, 'w') as f:
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
         json.dump(data, f, indent=2, cls=EnhancedJSONEncoder)
-    log_success(f"JSON report saved to {output_path}")
+    os.replace(tmp_path, output_path)
+    if not quiet:
+        log_success(f"JSON report saved to {output_path}")
 
 def export_csv_reports(result: AnalysisResult, output_dir: Path):
     if result.valuable_unused:
@@ -3175,6 +3672,18 @@ class FileScanner:
                 files.append(file_path)
         return files
 
+    def accepts(self, path: Path) -> bool:
+        """Whether ``scan`` would report ``path`` (existence aside)."""
+        try:
+            rel = path.relative_to(self.src_path)
+        except ValueError:
+            return False
+        if any(part in Config.IGNORE_DIRS for part in rel.parts[:-1]):
+            return False
+        if path.suffix not in self.valid_extensions:
+            return False
+        return not any(pattern in path.name for pattern in Config.IGNORE_FILES)
+
 
 # =============================================================================
 # MAIN ANALYZER
@@ -3203,6 +3712,9 @@ class GStudioAnalyzer:
                  fast_unused_scan: bool = False,
                  dry_run_unused: bool = False,
                  unused_threshold: int = Config.UNUSED_CONFIDENCE_THRESHOLD,
+                 reachability: bool = False,
+                 trace_path: Optional[Path] = None,
+                 trace_memory: bool = False,
                  ):
 
         self.project_path = project_path
@@ -3227,6 +3739,17 @@ class GStudioAnalyzer:
         self.fast_unused_scan = fast_unused_scan
         self.dry_run_unused = dry_run_unused
         self.unused_threshold = unused_threshold
+        self.reachability = reachability
+        if reachability and not COMPACT_GRAPH_AVAILABLE:
+            log_warning("--reachability needs tools/compact_graph.py; using signal-based unused detection")
+            self.reachability = False
+        # Phases are always timed; --trace adds hot-helper spans and a Chrome trace file
+        self.trace_path = trace_path
+        self.trace_memory = trace_memory
+        if (trace_path or trace_memory) and not PHASE_TRACE_AVAILABLE:
+            log_warning("--trace needs tools/phase_trace.py; skipping trace output")
+            self.trace_path = None
+        self.tracer = Tracer()
 
         if not dry_run:
             self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -3245,125 +3768,287 @@ class GStudioAnalyzer:
         self.skipped_files = 0
         self._start_time = 0
         self._file_content_cache: Dict[str, str] = {}
+        self._entry_points: List[str] = []
+        self.dep_graph: Optional[DependencyGraph] = None
+        self.wiring_detector: Optional[WiringIssueDetector] = None
+        self._wiring_by_file: Dict[str, List[WiringIssue]] = {}
 
     def analyze(self) -> AnalysisResult:
         log_header(f"G-STUDIO ENTERPRISE CODE INTELLIGENCE v{Config.VERSION}")
         self._start_time = time.time()
+        self.tracer = Tracer(detail=self.trace_path is not None, memory=self.trace_memory)
+        with self.tracer, self.tracer.span('analyze'):
+            self._run_phases()
+        self.result.phase_timings = self.tracer.summary()
+        self.result.counters = dict(self.tracer.counters)
+        self.result.analysis_duration_seconds = time.time() - self._start_time
+        if self.trace_path:
+            self.tracer.export_chrome_trace(self.trace_path)
+            log_success(f"Chrome trace saved to {self.trace_path}")
 
-        framework, entry_points = self.framework_detector.detect()
-        self.result.framework = framework
-        log_info(f"Detected framework: {framework.value}")
+        self.cache.close()
+        return self.result
 
-        log_info("Scanning project files...")
-        file_paths = self.scanner.scan()
-        log_success(f"Found {len(file_paths)} source files")
+    def _run_phases(self):
+        span = self.tracer.span
 
-        if self.changed_only:
-            log_info("Filtering to files changed since last commit...")
-            changed_set = self._get_changed_files()
-            if changed_set is not None:
-                original_count = len(file_paths)
-                file_paths = [p for p in file_paths if str(p.relative_to(self.project_path)) in changed_set]
-                self.skipped_files = original_count - len(file_paths)
-                log_success(f"Keeping {len(file_paths)} changed files, skipped {self.skipped_files}")
-
-        log_info("Parsing and analyzing files (AST/CFG/DFG)...")
-        self._analyze_files(file_paths, entry_points)
-        log_success(f"Analyzed {len(self.files)} files")
-
-        log_info("Building dependency graph...")
-        dep_graph = DependencyGraph(self.files, self.project_path, self.scanner.src_path)
-        dep_graph.build()
-        dep_graph.compute_transitive_closure()
-        self.result.dependency_graph = dep_graph.graph
-
-        cycles = dep_graph.detect_cycles_tarjan()
-        self.result.circular_deps = cycles
-        if cycles:
-            log_warning(f"Found {len(cycles)} circular dependencies")
+        with span('framework'):
+            framework, entry_points = self.framework_detector.detect()
+            self.result.framework = framework
+            self._entry_points = entry_points
+            log_info(f"Detected framework: {framework.value}")
 
-        usage_analyzer = UsageAnalyzer(self.files, self.git_analyzer)
-        unused, unwired = usage_analyzer.analyze()
-        self.result.unused_files = unused
-        self.result.unwired_features = unwired
-        log_success(f"Found {len(unused)} truly unused files, {len(unwired)} unwired features")
+        with span('scan'):
+            log_info("Scanning project files...")
+            file_paths = self.scanner.scan()
+            count('files_scanned', len(file_paths))
+            log_success(f"Found {len(file_paths)} source files")
 
-        log_info("Scoring valuable unused components...")
-        self._find_valuable_unused(unused)
-        log_success(f"Found {len(self.result.valuable_unused)} valuable unused components")
-
-        log_info("Detecting wiring issues...")
-        self._detect_wiring_issues()
-        log_success(f"Found {len(self.result.wiring_issues)} wiring issues")
-
-        log_info("Analyzing architecture...")
-        arch_analyzer = ArchitecturalAnalyzer(self.files, self.project_path)
-        self.result.insights = arch_analyzer.analyze()
-        log_success(f"Generated {len(self.result.insights)} architectural insights")
+        if self.changed_only:
+            with span('changed_only'):
+                log_info("Filtering to files changed since last commit...")
+                changed_set = self._get_changed_files()
+                if changed_set is not None:
+                    original_count = len(file_paths)
+                    file_paths = [p for p in file_paths if str(p.relative_to(self.project_path)) in changed_set]
+                    self.skipped_files = original_count - len(file_paths)
+                    log_success(f"Keeping {len(file_paths)} changed files, skipped {self.skipped_files}")
+
+        with span('parse'):
+            log_info("Parsing and analyzing files (AST/CFG/DFG)...")
+            self._analyze_files(file_paths, entry_points)
+            unanalyzed = [rel for rel in (str(p.relative_to(self.project_path)) for p in file_paths)
+                          if rel not in self.files]
+            if unanalyzed:
+                # Not graph nodes: imports of them lead nowhere, so whatever is
+                # only reachable through them looks unused
+                log_warning(f"{len(unanalyzed)} scanned files could not be analyzed and are missing from the "
+                            f"dependency graph: {', '.join(unanalyzed[:5])}{' ...' if len(unanalyzed) > 5 else ''}")
+            count('files_analyzed', len(self.files))
+            count('cache_hits', self.cache.hits)
+            count('cache_misses', self.cache.misses)
+            log_success(f"Analyzed {len(self.files)} files")
+
+        with span('dependency_graph'):
+            log_info("Building dependency graph...")
+            dep_graph = DependencyGraph(self.files, self.project_path, self.scanner.src_path, cache=self.cache)
+            dep_graph.build()
+            count('edges_resolved', dep_graph.resolved_count)
+            if self.verbose:
+                log_info(f"Resolved edges for {dep_graph.resolved_count} files, "
+                         f"reused {len(self.files) - dep_graph.resolved_count} from cache")
+            dep_graph.compute_transitive_closure()
+            self.dep_graph = dep_graph
+            self.result.dependency_graph = dep_graph.graph
+
+        with span('cycles'):
+            cycles = dep_graph.detect_cycles_tarjan()
+            self.result.circular_deps = cycles
+            if cycles:
+                log_warning(f"Found {len(cycles)} circular dependencies")
+
+        with span('unused'):
+            usage_analyzer = UsageAnalyzer(self.files, self.git_analyzer)
+            unused, unwired = usage_analyzer.analyze()
+            if self.reachability:
+                unused, islands = dep_graph.find_unreachable(entry_points)
+                self.result.unreachable_files = unused
+                self.result.dead_islands = islands
+                log_success(f"Found {len(unused)} files unreachable from entry points in {len(islands)} dead islands "
+                            f"({sum(i.total_lines for i in islands):,} reclaimable lines)")
+            self.result.unused_files = unused
+            self.result.unwired_features = unwired
+            log_success(f"Found {len(unused)} truly unused files, {len(unwired)} unwired features")
+
+        with span('valuable_unused'):
+            log_info("Scoring valuable unused components...")
+            self._find_valuable_unused(unused)
+            log_success(f"Found {len(self.result.valuable_unused)} valuable unused components")
+
+        with span('wiring_issues'):
+            log_info("Detecting wiring issues...")
+            self._detect_wiring_issues()
+            log_success(f"Found {len(self.result.wiring_issues)} wiring issues")
+
+        with span('architecture'):
+            log_info("Analyzing architecture...")
+            arch_analyzer = ArchitecturalAnalyzer(self.files, self.project_path)
+            self.result.insights = arch_analyzer.analyze()
+            log_success(f"Generated {len(self.result.insights)} architectural insights")
 
         if self.enable_duplicates:
-            log_info("Detecting structural duplicates (AST‑based)...")
-            dup_detector = ASTDuplicateDetector(
-                self.files,
-                Config.STRUCTURAL_SIMILARITY_THRESHOLD,
-                project_path=self.project_path,
-                file_content_cache=self._file_content_cache
-            )
-            self.result.duplicate_clusters = dup_detector.detect()
-            log_success(f"Found {len(self.result.duplicate_clusters)} duplicate clusters")
+            with span('duplicates'):
+                log_info("Detecting structural duplicates (AST‑based)...")
+                dup_detector = ASTDuplicateDetector(
+                    self.files,
+                    Config.STRUCTURAL_SIMILARITY_THRESHOLD,
+                    project_path=self.project_path,
+                    file_content_cache=self._file_content_cache
+                )
+                self.result.duplicate_clusters = dup_detector.detect()
+                log_success(f"Found {len(self.result.duplicate_clusters)} duplicate clusters")
 
         if self.enable_recommendations:
-            log_info("Generating recommendations...")
-            rec_engine = RecommendationEngine(
-                self.files, self.result.dependency_graph,
-                self.result.duplicate_clusters, self.result.unwired_features
-            )
-            rec_engine.generate_recommendations()
-            log_success("Recommendations generated")
+            with span('recommendations'):
+                log_info("Generating recommendations...")
+                rec_engine = RecommendationEngine(
+                    self.files, self.result.dependency_graph,
+                    self.result.duplicate_clusters, self.result.unwired_features
+                )
+                rec_engine.generate_recommendations()
+                log_success("Recommendations generated")
 
         if self.archive:
-            log_info("Selecting archive candidates...")
-            candidates = self._select_archive_candidates()
-            self.result.archive_candidates = candidates
-            log_success(f"Selected {len(candidates)} archive candidates")
-            archive_mgr = ArchiveManager(self.project_path, self.output_dir, self.dry_run)
-            archive_mgr.archive_files([c.file_path for c in candidates], self.archive_reason)
+            with span('archive'):
+                log_info("Selecting archive candidates...")
+                candidates = self._select_archive_candidates()
+                self.result.archive_candidates = candidates
+                log_success(f"Selected {len(candidates)} archive candidates")
+                archive_mgr = ArchiveManager(self.project_path, self.output_dir, self.dry_run)
+                archive_mgr.archive_files([c.file_path for c in candidates], self.archive_reason)
 
         if self.unused_scan:
-            log_info("Running advanced unused file intelligence...")
-            self._analyze_potentially_unused()
-            log_success(f"Identified {len(self.result.potentially_unused_files)} potentially unused files (confidence ≥ {self.unused_threshold}%)")
+            with span('unused_scan'):
+                log_info("Running advanced unused file intelligence...")
+                self._analyze_potentially_unused()
+                log_success(f"Identified {len(self.result.potentially_unused_files)} potentially unused files (confidence ≥ {self.unused_threshold}%)")
+
+        with span('statistics'):
+            self._calculate_stats()
+            self.result.files = self.files
+            self.result.cache_hit_rate = self.cache.hit_rate()
+            self.result.git_available = self.git_analyzer.is_git_repo if self.git_analyzer else False
+
+    def watch(self):
+        """Keep files, graph and verdicts in memory after ``analyze`` and
+        re-analyze only what each edit batch touches, rewriting the JSON report.
+
+        Duplicates, recommendations, insights and archiving stay as computed by
+        the initial run; they need whole-project passes.
+        """
+        if not PROJECT_WATCH_AVAILABLE:
+            log_error("--watch needs tools/project_watch.py next to this checkout")
+            return
+        # analyze() closed the cache; edits still go through it.
+        self.cache = SQLiteCache(self.project_path / Config.CACHE_FILE, self.use_cache and not self.dry_run)
+        json_path = self.output_dir / 'analysis_report.json'
+        watcher = ProjectWatcher(self.scanner, Config.WATCH_POLL_INTERVAL, Config.WATCH_DEBOUNCE)
+        watcher.start()
+        log_header(f"WATCH MODE ({watcher.backend}) – Ctrl+C to stop")
+        if watcher.fallback_reason:
+            log_info(f"Polling for changes: {watcher.fallback_reason}")
+        try:
+            while True:
+                changed, removed = watcher.wait()
+                started = time.time()
+                changed_rel, removed_rel, affected = self._apply_changes(changed, removed)
+                if not self.dry_run:
+                    export_json_report(self.result, json_path, quiet=True)
+                elapsed = time.time() - started
+                log_success(f"{len(changed_rel)} changed, {len(removed_rel)} removed, "
+                            f"{len(affected)} re-evaluated – "
+                            f"{len(self.result.unused_files)} unused, {len(self.result.unwired_features)} unwired "
+                            f"({elapsed * 1000:.0f} ms)")
+                if elapsed > Config.WATCH_LATENCY_BUDGET:
+                    log_warning(f"Update took {elapsed:.2f}s, over the {Config.WATCH_LATENCY_BUDGET}s budget")
+        except KeyboardInterrupt:
+            log_info("Watch stopped")
+        finally:
+            watcher.stop()
+            self.cache.close()
+
+    def _apply_changes(self, changed: Set[Path], removed: Set[Path]) -> Tuple[Set[str], Set[str], Set[str]]:
+        changed_rel, added_rel, removed_rel = set(), set(), set()
+        for file_path in removed:
+            rel_path = str(file_path.relative_to(self.project_path))
+            self._file_content_cache.pop(str(file_path), None)
+            self.ast_trees.pop(rel_path, None)
+            if self.files.pop(rel_path, None) is not None:
+                removed_rel.add(rel_path)
+        for file_path in changed:
+            rel_path = str(file_path.relative_to(self.project_path))
+            self._file_content_cache.pop(str(file_path), None)
+            existed = self.files.pop(rel_path, None) is not None
+            self._parse_file(file_path, self._entry_points)
+            if rel_path in self.files:
+                changed_rel.add(rel_path)
+                if not existed:
+                    added_rel.add(rel_path)
+            elif existed:
+                removed_rel.add(rel_path)
+
+        touched = self.dep_graph.update(changed_rel, added_rel, removed_rel)
+        affected = self.dep_graph.affected_by(touched)
+        self.dep_graph.compute_transitive_closure(affected)
+        self.result.dependency_graph = self.dep_graph.graph
+        self.result.circular_deps = self.dep_graph.detect_cycles_tarjan()
+
+        # A full run judges before scoring, while every value_score is 0.0;
+        # _find_valuable_unused below re-scores the files that stay unused.
+        for path in affected:
+            self.files[path].value_score = 0.0
+        usage_analyzer = UsageAnalyzer(self.files, self.git_analyzer)
+        unused, self.result.unwired_features = usage_analyzer.update(
+            affected, self.result.unused_files, self.result.unwired_features)
+        rescore = set(affected)
+        if self.reachability:
+            # The sweep is O(V+E); membership can flip far from the edit.
+            unused, self.result.dead_islands = self.dep_graph.find_unreachable(self._entry_points)
+            self.result.unreachable_files = unused
+            rescore |= set(unused) ^ set(self.result.unused_files)
+            for path in rescore - affected:
+                if path in self.files:
+                    self.files[path].value_score = 0.0
+        self.result.unused_files = unused
+        unused_set = set(unused)
+        self.result.valuable_unused = [c for c in self.result.valuable_unused
+                                       if c.path in unused_set and c.path not in rescore]
+        self._find_valuable_unused([p for p in rescore if p in unused_set])
+
+        if any(self.files[p].layer == LayerType.HOOKS for p in changed_rel):
+            self.wiring_detector.refresh_context_hook_map()
+        for path in removed_rel:
+            self.wiring_detector.forget(path)
+            self._wiring_by_file.pop(path, None)
+        for path in changed_rel:
+            self._check_wiring(path)
+        self._collect_wiring_issues()
+
+        if self.unused_scan:
+            collector = UnusedSignalCollector(self.files, self.result.dependency_graph, self.git_analyzer, self.fast_unused_scan)
+            model = UnusedConfidenceModel()
+            simulator = UnusedDeletionSimulator(self.files, self.result.dependency_graph)
+            unused_details = [d for d in self.result.potentially_unused_files
+                              if d.path in self.files and d.path not in rescore]
+            if self.reachability:
+                unused_details = [d for d in unused_details if d.path in unused_set]
+                rescore &= unused_set
+            paths = sorted(rescore & self.files.keys())
+            if CAPABILITIES.available('numpy'):
+                unused_details.extend(self._evaluate_unused_batch(paths, collector, model, simulator))
+            else:
+                for path in paths:
+                    detail = self._evaluate_unused(path, collector, model, simulator)
+                    if detail and detail.confidence >= self.unused_threshold:
+                        unused_details.append(detail)
+            self._set_unused_details(unused_details)
 
         self._calculate_stats()
         self.result.files = self.files
-        self.result.cache_hit_rate = self.cache.hit_rate()
-        self.result.git_available = self.git_analyzer.is_git_repo if self.git_analyzer else False
-        self.result.analysis_duration_seconds = time.time() - self._start_time
-
-        self.cache.close()
-        return self.result
+        return changed_rel, removed_rel, affected
 
     def _get_changed_files(self) -> Optional[Set[str]]:
         return GitHelper.get_changed_files_since_last_commit(self.project_path)
 
     def _analyze_files(self, file_paths: List[Path], entry_points: List[str]):
-        large = [p for p in file_paths if p.stat().st_size > Config.SMALL_FILE_SIZE]
-        small = [p for p in file_paths if p.stat().st_size <= Config.SMALL_FILE_SIZE]
-
-        if large and self.parallel:
-            with ProcessPoolExecutor(max_workers=Config.MAX_WORKERS_CPU) as ex:
-                futures = [ex.submit(self._parse_file, p, entry_points) for p in large]
-                for f in tqdm(as_completed(futures), total=len(large), desc="Parsing large files"):
-                    try:
-                        f.result()
-                    except Exception as e:
-                        if self.verbose:
-                            log_warning(f"Worker error: {e}")
-
-        for batch in tqdm(list(chunks(small, Config.CHUNK_SIZE)), desc="Parsing small files"):
+        # Every file, large ones included, is parsed in this process: _parse_file
+        # fills self.files, the cache and self.ast_trees, none of which a worker
+        # process hands back, and the graph needs every scanned file as a node.
+        for batch in tqdm(list(chunks(file_paths, Config.CHUNK_SIZE)), desc="Parsing files"):
             for p in batch:
                 self._parse_file(p, entry_points)
 
+    @traced()
     def _parse_file(self, file_path: Path, entry_points: List[str]):
         try:
             rel_path = str(file_path.relative_to(self.project_path))
@@ -3372,8 +4057,12 @@ class GStudioAnalyzer:
             mtime = file_path.stat().st_mtime
 
             cached = self.cache.get(rel_path, content_hash)
+            if (cached and self.parser.compute_structural_hash
+                    and cached['analysis'].get('structural_version') != TOKENIZER_VERSION):
+                cached = None  # structural hash missing or from another normalizer
             if cached:
                 data = cached['analysis']
+                data.pop('structural_version', None)
                 # Convert nested dataclasses back from dicts
                 if 'imports' in data:
                     data['imports'] = [ImportInfo(**imp) if isinstance(imp, dict) else imp for imp in data['imports']]
@@ -3415,11 +4104,9 @@ class GStudioAnalyzer:
                 cache_data['recommendation'] = cache_data['recommendation'].value
                 if cache_data['unwired_type']:
                     cache_data['unwired_type'] = cache_data['unwired_type'].value
-                if cache_data['git_history']:
-                    cache_data['git_history'] = asdict(cache_data['git_history'])
-                # Convert lists of dataclasses to dicts for pickle
-                cache_data['imports'] = [asdict(i) for i in cache_data['imports']]
-                cache_data['exports'] = [asdict(e) for e in cache_data['exports']]
+                # asdict() already turned git_history, imports and exports into dicts
+                if self.parser.compute_structural_hash:
+                    cache_data['structural_version'] = TOKENIZER_VERSION
                 self.cache.set(rel_path, content_hash, cache_data)
 
             self.files[rel_path] = file_info
@@ -3431,6 +4118,7 @@ class GStudioAnalyzer:
         key = str(path)
         if key not in self._file_content_cache:
             self._file_content_cache[key] = path.read_text(encoding='utf-8', errors='ignore')
+            count('bytes_read', path.stat().st_size)
         return self._file_content_cache[key]
 
     def _create_file_info(self, rel_path: str, file_path: Path, content: str,
@@ -3638,16 +4326,24 @@ import {{ {name} }} from '@/{imp_path}';
 <{name} />"""
 
     def _detect_wiring_issues(self):
-        detector = WiringIssueDetector(self.files, self.project_path, verbose=self.verbose)
-        for path, fi in tqdm(self.files.items(), desc="Checking wiring"):
-            try:
-                content = self._read_file(self.project_path / path)
-                issues = detector.detect_issues(path, content)
-                self.result.wiring_issues.extend(issues)
-            except Exception as e:
-                if self.verbose:
-                    log_warning(f"Error checking wiring for {path}: {e}")
-        self.result.wiring_issues.extend(detector.post_process_ai_providers())
+        self.wiring_detector = WiringIssueDetector(self.files, self.project_path, verbose=self.verbose)
+        for path in tqdm(list(self.files), desc="Checking wiring"):
+            self._check_wiring(path)
+        self._collect_wiring_issues()
+
+    def _check_wiring(self, path: str):
+        self.wiring_detector.forget(path)
+        try:
+            content = self._read_file(self.project_path / path)
+            self._wiring_by_file[path] = self.wiring_detector.detect_issues(path, content)
+        except Exception as e:
+            self._wiring_by_file.pop(path, None)
+            if self.verbose:
+                log_warning(f"Error checking wiring for {path}: {e}")
+
+    def _collect_wiring_issues(self):
+        self.result.wiring_issues = [issue for issues in self._wiring_by_file.values() for issue in issues]
+        self.result.wiring_issues.extend(self.wiring_detector.post_process_ai_providers())
 
     def _select_archive_candidates(self) -> List[ArchiveDecision]:
         candidates = []
@@ -3680,6 +4376,7 @@ import {{ {name} }} from '@/{imp_path}';
         return candidates
 
     def _calculate_stats(self):
+        self.result.layer_stats = {}
         self.result.total_files = len(self.files)
         tsx = sum(1 for f in self.files.values() if f.path.endswith(('.tsx','.jsx')))
         self.result.tsx_percentage = (tsx / self.result.total_files * 100) if self.result.total_files else 0
@@ -3715,6 +4412,9 @@ import {{ {name} }} from '@/{imp_path}';
             print(f"{Colors.BOLD}Duplicate Clusters:{Colors.END} {len(self.result.duplicate_clusters)}")
         if self.result.unwired_features:
             print(f"{Colors.BOLD}Unwired Features:{Colors.END} {len(self.result.unwired_features)}")
+        if self.reachability:
+            print(f"{Colors.BOLD}Unreachable Files:{Colors.END} {len(self.result.unreachable_files)} "
+                  f"in {len(self.result.dead_islands)} dead islands")
         if self.unused_scan:
             print(f"{Colors.BOLD}Potentially Unused Files (confidence ≥ {self.unused_threshold}%):{Colors.END} {len(self.result.potentially_unused_files)}")
         print(f"\n{Colors.BOLD}{Colors.CYAN}📊 HTML report:{Colors.END} {self.output_dir / 'analysis_report.html'}")
@@ -3724,11 +4424,12 @@ import {{ {name} }} from '@/{imp_path}';
         model = UnusedConfidenceModel()
         simulator = UnusedDeletionSimulator(self.files, self.result.dependency_graph)
         unused_details = []
-        classification_counts = defaultdict(int)
-        total_confidence = 0.0
 
-        paths = list(self.files.keys())
-        if self.parallel:
+        # Reachable files are live by construction; only score the swept-out ones
+        paths = list(self.result.unreachable_files) if self.reachability else list(self.files.keys())
+        if CAPABILITIES.available('numpy'):
+            unused_details = self._evaluate_unused_batch(paths, collector, model, simulator)
+        elif self.parallel:
             with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS_IO) as ex:
                 futures = {ex.submit(self._evaluate_unused, path, collector, model, simulator): path for path in paths}
                 for f in tqdm(as_completed(futures), total=len(paths), desc="Evaluating unused"):
@@ -3736,8 +4437,6 @@ import {{ {name} }} from '@/{imp_path}';
                         detail = f.result()
                         if detail and detail.confidence >= self.unused_threshold:
                             unused_details.append(detail)
-                            classification_counts[detail.classification.value] += 1
-                            total_confidence += detail.confidence
                     except Exception as e:
                         if self.verbose:
                             log_warning(f"Unused evaluation error: {e}")
@@ -3746,14 +4445,18 @@ import {{ {name} }} from '@/{imp_path}';
                 detail = self._evaluate_unused(path, collector, model, simulator)
                 if detail and detail.confidence >= self.unused_threshold:
                     unused_details.append(detail)
-                    classification_counts[detail.classification.value] += 1
-                    total_confidence += detail.confidence
 
+        self._set_unused_details(unused_details)
+
+    def _set_unused_details(self, unused_details: List[UnusedFileDetail]):
+        classification_counts = defaultdict(int)
+        for detail in unused_details:
+            classification_counts[detail.classification.value] += 1
         self.result.potentially_unused_files = unused_details
         self.result.unused_classification_counts = dict(classification_counts)
         if unused_details:
             self.result.unused_confidence_summary = {
-                'average': total_confidence / len(unused_details),
+                'average': sum(d.confidence for d in unused_details) / len(unused_details),
                 'min': min(d.confidence for d in unused_details),
                 'max': max(d.confidence for d in unused_details)
             }
@@ -3772,26 +4475,56 @@ import {{ {name} }} from '@/{imp_path}';
             return None
 
         classification, action, merge_target = UnusedClassifier.classify(path, fi, signals, confidence)
-
+        return self._unused_detail(path, signals, confidence, classification, action, merge_target,
+                                   collector, simulator)
+
+    def _evaluate_unused_batch(self, paths: List[str], collector: UnusedSignalCollector,
+                               model: UnusedConfidenceModel,
+                               simulator: UnusedDeletionSimulator) -> List[UnusedFileDetail]:
+        """Score every path in one pass over signal columns; only files at or
+        above the threshold become UnusedFileDetail objects."""
+        paths = [p for p in paths if p in self.files]
+        if not paths:
+            return []
+        names = UnusedSignalCollector.SIGNALS
+        matrix = collector.collect_matrix(paths)
+        confidence = model.compute_batch(matrix, names)
+
+        # The pairwise similarity signal is by far the costliest. With a
+        # non-positive weight it can only pull a score down, so rows already
+        # below the threshold never need it.
+        if collector.similarity_enabled:
+            col = UnusedSignalCollector.COLUMN['structural_similarity_to_active']
+            rows = (np.flatnonzero(confidence >= self.unused_threshold)
+                    if model.weights.get(names[col], 0) <= 0 else range(len(paths)))
+            for i in rows:
+                _, sim = collector.most_similar_active(paths[i])
+                matrix[i, col] = sim > Config.STRUCTURAL_SIMILARITY_THRESHOLD
+            confidence = model.compute_batch(matrix, names)
+
+        keep = np.flatnonzero(confidence >= self.unused_threshold)
+        fis = [self.files[paths[i]] for i in keep]
+        outcomes = UnusedClassifier.classify_batch(
+            matrix[keep],
+            np.fromiter((fi.lines for fi in fis), dtype=np.int64, count=len(fis)),
+            np.fromiter((fi.value_score for fi in fis), dtype=np.float64, count=len(fis)))
+
+        details = []
+        for i, outcome in zip(keep, outcomes):
+            classification, action = UnusedClassifier.OUTCOMES[outcome]
+            signals = {name: bool(v) for name, v in zip(names, matrix[i])}
+            details.append(self._unused_detail(paths[i], signals, float(confidence[i]), classification,
+                                               action, None, collector, simulator))
+        return details
+
+    def _unused_detail(self, path: str, signals: Dict[str, bool], confidence: float,
+                       classification: UnusedClassification, action: RecommendedAction,
+                       merge_target: Optional[str], collector: UnusedSignalCollector,
+                       simulator: UnusedDeletionSimulator) -> UnusedFileDetail:
+        fi = self.files[path]
         if action == RecommendedAction.MERGE_WITH:
-            best_sim = 0.0
-            best_target = None
-            active_files = collector.active_files
-            for active in list(active_files)[:100]:
-                if active == path:
-                    continue
-                fi_active = self.files.get(active)
-                if not fi_active:
-                    continue
-                a_exports = {e.name for e in fi.exports}
-                a_imports = {i.source for i in fi.imports}
-                b_exports = {e.name for e in fi_active.exports}
-                b_imports = {i.source for i in fi_active.imports}
-                sim = jaccard_similarity(a_exports | a_imports, b_exports | b_imports)
-                if sim > best_sim and sim > Config.STRUCTURAL_SIMILARITY_THRESHOLD:
-                    best_sim = sim
-                    best_target = active
-            if best_target:
+            best_target, best_sim = collector.most_similar_active(path)
+            if best_target and best_sim > Config.STRUCTURAL_SIMILARITY_THRESHOLD:
                 merge_target = best_target
             else:
                 action = RecommendedAction.REVIEW
@@ -3823,6 +4556,20 @@ import {{ {name} }} from '@/{imp_path}';
 # =============================================================================
 # CLI
 # =============================================================================
+def print_startup_profile(setup_ms: float):
+    """--profile-startup: what importing and setting up cost before analysis
+    started, and which optional dependencies the run ended up loading."""
+    log_header("STARTUP PROFILE")
+    print(f"{Colors.BOLD}Module imports:{Colors.END} {_IMPORTS_MS:.1f} ms")
+    print(f"{Colors.BOLD}Setup:{Colors.END} {setup_ms:.1f} ms (arguments, parsers, cache)")
+    print(f"{Colors.BOLD}Optional dependencies (loaded on first use):{Colors.END}")
+    for name in CAPABILITIES.modules:
+        if name not in CAPABILITIES.loaded:
+            print(f"  {name:<12} not needed")
+        else:
+            state = 'loaded' if CAPABILITIES.loaded[name] else 'not installed'
+            print(f"  {name:<12} {CAPABILITIES.load_ms[name]:8.1f} ms  {state}")
+
 def parse_args():
     parser = argparse.ArgumentParser(
         description=f"G-Studio Enterprise Code Intelligence v{Config.VERSION}",
@@ -3840,6 +4587,18 @@ Examples:
 
   # Advanced unused scan with custom threshold
   %(prog)s . --unused-scan --unused-threshold 80 --fast-unused-scan
+
+  # Dead code by reachability from entry points (finds dead clusters)
+  %(prog)s . --reachability --unused-scan
+
+  # Keep the report JSON live while editing
+  %(prog)s . --unused-scan --watch
+
+  # Where does the time go? (per-phase table in the HTML report, plus a Chrome trace)
+  %(prog)s . --trace trace.json --trace-memory
+
+  # Import and setup cost, and which optional dependencies a run loads
+  %(prog)s . --since-last-commit --profile-startup
 """
     )
     parser.add_argument('project_path', nargs='?', default='.', help='Project directory (default: current)')
@@ -3848,7 +4607,7 @@ Examples:
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
     parser.add_argument('--html-only', action='store_true', help='Only generate HTML')
     parser.add_argument('--dry-run', action='store_true', help='Simulate only (no file writes)')
-    parser.add_argument('--no-parallel', action='store_true', help='Disable parallel parsing')
+    parser.add_argument('--no-parallel', action='store_true', help='Disable parallel unused-file evaluation')
     parser.add_argument('--since-last-commit', '-c', action='store_true', help='Only changed files since last commit')
     parser.add_argument('--csv', action='store_true', help='Export CSV files')
     parser.add_argument('--min-score', type=int, default=0, help='Minimum value score for valuable components')
@@ -3866,9 +4625,20 @@ Examples:
     parser.add_argument('--dry-run-unused', action='store_true', default=False, help='Do not simulate deletion, just report')
     parser.add_argument('--unused-threshold', type=int, default=Config.UNUSED_CONFIDENCE_THRESHOLD,
                         help=f'Confidence threshold for unused flagging (default: {Config.UNUSED_CONFIDENCE_THRESHOLD})')
+    parser.add_argument('--reachability', action='store_true', default=False,
+                        help='Mark-and-sweep unused detection from entry points (reports dead islands)')
+    parser.add_argument('--watch', '-w', action='store_true', default=False,
+                        help='Stay running and re-analyze edited files incrementally')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Also time hot helpers and write a Chrome trace (chrome://tracing, Perfetto)')
+    parser.add_argument('--trace-memory', action='store_true', default=False,
+                        help='Record tracemalloc peak per phase (slows analysis)')
+    parser.add_argument('--profile-startup', action='store_true', default=False,
+                        help='Print import/setup time and which optional dependencies were loaded')
     return parser.parse_args()
 
 def main():
+    main_started = time.perf_counter()
     args = parse_args()
     project_path = Path(args.project_path).resolve()
     if not project_path.exists():
@@ -3900,12 +4670,20 @@ def main():
         fast_unused_scan=args.fast_unused_scan,
         dry_run_unused=args.dry_run_unused,
         unused_threshold=args.unused_threshold,
+        reachability=args.reachability,
+        trace_path=Path(args.trace).resolve() if args.trace else None,
+        trace_memory=args.trace_memory,
     )
 
+    setup_ms = (time.perf_counter() - main_started) * 1000
     try:
         result = analyzer.analyze()
         analyzer.generate_report(html_only=args.html_only)
         log_success("Analysis complete!")
+        if args.profile_startup:
+            print_startup_profile(setup_ms)
+        if args.watch:
+            analyzer.watch()
     except KeyboardInterrupt:
         log_warning("\nInterrupted by user")
         sys.exit(1)
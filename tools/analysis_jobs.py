@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Background analysis jobs for the Tinker UI servers (fix_imports.py,
+react_project_analyzer_enhanced.py).
+
+  runner = JobRunner(run_job, fingerprint=fingerprint_tree)
+  job = runner.submit('analyze')           # returns at once; one worker runs jobs in order
+  runner.snapshot(job.id)                  # {'id', 'status', 'phase', 'current', 'total', ...}
+  stream_events(handler, runner, job.id)   # Server-Sent Events until the job ends
+
+run_job(kind, progress) does the work and returns (result, stats), calling
+progress(phase, current, total) as it goes. Progress is coalesced: a slow
+SSE client gets the latest state, not a backlog of every tick.
+
+fingerprint(kind) describes the inputs of a job, e.g. tree_fingerprint() of
+the files it would read. A job whose inputs match a cached run that left
+them unchanged finishes at once with that run's result. Runs that modify
+their own inputs (auto-fix) are never served from the cache.
+"""
+import hashlib
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+TERMINAL = ('done', 'failed')
+
+ProgressFn = Callable[[str, int, int], None]
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: str = 'queued'  # queued, running, done, failed
+    phase: str = ''
+    current: int = 0
+    total: int = 0
+    stats: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    cached: bool = False
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    seq: int = 0
+    result: Any = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'id': self.id, 'kind': self.kind, 'status': self.status, 'phase': self.phase,
+            'current': self.current, 'total': self.total, 'stats': self.stats, 'error': self.error,
+            'cached': self.cached, 'created': self.created, 'started': self.started,
+            'finished': self.finished, 'seq': self.seq,
+        }
+
+
+def tree_fingerprint(files: Iterable[Path], *extra: Any) -> str:
+    """Cheap identity of a file set: paths, sizes and mtimes, plus ``extra`` settings."""
+    digest = hashlib.sha1(repr(extra).encode())
+    for path in sorted(str(f) for f in files):
+        try:
+            st = Path(path).stat()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class JobRunner:
+    def __init__(self, run: Callable[[str, ProgressFn], Tuple[Any, Dict[str, Any]]],
+                 fingerprint: Optional[Callable[[str], Optional[str]]] = None,
+                 on_result: Optional[Callable[[Job], None]] = None,
+                 cache_size: int = 4, history: int = 50):
+        self._run = run
+        self._fingerprint = fingerprint
+        self._on_result = on_result
+        self._cache_size = cache_size
+        self._history = history
+        self._cache: 'OrderedDict[str, Tuple[Any, Dict[str, Any]]]' = OrderedDict()
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._queue: 'queue.Queue[Job]' = queue.Queue()
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    # ---------- client side ----------
+    def submit(self, kind: str) -> Job:
+        """Queue a job, or return the unfinished job of the same kind."""
+        with self._cond:
+            for job in self._jobs.values():
+                if job.kind == kind and job.status not in TERMINAL:
+                    return job
+            job = Job(id=uuid.uuid4().hex[:12], kind=kind)
+            self._jobs[job.id] = job
+            while len(self._jobs) > self._history:
+                oldest = next(iter(self._jobs.values()))
+                if oldest.status not in TERMINAL:
+                    break
+                self._jobs.popitem(last=False)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name='analysis-jobs', daemon=True)
+                self._worker.start()
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job else None
+
+    def wait(self, job_id: str, after_seq: int, timeout: float) -> Optional[Dict[str, Any]]:
+        """Block until the job's state moves past ``after_seq``; None on timeout or unknown id."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._cond.wait_for(lambda: job.seq > after_seq, timeout)
+            return job.snapshot() if job.seq > after_seq else None
+
+    # ---------- worker side ----------
+    def _update(self, job: Job, **changes):
+        with self._cond:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.seq += 1
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                self._execute(job)
+            finally:
+                self._queue.task_done()
+
+    def _execute(self, job: Job):
+        self._update(job, status='running', started=time.time(), phase='Starting')
+        try:
+            key = self._fingerprint(job.kind) if self._fingerprint else None
+            if key is not None and key in self._cache:
+                self._cache.move_to_end(key)
+                result, stats = self._cache[key]
+                job.result = result
+                if self._on_result:
+                    self._on_result(job)
+                self._update(job, status='done', phase='Cached', stats=stats, cached=True, finished=time.time())
+                return
+
+            def progress(phase: str, current: int = 0, total: int = 0):
+                self._update(job, phase=phase, current=current, total=total)
+
+            result, stats = self._run(job.kind, progress)
+            job.result = result
+            # Only cache runs that left their inputs as they found them
+            if key is not None and self._fingerprint(job.kind) == key:
+                self._cache[key] = (result, stats)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            if self._on_result:
+                self._on_result(job)
+            self._update(job, status='done', phase='Complete', stats=stats, finished=time.time())
+        except Exception as e:
+            self._update(job, status='failed', error=str(e), finished=time.time())
+
+
+def stream_events(handler, runner: JobRunner, job_id: str, keepalive: float = 15.0):
+    """Answer ``handler``'s GET with an SSE stream of the job's progress until it ends."""
+    snap = runner.snapshot(job_id)
+    if snap is None:
+        handler.send_error(404, 'Unknown job')
+        return
+
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/event-stream')
+    handler.send_header('Cache-Control', 'no-cache')
+    handler.send_header('Connection', 'close')
+    handler.end_headers()
+    try:
+        while True:
+            if snap is None:
+                handler.wfile.write(b': keepalive\n\n')
+            else:
+                event = snap['status'] if snap['status'] in TERMINAL else 'progress'
+                handler.wfile.write(f"id: {snap['seq']}\nevent: {event}\ndata: {json.dumps(snap)}\n\n".encode())
+                if event in TERMINAL:
+                    handler.wfile.flush()
+                    return
+                last_seq = snap['seq']
+            handler.wfile.flush()
+            snap = runner.wait(job_id, last_seq, keepalive)
+    except (BrokenPipeError, ConnectionResetError):
+        return
+
+
+def job_paths(path: str) -> Optional[Tuple[str, List[str]]]:
+    """Split /api/jobs/<id>[/events] into (id, rest) or None."""
+    if not path.startswith('/api/jobs/'):
+        return None
+    parts = path[len('/api/jobs/'):].strip('/').split('/')
+    return (parts[0], parts[1:]) if parts[0] else None
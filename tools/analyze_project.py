@@ -1,63 +1,45 @@
 import os
 import json
-import ast
-import hashlib
 import difflib
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
-import re
+
+from scan_core import Snapshot, scan_project
 
 class ProjectAnalyzer:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, use_snapshot: bool = True):
         self.project_root = Path(project_root)
+        self.use_snapshot = use_snapshot
+        self.snapshot: Optional[Snapshot] = None
         self.import_graph = {}
         self.file_dependencies = {}
         self.file_hashes = {}
         self.function_signatures = {}
         
     def scan_project(self):
-        """Recursively scan all files in the project"""
+        """Scan all files in the project (via the shared scan_core snapshot)"""
         file_data = []
-        excluded_dirs = {'.git', 'node_modules', '__pycache__', '.venv', 'dist', 'build'}
         excluded_ext = {'.pyc', '.pyo', '.so', '.dll', '.exe'}
         
-        for root, dirs, files in os.walk(self.project_root):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        self.snapshot = scan_project(self.project_root, use_snapshot=self.use_snapshot, verbose=True)
+        
+        for rel_path, record in self.snapshot.records.items():
+            # Skip excluded extensions
+            if any(rel_path.endswith(ext) for ext in excluded_ext):
+                continue
             
-            for file in files:
-                filepath = Path(root) / file
-                rel_path = filepath.relative_to(self.project_root)
-                
-                # Skip excluded extensions
-                if any(str(rel_path).endswith(ext) for ext in excluded_ext):
-                    continue
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        
-                    file_type = self._detect_file_type(filepath)
-                    imports = self._extract_imports(content, file_type)
-                    exports = self._extract_exports(content, file_type)
-                    
-                    file_info = {
-                        'path': str(rel_path),
-                        'full_path': str(filepath),
-                        'type': file_type,
-                        'size': len(content),
-                        'lines': content.count('\n') + 1,
-                        'imports': imports,
-                        'exports': exports,
-                        'hash': self._calculate_hash(content),
-                        'complexity': self._calculate_complexity(content, file_type),
-                        'last_modified': os.path.getmtime(filepath)
-                    }
-                    
-                    file_data.append(file_info)
-                    
-                except Exception as e:
-                    print(f"Error reading {filepath}: {e}")
+            file_data.append({
+                'path': rel_path,
+                'full_path': str(self.project_root / rel_path),
+                'type': self._detect_file_type(Path(rel_path)),
+                'size': record.size,
+                'lines': record.lines,
+                'imports': record.imports,
+                'exports': record.exports,
+                'hash': record.hash,
+                'complexity': record.complexity,
+                'last_modified': record.mtime
+            })
         
         return file_data
     
@@ -78,96 +60,8 @@ class ProjectAnalyzer:
         else:
             return 'other'
     
-    def _extract_imports(self, content: str, file_type: str) -> List[str]:
-        imports = []
-        
-        if file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-            except:
-                pass
-                
-        elif file_type == 'javascript':
-            # Match ES6 imports
-            es6_imports = re.findall(
-                r'import\s+(?:(?:\{[^}]*\}|\* as \w+|\w+)\s+from\s+)?[\'"]([^"\']+)[\'"]',
-                content
-            )
-            imports.extend(es6_imports)
-            
-            # Match require statements
-            requires = re.findall(
-                r'require\([\'"]([^"\']+)[\'"]\)',
-                content
-            )
-            imports.extend(requires)
-            
-            # Match dynamic imports
-            dynamic_imports = re.findall(
-                r'import\([\'"]([^"\']+)[\'"]\)',
-                content
-            )
-            imports.extend(dynamic_imports)
-        
-        return list(set(imports))
-    
-    def _extract_exports(self, content: str, file_type: str) -> List[str]:
-        exports = []
-        
-        if file_type == 'python':
-            # Look for __all__ declarations
-            all_matches = re.findall(r'__all__\s*=\s*\[([^\]]+)\]', content)
-            for match in all_matches:
-                exports.extend([exp.strip(" '") for exp in match.split(',')])
-                
-        elif file_type == 'javascript':
-            # Match export statements
-            export_matches = re.findall(
-                r'export\s+(?:const|let|var|function|class|default|async\s+function)?\s*([a-zA-Z_$][\w$]*)',
-                content
-            )
-            exports.extend(export_matches)
-            
-            # Match export { x, y } pattern
-            named_exports = re.findall(
-                r'export\s*\{([^}]+)\}',
-                content
-            )
-            for export_group in named_exports:
-                exports.extend([exp.strip() for exp in export_group.split(',')])
-        
-        return list(set(exports))
-    
-    def _calculate_hash(self, content: str) -> str:
-        return hashlib.md5(content.encode()).hexdigest()
-    
-    def _calculate_complexity(self, content: str, file_type: str) -> int:
-        """Calculate simple complexity score"""
-        lines = content.split('\n')
-        complexity = 0
-        
-        for line in lines:
-            line = line.strip()
-            # Count control structures
-            if any(keyword in line for keyword in ['if', 'for', 'while', 'catch', 'switch', '&&', '||', '?']):
-                complexity += 1
-            # Count function/method definitions
-            if re.search(r'(def |function |class |=>)', line):
-                complexity += 2
-            # Count nested brackets/braces
-            complexity += line.count('{') + line.count('[') + line.count('(')
-        
-        return complexity
-    
     def build_dependency_graph(self, file_data: List[Dict]) -> Dict:
-        """Build graph of file dependencies"""
+        """Build graph of file dependencies from the snapshot's resolved imports"""
         graph = {}
         reverse_graph = {}
         
@@ -178,39 +72,13 @@ class ProjectAnalyzer:
         
         for file_info in file_data:
             file_path = file_info['path']
-            imports = file_info['imports']
-            
-            for imp in imports:
-                # Try to find which file this import refers to
-                target_file = self._resolve_import(imp, file_info['path'], file_data)
-                if target_file:
+            for target_file in self.snapshot.edges.get(file_path, ()):
+                if target_file in reverse_graph:
                     graph[file_path].add(target_file)
                     reverse_graph[target_file].add(file_path)
         
         return graph, reverse_graph
     
-    def _resolve_import(self, import_str: str, source_path: str, file_data: List[Dict]) -> Optional[str]:
-        """Resolve import string to actual file path"""
-        # Simple implementation - can be extended based on project structure
-        source_dir = str(Path(source_path).parent)
-        
-        for file_info in file_data:
-            file_path = file_info['path']
-            filename = Path(file_path).name
-            stem = Path(file_path).stem
-            
-            # Check exact matches
-            if import_str in file_path or import_str in filename or import_str in stem:
-                return file_path
-            
-            # Check relative paths
-            if import_str.startswith('.'):
-                resolved = str(Path(source_dir) / import_str).replace('./', '')
-                if resolved in file_path or file_path.startswith(resolved):
-                    return file_path
-        
-        return None
-    
     def find_unused_files(self, file_data: List[Dict], reverse_graph: Dict) -> List[Dict]:
         """Find files not imported by any other file"""
         unused = []
@@ -3,11 +3,12 @@
 import argparse
 import json
 import os
-import shutil
 import sys
 from pathlib import Path
 from datetime import datetime
 
+from barrel_engine import BarrelIndex
+
 def find_abs_path(rel_path, files_dict, scan_root):
     rel_norm = rel_path.replace("/", os.sep)
     for k in files_dict:
@@ -37,29 +38,15 @@ def find_index(parent_rel):
             return str(idx).replace("\\", "/")
     return None
 
-def apply_export(index_path, comp_path, exports, backup_ts, dry_run: bool):
+def apply_export(barrels: BarrelIndex, index_path, comp_path, exports, dry_run: bool):
+    """Queue the export in the shared barrel index; written later by barrels.commit()."""
     stem = Path(comp_path).stem
-    line = f"export {{ {', '.join(str(e) for e in exports)} }} from './{stem}'"
-    if not os.path.exists(index_path):
-        if dry_run:
-            return "would_create", index_path
-        parent = Path(index_path).parent
-        parent.mkdir(parents=True, exist_ok=True)
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(f"export {{ {', '.join(str(e) for e in exports)} }} from './{stem}'\n")
-        return "applied", "created"
-    with open(index_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    if line.strip() in content or f"from './{stem}'" in content:
+    status = barrels.add_export(Path(index_path), f"./{stem}", [str(e) for e in exports])
+    if status == "exists":
         return "exists", "already exported"
-    backup = f"{index_path}.backup.{backup_ts}"
     if dry_run:
-        return "would_apply", backup
-    shutil.copy2(index_path, backup)
-    new_content = content.rstrip() + "\n" + line + "\n"
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
-    return "applied", backup
+        return ("would_create" if status == "queued_create" else "would_apply"), index_path
+    return "applied", "created" if status == "queued_create" else "queued"
 
 def main():
     parser = argparse.ArgumentParser(description="Apply activation exports to barrel indexes (with backups).")
@@ -79,6 +66,8 @@ def main():
     applied = []
     would_apply = []
     include_medium = bool(args.include_medium)
+    # Parse each barrel at most once; all edits are written in one batch below
+    barrels = BarrelIndex()
     for c in data.get("candidates", []):
         risk = c.get("estimated_risk")
         if risk == "HIGH":
@@ -103,7 +92,7 @@ def main():
         exports = get_exports(full_report, path)
         if not exports:
             continue
-        status, msg = apply_export(index_path, path, exports, ts, dry_run=bool(args.dry_run))
+        status, msg = apply_export(barrels, index_path, path, exports, dry_run=bool(args.dry_run))
         if status == "applied":
             applied.append({"id": c["id"], "path": path, "target": index_path})
             c["status"] = "applied"
@@ -115,6 +104,11 @@ def main():
             would_apply.append({"id": c.get("id"), "path": path, "target": index_path, "action": status})
 
     if not args.dry_run:
+        try:
+            barrels.commit(backup_ts=ts)
+        except Exception as e:
+            print(json.dumps({"error": f"barrel write failed, no files changed: {e}"}))
+            return 1
         with open(rp / "medium_candidates_activation.json", "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     patch_dir = rp / "patches"
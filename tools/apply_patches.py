@@ -1,114 +1,230 @@
 #!/usr/bin/env python3
-"""Apply low-risk patches with backups and validation"""
+"""Apply low-risk patches as one transaction with a rollback journal
+
+Patches are grouped by target file and applied in memory, so a file touched
+by several patches is read once and written once. All new contents are staged
+to temp files, the journal is written, and only then are the temps renamed
+into place. Instead of a <file>.backup.<ts> copy next to every source file,
+originals are kept as content-addressed blobs next to the journal:
+
+  <report>/patch_journal/<timestamp>.json   — targets, original/new sha256, patch ids
+  <report>/patch_journal/blobs/<aa>/<sha>   — original contents, stored once per hash
+
+Usage:
+  apply_patches.py [patches.json] [--dry-run]
+  apply_patches.py --rollback <report>/patch_journal/<timestamp>.json [--force]
+"""
+import hashlib
 import json
+import os
 import sys
-import shutil
 from pathlib import Path
 from datetime import datetime
 
-def backup_file(file_path: str, timestamp: str) -> str:
-    """Create backup of file before modification"""
-    if not Path(file_path).exists():
+JOURNAL_DIR = 'patch_journal'
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def blob_path(journal_dir: Path, digest: str) -> Path:
+    return journal_dir / 'blobs' / digest[:2] / digest
+
+
+def put_blob(journal_dir: Path, text: str) -> str:
+    """Store text once per unique content; return its digest"""
+    digest = sha256_text(text)
+    dest = blob_path(journal_dir, digest)
+    if not dest.exists():
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + '.tmp')
+        tmp.write_text(text, encoding='utf-8', newline='')
+        os.replace(tmp, dest)
+    return digest
+
+
+def read_text(path: Path):
+    """File content, or None if it does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
         return None
-    
-    backup_path = f"{file_path}.backup.{timestamp}"
-    shutil.copy2(file_path, backup_path)
-    return backup_path
 
-def apply_patch(patch_data: dict, timestamp: str, dry_run: bool = False) -> dict:
-    """Apply a single patch"""
+
+def group_by_target(patches: list) -> dict:
+    """{target_file: [(index, patch_id, patch), ...]} in original patch order"""
+    groups = {}
+    for i, patch in enumerate(patches, 1):
+        patch_id = patch.get('patch_id', f'patch_{i}')
+        groups.setdefault(patch.get('target_file', ''), []).append((i, patch_id, patch))
+    return groups
+
+
+def apply_patch(patch_data: dict, content, dry_run: bool = False):
+    """Apply a single patch to in-memory content.
+
+    content is the file text as left by earlier patches in this run (None if
+    the file does not exist). Returns (result, new content).
+    """
     target_file = patch_data.get('target_file', '')
     patch_type = patch_data.get('patch_type', '')
     diff_line = patch_data.get('diff_line', '')
-    
+
     result = {
         'target_file': target_file,
         'status': 'pending',
-        'message': '',
-        'backup': None
+        'message': ''
     }
-    
+
     if not target_file:
         result['status'] = 'skipped'
         result['message'] = 'No target file specified'
-        return result
-    
+        return result, content
+
     # Check if file needs to be created
     if patch_type == 'create':
-        if Path(target_file).exists():
+        if content is not None:
             result['status'] = 'skipped'
             result['message'] = 'File already exists'
-            return result
-        
+            return result, content
+
         if dry_run:
             result['status'] = 'would_create'
             result['message'] = f'Would create {target_file}'
-            return result
-        
-        # Create parent directory
-        Path(target_file).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Create file with new content
-        new_content = patch_data.get('new_content', '')
-        with open(target_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        result['status'] = 'created'
-        result['message'] = f'Created {target_file}'
-        return result
-    
+        else:
+            result['status'] = 'created'
+            result['message'] = f'Created {target_file}'
+        return result, patch_data.get('new_content', '')
+
     # Append to existing file
-    if not Path(target_file).exists():
+    if content is None:
         result['status'] = 'error'
         result['message'] = f'File not found: {target_file}'
-        return result
-    
-    # Backup original
-    backup_path = backup_file(target_file, timestamp)
-    result['backup'] = backup_path
-    
-    # Read current content
-    with open(target_file, 'r', encoding='utf-8') as f:
-        current_content = f.read()
-    
+        return result, content
+
     # Check if already applied
-    if diff_line and diff_line in current_content:
+    if diff_line and diff_line in content:
         result['status'] = 'already_applied'
         result['message'] = 'Export already exists'
-        return result
-    
-    if dry_run:
-        result['status'] = 'would_apply'
-        result['message'] = f'Would add: {diff_line[:50]}...'
-        return result
-    
+        return result, content
+
     # Apply patch (append line)
-    new_content = current_content
-    if not current_content.endswith('\n'):
+    new_content = content
+    if not content.endswith('\n'):
         new_content += '\n'
     new_content += diff_line + '\n'
-    
-    # Write updated content
-    with open(target_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    result['status'] = 'applied'
-    result['message'] = f'Added export to {target_file}'
-    
-    return result
+
+    if dry_run:
+        result['status'] = 'would_apply'
+        result['message'] = f'Would add: {diff_line[:50]}...'
+    else:
+        result['status'] = 'applied'
+        result['message'] = f'Added export to {target_file}'
+
+    return result, new_content
+
+
+def commit(changes: dict, journal_dir: Path, timestamp: str) -> Path:
+    """Write all changed files as one transaction; return the journal path.
+
+    changes: {target: (original content or None, new content, [patch ids])}
+    """
+    staged = {}
+    try:
+        for target, (_, new, _) in changes.items():
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + '.patch.tmp')
+            with open(tmp, 'w', encoding='utf-8', newline='') as f:
+                f.write(new)
+            staged[target] = tmp
+
+        # Write-ahead: originals and journal are durable before any target changes
+        journal = {
+            'timestamp': timestamp,
+            'files': [
+                {
+                    'target_file': target,
+                    'original_sha256': put_blob(journal_dir, old) if old is not None else None,
+                    'new_sha256': sha256_text(new),
+                    'patches': ids,
+                }
+                for target, (old, new, ids) in changes.items()
+            ],
+        }
+        journal_path = journal_dir / f'{timestamp}.json'
+        with open(journal_path, 'w', encoding='utf-8') as f:
+            json.dump(journal, f, indent=2, ensure_ascii=False)
+    except Exception:
+        for tmp in staged.values():
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+        raise
+
+    for target, tmp in staged.items():
+        os.replace(tmp, target)
+    return journal_path
+
+
+def rollback(journal_path: Path, force: bool = False) -> int:
+    """Restore every file recorded in a journal; returns number of conflicts.
+
+    A file is only restored if it still has the content this run wrote, so
+    later manual edits are not clobbered unless force is given.
+    """
+    journal_dir = journal_path.parent
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        journal = json.load(f)
+
+    conflicts = 0
+    for entry in journal.get('files', []):
+        target = Path(entry['target_file'])
+        current = read_text(target)
+        if current is not None and sha256_text(current) != entry['new_sha256'] and not force:
+            conflicts += 1
+            print(f"  conflict: {target} changed since {journal['timestamp']} (use --force)")
+            continue
+        original = entry.get('original_sha256')
+        if original is None:
+            if current is not None:
+                target.unlink()
+            print(f"  removed: {target}")
+            continue
+        tmp = target.with_name(target.name + '.patch.tmp')
+        # Bytes, not text: a text read would turn CRLF originals into LF
+        tmp.write_bytes(blob_path(journal_dir, original).read_bytes())
+        os.replace(tmp, target)
+        print(f"  restored: {target}")
+    return conflicts
+
 
 def main():
     """Apply all patches"""
-    patches_file = sys.argv[1] if len(sys.argv) > 1 else 'reports/20260211_064615/patches_generated.json'
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
     dry_run = '--dry-run' in sys.argv
-    
+
+    if '--rollback' in sys.argv:
+        if not args:
+            print("Usage: apply_patches.py --rollback <journal.json> [--force]")
+            return 1
+        print(f"Rolling back {args[0]}...")
+        conflicts = rollback(Path(args[0]), force='--force' in sys.argv)
+        return 1 if conflicts else 0
+
+    patches_file = args[0] if args else 'reports/20260211_064615/patches_generated.json'
+    report_dir = Path(patches_file).parent
+
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
+
     with open(patches_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
+
     patches = data.get('patches', [])
-    
+
     results = {
         'timestamp': timestamp,
         'dry_run': dry_run,
@@ -118,23 +234,33 @@ def main():
         'skipped': 0,
         'already_applied': 0,
         'errors': 0,
+        'journal': None,
         'details': []
     }
-    
+
     print(f"{'DRY RUN: ' if dry_run else ''}Applying {len(patches)} patches...")
     print(f"Timestamp: {timestamp}")
     print()
-    
-    for i, patch in enumerate(patches, 1):
-        patch_id = patch.get('patch_id', f'patch_{i}')
-        print(f"[{i}/{len(patches)}] {patch_id}...", end=' ')
-        
-        result = apply_patch(patch, timestamp, dry_run)
-        results['details'].append({
-            'patch_id': patch_id,
-            **result
-        })
-        
+
+    # Each target is read once and all of its patches applied in memory
+    details = {}
+    changes = {}
+    for target, group in group_by_target(patches).items():
+        original = read_text(Path(target)) if target else None
+        content = original
+        ids = []
+        for i, patch_id, patch in group:
+            result, content = apply_patch(patch, content, dry_run)
+            details[i] = {'patch_id': patch_id, **result}
+            if result['status'] in ('applied', 'created', 'would_apply', 'would_create'):
+                ids.append(patch_id)
+        if ids and content != original:
+            changes[target] = (original, content, ids)
+
+    for i in sorted(details):
+        result = details[i]
+        results['details'].append(result)
+
         # Update counters
         if result['status'] == 'applied':
             results['applied'] += 1
@@ -146,14 +272,24 @@ def main():
             results['already_applied'] += 1
         elif result['status'] == 'error':
             results['errors'] += 1
-        
-        print(f"{result['status']}: {result['message']}")
-    
+
+        print(f"[{i}/{len(patches)}] {result['patch_id']}... {result['status']}: {result['message']}")
+
+    if changes and not dry_run:
+        journal_dir = report_dir / JOURNAL_DIR
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            journal_path = commit(changes, journal_dir, timestamp)
+        except Exception as e:
+            print(f"\nERROR: write failed, no files changed: {e}")
+            return 1
+        results['journal'] = str(journal_path)
+
     # Save results
-    results_file = f"reports/20260211_064615/apply_results_{timestamp}.json"
+    results_file = report_dir / f"apply_results_{timestamp}.json"
     with open(results_file, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
-    
+
     print()
     print("=" * 60)
     print("SUMMARY:")
@@ -163,7 +299,12 @@ def main():
     print(f"  Skipped: {results['skipped']}")
     print(f"  Already applied: {results['already_applied']}")
     print(f"  Errors: {results['errors']}")
+    print(f"  Files written: {0 if dry_run else len(changes)}")
+    if results['journal']:
+        print(f"\nJournal: {results['journal']}")
+        print(f"  Undo with: python tools/apply_patches.py --rollback {results['journal']}")
     print(f"\nResults saved: {results_file}")
+    return 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
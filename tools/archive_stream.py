@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Archive stream — write files straight from source into a .zip or .tar.zst
+archive, shared by the analyzers (g_studio_intelligence_v10.py,
+main-fixer-9.v3.py).
+
+  with StreamingArchiveWriter(Path("out.zip"), "zip", workers=8) as writer:
+      for entry in writer.add_files([(Path("src/a.ts"), "src/a.ts")]):
+          ...                              # {'arcname', 'sha256', 'duplicate_of', ...}
+  writer.verify()                          # [] when every member checks out
+  extract_archive(Path("out.zip"), Path("restored"))
+
+Byte-identical files are stored once. In tar.zst archives each duplicate is a
+hardlink to the first copy, so any tar restores it; zip has no links, so the
+duplicates are listed in a DEDUP_MEMBER table and extract_archive (or
+`python archive_stream.py extract ARCHIVE DEST`) copies them back.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tarfile
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Optional: zstandard for multi-threaded tar.zst archives
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+DEDUP_MEMBER = '__dedup__.json'   # zip only: {duplicate arcname: stored arcname}
+
+
+class _HashingReader:
+    """File wrapper that hashes bytes as the archiver reads them"""
+
+    def __init__(self, f):
+        self.f = f
+        self.sha = hashlib.sha256()
+        self.crc = 0
+        self.size = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self.f.read(n)
+        self.sha.update(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        return data
+
+
+def _read_member(path: Path) -> Tuple[Optional[bytes], str, int, os.stat_result]:
+    """Read a small file once for hashing and archiving; large files are streamed later"""
+    st = path.stat()
+    if st.st_size > StreamingArchiveWriter.LARGE_MEMBER:
+        return None, '', 0, st
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest(), zlib.crc32(data), st
+
+
+class StreamingArchiveWriter:
+    """
+    Write files straight from source into a .zip or .tar.zst archive.
+
+    Every file is read exactly once: the same pass feeds sha256 (dedup and
+    manifest), crc32 (verification against the zip directory) and the member
+    data. Byte-identical files are stored once and recorded as duplicates.
+    Small files are read ahead by a thread pool; 'tar.zst' (requires the
+    optional `zstandard` package) compresses on all cores.
+    """
+
+    LARGE_MEMBER = 8 * 1024 * 1024
+    STORED_EXTENSIONS = {
+        '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.woff', '.woff2',
+        '.zip', '.gz', '.br', '.zst', '.mp3', '.mp4', '.webm', '.pdf',
+    }
+    FORMATS = ('zip', 'tar.zst')
+
+    def __init__(self, archive_path: Path, fmt: str = 'zip', workers: int = 4):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown archive format: {fmt}")
+        if fmt == 'tar.zst' and not ZSTD_AVAILABLE:
+            raise RuntimeError("tar.zst archives require the 'zstandard' package")
+        self.archive_path = archive_path
+        self.fmt = fmt
+        self.workers = max(1, workers)
+        self.by_hash: Dict[str, str] = {}
+        self.entries: List[Dict] = []
+        self._zip = None
+        self._tar = None
+        self._stream = None
+
+    def __enter__(self):
+        if self.fmt == 'zip':
+            self._zip = zipfile.ZipFile(self.archive_path, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            cctx = zstandard.ZstdCompressor(level=10, threads=-1, write_checksum=True)
+            self._stream = cctx.stream_writer(open(self.archive_path, 'wb'))
+            self._tar = tarfile.open(fileobj=self._stream, mode='w|')
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._zip is not None:
+            duplicates = self.duplicates()
+            if duplicates:
+                self.add_bytes(DEDUP_MEMBER, json.dumps(duplicates, indent=2).encode('utf-8'))
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._stream.close()
+            self._tar = self._stream = None
+
+    def _compress_type(self, arcname: str) -> int:
+        if Path(arcname).suffix.lower() in self.STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def add_bytes(self, arcname: str, data: bytes, mtime: Optional[float] = None):
+        """Add an in-memory member (e.g. metadata.json)"""
+        mtime = time.time() if mtime is None else mtime
+        if self._zip is not None:
+            zinfo = zipfile.ZipInfo(arcname, time.localtime(mtime)[:6])
+            self._zip.writestr(zinfo, data, compress_type=self._compress_type(arcname))
+        else:
+            tinfo = tarfile.TarInfo(arcname)
+            tinfo.size = len(data)
+            tinfo.mtime = int(mtime)
+            self._tar.addfile(tinfo, io.BytesIO(data))
+
+    def _add_stream(self, path: Path, arcname: str, st: os.stat_result) -> _HashingReader:
+        with open(path, 'rb') as src:
+            reader = _HashingReader(src)
+            if self._zip is not None:
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                zinfo.compress_type = self._compress_type(arcname)
+                with self._zip.open(zinfo, 'w', force_zip64=True) as dst:
+                    shutil.copyfileobj(reader, dst, 1 << 20)
+            else:
+                tinfo = tarfile.TarInfo(arcname)
+                tinfo.size = st.st_size
+                tinfo.mtime = int(st.st_mtime)
+                self._tar.addfile(tinfo, reader)
+        return reader
+
+    def _add_link(self, arcname: str, target: str, st: os.stat_result):
+        """Record a duplicate as a tar hardlink to the stored copy"""
+        tinfo = tarfile.TarInfo(arcname)
+        tinfo.type = tarfile.LNKTYPE
+        tinfo.linkname = target
+        tinfo.mtime = int(st.st_mtime)
+        self._tar.addfile(tinfo)
+
+    def _add(self, path: Path, arcname: str, read: Tuple) -> Dict:
+        data, sha, crc, st = read
+        entry = {'arcname': arcname, 'size': st.st_size, 'sha256': sha, 'crc32': crc, 'duplicate_of': None}
+        if data is None:
+            reader = self._add_stream(path, arcname, st)
+            entry.update(sha256=reader.sha.hexdigest(), crc32=reader.crc, size=reader.size)
+            self.by_hash.setdefault(entry['sha256'], arcname)
+        elif sha in self.by_hash:
+            entry['duplicate_of'] = self.by_hash[sha]
+            if self._tar is not None:
+                self._add_link(arcname, entry['duplicate_of'], st)
+        else:
+            self.by_hash[sha] = arcname
+            self.add_bytes(arcname, data, st.st_mtime)
+        self.entries.append(entry)
+        return entry
+
+    def add_files(self, items: List[Tuple[Path, str]]):
+        """Yield one entry per (path, arcname) in order; read errors yield {'error': ...}"""
+        items = iter(items)
+        window = self.workers * 4
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            def submit():
+                item = next(items, None)
+                if item is not None:
+                    pending.append((item[0], item[1], pool.submit(_read_member, item[0])))
+
+            for _ in range(window):
+                submit()
+            while pending:
+                path, arcname, future = pending.popleft()
+                submit()
+                try:
+                    yield self._add(path, arcname, future.result())
+                except OSError as e:
+                    yield {'arcname': arcname, 'error': str(e)}
+
+    def duplicates(self) -> Dict[str, str]:
+        """Duplicate arcname -> arcname of the stored copy"""
+        return {e['arcname']: e['duplicate_of'] for e in self.entries if e['duplicate_of']}
+
+    def verify(self) -> List[str]:
+        """Check the written archive against hashes taken during the read pass"""
+        problems = []
+        stored = [e for e in self.entries if e['duplicate_of'] is None]
+        if self.fmt == 'zip':
+            with zipfile.ZipFile(self.archive_path, 'r') as zf:
+                infos = {zi.filename: zi for zi in zf.infolist()}
+                links = json.loads(zf.read(DEDUP_MEMBER)) if DEDUP_MEMBER in infos else {}
+            for entry in stored:
+                zi = infos.get(entry['arcname'])
+                if zi is None:
+                    problems.append(f"missing member: {entry['arcname']}")
+                elif zi.CRC != entry['crc32'] or zi.file_size != entry['size']:
+                    problems.append(f"checksum mismatch: {entry['arcname']}")
+        else:
+            # Decompressing validates the zstd frame checksum; member sizes are checked here
+            dctx = zstandard.ZstdDecompressor()
+            with open(self.archive_path, 'rb') as raw, dctx.stream_reader(raw) as stream:
+                with tarfile.open(fileobj=stream, mode='r|') as tar:
+                    members = list(tar)
+            sizes = {ti.name: ti.size for ti in members if ti.isfile()}
+            links = {ti.name: ti.linkname for ti in members if ti.islnk()}
+            for entry in stored:
+                if sizes.get(entry['arcname']) != entry['size']:
+                    problems.append(f"size mismatch: {entry['arcname']}")
+        for arcname, target in self.duplicates().items():
+            if links.get(arcname) != target:
+                problems.append(f"unrecorded duplicate: {arcname}")
+        return problems
+
+    def stats(self) -> Dict:
+        duplicates = [e for e in self.entries if e['duplicate_of']]
+        return {
+            'members': len(self.entries) - len(duplicates),
+            'duplicates': len(duplicates),
+            'bytes_deduplicated': sum(e['size'] for e in duplicates),
+        }
+
+
+def extract_archive(archive_path: Path, dest: Path) -> int:
+    """Extract a StreamingArchiveWriter archive into dest, deduplicated files
+    included; returns the number of files written"""
+    dest.mkdir(parents=True, exist_ok=True)
+    if archive_path.name.endswith('.tar.zst'):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("tar.zst archives require the 'zstandard' package")
+        # 'data' rejects absolute paths and links leaving dest (where supported)
+        safe = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        dctx = zstandard.ZstdDecompressor()
+        with open(archive_path, 'rb') as raw, dctx.stream_reader(raw) as stream:
+            with tarfile.open(fileobj=stream, mode='r|') as tar:
+                count = 0
+                for tinfo in tar:
+                    # Hardlink targets always precede their links, so they exist on disk
+                    tar.extract(tinfo, dest, **safe)
+                    count += tinfo.isfile() or tinfo.islnk()
+        return count
+
+    with zipfile.ZipFile(archive_path, 'r') as zf:
+        names = [n for n in zf.namelist() if n != DEDUP_MEMBER]
+        zf.extractall(dest, names)
+        table = json.loads(zf.read(DEDUP_MEMBER)) if DEDUP_MEMBER in zf.namelist() else {}
+    root = dest.resolve()
+    for arcname, target in table.items():
+        copy = (dest / arcname).resolve()
+        if root not in copy.parents:
+            raise ValueError(f"Refusing to restore outside {dest}: {arcname}")
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(dest / target, copy)
+    return len(names) + len(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Restore an analyzer archive, deduplicated files included")
+    sub = parser.add_subparsers(dest='command', required=True)
+    extract = sub.add_parser('extract', help='Extract ARCHIVE into DEST')
+    extract.add_argument('archive', type=Path)
+    extract.add_argument('dest', type=Path)
+    args = parser.parse_args()
+    try:
+        count = extract_archive(args.archive, args.dest)
+    except (OSError, ValueError, RuntimeError, zipfile.BadZipFile, tarfile.TarError) as e:
+        print(f"Extraction failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Restored {count} files into {args.dest}")
+
+
+if __name__ == '__main__':
+    main()
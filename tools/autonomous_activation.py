@@ -16,6 +16,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Set
 
+from barrel_engine import BarrelIndex
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -127,32 +129,14 @@ def get_exports_from_file(file_path: Path, full_report: dict) -> List[str]:
     stem = file_path.stem
     return [stem] if stem else []
 
-def apply_barrel_export(index_path: Path, component_path: Path, exports: List[str], timestamp: str, dry_run: bool) -> str:
-    """Apply barrel export to index file"""
-    stem = component_path.stem
-    line = f"export {{ {', '.join(exports)} }} from './{stem}'"
-    
-    # Create index if needed
-    if not index_path.exists():
-        if dry_run:
-            return "would_create"
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-        index_path.write_text(line + "\n", encoding="utf-8")
-        return "created"
-    
-    # Check if already exported
-    content = index_path.read_text(encoding="utf-8")
-    if line.strip() in content or f"from './{stem}'" in content:
+def apply_barrel_export(barrels: BarrelIndex, index_path: Path, component_path: Path, exports: List[str], dry_run: bool) -> str:
+    """Queue barrel export in the shared index; files are written once by barrels.commit()"""
+    status = barrels.add_export(index_path, f"./{component_path.stem}", exports)
+    if status == "exists":
         return "exists"
-    
-    # Backup and append
-    backup = f"{index_path}.backup.{timestamp}"
-    if dry_run:
-        return "would_apply"
-    shutil.copy2(index_path, backup)
-    new_content = content.rstrip() + "\n" + line + "\n"
-    index_path.write_text(new_content, encoding="utf-8")
-    return "applied"
+    if status == "queued_create":
+        return "would_create" if dry_run else "created"
+    return "would_apply" if dry_run else "applied"
 
 def should_create_index(parent_path: Path) -> bool:
     """Determine if we should create an index file for this path"""
@@ -169,7 +153,7 @@ def should_create_index(parent_path: Path) -> bool:
     
     return any(parent_str.startswith(p) for p in allowed_prefixes)
 
-def activate_component(candidate: dict, full_report: dict, timestamp: str, dry_run: bool) -> dict:
+def activate_component(candidate: dict, full_report: dict, barrels: BarrelIndex, timestamp: str, dry_run: bool) -> dict:
     """Activate a single component"""
     result = {
         "id": candidate["id"],
@@ -204,7 +188,7 @@ def activate_component(candidate: dict, full_report: dict, timestamp: str, dry_r
         return result
     
     # Apply export
-    status = apply_barrel_export(index_path, path, exports, timestamp, dry_run=dry_run)
+    status = apply_barrel_export(barrels, index_path, path, exports, dry_run=dry_run)
     
     if status in ("applied", "created"):
         result["status"] = "applied"
@@ -356,8 +340,9 @@ def main():
     # Step 4: Apply components
     log("Step 4: Applying components...", "INFO")
     applied = []
+    barrels = BarrelIndex()
     for candidate in auto_apply:
-        result = activate_component(candidate, full_report, timestamp, dry_run=dry_run)
+        result = activate_component(candidate, full_report, barrels, timestamp, dry_run=dry_run)
         applied.append(result)
         if result["status"] == "applied":
             log(f"  + Applied: {result['path']}", "INFO")
@@ -367,6 +352,13 @@ def main():
             log(f"  = Already applied: {result['path']}", "INFO")
         else:
             log(f"  - Skipped: {result['path']} ({result['reason']})", "INFO")
+    if not dry_run:
+        try:
+            written = barrels.commit(backup_ts=timestamp)
+            log(f"  Wrote {len(written)} barrel file(s) in one batch", "INFO")
+        except Exception as e:
+            log(f"Barrel write failed, no barrels changed: {e}", "ERROR")
+            return 1
     
     # Step 5: Update activation data
     log("Step 5: Updating activation data...", "INFO")
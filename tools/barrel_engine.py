@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Barrel engine — parse every barrel (index.ts/index.tsx) once into a symbol table.
+
+Shared by fix_barrels_v3.py, apply_activation.py, autonomous_activation.py and
+generate_patches.py so none of them re-read barrels or substring-scan lines:
+
+  barrels = BarrelIndex.load(Path("src"))
+  barrels.is_exported(index, "Foo")          # O(1)
+  barrels.exports_module(index, "./Foo")     # O(1)
+  barrels.add_export(index, "./Foo", ["Foo"])
+  barrels.dedupe()                           # mark duplicate re-exports
+  barrels.commit(backup_ts)                  # one batched, atomic write set
+"""
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+BARREL_NAMES = ("index.ts", "index.tsx")
+
+# A trailing "// note" after the statement is allowed and kept when it is rewritten
+EXPORT_FROM_RE = re.compile(
+    r"^export\s+(type\s+)?\{(.*)\}\s*from\s*['\"]([^'\"]+)['\"]\s*(;?)\s*(//.*)?$", re.S
+)
+EXPORT_LOCAL_RE = re.compile(r"^export\s+(type\s+)?\{(.*)\}\s*;?\s*(?://.*)?$", re.S)
+EXPORT_STAR_RE = re.compile(r"^export\s+\*\s+(?:as\s+(\w+)\s+)?from\s*['\"]([^'\"]+)['\"]")
+EXPORT_DECL_RE = re.compile(
+    r"^export\s+(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+    r"(?:const|let|var|function\*?|class|interface|type|enum|namespace)\s+(\w+)"
+)
+EXPORT_DEFAULT_RE = re.compile(r"^export\s+default\b")
+
+
+def normalize_module(module: str) -> str:
+    """'./Foo.tsx', './Foo/index' and './Foo' all name the same module"""
+    module = re.sub(r"\.(tsx?|jsx?)$", "", module.strip())
+    if module.endswith("/index"):
+        module = module[: -len("/index")]
+    return module
+
+
+@dataclass
+class ExportEntry:
+    """One exported name in a barrel"""
+    name: str                    # name as seen by importers of the barrel
+    spec: str                    # original specifier text, e.g. "default as Foo"
+    module: Optional[str]        # normalized source module; None for local exports
+    is_type: bool = False
+    is_default: bool = False     # re-exports the module's default export
+    stmt: int = -1
+    removed: bool = False
+
+
+@dataclass
+class ExportStatement:
+    """An export statement spanning lines[start..end]"""
+    start: int
+    end: int
+    kind: str                    # "from" | "local" | "star" | "decl" | "default"
+    is_type: bool = False
+    module: Optional[str] = None
+    raw_module: Optional[str] = None
+    semicolon: bool = False
+    comment: str = ""            # trailing line comment, without leading space
+    entries: List[ExportEntry] = field(default_factory=list)
+
+
+def _parse_specs(body: str, is_type: bool, module: Optional[str], stmt: int) -> List[ExportEntry]:
+    entries = []
+    for spec in body.split(","):
+        spec = " ".join(spec.split())
+        if not spec:
+            continue
+        spec_is_type = is_type
+        core = spec
+        if core.startswith("type "):
+            spec_is_type = True
+            core = core[5:].strip()
+        parts = core.split(" as ")
+        local = parts[0].strip()
+        name = parts[-1].strip()
+        entries.append(ExportEntry(
+            name=name,
+            spec=spec,
+            module=module,
+            is_type=spec_is_type,
+            is_default=(local == "default" and module is not None),
+            stmt=stmt,
+        ))
+    return entries
+
+
+class BarrelFile:
+    """Parsed barrel: statements plus name and module lookup tables"""
+
+    def __init__(self, path: Path, text: Optional[str] = None):
+        self.path = path
+        self.exists = text is not None
+        self.text = text or ""
+        self.lines: List[str] = self.text.split("\n") if self.text else []
+        self.statements: List[ExportStatement] = []
+        self.names: Dict[str, ExportEntry] = {}          # first occurrence wins
+        self.default_modules: Set[str] = set()           # modules whose default is re-exported as "default"
+        self.modules: Dict[str, Set[str]] = {}           # module -> exported names
+        self.star_modules: Set[str] = set()
+        self.duplicates: List[ExportEntry] = []
+        self.appended: List[str] = []
+        self._parse()
+
+    @classmethod
+    def read(cls, path: Path) -> "BarrelFile":
+        try:
+            return cls(path, path.read_text(encoding="utf-8", errors="ignore"))
+        except FileNotFoundError:
+            return cls(path)
+
+    def _parse(self):
+        i = 0
+        n = len(self.lines)
+        while i < n:
+            stripped = self.lines[i].strip()
+            if not stripped.startswith("export"):
+                i += 1
+                continue
+            start = i
+            text = stripped
+            # Multi-line export block: join until the closing brace (and its "from")
+            if "{" in text and "}" not in text:
+                while i + 1 < n and "}" not in self.lines[i]:
+                    i += 1
+                    text += " " + self.lines[i].strip()
+            if text.rstrip().endswith("}") and i + 1 < n and self.lines[i + 1].strip().startswith("from"):
+                i += 1
+                text += " " + self.lines[i].strip()
+            self._add_statement(start, i, text)
+            i += 1
+
+    def _add_statement(self, start: int, end: int, text: str):
+        idx = len(self.statements)
+        m = EXPORT_FROM_RE.match(text)
+        if m:
+            module = normalize_module(m.group(3))
+            stmt = ExportStatement(start, end, "from", bool(m.group(1)), module, m.group(3), bool(m.group(4)),
+                                   (m.group(5) or "").strip())
+            stmt.entries = _parse_specs(m.group(2), stmt.is_type, module, idx)
+        elif EXPORT_STAR_RE.match(text):
+            m = EXPORT_STAR_RE.match(text)
+            module = normalize_module(m.group(2))
+            stmt = ExportStatement(start, end, "star", False, module, m.group(2))
+            if m.group(1):
+                stmt.entries = [ExportEntry(m.group(1), text, module, stmt=idx)]
+            self.star_modules.add(module)
+        elif EXPORT_LOCAL_RE.match(text):
+            m = EXPORT_LOCAL_RE.match(text)
+            stmt = ExportStatement(start, end, "local", bool(m.group(1)))
+            stmt.entries = _parse_specs(m.group(2), stmt.is_type, None, idx)
+        elif EXPORT_DEFAULT_RE.match(text):
+            stmt = ExportStatement(start, end, "default")
+            stmt.entries = [ExportEntry("default", text, None, stmt=idx)]
+        else:
+            m = EXPORT_DECL_RE.match(text)
+            if not m:
+                return
+            stmt = ExportStatement(start, end, "decl", text.split()[1] in ("type", "interface"))
+            stmt.entries = [ExportEntry(m.group(1), text, None, stmt.is_type, stmt=idx)]
+        self.statements.append(stmt)
+        for entry in stmt.entries:
+            self._register(entry)
+
+    def _register(self, entry: ExportEntry):
+        if entry.module is not None:
+            self.modules.setdefault(entry.module, set()).add(entry.name)
+        if entry.name == "default" and entry.module is not None:
+            # `export { default } from` is a duplicate only when repeated for the same module
+            if entry.module in self.default_modules:
+                if self.statements[entry.stmt].kind == "from":
+                    self.duplicates.append(entry)
+                return
+            self.default_modules.add(entry.module)
+            self.names.setdefault(entry.name, entry)
+            return
+        if entry.name in self.names:
+            # Only re-exports can be dropped; local declarations are never rewritten
+            if entry.module is not None and self.statements[entry.stmt].kind == "from":
+                self.duplicates.append(entry)
+            return
+        self.names[entry.name] = entry
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def is_exported(self, name: str) -> bool:
+        return name in self.names
+
+    def exports_module(self, module: str) -> bool:
+        module = normalize_module(module)
+        return module in self.modules or module in self.star_modules
+
+    # ------------------------------------------------------------------
+    # Edits
+    # ------------------------------------------------------------------
+    def add_export(self, module: str, names: List[str], is_type: bool = False) -> bool:
+        """Queue `export { names } from 'module'`; False if already exported"""
+        if self.exports_module(module) or all(self.is_exported(n) for n in names):
+            return False
+        new = [n for n in names if not self.is_exported(n)]
+        prefix = "export type" if is_type else "export"
+        line = f"{prefix} {{ {', '.join(new)} }} from '{module}'"
+        self.appended.append(line)
+        idx = len(self.statements)
+        stmt = ExportStatement(-1, -1, "from", is_type, normalize_module(module), module)
+        stmt.entries = [ExportEntry(n, n, stmt.module, is_type, stmt=idx) for n in new]
+        self.statements.append(stmt)
+        for entry in stmt.entries:
+            self._register(entry)
+        return True
+
+    def dedupe(self) -> int:
+        """Mark every duplicate re-export for removal; returns the count"""
+        for entry in self.duplicates:
+            entry.removed = True
+        return len(self.duplicates)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.appended) or any(e.removed for e in self.duplicates)
+
+    def render(self) -> str:
+        """New file content with removals and appended exports applied"""
+        out: List[str] = []
+        by_start = {s.start: s for s in self.statements if s.start >= 0}
+        i = 0
+        while i < len(self.lines):
+            stmt = by_start.get(i)
+            if stmt is None or stmt.kind != "from" or not any(e.removed for e in stmt.entries):
+                out.append(self.lines[i])
+                i += 1
+                continue
+            kept = [e.spec for e in stmt.entries if not e.removed]
+            if kept:
+                prefix = "export type" if stmt.is_type else "export"
+                line = f"{prefix} {{ {', '.join(kept)} }} from '{stmt.raw_module}'" + (";" if stmt.semicolon else "")
+                out.append(f"{line} {stmt.comment}" if stmt.comment else line)
+            i = stmt.end + 1
+        while out and not out[-1].strip():
+            out.pop()
+        out.extend(self.appended)
+        return "\n".join(out) + "\n"
+
+
+class BarrelIndex:
+    """Project-wide symbol table over all barrel files"""
+
+    def __init__(self):
+        self.files: Dict[Path, BarrelFile] = {}
+
+    @classmethod
+    def load(cls, root: Path, names=BARREL_NAMES) -> "BarrelIndex":
+        """Parse every barrel under root in a single pass"""
+        index = cls()
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if d != "node_modules"]
+            for name in files:
+                if name in names:
+                    index.get(Path(dirpath) / name)
+        return index
+
+    def get(self, path: Path) -> BarrelFile:
+        """Parsed barrel for path (read at most once; a missing file parses as empty)"""
+        key = Path(os.path.abspath(path))
+        bf = self.files.get(key)
+        if bf is None:
+            bf = self.files[key] = BarrelFile.read(key)
+        return bf
+
+    def set_text(self, path: Path, text: str) -> BarrelFile:
+        """Replace the parsed barrel for path with text (e.g. a planned new file)"""
+        key = Path(os.path.abspath(path))
+        bf = self.files[key] = BarrelFile(key, text)
+        return bf
+
+    def exported_by(self, name: str) -> List[Path]:
+        """All barrels exporting name"""
+        return [p for p, bf in self.files.items() if name in bf.names]
+
+    def is_exported(self, index_path: Path, name: str) -> bool:
+        return self.get(index_path).is_exported(name)
+
+    def exports_module(self, index_path: Path, module: str) -> bool:
+        return self.get(index_path).exports_module(module)
+
+    def add_export(self, index_path: Path, module: str, names: List[str], is_type: bool = False) -> str:
+        """Queue an export; returns "exists", "queued_create" or "queued" """
+        bf = self.get(index_path)
+        if not bf.add_export(module, names, is_type=is_type):
+            return "exists"
+        return "queued" if bf.exists else "queued_create"
+
+    def dedupe(self) -> Dict[Path, int]:
+        """Mark duplicates in every barrel; returns {path: removed count} for dirty files"""
+        counts = {}
+        for path, bf in self.files.items():
+            n = bf.dedupe()
+            if n:
+                counts[path] = n
+        return counts
+
+    def write_set(self) -> Dict[Path, str]:
+        """{path: new content} for every barrel with pending edits"""
+        return {path: bf.render() for path, bf in self.files.items() if bf.dirty}
+
+    def commit(self, backup_ts: Optional[str] = None) -> Dict[Path, Optional[str]]:
+        """Write all pending edits as one batch.
+
+        Every new file is staged to a temp file first (and existing files backed up
+        to <file>.backup.<ts> when backup_ts is given); only when every stage
+        succeeded are the temps renamed into place, so a failure leaves all
+        barrels untouched. Returns {path: backup path or None}.
+        """
+        write_set = self.write_set()
+        staged: Dict[Path, Path] = {}
+        backups: Dict[Path, Optional[str]] = {}
+        try:
+            for path, content in write_set.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(path.name + ".barrel.tmp")
+                with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+                    f.write(content)
+                staged[path] = tmp
+                backups[path] = None
+                if backup_ts and path.exists():
+                    backup = f"{path}.backup.{backup_ts}"
+                    shutil.copy2(path, backup)
+                    backups[path] = backup
+        except Exception:
+            for tmp in staged.values():
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+            raise
+        for path, tmp in staged.items():
+            os.replace(tmp, path)
+            self.set_text(path, write_set[path])
+        return backups
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Benchmark the project analyzers phase by phase on synthetic projects.
+
+Generates (or reuses) deterministic projects with synth_project.py, runs each
+analyzer on each size in its own child process, and appends wall time per
+phase, peak RSS and files/s to a JSON history so runs on different commits
+compare like for like:
+
+  python tools/bench_analyzers.py --files 1000 5000
+  python tools/bench_analyzers.py --files 20000 --analyzers v10 gstudio9 --repeat 3
+
+Phases are timed by wrapping the methods each analyzer's orchestrator calls
+(see ANALYZERS); a phase's time is the wall-clock span during which any call
+to it was running, so methods fanned out over a thread pool are not counted
+once per thread. 'other' is whatever the orchestrator did outside the listed
+phases. 'records_mb' is the memory still reachable from the analyzer's
+per-file records (its ``files`` dict) after the run. Each new result is
+compared with the latest earlier result in the history for the same
+analyzer, project size, seed and generator version.
+
+Analyzers run in dry-run / no-cache mode where they have one, so every run
+does the full work and nothing is written into the synthetic project. Some
+scanners skip any path containing names like 'tmp', 'build' or '.cache', so
+--workdir defaults to ~/analyzer-bench rather than the temp directory.
+"""
+import argparse
+import functools
+import gc
+import importlib.util
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TOOLS = Path(__file__).resolve().parent
+REPO = TOOLS.parent
+sys.path.insert(0, str(TOOLS))
+from synth_project import GENERATOR_VERSION, SynthConfig, ensure_project  # noqa: E402
+
+DEFAULT_HISTORY = REPO / 'reports' / 'bench' / 'analyzers.json'
+
+
+# ---------- analyzers ----------
+def _load(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _v10(project: Path, scratch: Path):
+    mod = _load(TOOLS / 'g_studio_intelligence_v10.py', 'g_studio_intelligence_v10')
+    analyzer = mod.GStudioAnalyzer(project, scratch, use_cache=False, dry_run=True, enable_duplicates=True,
+                                   enable_recommendations=True, detect_barrels=True, reachability=True)
+    return mod, analyzer.analyze
+
+
+def _gstudio9(project: Path, scratch: Path):
+    mod = _load(REPO / 'Debugger' / 'gstudio_analyzer-9.py', 'gstudio_analyzer_9')
+    analyzer = mod.GStudioAnalyzer(project, scratch, use_cache=False, dry_run=True, enable_duplicates=True,
+                                   enable_recommendations=True, detect_barrels=True, unused_scan=True,
+                                   reachability=True)
+    return mod, analyzer.analyze
+
+
+def _main_fixer(project: Path, scratch: Path):
+    mod = _load(TOOLS / 'main-fixer-9.v3.py', 'main_fixer_9_v3')
+    if not mod.IGNORE_PARTS.isdisjoint(project.parts):
+        # The scanner skips any path with a component like 'tmp' or 'build'
+        raise SystemExit(f"main-fixer ignores {project}: pick a --workdir without "
+                         f"{sorted(mod.IGNORE_PARTS.intersection(project.parts))} in its path")
+    platform_ = mod.CodeIntelligencePlatform(str(project), report_folder_override=str(scratch))
+    return mod, platform_.analyze
+
+
+def _fix_imports(project: Path, scratch: Path):
+    mod = _load(TOOLS / 'fix_imports.py', 'fix_imports')
+    analyzer = mod.ReactProjectAnalyzer(project, scratch, dry_run=True)
+    return mod, analyzer.run
+
+
+def _fix_all2(project: Path, scratch: Path):
+    mod = _load(TOOLS / 'fix_all2.py', 'fix_all2')
+    hits = sorted(ex for ex in mod.EXCLUDE_DIRS if ex in str(project))
+    if hits:
+        # find_files drops any file whose absolute path contains an excluded name
+        raise SystemExit(f"fix_all2 ignores {project}: pick a --workdir without {hits} in its path")
+    analyzer = mod.ProjectAnalyzer(project)
+    return mod, analyzer.analyze
+
+
+# name -> (setup, [(phase, 'Class.method'), ...])
+ANALYZERS: Dict[str, Tuple[Callable, List[Tuple[str, str]]]] = {
+    'v10': (_v10, [
+        ('scan', 'FileScanner.scan'),
+        ('parse', 'GStudioAnalyzer._analyze_files'),
+        ('graph', 'DependencyAnalyzer.build_graph'),
+        ('unused', 'DependencyAnalyzer.find_unreachable'),
+        ('scoring', 'GStudioAnalyzer._find_valuable_unused'),
+        ('wiring', 'GStudioAnalyzer._detect_wiring_issues'),
+        ('architecture', 'ArchitecturalAnalyzer.analyze'),
+        ('duplicates', 'DuplicateDetector.detect'),
+        ('usage', 'UsageAnalyzer.analyze'),
+        ('recommendations', 'RecommendationEngine.generate_recommendations'),
+    ]),
+    'gstudio9': (_gstudio9, [
+        ('framework', 'FrameworkDetector.detect'),
+        ('scan', 'FileScanner.scan'),
+        ('parse', 'GStudioAnalyzer._analyze_files'),
+        ('graph', 'DependencyGraph.build'),
+        ('closure', 'DependencyGraph.compute_transitive_closure'),
+        ('cycles', 'DependencyGraph.detect_cycles_tarjan'),
+        ('usage', 'UsageAnalyzer.analyze'),
+        ('unused', 'DependencyGraph.find_unreachable'),
+        ('scoring', 'GStudioAnalyzer._find_valuable_unused'),
+        ('wiring', 'GStudioAnalyzer._detect_wiring_issues'),
+        ('architecture', 'ArchitecturalAnalyzer.analyze'),
+        ('duplicates', 'ASTDuplicateDetector.detect'),
+        ('recommendations', 'RecommendationEngine.generate_recommendations'),
+        ('unused-intel', 'GStudioAnalyzer._analyze_potentially_unused'),
+    ]),
+    'main-fixer': (_main_fixer, [
+        ('scan', 'ProjectScanner.scan'),
+        ('graph', 'DependencyGraphBuilder.build'),
+        ('duplicates', 'DuplicateDetector.analyze'),
+        ('usage', 'UsageAnalyzer.analyze'),
+        ('stability', 'StabilityCalculator.calculate'),
+        ('recommendations', 'CodeIntelligencePlatform._generate_comprehensive_recommendations'),
+        ('archive', 'ArchiveDecisionEngine.evaluate_archive_candidate'),
+        ('quality', 'CodeIntelligencePlatform._calculate_quality_metrics'),
+        ('reports', 'ReportGenerator.generate_all'),
+    ]),
+    'fix_imports': (_fix_imports, [
+        ('scan', 'ReactProjectAnalyzer._scan_project'),
+        ('parse', 'ReactProjectAnalyzer._analyze_files'),
+        ('enhance', 'ReactProjectAnalyzer._enhance_files'),
+        ('cycles', 'CircularDependencyDetector.find_cycles'),
+        ('unused', 'UnusedFileDetector.detect_unused'),
+        ('build', 'BuildVerifier.verify'),
+        ('reports', 'ReactProjectAnalyzer._generate_reports'),
+    ]),
+    'fix_all2': (_fix_all2, [
+        ('scan', 'ProjectAnalyzer.find_files'),
+        ('parse', 'ProjectAnalyzer.analyze_file'),
+        ('typecheck', 'TypeScriptErrorDetector.detect_errors'),
+        ('duplicates', 'ProjectAnalyzer._find_duplicates'),
+        ('cycles', 'ProjectAnalyzer._find_circular_dependencies'),
+        ('suggestions', 'ProjectAnalyzer._generate_optimization_suggestions'),
+    ]),
+}
+
+
+class PhaseTimer:
+    """Accumulates, per phase, the wall time during which any wrapped call runs."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._depth: Dict[str, int] = {}
+        self._since: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, owner, attr: str, phase: str):
+        raw = inspect.getattr_static(owner, attr)
+        if isinstance(raw, (staticmethod, classmethod)):
+            func, rewrap = raw.__func__, type(raw)
+        else:
+            func, rewrap = raw, (lambda f: f)
+        self.totals.setdefault(phase, 0.0)
+        self.calls.setdefault(phase, 0)
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            self._enter(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(phase)
+
+        setattr(owner, attr, rewrap(timed))
+
+    def _enter(self, phase: str):
+        with self._lock:
+            self.calls[phase] += 1
+            if not self._depth.get(phase):
+                self._since[phase] = time.perf_counter()
+            self._depth[phase] = self._depth.get(phase, 0) + 1
+
+    def _exit(self, phase: str):
+        with self._lock:
+            self._depth[phase] -= 1
+            if not self._depth[phase]:
+                self.totals[phase] += time.perf_counter() - self._since[phase]
+
+
+def peak_rss_mb(who=None) -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def retained_mb(root) -> float:
+    """Memory reachable from ``root``: every object counted once, so strings
+    and graphs shared between records are not charged per record."""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, types.ModuleType, types.FunctionType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total / (1024 * 1024)
+
+
+def run_child(name: str, project: Path, scratch: Path) -> Dict:
+    """Run one analyzer in this process and measure it."""
+    setup, phases = ANALYZERS[name]
+    module, entry = setup(project, scratch)
+    timer = PhaseTimer()
+    for phase, target in phases:
+        cls_name, attr = target.split('.')
+        timer.wrap(getattr(module, cls_name), attr, phase)
+
+    t0 = time.perf_counter()
+    entry()
+    wall = time.perf_counter() - t0
+
+    timed = {p: round(s, 4) for p, s in timer.totals.items()}
+    timed['other'] = round(max(0.0, wall - sum(timer.totals.values())), 4)
+    # The per-file records the analyzer keeps once analysis is done
+    records = getattr(getattr(entry, '__self__', None), 'files', None)
+    return {
+        'wall_s': round(wall, 4),
+        'phases': timed,
+        'calls': timer.calls,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'workers_peak_rss_mb': round(peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else 0.0, 1),
+        'records_mb': round(retained_mb(records), 1) if isinstance(records, dict) else None,
+    }
+
+
+# ---------- parent ----------
+def git_state() -> Dict:
+    def git(*args):
+        try:
+            out = subprocess.run(['git', *args], cwd=REPO, capture_output=True, text=True, timeout=30)
+            return out.stdout.strip() if out.returncode == 0 else None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    status = git('status', '--porcelain', '--untracked-files=no')
+    return {'commit': git('rev-parse', '--short', 'HEAD'), 'dirty': bool(status) if status is not None else None}
+
+
+def measure(name: str, project: Path, modules: int, workdir: Path, timeout: float) -> Dict:
+    scratch = Path(tempfile.mkdtemp(prefix=f'{name}-', dir=workdir))
+    out_path = scratch / 'result.json'
+    log_path = workdir / 'logs' / f'{name}-{modules}.log'
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, __file__, '--child', name, '--project', str(project),
+           '--scratch', str(scratch / 'out'), '--result', str(out_path)]
+    with open(log_path, 'w', encoding='utf-8') as log:
+        try:
+            proc = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, timeout=timeout,
+                                  env={**os.environ, 'PYTHONIOENCODING': 'utf-8'})
+        except subprocess.TimeoutExpired:
+            return {'status': 'timeout', 'log': str(log_path)}
+    if proc.returncode != 0 or not out_path.exists():
+        return {'status': 'failed', 'log': str(log_path)}
+    result = json.loads(out_path.read_text(encoding='utf-8'))
+    result['status'] = 'ok'
+    result['files_per_s'] = round(modules / result['wall_s'], 1) if result['wall_s'] else None
+    return result
+
+
+def load_history(path: Path) -> Dict:
+    if path.exists():
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except ValueError:
+            print(f"warning: {path} is not valid JSON; starting a new history", file=sys.stderr)
+    return {'runs': []}
+
+
+def previous_result(history: Dict, result: Dict) -> Optional[Dict]:
+    key = ('analyzer', 'files', 'seed', 'generator_version')
+    for run in reversed(history['runs']):
+        for old in run['results']:
+            if old.get('status') == 'ok' and all(old.get(k) == result.get(k) for k in key):
+                return dict(old, commit=run.get('commit'))
+    return None
+
+
+def _delta(new: float, old: Optional[float]) -> str:
+    if not old:
+        return ''
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def print_results(results: List[Dict], history: Dict):
+    print(f"{'analyzer':<12} {'files':>6} {'wall s':>8} {'vs prev':>8} {'files/s':>9} {'peak MB':>8} "
+          f"{'rec MB':>7} {'vs prev':>8}  slowest phases")
+    for r in results:
+        if r['status'] != 'ok':
+            print(f"{r['analyzer']:<12} {r['files']:>6} {r['status']:>8}  see {r['log']}")
+            continue
+        prev = previous_result(history, r)
+        top = sorted(r['phases'].items(), key=lambda kv: -kv[1])[:3]
+        phases = ', '.join(f"{p} {s:.2f}s" for p, s in top)
+        records = r.get('records_mb')
+        print(f"{r['analyzer']:<12} {r['files']:>6} {r['wall_s']:>8.2f} "
+              f"{_delta(r['wall_s'], prev and prev['wall_s']):>8} {r['files_per_s']:>9} "
+              f"{r['peak_rss_mb']:>8} {records if records is not None else '-':>7} "
+              f"{_delta(records, prev and prev.get('records_mb')) if records else '':>8}  {phases}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analyzers on synthetic projects")
+    parser.add_argument("--files", type=int, nargs="+", default=[1000], help="Project sizes (default: 1000)")
+    parser.add_argument("--analyzers", nargs="+", choices=sorted(ANALYZERS), default=sorted(ANALYZERS),
+                        help="Analyzers to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per analyzer and size; the median is kept")
+    parser.add_argument("--timeout", type=float, default=1800, help="Seconds before a run is abandoned")
+    parser.add_argument("--workdir", default=str(Path.home() / 'analyzer-bench'),
+                        help="Where synthetic projects and run logs live (projects are reused)")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help=f"JSON history (default: {DEFAULT_HISTORY})")
+    parser.add_argument("--no-history", action="store_true", help="Print results without recording them")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--project", help=argparse.SUPPRESS)
+    parser.add_argument("--scratch", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_child(args.child, Path(args.project), Path(args.scratch))
+        Path(args.result).write_text(json.dumps(result), encoding='utf-8')
+        return 0
+
+    workdir = Path(args.workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+    history_path = Path(args.history)
+    history = load_history(history_path)
+
+    results = []
+    for files in args.files:
+        project = workdir / f'synth-{files}-s{args.seed}'
+        t0 = time.perf_counter()
+        manifest = ensure_project(project, SynthConfig(files=files, seed=args.seed))
+        print(f"project {project.name}: {manifest['counts']['modules']} modules "
+              f"({time.perf_counter() - t0:.1f}s to prepare)")
+        for name in args.analyzers:
+            runs = [measure(name, project, manifest['counts']['modules'], workdir, args.timeout)
+                    for _ in range(args.repeat)]
+            ok = [r for r in runs if r['status'] == 'ok']
+            result = sorted(ok, key=lambda r: r['wall_s'])[len(ok) // 2] if ok else runs[-1]
+            if len(ok) > 1:
+                result['wall_s_runs'] = [r['wall_s'] for r in ok]
+                result['wall_s_stdev'] = round(statistics.stdev(result['wall_s_runs']), 4)
+            result.update(analyzer=name, files=manifest['counts']['modules'], seed=args.seed,
+                          generator_version=GENERATOR_VERSION)
+            results.append(result)
+            status = f"{result['wall_s']:.2f}s" if result['status'] == 'ok' else result['status']
+            print(f"  {name:<12} {status}")
+
+    print()
+    print_results(results, history)
+
+    if not args.no_history:
+        history['runs'].append({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            **git_state(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'results': results,
+        })
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        history_path.write_text(json.dumps(history, indent=2), encoding='utf-8')
+        print(f"\nRecorded in {history_path}")
+    return 0 if all(r['status'] == 'ok' for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
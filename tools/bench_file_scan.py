@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark fix_all2's single-read FileSystem.scan_file against the three-read
+path analyze_file used before it (count_lines, safe_read, get_file_hash, each
+opening the file), and check both agree on every file.
+
+The legacy functions are kept here verbatim so the comparison survives the
+old code's removal. The hash cache is cleared between rounds so neither side
+is served from memory.
+
+Usage:
+  python tools/bench_file_scan.py [ROOT] [--repeat 5] [--parse] [--json out.json]
+"""
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from fix_all2 import FileSystem, ImportExportParser  # noqa: E402
+
+EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build'}
+
+
+def legacy_count_lines(file_path: Path):
+    content = FileSystem.safe_read(file_path)
+    if not content:
+        return 0, 0, 0, 0
+    lines = content.split('\n')
+    total = len(lines)
+    sloc = comments = blanks = 0
+    in_block_comment = False
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blanks += 1
+            continue
+        if '/*' in line and '*/' in line:
+            comments += 1
+            before_comment, after_comment = line.split('/*', 1)
+            after_comment = after_comment.split('*/', 1)[-1]
+            if before_comment.strip() or after_comment.strip():
+                sloc += 1
+            continue
+        elif '/*' in line:
+            in_block_comment = True
+            comments += 1
+            if line.split('/*')[0].strip():
+                sloc += 1
+            continue
+        elif '*/' in line:
+            in_block_comment = False
+            comments += 1
+            if line.split('*/')[-1].strip():
+                sloc += 1
+            continue
+        if in_block_comment:
+            comments += 1
+            continue
+        if stripped.startswith('//'):
+            comments += 1
+            continue
+        if '//' in line:
+            if line.split('//')[0].strip():
+                sloc += 1
+            comments += 1
+            continue
+        sloc += 1
+    return total, sloc, comments, blanks
+
+
+def legacy_read(file_path: Path, parse: bool):
+    counts = legacy_count_lines(file_path)
+    content = FileSystem.safe_read(file_path)
+    if parse:
+        ImportExportParser.parse_imports(content)
+        ImportExportParser.parse_exports(content)
+    file_hash = FileSystem.get_file_hash(file_path)
+    content_hash = hashlib.md5(content.encode()).hexdigest() if content else ""
+    return counts, file_hash, content_hash, content
+
+
+def fused_read(file_path: Path, parse: bool):
+    scan = FileSystem.scan_file(file_path)
+    if parse:
+        ImportExportParser.parse_imports(scan.content)
+        ImportExportParser.parse_exports(scan.content)
+    return ((scan.total_lines, scan.sloc, scan.comments, scan.blanks),
+            scan.hash, scan.content_hash, scan.content)
+
+
+def collect(root: Path):
+    files = []
+    for path in root.rglob('*'):
+        if path.suffix in EXTENSIONS and path.is_file() and not SKIP_DIRS.intersection(path.parts):
+            files.append(path)
+    return sorted(files)
+
+
+def time_round(reader, files, parse: bool) -> float:
+    FileSystem._cache.clear()
+    t0 = time.perf_counter()
+    for path in files:
+        reader(path, parse)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fused file scanning against the three-read path")
+    parser.add_argument("root", nargs="?", default=str(Path(__file__).resolve().parent.parent),
+                        help="Directory to scan (default: repository root)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds per reader (default: 5)")
+    parser.add_argument("--parse", action="store_true", help="Include import/export parsing in the timing")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    files = collect(Path(args.root))
+    if not files:
+        print(f"No source files under {args.root}")
+        return 1
+    total_bytes = sum(p.stat().st_size for p in files)
+
+    mismatches = []
+    FileSystem._cache.clear()
+    for path in files:
+        if legacy_read(path, False) != fused_read(path, False):
+            mismatches.append(str(path))
+
+    legacy = [time_round(legacy_read, files, args.parse) for _ in range(args.repeat)]
+    fused = [time_round(fused_read, files, args.parse) for _ in range(args.repeat)]
+    legacy_s, fused_s = statistics.median(legacy), statistics.median(fused)
+
+    print(f"{len(files)} files, {total_bytes / 1e6:.1f} MB{' (with parsing)' if args.parse else ''}")
+    print(f"{'three reads':<14} {legacy_s * 1000:>9.1f} ms  {total_bytes / 1e6 / legacy_s:>7.1f} MB/s")
+    print(f"{'scan_file':<14} {fused_s * 1000:>9.1f} ms  {total_bytes / 1e6 / fused_s:>7.1f} MB/s")
+    print(f"speedup {legacy_s / fused_s:.2f}x; {len(mismatches)} file(s) disagree")
+    for path in mismatches[:10]:
+        print(f"  mismatch: {path}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'files': len(files), 'bytes': total_bytes, 'parse': args.parse,
+            'legacy_ms': round(legacy_s * 1000, 2), 'fused_ms': round(fused_s * 1000, 2),
+            'mismatches': mismatches,
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark project_analyzer memory and merge-analysis time.
+
+Each mode runs in its own child process so peak RSS is not shared:
+  legacy  - scan, then hold every file's text (what FileInfo.content used to keep)
+            and compare similar-named files character by character
+  lines   - content-free scan, line-hash similarity backend (default)
+
+Usage:
+  python tools/bench_project_analyzer.py [src] [--json out.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+from project_analyzer import ProjectAnalyzer, LineHashIndex  # noqa: E402
+
+MODES = ('legacy', 'lines')
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_mode(path: str, mode: str) -> dict:
+    analyzer = ProjectAnalyzer(path, similarity='chars' if mode == 'legacy' else 'lines', use_snapshot=False)
+    t0 = time.perf_counter()
+    file_infos = analyzer._scan_project()
+    scan_s = time.perf_counter() - t0
+
+    held = []
+    if mode == 'legacy':
+        held = [LineHashIndex.read(f) for f in file_infos]
+
+    analyzer._build_dependency_graph(file_infos)
+    similar = analyzer._find_similar_files()
+    t0 = time.perf_counter()
+    merges = analyzer._analyze_merge_candidates(similar)
+    merge_s = time.perf_counter() - t0
+
+    return {
+        'mode': mode,
+        'files': len(file_infos),
+        'similar_groups': len(similar),
+        'comparisons': sum(len(m['comparisons']) for m in merges),
+        'scan_s': round(scan_s, 3),
+        'merge_s': round(merge_s, 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'content_mb_held': round(sum(len(c) for c in held) / (1024 * 1024), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark project_analyzer scan memory and merge time")
+    parser.add_argument("path", nargs="?", default="src", help="Tree to analyze (default: src)")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.path, args.mode)))
+        return 0
+
+    results = []
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, __file__, args.path, '--mode', mode],
+            capture_output=True, text=True, env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},
+        )
+        if out.returncode != 0:
+            print(out.stderr, file=sys.stderr)
+            return 1
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f"{'mode':<8} {'files':>6} {'pairs':>6} {'scan s':>8} {'merge s':>8} {'peak MB':>8} {'held MB':>8}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['files']:>6} {r['comparisons']:>6} {r['scan_s']:>8} "
+              f"{r['merge_s']:>8} {r['peak_rss_mb']:>8} {r['content_mb_held']:>8}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark ProjectScanner's per-file extractors in main-fixer-9.v3.
+
+Every scannable file is read once up front; each extractor is then timed
+over the whole corpus so the table shows where _analyze_file spends its
+time. The 'legacy counts' row reproduces the five separate findall() passes
+that _count_declarations replaced.
+
+Usage:
+  python tools/bench_scanner_extractors.py [src] [--repeat N] [--json out.json]
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+SCANNER = Path(__file__).parent / 'main-fixer-9.v3.py'
+
+LEGACY_COUNT_PATTERNS = [
+    r':\s*any\b', r'\binterface\s+\w+', r'\btype\s+\w+\s*=',
+    r'\bfunction\s+\w+', r'\bclass\s+\w+',
+]
+
+
+def load_scanner():
+    spec = importlib.util.spec_from_file_location('main_fixer', SCANNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _QuietLogger:
+    def info(self, *args, **kwargs):
+        pass
+
+    warning = error = debug = info
+
+
+def collect(mf, scanner) -> list:
+    """[(path, content)] for every file scan() would analyze"""
+    corpus = []
+    for root, dirs, files in os.walk(scanner.scope):
+        dirs[:] = [d for d in dirs if not scanner.should_ignore(Path(root) / d)]
+        for name in files:
+            path = Path(root) / name
+            if scanner.should_ignore(path) or path.suffix not in mf.FILE_EXTENSIONS:
+                continue
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                corpus.append((path, f.read()))
+    return corpus
+
+
+def extractors(scanner) -> dict:
+    """name -> callable(path, content)"""
+    legacy = [re.compile(p) for p in LEGACY_COUNT_PATTERNS]
+    return {
+        'stat': lambda p, c: p.stat(),
+        'content hash': lambda p, c: hashlib.sha256(c.encode('utf-8')).hexdigest(),
+        'structural hash': lambda p, c: scanner._compute_structural_hash(c),
+        'exports': lambda p, c: scanner._extract_exports(c),
+        'imports': lambda p, c: scanner._extract_imports(c),
+        'classify': lambda p, c: scanner._classify_file(p, c),
+        'declaration counts': lambda p, c: scanner._count_declarations(c),
+        'legacy counts': lambda p, c: [len(r.findall(c)) for r in legacy],
+        'complexity': lambda p, c: scanner._compute_complexity(c),
+        'react component': lambda p, c: scanner._detect_react_component(c),
+        'custom hook': lambda p, c: scanner._detect_custom_hook(p.name, c),
+        'dynamic import': lambda p, c: scanner._detect_dynamic_import(c),
+        'side effects': lambda p, c: scanner._detect_side_effects(c),
+        'hook usage': lambda p, c: scanner._extract_hook_usage(c),
+        'component info': lambda p, c: scanner._extract_component_info(p, c),
+        'fused facts': lambda p, c: scanner._extract_facts(p, c),
+    }
+
+
+def time_extractor(fn, corpus, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for path, content in corpus:
+            fn(path, content)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each ProjectScanner extractor over a tree")
+    parser.add_argument("path", nargs="?", default="src", help="Tree to scan (default: src)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per extractor, best is kept (default: 3)")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    mf = load_scanner()
+    scanner = mf.ProjectScanner(args.path, _QuietLogger())
+    corpus = collect(mf, scanner)
+    total_mb = sum(len(c) for _, c in corpus) / (1024 * 1024)
+    print(f"{len(corpus)} files, {total_mb:.1f} MB, best of {args.repeat}\n")
+
+    results = []
+    for name, fn in extractors(scanner).items():
+        seconds = time_extractor(fn, corpus, args.repeat)
+        results.append({
+            'extractor': name,
+            'seconds': round(seconds, 4),
+            'us_per_file': round(seconds / max(len(corpus), 1) * 1e6, 1),
+            'mb_per_s': round(total_mb / seconds, 1) if seconds else 0.0,
+        })
+
+    print(f"{'extractor':<20} {'total s':>8} {'us/file':>9} {'MB/s':>8}")
+    for r in sorted(results, key=lambda r: r['seconds'], reverse=True):
+        print(f"{r['extractor']:<20} {r['seconds']:>8} {r['us_per_file']:>9} {r['mb_per_s']:>8}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'files': len(corpus), 'mb': round(total_mb, 2), 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark fix_all2 web UI API request latency on a synthetic report.
+
+Builds a ProjectReport with N files and M TypeScript errors, serves it with
+WebUIHandler on a loopback port and times each request, compared with the
+old handlers' per-request json.dumps of the whole view ("legacy", timed
+in-process, so it excludes HTTP overhead and flatters the old code).
+
+Usage:
+  python tools/bench_webui_api.py [--files 10000] [--errors 50000] [--json out.json]
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from fix_all2 import FileInfo, ProjectReport, TypeScriptError, WebUIHandler  # noqa: E402
+
+CODES = ('TS2304', 'TS7006', 'TS2339', 'TS2322', 'TS2345', 'TS2531', 'TS2532', 'TS2552')
+
+REQUESTS = (
+    ('files, first page', '/api/files'),
+    ('files, sorted by loc desc', '/api/files?sort=-loc&page=3'),
+    ('files, has_errors + q', '/api/files?has_errors=1&q=components'),
+    ('errors, first page', '/api/errors'),
+    ('errors, code filter', '/api/errors?code=TS2304,TS2552&sort=file'),
+    ('errors, message search', '/api/errors?q=implicitly&page=2&page_size=500'),
+    ('full report', '/api/report'),
+)
+
+
+def build_report(n_files: int, n_errors: int, seed: int = 7) -> ProjectReport:
+    rng = random.Random(seed)
+    report = ProjectReport(root_path='/bench')
+    dirs = ('components', 'hooks', 'services', 'utils', 'stores', 'pages')
+    paths = [f"src/{rng.choice(dirs)}/module_{i}.tsx" for i in range(n_files)]
+    for path in paths:
+        report.files[path] = FileInfo(path=path, size=rng.randint(200, 40000), loc=rng.randint(10, 1500),
+                                      is_core=rng.random() < 0.02, is_large_file=rng.random() < 0.05)
+    for _ in range(n_errors):
+        path = rng.choice(paths)
+        code = rng.choice(CODES)
+        report.files[path].errors.append(TypeScriptError(
+            file_path=path, line_number=rng.randint(1, 1500), column=rng.randint(1, 80), error_code=code,
+            message=f"{code}: Parameter 'arg{rng.randint(0, 99)}' implicitly has an 'any' type.",
+            is_fixable=code in ('TS2304', 'TS7006')))
+    return report
+
+
+def legacy_latency(report: ProjectReport, path: str) -> float:
+    """What the old handlers did on every request: rebuild and dump the whole view."""
+    t0 = time.perf_counter()
+    if path.startswith('/api/report'):
+        json.dumps(report.to_dict())
+    elif path.startswith('/api/files'):
+        json.dumps([{'path': p, 'size': i.size, 'loc': i.loc, 'errors': len(i.errors),
+                     'warnings': len(i.warnings), 'is_core': i.is_core, 'is_large': i.is_large_file}
+                    for p, i in report.files.items()])
+    else:
+        json.dumps([{'file': p, 'line': e.line_number, 'column': e.column, 'code': e.error_code,
+                     'message': e.message, 'severity': e.severity, 'fixable': e.is_fixable}
+                    for p, i in report.files.items() for e in i.errors])
+    return time.perf_counter() - t0
+
+
+def fetch(conn: http.client.HTTPConnection, path: str, etag: str = None):
+    headers = {'Accept-Encoding': 'gzip'}
+    if etag:
+        headers['If-None-Match'] = etag
+    t0 = time.perf_counter()
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    return time.perf_counter() - t0, response.status, response.getheader('ETag'), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fix_all2 web UI API latency")
+    parser.add_argument("--files", type=int, default=10000, help="Synthetic files (default: 10000)")
+    parser.add_argument("--errors", type=int, default=50000, help="Synthetic errors (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=20, help="Warm requests per endpoint (default: 20)")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    report = build_report(args.files, args.errors)
+    t0 = time.perf_counter()
+    WebUIHandler.set_report(report)
+    build_s = time.perf_counter() - t0
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), WebUIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    results = []
+    try:
+        for label, path in REQUESTS:
+            conn = http.client.HTTPConnection('127.0.0.1', port)
+            cold_s, status, etag, size = fetch(conn, path)
+            conn.close()
+            warm = []
+            for _ in range(args.repeat):
+                conn = http.client.HTTPConnection('127.0.0.1', port)
+                warm.append(fetch(conn, path)[0])
+                conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port)
+            revalidate_s, revalidate_status, _, _ = fetch(conn, path, etag)
+            conn.close()
+            results.append({
+                'request': label,
+                'path': path,
+                'status': status,
+                'gzip_bytes': size,
+                'cold_ms': round(cold_s * 1000, 2),
+                'warm_median_ms': round(statistics.median(warm) * 1000, 2),
+                'revalidate_ms': round(revalidate_s * 1000, 2),
+                'revalidate_status': revalidate_status,
+                'legacy_ms': round(legacy_latency(report, path) * 1000, 2),
+            })
+    finally:
+        server.shutdown()
+
+    print(f"{args.files} files, {args.errors} errors; API views built in {build_s:.2f}s")
+    print(f"{'request':<28} {'cold ms':>9} {'warm ms':>9} {'304 ms':>8} {'legacy ms':>10} {'gzip KB':>9}")
+    for r in results:
+        print(f"{r['request']:<28} {r['cold_ms']:>9} {r['warm_median_ms']:>9} {r['revalidate_ms']:>8} "
+              f"{r['legacy_ms']:>10} {r['gzip_bytes'] / 1024:>9.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({'files': args.files, 'errors': args.errors,
+                                               'build_s': round(build_s, 3), 'results': results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Compact graph — an immutable import graph over integer ids, shared by the
+analyzers (g_studio_intelligence_v10.py, Debugger/gstudio_analyzer-9.py).
+
+  g = CompactGraph.from_adjacency(files, {"App.tsx": ["components/Button.tsx"]})
+  i = g.id_of("App.tsx")
+  g.successors(i)                      # ids App.tsx imports
+  g.paths_of(g.closure(i))             # everything App.tsx pulls in, as paths
+  g.strongly_connected_components()    # import cycles, as id lists
+
+Paths are interned once; forward and reverse adjacency are CSR arrays
+(offsets + targets in array('i')), so traversals touch small ints instead of
+hashing path strings. Convert back to paths only when reporting.
+
+Per-file closures kept on records should be PathSets (g.closure_set(i)): a
+sorted id array over the graph's path table, 4 bytes per member, that reads
+as a set of paths.
+"""
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Set as AbstractSet
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+class CompactGraph:
+    __slots__ = ('paths', 'index', 'fwd_offsets', 'fwd_targets', 'rev_offsets', 'rev_targets')
+
+    def __init__(self, paths: List[str], fwd_offsets: array, fwd_targets: array,
+                 rev_offsets: array, rev_targets: array):
+        self.paths = paths
+        self.index: Dict[str, int] = {p: i for i, p in enumerate(paths)}
+        self.fwd_offsets = fwd_offsets
+        self.fwd_targets = fwd_targets
+        self.rev_offsets = rev_offsets
+        self.rev_targets = rev_targets
+
+    @classmethod
+    def from_adjacency(cls, nodes: Iterable[str],
+                       adjacency: Mapping[str, Iterable[str]]) -> 'CompactGraph':
+        """Intern ``nodes`` in order and keep the edges between them.
+
+        Edges to or from unknown paths are dropped; duplicate edges collapse.
+        """
+        paths = list(dict.fromkeys(nodes))
+        index = {p: i for i, p in enumerate(paths)}
+        n = len(paths)
+
+        fwd_offsets = array('i', [0])
+        fwd_targets = array('i')
+        in_degree = [0] * n
+        for path in paths:
+            row = sorted({index[t] for t in adjacency.get(path, ()) if t in index})
+            fwd_targets.extend(row)
+            fwd_offsets.append(len(fwd_targets))
+            for target in row:
+                in_degree[target] += 1
+
+        # Counting sort of the forward edges by target gives the reverse CSR,
+        # with each row's sources in ascending order.
+        rev_offsets = array('i', [0] * (n + 1))
+        for i in range(n):
+            rev_offsets[i + 1] = rev_offsets[i] + in_degree[i]
+        rev_targets = array('i', [0] * len(fwd_targets))
+        cursor = list(rev_offsets[:n])
+        for src in range(n):
+            for pos in range(fwd_offsets[src], fwd_offsets[src + 1]):
+                target = fwd_targets[pos]
+                rev_targets[cursor[target]] = src
+                cursor[target] += 1
+
+        return cls(paths, fwd_offsets, fwd_targets, rev_offsets, rev_targets)
+
+    # ---------- ids <-> paths ----------
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.fwd_targets)
+
+    def id_of(self, path: str) -> Optional[int]:
+        return self.index.get(path)
+
+    def path_of(self, node: int) -> str:
+        return self.paths[node]
+
+    def paths_of(self, nodes: Iterable[int]) -> List[str]:
+        paths = self.paths
+        return [paths[i] for i in nodes]
+
+    def to_adjacency(self) -> Dict[str, List[str]]:
+        """Forward edges keyed by path, omitting files with no imports."""
+        return {self.paths[i]: self.paths_of(self.successors(i))
+                for i in range(len(self.paths)) if self.out_degree(i)}
+
+    # ---------- adjacency ----------
+    def successors(self, node: int) -> Sequence[int]:
+        return self.fwd_targets[self.fwd_offsets[node]:self.fwd_offsets[node + 1]]
+
+    def predecessors(self, node: int) -> Sequence[int]:
+        return self.rev_targets[self.rev_offsets[node]:self.rev_offsets[node + 1]]
+
+    def out_degree(self, node: int) -> int:
+        return self.fwd_offsets[node + 1] - self.fwd_offsets[node]
+
+    def in_degree(self, node: int) -> int:
+        return self.rev_offsets[node + 1] - self.rev_offsets[node]
+
+    # ---------- traversals ----------
+    def reachable(self, sources: Iterable[int], reverse: bool = False) -> bytearray:
+        """Multi-source BFS; returns a mask with 1 for every reached id
+        (sources included). ``reverse`` walks importers instead of imports."""
+        offsets, targets = self._csr(reverse)
+        seen = bytearray(len(self.paths))
+        queue = deque()
+        for s in sources:
+            if not seen[s]:
+                seen[s] = 1
+                queue.append(s)
+        while queue:
+            node = queue.popleft()
+            for pos in range(offsets[node], offsets[node + 1]):
+                nxt = targets[pos]
+                if not seen[nxt]:
+                    seen[nxt] = 1
+                    queue.append(nxt)
+        return seen
+
+    def closure(self, node: int, reverse: bool = False) -> List[int]:
+        """Ids transitively reachable from ``node``, excluding ``node``."""
+        seen = self.reachable((node,), reverse)
+        seen[node] = 0
+        return [i for i, hit in enumerate(seen) if hit]
+
+    def closure_set(self, node: int, reverse: bool = False) -> 'PathSet':
+        """``closure`` as a compact, read-only set of paths."""
+        return PathSet(self, self.closure(node, reverse))
+
+    def weak_components(self, mask: Sequence[int]) -> List[List[int]]:
+        """Connected components of the subgraph induced by ids with a truthy
+        ``mask`` entry, ignoring edge direction."""
+        seen = bytearray(len(self.paths))
+        components = []
+        for root in range(len(self.paths)):
+            if seen[root] or not mask[root]:
+                continue
+            seen[root] = 1
+            component = [root]
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                for neighbours in (self.successors(node), self.predecessors(node)):
+                    for nxt in neighbours:
+                        if mask[nxt] and not seen[nxt]:
+                            seen[nxt] = 1
+                            component.append(nxt)
+                            stack.append(nxt)
+            components.append(component)
+        return components
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan's algorithm, iterative so deep import chains cannot hit the
+        recursion limit. Components come out in reverse topological order."""
+        offsets, targets = self.fwd_offsets, self.fwd_targets
+        n = len(self.paths)
+        order = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, offsets[root])]
+            while work:
+                node, pos = work[-1]
+                if pos < offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    nxt = targets[pos]
+                    if order[nxt] == -1:
+                        order[nxt] = low[nxt] = counter
+                        counter += 1
+                        stack.append(nxt)
+                        on_stack[nxt] = 1
+                        work.append((nxt, offsets[nxt]))
+                    elif on_stack[nxt] and order[nxt] < low[node]:
+                        low[node] = order[nxt]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def topological_order(self) -> List[int]:
+        """Kahn's algorithm over imports; files on cycles are left out."""
+        in_degree = [self.in_degree(i) for i in range(len(self.paths))]
+        queue = deque(i for i, d in enumerate(in_degree) if d == 0)
+        result = []
+        while queue:
+            node = queue.popleft()
+            result.append(node)
+            for nxt in self.successors(node):
+                in_degree[nxt] -= 1
+                if in_degree[nxt] == 0:
+                    queue.append(nxt)
+        return result
+
+    def _csr(self, reverse: bool):
+        if reverse:
+            return self.rev_offsets, self.rev_targets
+        return self.fwd_offsets, self.fwd_targets
+
+
+class PathSet(AbstractSet):
+    """Read-only set of paths stored as sorted ids into a CompactGraph.
+
+    Membership is a bisect, iteration yields paths in id order. Copies return
+    the same object and pickling produces a plain set, so records holding one
+    go through asdict() and the caches unchanged.
+    """
+    __slots__ = ('graph', 'ids')
+
+    def __init__(self, graph: CompactGraph, ids: Iterable[int]):
+        self.graph = graph
+        self.ids = array('i', sorted(ids))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        paths = self.graph.paths
+        return (paths[i] for i in self.ids)
+
+    def __contains__(self, path) -> bool:
+        node = self.graph.index.get(path)
+        if node is None:
+            return False
+        pos = bisect_left(self.ids, node)
+        return pos < len(self.ids) and self.ids[pos] == node
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)  # results of &, |, - are ordinary sets
+
+    def __copy__(self) -> 'PathSet':
+        return self
+
+    def __deepcopy__(self, memo) -> 'PathSet':
+        return self
+
+    def __reduce__(self):
+        return set, (list(self),)
+
+    def __repr__(self) -> str:
+        return f"PathSet({len(self.ids)} paths)"
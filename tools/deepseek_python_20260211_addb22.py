@@ -27,7 +27,14 @@ from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Set, Tuple, Optional, Any, DefaultDict
 from enum import Enum
 import html
-from difflib import SequenceMatcher
+
+# Shared with the other analyzers; found next to this file even when it is
+# loaded by path (workflow/go.py) rather than run from tools/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    from structural_tokens import file_structural_hash, similarity as token_similarity, tokenize
+finally:
+    sys.path.pop(0)
 
 # ============================================================================
 # ENUMERATIONS
@@ -608,7 +615,7 @@ class SafeRefactorAnalyzer:
                     last_modified=stat.st_mtime,
                     category=category,
                     content_hash=hashlib.sha256(content.encode()).hexdigest(),
-                    structural_hash=self._compute_structural_hash(content),
+                    structural_hash=self._compute_structural_hash(file_path, content),
                     is_dynamic_imported=bool(re.search(r'import\(|React\.lazy\(|require\(', content)),
                     is_test_file=bool(re.search(r'\.(spec|test)\.', file_path.name)),
                     barrel_exported=self._check_barrel_export(file_path, content)
@@ -687,28 +694,10 @@ class SafeRefactorAnalyzer:
                     continue
         return False
     
-    def _compute_structural_hash(self, content: str) -> str:
-        """Compute structural hash for similarity detection"""
-        normalized = self._normalize_content_for_comparison(content)
-        return hashlib.sha256(normalized.encode()).hexdigest()
-    
-    def _normalize_content_for_comparison(self, content: str) -> str:
-        """Normalize content for structural comparison"""
-        # Remove comments
-        normalized = re.sub(r'//.*$', '', content, flags=re.MULTILINE)
-        normalized = re.sub(r'/\*.*?\*/', '', normalized, flags=re.DOTALL)
-        
-        # Normalize strings and numbers
-        normalized = re.sub(r'[\'"`].*?[\'"`]', '__STR__', normalized)
-        normalized = re.sub(r'\b\d+\.?\d*\b', '__NUM__', normalized)
-        
-        # Normalize identifiers
-        normalized = re.sub(r'\b(const|let|var)\s+\w+', r'\1 __VAR__', normalized)
-        normalized = re.sub(r'function\s+\w+', 'function __FUNC__', normalized)
-        
-        # Preserve structure
-        normalized = re.sub(r'\s+', ' ', normalized)
-        return normalized.strip()
+    def _compute_structural_hash(self, file_path: Path, content: str) -> str:
+        """Compute structural hash for similarity detection (token stream for
+        JS/TS, normalized text otherwise; see structural_tokens)"""
+        return file_structural_hash(file_path.name, content)
     
     def _extract_exports(self, content: str) -> List[str]:
         """Extract exported symbols"""
@@ -1039,89 +1028,21 @@ class SafeRefactorAnalyzer:
     def _compute_structural_similarity(self, file_a: str, file_b: str) -> float:
         """Compute structural similarity between two files"""
         try:
-            content_a = (self.root / file_a).read_text(encoding='utf-8', errors='ignore')
-            content_b = (self.root / file_b).read_text(encoding='utf-8', errors='ignore')
-            
-            # Normalize
-            norm_a = self._normalize_content_for_similarity(content_a)
-            norm_b = self._normalize_content_for_similarity(content_b)
+            tokens_a = tokenize((self.root / file_a).read_text(encoding='utf-8', errors='ignore'))
+            tokens_b = tokenize((self.root / file_b).read_text(encoding='utf-8', errors='ignore'))
             
             # Early return for very different sizes
-            size_ratio = min(len(norm_a), len(norm_b)) / max(len(norm_a), len(norm_b), 1)
+            size_ratio = min(len(tokens_a), len(tokens_b)) / max(len(tokens_a), len(tokens_b), 1)
             if size_ratio < 0.3:
                 return 0.0
             
-            # Sequence similarity
-            sequence_ratio = SequenceMatcher(None, norm_a, norm_b).ratio()
-            
-            # Token Jaccard similarity
-            tokens_a = self._extract_structural_tokens(content_a)
-            tokens_b = self._extract_structural_tokens(content_b)
-            
-            jaccard_ratio = 0.0
-            if tokens_a and tokens_b:
-                set_a = set(tokens_a)
-                set_b = set(tokens_b)
-                if set_a and set_b:
-                    jaccard_ratio = len(set_a.intersection(set_b)) / len(set_a.union(set_b))
-            
-            # Weighted combination
-            similarity = (0.6 * sequence_ratio) + (0.4 * jaccard_ratio)
-            
-            return min(similarity, 1.0)
+            # 0.6 token-sequence ratio + 0.4 shingle Jaccard
+            return token_similarity(tokens_a, tokens_b)
             
         except Exception as e:
             self._log("WARNING", f"Could not compute similarity for {file_a} vs {file_b}: {str(e)}")
             return 0.0
     
-    def _normalize_content_for_similarity(self, content: str) -> str:
-        """Advanced normalization for similarity detection"""
-        normalized = content
-        
-        # Remove comments
-        normalized = re.sub(r'//.*$', '', normalized, flags=re.MULTILINE)
-        normalized = re.sub(r'/\*.*?\*/', '', normalized, flags=re.DOTALL)
-        normalized = re.sub(r'\{/\*.*?\*/\}', '', normalized, flags=re.DOTALL)
-        
-        # Normalize strings and numbers
-        normalized = re.sub(r'[\'"`].*?[\'"`]', '__STR__', normalized)
-        normalized = re.sub(r'\b\d+\.?\d*\b', '__NUM__', normalized)
-        
-        # Normalize identifiers
-        normalized = re.sub(r'\b(const|let|var)\s+\w+', r'\1 __VAR__', normalized)
-        normalized = re.sub(r'function\s+\w+', 'function __FUNC__', normalized)
-        normalized = re.sub(r'\((\s*\w+\s*,?\s*)+\)', '(__PARAMS__)', normalized)
-        
-        # Preserve structure
-        normalized = re.sub(r'\s+', ' ', normalized)
-        normalized = re.sub(r'\n\s*\n', '\n', normalized)
-        
-        return normalized.strip()
-    
-    def _extract_structural_tokens(self, content: str) -> List[str]:
-        """Extract structural tokens"""
-        tokens = []
-        
-        # Functions and classes
-        func_matches = re.findall(r'(?:function|const|let|var)\s+(\w+)\s*[=(]', content)
-        tokens.extend(func_matches)
-        
-        class_matches = re.findall(r'class\s+(\w+)', content)
-        tokens.extend(class_matches)
-        
-        # Imports and exports
-        import_matches = re.findall(r'import\s+.*from\s+[\'"]([^\'"]+)[\'"]', content)
-        tokens.extend([f"import:{imp}" for imp in import_matches])
-        
-        export_matches = re.findall(r'export\s+(?:default\s+)?(?:class|function|const|let|var)\s+(\w+)', content)
-        tokens.extend([f"export:{exp}" for exp in export_matches])
-        
-        # Hooks
-        hook_matches = re.findall(r'\b(use[A-Z][A-Za-z]*)\b', content)
-        tokens.extend([f"hook:{hook}" for hook in hook_matches])
-        
-        return tokens
-    
     def _are_files_in_same_exact_cluster(self, file_a: str, file_b: str) -> bool:
         """Check if files are in same exact cluster"""
         for cluster in self.duplicate_clusters:
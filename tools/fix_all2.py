@@ -13,6 +13,7 @@ import shutil
 import argparse
 import sys
 import hashlib
+import gzip
 import time
 import webbrowser
 import subprocess
@@ -21,6 +22,8 @@ import fnmatch
 import difflib
 import textwrap
 import zipfile
+import zlib
+import bisect
 import tempfile
 import threading
 import socket
@@ -29,7 +32,7 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Set, Optional, Any, Union, Callable
 from dataclasses import dataclass, field, asdict, is_dataclass
 from datetime import datetime
-from collections import defaultdict, Counter, deque
+from collections import defaultdict, Counter, deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from threading import Lock, RLock, Semaphore
 from html import escape
@@ -317,6 +320,32 @@ class FileMetrics:
     class_cohesion: float = 0.0
     dependency_count: int = 0
 
+@dataclass
+class FileScan:
+    """Everything one read of a file yields: see FileSystem.scan_file"""
+    content: str
+    size: int
+    mtime: float
+    hash: str
+    content_hash: str
+    total_lines: int
+    sloc: int
+    comments: int
+    blanks: int
+    encoding: str = "utf-8"
+    _line_offsets: Optional[List[int]] = field(default=None, repr=False)
+    
+    @property
+    def line_offsets(self) -> List[int]:
+        """Offset in ``content`` where each line starts, built on first use"""
+        if self._line_offsets is None:
+            self._line_offsets = [0] + [m.end() for m in re.finditer('\n', self.content)]
+        return self._line_offsets
+    
+    def line_at(self, offset: int) -> int:
+        """1-based line number containing ``content[offset]``"""
+        return bisect.bisect_right(self.line_offsets, offset)
+
 @dataclass
 class FileInfo:
     """Complete file information with all analysis data"""
@@ -618,8 +647,7 @@ class Logger:
         INFO: "ℹ",
         WARNING: "⚠",
         ERROR: "✗",
-        CRITICAL: "💥",
-        SUCCESS: "✓"
+        CRITICAL: "💥"
     }
     
     @classmethod
@@ -848,94 +876,151 @@ class FileSystem:
                     hasher.update(chunk)
             
             hash_value = hasher.hexdigest()
-            
-            with FileSystem._cache_lock:
-                # Manage cache size
-                if len(FileSystem._cache) >= FileSystem._cache_size:
-                    # Remove oldest (simple FIFO)
-                    keys = list(FileSystem._cache.keys())
-                    for k in keys[:FileSystem._cache_size // 2]:
-                        del FileSystem._cache[k]
-                FileSystem._cache[cache_key] = hash_value
-            
+            FileSystem._cache_hash(cache_key, hash_value)
             return hash_value
         except Exception:
             return ""
     
     @staticmethod
-    def count_lines(file_path: Path) -> Tuple[int, int, int, int]:
-        """Count lines of code, source lines, comments, and blanks"""
+    def _cache_hash(cache_key: str, hash_value: str):
+        with FileSystem._cache_lock:
+            # Manage cache size
+            if len(FileSystem._cache) >= FileSystem._cache_size:
+                # Remove oldest (simple FIFO)
+                keys = list(FileSystem._cache.keys())
+                for k in keys[:FileSystem._cache_size // 2]:
+                    del FileSystem._cache[k]
+            FileSystem._cache[cache_key] = hash_value
+    
+    @staticmethod
+    def scan_file(file_path: Path, method: str = "md5") -> Optional[FileScan]:
+        """Read a file once and derive its text, hash, size and line counts.
+        
+        Replaces count_lines + safe_read + get_file_hash, which read the file
+        three times. Lines are counted on the raw bytes, so the text is only
+        decoded once, for the parser. Returns None if the file can't be read.
+        """
         try:
-            content = FileSystem.safe_read(file_path)
-            if not content:
-                return 0, 0, 0, 0
-            
-            lines = content.split('\n')
-            total = len(lines)
-            sloc = 0
-            comments = 0
-            blanks = 0
-            in_block_comment = False
-            in_string = False
-            string_char = None
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                # Skip empty lines
-                if not stripped:
-                    blanks += 1
-                    continue
-                
-                # Handle block comments
-                if '/*' in line and '*/' in line:
-                    comments += 1
-                    # Check if there's code after the comment
-                    before_comment, after_comment = line.split('/*', 1)
-                    after_comment = after_comment.split('*/', 1)[-1]
-                    if before_comment.strip() or after_comment.strip():
-                        sloc += 1
-                    continue
-                elif '/*' in line:
-                    in_block_comment = True
-                    comments += 1
-                    # Check if there's code before the comment
-                    before_comment = line.split('/*')[0]
-                    if before_comment.strip():
-                        sloc += 1
-                    continue
-                elif '*/' in line:
-                    in_block_comment = False
-                    comments += 1
-                    # Check if there's code after the comment
-                    after_comment = line.split('*/')[-1]
-                    if after_comment.strip():
-                        sloc += 1
-                    continue
-                
-                if in_block_comment:
-                    comments += 1
-                    continue
-                
-                # Skip single-line comments
-                if stripped.startswith('//'):
-                    comments += 1
-                    continue
-                
-                # Count inline comments
-                if '//' in line:
-                    code_part = line.split('//')[0]
-                    if code_part.strip():
-                        sloc += 1
-                    comments += 1
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                mtime = os.fstat(f.fileno()).st_mtime
+        except OSError as e:
+            Logger.debug(f"Failed to read {file_path}: {e}")
+            return None
+        
+        hasher = hashlib.new(method if method in ("md5", "sha1", "sha256") else "md5", data)
+        hash_value = hasher.hexdigest()
+        FileSystem._cache_hash(f"{file_path}:{method}", hash_value)
+        
+        # Same decoding as safe_read, including its newline translation
+        encoding = "utf-8"
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            for encoding in ["utf-8-sig", "latin-1", "cp1252"]:
+                try:
+                    content = data.decode(encoding)
+                    break
+                except UnicodeDecodeError:
                     continue
-                
-                # If we got here, it's source code
-                sloc += 1
-            
-            return total, sloc, comments, blanks
-        except Exception:
+        translated = b'\r' in data
+        if translated:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        if not content:
+            content_hash = ""
+        elif encoding == "utf-8" and not translated and hasher.name == "md5":
+            content_hash = hash_value
+        else:
+            content_hash = hashlib.md5(content.encode()).hexdigest()
+        
+        size = len(data)
+        if translated:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        total, sloc, comments, blanks = FileSystem._count_line_bytes(data)
+        return FileScan(content=content, size=size, mtime=mtime, hash=hash_value,
+                        content_hash=content_hash, total_lines=total, sloc=sloc, comments=comments,
+                        blanks=blanks, encoding=encoding)
+    
+    @staticmethod
+    def _count_line_bytes(data: bytes) -> Tuple[int, int, int, int]:
+        """Total/source/comment/blank line counts of ``data``.
+        
+        Only lines holding a comment marker (//, /*, */) are looked at one by
+        one; they are found with bytes.find. Every other non-blank line is
+        code, or comment text when it sits inside a /* block, so those are
+        counted in bulk.
+        """
+        if not data:
             return 0, 0, 0, 0
+        
+        lines = data.split(b'\n')
+        total = len(lines)
+        blanks = total - len(list(filter(bytes.strip, lines)))
+        
+        sloc = 0
+        comments = 0
+        marker_lines = 0
+        block_text = 0  # non-blank lines without markers inside /* blocks
+        in_block_comment = False
+        run_start = 0   # first byte after the last marker line
+        
+        pos = data.find(b'/')
+        while pos != -1:
+            # Slashes in paths and division are not markers
+            if data[pos + 1:pos + 2] not in (b'/', b'*') and data[pos - 1:pos] != b'*':
+                pos = data.find(b'/', pos + 1)
+                continue
+            line_start = data.rfind(b'\n', 0, pos) + 1
+            line_end = data.find(b'\n', pos)
+            if line_end == -1:
+                line_end = len(data)
+            if in_block_comment and line_start > run_start:
+                block_text += len(list(filter(bytes.strip, data[run_start:line_start - 1].split(b'\n'))))
+            run_start = line_end + 1
+            marker_lines += 1
+            
+            line = data[line_start:line_end]
+            pos = data.find(b'/', run_start)
+            opens = b'/*' in line
+            closes = b'*/' in line
+            if opens and closes:
+                comments += 1
+                # Check if there's code around the comment
+                before_comment, after_comment = line.split(b'/*', 1)
+                after_comment = after_comment.split(b'*/', 1)[-1]
+                if before_comment.strip() or after_comment.strip():
+                    sloc += 1
+            elif opens:
+                in_block_comment = True
+                comments += 1
+                if line.split(b'/*', 1)[0].strip():
+                    sloc += 1
+            elif closes:
+                in_block_comment = False
+                comments += 1
+                if line.rsplit(b'*/', 1)[-1].strip():
+                    sloc += 1
+            elif in_block_comment or line.lstrip().startswith(b'//'):
+                comments += 1
+            else:
+                # Inline comment after code
+                if line.split(b'//', 1)[0].strip():
+                    sloc += 1
+                comments += 1
+        
+        if in_block_comment and run_start <= len(data):
+            block_text += len(list(filter(bytes.strip, data[run_start:].split(b'\n'))))
+        
+        plain = total - blanks - marker_lines
+        return total, sloc + plain - block_text, comments + block_text, blanks
+    
+    @staticmethod
+    def count_lines(file_path: Path) -> Tuple[int, int, int, int]:
+        """Count lines of code, source lines, comments, and blanks"""
+        scan = FileSystem.scan_file(file_path)
+        if scan is None:
+            return 0, 0, 0, 0
+        return scan.total_lines, scan.sloc, scan.comments, scan.blanks
     
     @staticmethod
     def find_files(root: Path, pattern: str = "*") -> List[Path]:
@@ -1975,6 +2060,72 @@ class GStudioCoreFixer:
             return '\n'.join(lines)
         return content
 
+# ==============================================================================
+# EXPORT SYMBOL INDEX
+# ==============================================================================
+
+class ExportSymbolIndex:
+    """Project-wide index of exported names, built once per fix run.
+    
+    Exact lookups are a dict hit. Fuzzy lookups only score exports that share
+    a padded trigram with the query: a name within the similarity threshold
+    differs in fewer than 0.3 * len edits, and each edit breaks at most three
+    trigrams, so every such name is still a candidate.
+    """
+    
+    FUZZY_THRESHOLD = 0.7
+    _PAD = '\x00\x00'
+    
+    def __init__(self, project_files: Dict[str, FileInfo]):
+        self.exact: Dict[str, List[str]] = defaultdict(list)
+        self._entries: List[Tuple[str, str]] = []  # (lowercased name, defining file)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._fuzzy_cache: Dict[str, Optional[Tuple[str, float]]] = {}
+        
+        for file_path, file_info in project_files.items():
+            for export in file_info.exports:
+                for item in export.exported_items:
+                    if file_path not in self.exact[item]:
+                        self.exact[item].append(file_path)
+                    entry = len(self._entries)
+                    self._entries.append((item.lower(), file_path))
+                    for gram in self._trigrams(item.lower()):
+                        self._postings[gram].append(entry)
+    
+    def __len__(self) -> int:
+        return len(self.exact)
+    
+    @classmethod
+    def _trigrams(cls, text: str) -> Set[str]:
+        padded = cls._PAD + text + cls._PAD
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def lookup(self, name: str) -> Optional[Tuple[str, float]]:
+        """Best defining file for ``name`` and its score (1.0 for an exact export)"""
+        sources = self.exact.get(name)
+        if sources:
+            return sources[0], 1.0
+        if name not in self._fuzzy_cache:
+            self._fuzzy_cache[name] = self._fuzzy_lookup(name.lower())
+        return self._fuzzy_cache[name]
+    
+    def _fuzzy_lookup(self, query: str) -> Optional[Tuple[str, float]]:
+        candidates = set()
+        for gram in self._trigrams(query):
+            candidates.update(self._postings.get(gram, ()))
+        
+        best = None
+        # Ascending entry order keeps the first of equally good matches
+        for entry in sorted(candidates):
+            item, file_path = self._entries[entry]
+            # Length difference alone bounds the edit distance from below
+            if 1.0 - abs(len(item) - len(query)) / max(len(item), len(query)) <= self.FUZZY_THRESHOLD:
+                continue
+            score = TextUtils.similarity_score(query, item)
+            if score > self.FUZZY_THRESHOLD and (best is None or score > best[1]):
+                best = (file_path, score)
+        return best
+
 # ==============================================================================
 # AUTO FIXER (Enhanced)
 # ==============================================================================
@@ -1990,6 +2141,7 @@ class AutoFixer:
         self.backup_manager = BackupManager(project_root)
         self.stubs_dir = project_root / CONFIG["project"]["stubs_dir"]
         self.stubs_dir.mkdir(exist_ok=True)
+        self._symbol_index: Optional[Tuple[Dict[str, FileInfo], ExportSymbolIndex]] = None
     
     def fix_ts7006(self, file_path: Path, error: TypeScriptError) -> FixResult:
         """Fix TS7006: Parameter implicitly has 'any' type"""
@@ -2065,87 +2217,115 @@ class AutoFixer:
     
     def fix_ts2304(self, file_path: Path, error: TypeScriptError, project_files: Dict[str, FileInfo]) -> FixResult:
         """Fix TS2304: Cannot find name"""
+        return self.fix_ts2304_batch(file_path, [error], self._symbol_index_for(project_files))[0]
+    
+    def fix_ts2304_batch(self, file_path: Path, errors: List[TypeScriptError],
+                         symbol_index: 'ExportSymbolIndex') -> List[FixResult]:
+        """Fix all TS2304/TS2552 errors of one file: resolve each missing name
+        through the symbol index, then add every import in a single write"""
+        def fix_id(error: TypeScriptError) -> str:
+            return f"ts2304_{hashlib.md5(str(error).encode()).hexdigest()[:8]}"
+        
         try:
             content = FileSystem.safe_read(file_path)
             
-            # Extract missing name from error message
-            name_match = re.search(r"Cannot find name '(\w+)'", error.message)
-            if not name_match:
-                return FixResult(
-                    id=f"ts2304_{hashlib.md5(str(error).encode()).hexdigest()[:8]}",
-                    file_path=str(file_path),
-                    fix_type="TS2304",
-                    error_code="TS2304",
-                    success=False,
-                    description="Could not extract name from error message",
-                    error_message="Name pattern not found"
-                )
-            
-            missing_name = name_match.group(1)
-            
-            # Try to find the name in project exports
-            possible_sources = []
-            for file_path_str, file_info in project_files.items():
-                for export in file_info.exports:
-                    if missing_name in export.exported_items:
-                        rel_path = file_path_str
-                        # Convert to relative import path
-                        if rel_path.startswith('src/'):
-                            rel_path = rel_path[4:]
-                        if rel_path.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                            rel_path = rel_path[:-3]
-                        elif rel_path.endswith('.jsx'):
-                            rel_path = rel_path[:-4]
-                        
-                        possible_sources.append((rel_path, 1.0))  # Exact match
+            # Missing name -> (import statement, description, confidence)
+            imports: Dict[str, Tuple[str, str, float]] = {}
+            stubs: Dict[str, str] = {}
+            names: List[Optional[str]] = []
+            for error in errors:
+                name_match = re.search(r"Cannot find name '(\w+)'", error.message)
+                if not name_match:
+                    names.append(None)
+                    continue
+                missing_name = name_match.group(1)
+                names.append(missing_name)
+                if missing_name in imports:
+                    continue
+                
+                hit = symbol_index.lookup(missing_name)
+                if hit:
+                    source, score = hit
+                    specifier = self._import_specifier(file_path, source)
+                    imports[missing_name] = (
+                        f"import {{ {missing_name} }} from '{specifier}';\n",
+                        f"Added import for '{missing_name}' from '{specifier}'",
+                        score
+                    )
+                else:
+                    # Create a stub if no source found
+                    stubs[missing_name] = self._stub_content(missing_name)
+                    imports[missing_name] = (
+                        f"import {missing_name} from './stubs/{missing_name}';\n",
+                        f"Created stub and added import for '{missing_name}'",
+                        0.5
+                    )
             
-            # If no exact match, try fuzzy search
-            if not possible_sources:
-                for file_path_str, file_info in project_files.items():
-                    for export in file_info.exports:
-                        for exported_item in export.exported_items:
-                            similarity = TextUtils.similarity_score(missing_name.lower(), exported_item.lower())
-                            if similarity > 0.7:
-                                rel_path = file_path_str
-                                if rel_path.startswith('src/'):
-                                    rel_path = rel_path[4:]
-                                if rel_path.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                                    rel_path = rel_path[:-3]
-                                elif rel_path.endswith('.jsx'):
-                                    rel_path = rel_path[:-4]
-                                
-                                possible_sources.append((rel_path, similarity))
+            new_content = ''.join(stmt for stmt, _, _ in imports.values()) + content
+            backup = None
+            if imports and not self.dry_run:
+                for missing_name, stub_content in stubs.items():
+                    FileSystem.safe_write(self.stubs_dir / f"{missing_name}.d.ts", stub_content)
+                backup = self.backup_manager.create_backup(file_path)
+                FileSystem.safe_write(file_path, new_content)
             
-            if possible_sources:
-                # Sort by similarity score
-                possible_sources.sort(key=lambda x: x[1], reverse=True)
-                best_source, score = possible_sources[0]
-                
-                # Add import statement at the beginning of the file
-                import_stmt = f"import {{ {missing_name} }} from './{best_source}';\n"
-                new_content = import_stmt + content
-                
-                if not self.dry_run:
-                    backup = self.backup_manager.create_backup(file_path)
-                    FileSystem.safe_write(file_path, new_content)
-                
-                return FixResult(
-                    id=f"ts2304_{hashlib.md5(str(error).encode()).hexdigest()[:8]}",
+            results = []
+            for error, missing_name in zip(errors, names):
+                if missing_name is None:
+                    results.append(FixResult(
+                        id=fix_id(error),
+                        file_path=str(file_path),
+                        fix_type="TS2304",
+                        error_code="TS2304",
+                        success=False,
+                        description="Could not extract name from error message",
+                        error_message="Name pattern not found"
+                    ))
+                    continue
+                _, description, confidence = imports[missing_name]
+                results.append(FixResult(
+                    id=fix_id(error),
                     file_path=str(file_path),
                     fix_type="TS2304",
                     error_code="TS2304",
                     success=True,
-                    description=f"Added import for '{missing_name}' from './{best_source}'",
+                    description=description,
                     changes_made=1,
                     original_content=content,
                     new_content=new_content,
-                    backup_path=str(backup) if not self.dry_run and backup else None,
-                    confidence=score
-                )
-            
-            # Create a stub if no source found
-            stub_path = self.stubs_dir / f"{missing_name}.d.ts"
-            stub_content = f"""// AUTO-GENERATED STUB for {missing_name}
+                    backup_path=str(backup) if backup else None,
+                    confidence=confidence
+                ))
+            return results
+        
+        except Exception as e:
+            return [FixResult(
+                id=fix_id(error),
+                file_path=str(file_path),
+                fix_type="TS2304",
+                error_code="TS2304",
+                success=False,
+                description=f"Error fixing TS2304: {str(e)}",
+                error_message=str(e)
+            ) for error in errors]
+    
+    def _symbol_index_for(self, project_files: Dict[str, FileInfo]) -> 'ExportSymbolIndex':
+        """Export index for ``project_files``, built once and reused across errors"""
+        if self._symbol_index is None or self._symbol_index[0] is not project_files:
+            index = ExportSymbolIndex(project_files)
+            Logger.debug(f"Indexed {len(index)} exported names from {len(project_files)} files")
+            self._symbol_index = (project_files, index)
+        return self._symbol_index[1]
+    
+    def _import_specifier(self, from_file: Path, target: str) -> str:
+        """Relative module specifier for project file ``target`` as seen from ``from_file``"""
+        target_path = self.project_root / os.path.splitext(target)[0]
+        specifier = os.path.relpath(target_path, from_file.parent).replace('\\', '/')
+        return specifier if specifier.startswith('.') else f'./{specifier}'
+    
+    @staticmethod
+    def _stub_content(missing_name: str) -> str:
+        return f"""// AUTO-GENERATED STUB for {missing_name}
 // Created by G-Studio Analyzer v{VERSION}
 // Please review and replace with actual implementation
 
@@ -2159,41 +2339,6 @@ declare module '*/{missing_name}' {{
   export default {missing_name};
 }}
 """
-            if not self.dry_run:
-                FileSystem.safe_write(stub_path, stub_content)
-            
-            # Add import to file
-            import_stmt = f"import {missing_name} from './stubs/{missing_name}';\n"
-            new_content = import_stmt + content
-            
-            if not self.dry_run:
-                backup = self.backup_manager.create_backup(file_path)
-                FileSystem.safe_write(file_path, new_content)
-            
-            return FixResult(
-                id=f"ts2304_{hashlib.md5(str(error).encode()).hexdigest()[:8]}",
-                file_path=str(file_path),
-                fix_type="TS2304",
-                error_code="TS2304",
-                success=True,
-                description=f"Created stub and added import for '{missing_name}'",
-                changes_made=1,
-                original_content=content,
-                new_content=new_content,
-                backup_path=str(backup) if not self.dry_run and backup else None,
-                confidence=0.5
-            )
-        
-        except Exception as e:
-            return FixResult(
-                id=f"ts2304_{hashlib.md5(str(error).encode()).hexdigest()[:8]}",
-                file_path=str(file_path),
-                fix_type="TS2304",
-                error_code="TS2304",
-                success=False,
-                description=f"Error fixing TS2304: {str(e)}",
-                error_message=str(e)
-            )
     
     def fix_ts2531(self, file_path: Path, error: TypeScriptError) -> FixResult:
         """Fix TS2531/TS2532: Object is possibly null/undefined"""
@@ -2289,6 +2434,7 @@ declare module '*/{missing_name}' {{
             # Sort errors by line number (ascending) to avoid line number shifts
             errors.sort(key=lambda e: e.line_number)
             
+            missing_names = []
             for error in errors:
                 if error.error_code not in SAFE_FIX_CODES:
                     continue
@@ -2296,42 +2442,65 @@ declare module '*/{missing_name}' {{
                 if error.fixed:
                     continue
                 
+                if error.error_code in ("TS2304", "TS2552"):
+                    # TS2552 is similar to TS2304; both are batched per file below
+                    missing_names.append(error)
+                    continue
+                
                 Logger.info(f"Fixing {error.error_code} in {file_path_str}:{error.line_number}")
                 
                 result = None
                 if error.error_code == "TS7006":
                     result = self.fix_ts7006(file_path, error)
-                elif error.error_code == "TS2304":
-                    result = self.fix_ts2304(file_path, error, project_files)
                 elif error.error_code in ["TS2531", "TS2532"]:
                     result = self.fix_ts2531(file_path, error)
                 elif error.error_code == "TS7031":
                     # Similar to TS7006
                     result = self.fix_ts7006(file_path, error)
-                elif error.error_code == "TS2552":
-                    # Similar to TS2304
-                    result = self.fix_ts2304(file_path, error, project_files)
                 
                 if result:
-                    self.fixes_applied.append(result)
-                    if result.success:
-                        fixed_count += 1
-                        error.fixed = True
+                    fixed_count += self._record_fix(error, result)
+            
+            # Imports are prepended, so add them only after the line-addressed fixes
+            if missing_names:
+                Logger.info(f"Adding imports for {len(missing_names)} missing names in {file_path_str}")
+                results = self.fix_ts2304_batch(file_path, missing_names, self._symbol_index_for(project_files))
+                for error, result in zip(missing_names, results):
+                    fixed_count += self._record_fix(error, result)
         
         Logger.success(f"Fixed {fixed_count} errors automatically")
         return fixed_count
+    
+    def _record_fix(self, error: TypeScriptError, result: FixResult) -> int:
+        self.fixes_applied.append(result)
+        if result.success:
+            error.fixed = True
+            return 1
+        return 0
 
 # ==============================================================================
 # BACKUP MANAGER (Enhanced)
 # ==============================================================================
 
 class BackupManager:
-    """Enhanced backup management system"""
+    """Enhanced backup management system
+    
+    Single-file backups (create_backup) are plain copies under a timestamp
+    directory. Snapshots are content-addressed: each file's bytes are stored
+    once as a zlib-compressed blob under objects/<sha256>, and each snapshot
+    is a JSON manifest in manifests/ mapping paths to blob digests. Legacy
+    snapshot_<ts> directories are still listed and restorable.
+    """
+    
+    BINARY_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.pdf'}
+    MAX_SNAPSHOT_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.backup_dir = project_root / CONFIG["project"]["backup_dir"]
         self.backup_dir.mkdir(exist_ok=True)
+        self.objects_dir = self.backup_dir / "objects"
+        self.manifests_dir = self.backup_dir / "manifests"
         self._lock = Lock()
     
     def create_backup(self, file_path: Path) -> Optional[Path]:
@@ -2355,14 +2524,17 @@ class BackupManager:
                 return None
     
     def create_snapshot(self) -> str:
-        """Create a full project snapshot"""
+        """Create a full project snapshot, storing only blobs not already in the object store"""
         with self._lock:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            snapshot_dir = self.backup_dir / f"snapshot_{timestamp}"
+            name = f"snapshot_{timestamp}"
             
             Logger.info(f"Creating snapshot: {timestamp}")
             
-            files_backed = 0
+            # Files whose size and mtime match the last snapshot reuse its digest unread
+            previous = self._latest_manifest_files()
+            entries: Dict[str, List] = {}
+            new_blobs = 0
             for root, dirs, files in os.walk(self.project_root):
                 # Skip backup directory and other excluded dirs
                 dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
@@ -2370,24 +2542,37 @@ class BackupManager:
                 for file in files:
                     file_path = Path(root) / file
                     
-                    # Skip large files and binaries
-                    if file_path.stat().st_size > 10 * 1024 * 1024:  # 10MB
-                        continue
-                    
                     # Skip non-text files
-                    if file_path.suffix in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.pdf']:
+                    if file_path.suffix in self.BINARY_SUFFIXES:
                         continue
                     
                     try:
-                        rel_path = file_path.relative_to(self.project_root)
-                        backup_file = snapshot_dir / rel_path
-                        backup_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(file_path, backup_file)
-                        files_backed += 1
+                        stat = file_path.stat()
+                        # Skip large files
+                        if stat.st_size > self.MAX_SNAPSHOT_FILE_SIZE:
+                            continue
+                        
+                        rel_path = file_path.relative_to(self.project_root).as_posix()
+                        prev = previous.get(rel_path)
+                        if (prev and prev[1] == stat.st_size and prev[2] == stat.st_mtime_ns
+                                and self._object_path(prev[0]).exists()):
+                            entries[rel_path] = prev
+                            continue
+                        
+                        digest, created = self._store_blob(file_path.read_bytes())
+                        new_blobs += created
+                        entries[rel_path] = [digest, stat.st_size, stat.st_mtime_ns]
                     except Exception:
                         continue
             
-            Logger.success(f"Snapshot created: {timestamp} ({files_backed} files)")
+            self._write_manifest({
+                "name": name,
+                "created": datetime.strptime(timestamp, "%Y%m%d_%H%M%S").isoformat(),
+                "file_count": len(entries),
+                "files": entries
+            })
+            
+            Logger.success(f"Snapshot created: {timestamp} ({len(entries)} files, {new_blobs} new blobs)")
             return timestamp
     
     def list_backups(self) -> List[Tuple[str, datetime, int]]:
@@ -2397,6 +2582,12 @@ class BackupManager:
         if not self.backup_dir.exists():
             return backups
         
+        for manifest_path in self.manifests_dir.glob("*.json"):
+            manifest = self._read_manifest(manifest_path.stem)
+            if manifest:
+                backups.append((manifest["name"], datetime.fromisoformat(manifest["created"]),
+                                manifest.get("file_count", len(manifest["files"]))))
+        
         for item in self.backup_dir.iterdir():
             if item.is_dir():
                 try:
@@ -2423,6 +2614,10 @@ class BackupManager:
     
     def rollback(self, backup_name: str) -> bool:
         """Rollback to a specific backup"""
+        manifest = self._read_manifest(backup_name)
+        if manifest:
+            return self._restore_manifest(manifest)
+        
         backups = self.list_backups()
         backup_names = [b[0] for b in backups]
         
@@ -2469,20 +2664,121 @@ class BackupManager:
         
         to_delete = backups[keep_last:]
         deleted = 0
+        manifests_deleted = False
         
         for backup_name, _, _ in to_delete:
+            manifest_path = self.manifests_dir / f"{backup_name}.json"
             backup_path = self.backup_dir / backup_name
             try:
-                shutil.rmtree(backup_path)
+                if manifest_path.exists():
+                    manifest_path.unlink()
+                    manifests_deleted = True
+                else:
+                    shutil.rmtree(backup_path)
                 deleted += 1
                 Logger.debug(f"Deleted old backup: {backup_name}")
             except Exception as e:
                 Logger.warning(f"Failed to delete backup {backup_name}: {e}")
         
+        if manifests_deleted:
+            self._collect_garbage()
+        
         if deleted > 0:
             Logger.info(f"Cleaned up {deleted} old backups")
         
         return deleted
+    
+    # ---------- content-addressed store ----------
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+    
+    def _store_blob(self, data: bytes) -> Tuple[str, bool]:
+        """Store ``data`` under its SHA-256; returns (digest, whether a new blob was written)"""
+        digest = hashlib.sha256(data).hexdigest()
+        obj = self._object_path(digest)
+        if obj.exists():
+            return digest, False
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        tmp = obj.with_name(obj.name + ".tmp")
+        tmp.write_bytes(zlib.compress(data))
+        os.replace(tmp, obj)
+        return digest, True
+    
+    def _load_blob(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+    
+    def _write_manifest(self, manifest: Dict):
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        path = self.manifests_dir / f"{manifest['name']}.json"
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+    
+    def _read_manifest(self, name: str) -> Optional[Dict]:
+        path = self.manifests_dir / f"{name}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+    
+    def _latest_manifest_files(self) -> Dict[str, List]:
+        # snapshot_<%Y%m%d_%H%M%S> names sort chronologically
+        names = sorted(p.stem for p in self.manifests_dir.glob("*.json"))
+        manifest = self._read_manifest(names[-1]) if names else None
+        return manifest["files"] if manifest else {}
+    
+    def _restore_manifest(self, manifest: Dict) -> bool:
+        """Restore the files of a snapshot manifest that differ from the working tree"""
+        Logger.header(f"Rolling back to: {manifest['name']}")
+        
+        try:
+            restored = 0
+            for rel_path, (digest, size, mtime_ns) in manifest["files"].items():
+                target_file = self.project_root / rel_path
+                if self._is_unchanged(target_file, digest, size, mtime_ns):
+                    continue
+                target_file.parent.mkdir(parents=True, exist_ok=True)
+                target_file.write_bytes(self._load_blob(digest))
+                os.utime(target_file, ns=(mtime_ns, mtime_ns))
+                restored += 1
+            
+            unchanged = len(manifest["files"]) - restored
+            Logger.success(f"Rollback complete: {restored} files restored ({unchanged} already matched)")
+            return True
+        
+        except Exception as e:
+            Logger.error(f"Rollback failed: {e}")
+            return False
+    
+    @staticmethod
+    def _is_unchanged(file_path: Path, digest: str, size: int, mtime_ns: int) -> bool:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == mtime_ns:
+            return True
+        return hashlib.sha256(file_path.read_bytes()).hexdigest() == digest
+    
+    def _collect_garbage(self) -> int:
+        """Delete blobs no remaining manifest references"""
+        referenced = set()
+        for manifest_path in self.manifests_dir.glob("*.json"):
+            manifest = self._read_manifest(manifest_path.stem)
+            if manifest is None:
+                # Never drop blobs while a manifest is unreadable
+                return 0
+            referenced.update(entry[0] for entry in manifest["files"].values())
+        
+        removed = 0
+        for obj in self.objects_dir.glob("*/*"):
+            if obj.parent.name + obj.name not in referenced:
+                obj.unlink()
+                removed += 1
+        Logger.debug(f"Removed {removed} unreferenced snapshot blobs")
+        return removed
 
 # ==============================================================================
 # PROJECT ANALYZER (Enhanced)
@@ -2550,11 +2846,12 @@ class ProjectAnalyzer:
             # Get basic file info
             rel_path = str(file_path.relative_to(self.project_root)).replace('\\', '/')
             
-            # Count lines
-            total_lines, sloc, comments, blanks = FileSystem.count_lines(file_path)
-            
-            # Read content
-            content = FileSystem.safe_read(file_path)
+            # One read: hash, size, line counts and the text to parse
+            scan = FileSystem.scan_file(file_path)
+            if scan is None:
+                raise OSError(f"cannot read {file_path}")
+            content = scan.content
+            total_lines = scan.total_lines
             
             # Parse imports and exports
             imports = ImportExportParser.parse_imports(content, rel_path)
@@ -2577,13 +2874,14 @@ class ProjectAnalyzer:
             info = FileInfo(
                 path=rel_path,
                 absolute_path=str(file_path),
-                size=file_path.stat().st_size if file_path.exists() else 0,
+                size=scan.size,
                 loc=total_lines,
-                sloc=sloc,
-                comments=comments,
-                blanks=blanks,
-                hash=FileSystem.get_file_hash(file_path),
-                content_hash=hashlib.md5(content.encode()).hexdigest() if content else "",
+                sloc=scan.sloc,
+                comments=scan.comments,
+                blanks=scan.blanks,
+                hash=scan.hash,
+                content_hash=scan.content_hash,
+                encoding=scan.encoding,
                 imports=imports,
                 exports=exports,
                 is_core=TypeScriptUtils.is_core_file(file_path),
@@ -2591,7 +2889,7 @@ class ProjectAnalyzer:
                 is_very_large=total_lines > CONFIG["analysis"]["very_large_file_threshold"],
                 is_disconnected=any(pattern in rel_path.lower() for pattern in CONFIG["g_studio"]["disconnected_subsystems"]),
                 capabilities=capabilities,
-                last_modified=datetime.fromtimestamp(file_path.stat().st_mtime).isoformat() if file_path.exists() else None
+                last_modified=datetime.fromtimestamp(scan.mtime).isoformat()
             )
             
             # Count components, hooks, etc.
@@ -2765,7 +3063,7 @@ class ProjectAnalyzer:
                         group.metrics[file] = {
                             'size': info.size,
                             'loc': info.loc,
-                            'error_count': info.error_count,
+                            'error_count': len(info.errors),
                             'complexity': info.metrics.cognitive_complexity if info.metrics else 0
                         }
                 
@@ -3519,11 +3817,220 @@ class ReportGenerator:
 # WEB UI SERVER (Enhanced)
 # ==============================================================================
 
+class CachedResponse:
+    """Serialized JSON body with its ETag and a lazily built gzip variant"""
+    
+    __slots__ = ('body', 'etag', '_gzip')
+    
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._gzip: Optional[bytes] = None
+    
+    def gzipped(self) -> bytes:
+        if self._gzip is None:
+            self._gzip = gzip.compress(self.body, compresslevel=6)
+        return self._gzip
+
+class ReportAPI:
+    """Read model of one report version for the web UI API
+    
+    Built once per report version: rows for /api/files and /api/errors are
+    serialized up front, with filter indexes and presorted orders, so a
+    request only selects row ids and joins pre-encoded JSON fragments.
+    Whole-report payloads are serialized here too. Responses are memoized
+    per normalized query in a small LRU.
+    """
+    
+    FILE_SORT_KEYS = ('path', 'size', 'loc', 'errors', 'warnings')
+    ERROR_SORT_KEYS = ('file', 'line', 'code', 'severity')
+    FILE_PARAMS = ('q', 'core', 'large', 'has_errors', 'sort', 'page', 'page_size')
+    ERROR_PARAMS = ('q', 'code', 'file', 'severity', 'fixable', 'sort', 'page', 'page_size')
+    MAX_PAGE_SIZE = 1000
+    CACHE_SIZE = 256
+    
+    def __init__(self, report: ProjectReport, version: str):
+        self.version = version
+        
+        self.files = []
+        self.errors = []
+        for path, info in report.files.items():
+            self.files.append({
+                'path': path,
+                'size': info.size,
+                'loc': info.loc,
+                'errors': len(info.errors),
+                'warnings': len(info.warnings),
+                'is_core': info.is_core,
+                'is_large': info.is_large_file
+            })
+            for error in info.errors:
+                self.errors.append({
+                    'file': path,
+                    'line': error.line_number,
+                    'column': error.column,
+                    'code': error.error_code,
+                    'message': error.message,
+                    'severity': error.severity,
+                    'fixable': error.is_fixable
+                })
+        self._file_json = [json.dumps(row).encode() for row in self.files]
+        self._error_json = [json.dumps(row).encode() for row in self.errors]
+        
+        # Filter indexes (row ids in natural order)
+        self._file_flags = {
+            'core': [i for i, row in enumerate(self.files) if row['is_core']],
+            'large': [i for i, row in enumerate(self.files) if row['is_large']],
+            'has_errors': [i for i, row in enumerate(self.files) if row['errors']],
+        }
+        self._errors_by = {key: defaultdict(list) for key in ('code', 'file', 'severity')}
+        for i, row in enumerate(self.errors):
+            for key, index in self._errors_by.items():
+                index[row[key]].append(i)
+        
+        # Sort orders and, for sorting subsets, each row's rank in that order
+        self._file_orders = {key: self._order(self.files, key) for key in self.FILE_SORT_KEYS}
+        self._error_orders = {key: self._order(self.errors, key) for key in self.ERROR_SORT_KEYS}
+        
+        self._static = {
+            '/api/report': self._cached('/api/report', json.dumps(report.to_dict()).encode()),
+            '/api/fixes': self._cached('/api/fixes', json.dumps({
+                'automatic': [f.to_dict() for f in report.fixes_applied],
+                'core': [f.to_dict() for f in report.core_fixes_applied]
+            }).encode()),
+            '/api/optimizations': self._cached('/api/optimizations', json.dumps(
+                [asdict(s) for s in report.optimization_suggestions]).encode()),
+        }
+        self._responses: 'OrderedDict[Tuple, CachedResponse]' = OrderedDict()
+        self._lock = Lock()
+    
+    @staticmethod
+    def _order(rows: List[Dict], key: str) -> Tuple[List[int], List[int]]:
+        order = sorted(range(len(rows)), key=lambda i: rows[i][key])
+        rank = [0] * len(rows)
+        for position, i in enumerate(order):
+            rank[i] = position
+        return order, rank
+    
+    def _cached(self, key: Any, body: bytes) -> CachedResponse:
+        digest = hashlib.md5(f"{self.version}:{key}".encode()).hexdigest()[:20]
+        return CachedResponse(body, f'"{digest}"')
+    
+    def get(self, path: str, query: Dict[str, List[str]]) -> Optional[CachedResponse]:
+        """Response for an API path, or None if the path is not served here.
+        
+        Raises ValueError for malformed query parameters.
+        """
+        if path in self._static:
+            return self._static[path]
+        if path == '/api/files':
+            params = self.FILE_PARAMS
+        elif path == '/api/errors':
+            params = self.ERROR_PARAMS
+        else:
+            return None
+        
+        key = (path,) + tuple((name, query[name][-1]) for name in params if name in query)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached:
+                self._responses.move_to_end(key)
+                return cached
+        
+        args = dict(key[1:])
+        body = self._query_files(args) if path == '/api/files' else self._query_errors(args)
+        cached = self._cached(key, body)
+        with self._lock:
+            self._responses[key] = cached
+            if len(self._responses) > self.CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return cached
+    
+    def _query_files(self, args: Dict[str, str]) -> bytes:
+        ids = None
+        for flag, index in self._file_flags.items():
+            if flag in args:
+                wanted = self._flag(args[flag])
+                selected = set(index)
+                if not wanted:
+                    selected = set(range(len(self.files))) - selected
+                ids = selected if ids is None else ids & selected
+        if 'q' in args:
+            needle = args['q'].lower()
+            candidates = range(len(self.files)) if ids is None else ids
+            ids = {i for i in candidates if needle in self.files[i]['path'].lower()}
+        return self._page(self._file_json, ids, self._file_orders, args)
+    
+    def _query_errors(self, args: Dict[str, str]) -> bytes:
+        ids = None
+        for key, index in self._errors_by.items():
+            if key in args:
+                selected = set()
+                for value in args[key].split(','):
+                    selected.update(index.get(value, ()))
+                ids = selected if ids is None else ids & selected
+        if 'fixable' in args:
+            wanted = self._flag(args['fixable'])
+            candidates = range(len(self.errors)) if ids is None else ids
+            ids = {i for i in candidates if self.errors[i]['fixable'] == wanted}
+        if 'q' in args:
+            needle = args['q'].lower()
+            candidates = range(len(self.errors)) if ids is None else ids
+            ids = {i for i in candidates
+                   if needle in self.errors[i]['message'].lower() or needle in self.errors[i]['file'].lower()}
+        return self._page(self._error_json, ids, self._error_orders, args)
+    
+    def _page(self, fragments: List[bytes], ids: Optional[Set[int]],
+              orders: Dict[str, Tuple[List[int], List[int]]], args: Dict[str, str]) -> bytes:
+        sort = args.get('sort', '')
+        descending = sort.startswith('-')
+        sort = sort.lstrip('-')
+        if sort and sort not in orders:
+            raise ValueError(f"Unknown sort key: {sort}")
+        
+        if sort:
+            order, rank = orders[sort]
+            selected = list(order) if ids is None else sorted(ids, key=rank.__getitem__)
+        else:
+            selected = list(range(len(fragments))) if ids is None else sorted(ids)
+        if descending:
+            selected.reverse()
+        
+        page = int(args.get('page', 1))
+        page_size = int(args.get('page_size', CONFIG["ui"]["max_items_per_page"]))
+        if page < 1 or not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError("page must be >= 1 and page_size between 1 and %d" % self.MAX_PAGE_SIZE)
+        
+        start = (page - 1) * page_size
+        items = b', '.join(fragments[i] for i in selected[start:start + page_size])
+        head = json.dumps({'total': len(selected), 'page': page, 'page_size': page_size})
+        return head[:-1].encode() + b', "items": [' + items + b']}'
+    
+    @staticmethod
+    def _flag(value: str) -> bool:
+        if value.lower() in ('1', 'true', 'yes'):
+            return True
+        if value.lower() in ('0', 'false', 'no'):
+            return False
+        raise ValueError(f"Expected a boolean, got: {value}")
+
 class WebUIHandler(BaseHTTPRequestHandler):
     """Enhanced web UI handler with API endpoints"""
     
     report_data: Optional[ProjectReport] = None
+    report_api: Optional[ReportAPI] = None
     static_dir: Optional[Path] = None
+    GZIP_MIN_SIZE = 1024
+    _report_versions = 0
+    
+    @classmethod
+    def set_report(cls, report: Optional[ProjectReport]):
+        """Install a new report version and rebuild the serialized API views"""
+        cls._report_versions += 1
+        cls.report_data = report
+        cls.report_api = None
+        if report:
+            cls.report_api = ReportAPI(report, f"{report.analysis_id}-{cls._report_versions}")
     
     def do_GET(self):
         """Handle GET requests"""
@@ -3532,18 +4039,10 @@ class WebUIHandler(BaseHTTPRequestHandler):
             path = parsed.path
             
             # API endpoints
-            if path == '/api/report':
-                self._serve_report()
+            if path in ('/api/report', '/api/files', '/api/errors', '/api/fixes', '/api/optimizations'):
+                self._serve_api(path, parse_qs(parsed.query))
             elif path == '/api/status':
                 self._serve_status()
-            elif path == '/api/files':
-                self._serve_files()
-            elif path == '/api/errors':
-                self._serve_errors()
-            elif path == '/api/fixes':
-                self._serve_fixes()
-            elif path == '/api/optimizations':
-                self._serve_optimizations()
             elif path.startswith('/api/file/'):
                 self._serve_file_content(path[10:])
             # Static files and UI
@@ -3573,107 +4072,60 @@ class WebUIHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error(500, f"Internal server error: {str(e)}")
     
-    def _serve_report(self):
-        """Serve complete report data"""
-        if self.report_data:
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(self.report_data.to_dict()).encode())
-        else:
+    def _serve_api(self, path: str, query: Dict[str, List[str]]):
+        """Serve a report view from the pre-serialized API cache"""
+        if not self.report_api:
             self.send_response(404)
+            self.send_header('Content-Type', 'application/json')
             self.end_headers()
             self.wfile.write(b'{"error": "No report data available"}')
-    
-    def _serve_status(self):
-        """Serve status information"""
-        status = {
-            'status': 'ready' if self.report_data else 'no_data',
-            'timestamp': datetime.now().isoformat(),
-            'report_available': self.report_data is not None,
-            'version': VERSION
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(status).encode())
-    
-    def _serve_files(self):
-        """Serve file list with metadata"""
-        if not self.report_data:
-            self.send_error(404, "No report data")
             return
         
-        files = []
-        for path, info in self.report_data.files.items():
-            files.append({
-                'path': path,
-                'size': info.size,
-                'loc': info.loc,
-                'errors': len(info.errors),
-                'warnings': len(info.warnings),
-                'is_core': info.is_core,
-                'is_large': info.is_large_file
-            })
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(files).encode())
-    
-    def _serve_errors(self):
-        """Serve error list"""
-        if not self.report_data:
-            self.send_error(404, "No report data")
+        try:
+            cached = self.report_api.get(path, query)
+        except ValueError as e:
+            self.send_error(400, f"Invalid query: {e}")
             return
         
-        errors = []
-        for file_path, file_info in self.report_data.files.items():
-            for error in file_info.errors:
-                errors.append({
-                    'file': file_path,
-                    'line': error.line_number,
-                    'column': error.column,
-                    'code': error.error_code,
-                    'message': error.message,
-                    'severity': error.severity,
-                    'fixable': error.is_fixable
-                })
+        use_gzip = len(cached.body) >= self.GZIP_MIN_SIZE and 'gzip' in self.headers.get('Accept-Encoding', '')
+        # Each encoding is its own representation, so it gets its own tag
+        etag = cached.etag[:-1] + '-gz"' if use_gzip else cached.etag
         
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(errors).encode())
-    
-    def _serve_fixes(self):
-        """Serve fix list"""
-        if not self.report_data:
-            self.send_error(404, "No report data")
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
             return
         
-        fixes = {
-            'automatic': [f.to_dict() for f in self.report_data.fixes_applied],
-            'core': [f.to_dict() for f in self.report_data.core_fixes_applied]
-        }
+        body = cached.gzipped() if use_gzip else cached.body
         
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
         self.end_headers()
-        self.wfile.write(json.dumps(fixes).encode())
+        self.wfile.write(body)
     
-    def _serve_optimizations(self):
-        """Serve optimization suggestions"""
-        if not self.report_data:
-            self.send_error(404, "No report data")
-            return
-        
-        optimizations = [s.to_dict() for s in self.report_data.optimization_suggestions]
+    def _serve_status(self):
+        """Serve status information"""
+        status = {
+            'status': 'ready' if self.report_data else 'no_data',
+            'timestamp': datetime.now().isoformat(),
+            'report_available': self.report_data is not None,
+            'version': VERSION
+        }
         
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.end_headers()
-        self.wfile.write(json.dumps(optimizations).encode())
+        self.wfile.write(json.dumps(status).encode())
     
     def _serve_file_content(self, file_path: str):
         """Serve content of a specific file"""
@@ -3828,7 +4280,7 @@ class WebUIHandler(BaseHTTPRequestHandler):
 
 def serve_ui(report: ProjectReport, port: int = 8080, host: str = 'localhost'):
     """Start the web UI server"""
-    WebUIHandler.report_data = report
+    WebUIHandler.set_report(report)
     
     # Create static directory if needed
     static_dir = Path(__file__).parent / 'static'
@@ -46,16 +46,17 @@ import socket
 import webbrowser
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Optional, Any, Union
+from typing import Dict, List, Tuple, Set, Optional, Any, Union, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock, Thread
 from html import escape
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
-import socketserver
+
+from analysis_jobs import Job, JobRunner, job_paths, stream_events, tree_fingerprint
 
 VERSION = "9.0.0"
 
@@ -2779,10 +2780,52 @@ class MarkdownChangelogGenerator:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TinkerUIHandler(BaseHTTPRequestHandler):
-    """HTTP handler for Tinker UI"""
+    """HTTP handler for Tinker UI
+    
+    Analysis and fix requests run as background jobs (one at a time, in
+    order); the POST returns a job id at once and progress streams from
+    /api/jobs/<id>/events. Serve it from a ThreadingHTTPServer so the
+    stream and other requests are answered while a job runs.
+    """
     
     analyzer = None
     report: Optional[ProjectReport] = None
+    jobs: Optional[JobRunner] = None
+    
+    @classmethod
+    def attach(cls, analyzer: 'ReactProjectAnalyzer'):
+        """Run UI jobs with ``analyzer``'s settings"""
+        cls.analyzer = analyzer
+        cls.jobs = JobRunner(cls._run_job, fingerprint=cls._job_fingerprint, on_result=cls._job_finished)
+    
+    @classmethod
+    def _run_job(cls, kind: str, progress: Callable[[str, int, int], None]):
+        # 'fix' always applies fixes; 'analyze' keeps the configured mode
+        analyzer = cls.analyzer.fresh(auto_mode=True if kind == 'fix' else None)
+        analyzer.on_progress = progress
+        report = analyzer.run()
+        return report, cls._stats(report)
+    
+    @classmethod
+    def _job_fingerprint(cls, kind: str) -> str:
+        analyzer = cls.analyzer
+        return tree_fingerprint(analyzer._scan_project(), kind, analyzer.dry_run,
+                                analyzer.create_stubs, analyzer.auto_mode)
+    
+    @classmethod
+    def _job_finished(cls, job: Job):
+        cls.report = job.result
+    
+    @staticmethod
+    def _stats(report: Optional[ProjectReport]) -> Dict[str, int]:
+        if not report:
+            return {'files': 0, 'features': 0, 'issues': 0, 'fixed': 0}
+        return {
+            'files': report.total_files,
+            'features': report.features_detected,
+            'issues': report.issues_found,
+            'fixed': report.issues_fixed
+        }
     
     def log_message(self, format, *args):
         """Suppress default logging"""
@@ -2801,6 +2844,8 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
             self._serve_report()
         elif path == '/report.html':
             self._serve_html_report()
+        elif job_paths(path):
+            self._serve_job(*job_paths(path))
         else:
             self.send_error(404)
     
@@ -2810,9 +2855,9 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
         path = parsed.path
         
         if path == '/api/analyze':
-            self._run_analysis()
+            self._start_job('analyze')
         elif path == '/api/fix':
-            self._run_fixes()
+            self._start_job('fix')
         else:
             self.send_error(404)
     
@@ -3021,45 +3066,52 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
             statusDiv.innerHTML = `<span class="status-badge status-${type}">${status}</span>`;
         }
         
-        async function runAnalysis() {
-            log('Starting project analysis...', 'info');
-            setStatus('Analyzing...', 'running');
+        function startJob(url, label, doneMessage) {
+            log(label + '...', 'info');
+            setStatus(label + '...', 'running');
             
-            try {
-                const response = await fetch('/api/analyze', { method: 'POST' });
-                const data = await response.json();
-                
-                if (data.success) {
-                    log('Analysis complete!', 'success');
-                    setStatus('Complete', 'complete');
-                    updateStats(data.stats);
-                } else {
-                    log('Analysis failed: ' + data.error, 'error');
+            fetch(url, { method: 'POST' })
+                .then(response => response.json())
+                .then(data => followJob(data.job, label, doneMessage))
+                .catch(e => {
+                    log('Error: ' + e.message, 'error');
                     setStatus('Error', 'error');
-                }
-            } catch (e) {
-                log('Error: ' + e.message, 'error');
-            }
+                });
         }
         
-        async function runFixes() {
-            log('Applying fixes...', 'info');
-            setStatus('Fixing...', 'running');
-            
-            try {
-                const response = await fetch('/api/fix', { method: 'POST' });
-                const data = await response.json();
-                
-                if (data.success) {
-                    log(`Fixed ${data.fixed} issues!`, 'success');
-                    setStatus('Complete', 'complete');
-                    updateStats(data.stats);
-                } else {
-                    log('Fix failed: ' + data.error, 'error');
+        function followJob(job, label, doneMessage) {
+            const events = new EventSource(`/api/jobs/${job.id}/events`);
+            let lastPhase = '';
+            events.addEventListener('progress', e => {
+                const state = JSON.parse(e.data);
+                const count = state.total ? ` ${state.current}/${state.total}` : '';
+                setStatus(`${label}: ${state.phase}${count}`, 'running');
+                if (state.phase !== lastPhase) {
+                    log(state.phase, 'info');
+                    lastPhase = state.phase;
                 }
-            } catch (e) {
-                log('Error: ' + e.message, 'error');
-            }
+            });
+            events.addEventListener('done', e => {
+                const state = JSON.parse(e.data);
+                events.close();
+                log(doneMessage(state) + (state.cached ? ' (unchanged tree, cached result)' : ''), 'success');
+                setStatus('Complete', 'complete');
+                updateStats(state.stats);
+            });
+            events.addEventListener('failed', e => {
+                const state = JSON.parse(e.data);
+                events.close();
+                log(label + ' failed: ' + state.error, 'error');
+                setStatus('Error', 'error');
+            });
+        }
+        
+        function runAnalysis() {
+            startJob('/api/analyze', 'Analyzing', state => 'Analysis complete!');
+        }
+        
+        function runFixes() {
+            startJob('/api/fix', 'Fixing', state => `Fixed ${state.stats.fixed} issues!`);
         }
         
         function viewReport() {
@@ -3088,27 +3140,17 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(html.encode())
     
-    def _serve_status(self):
-        """Serve current status as JSON"""
-        stats = {
-            'files': 0,
-            'features': 0,
-            'issues': 0,
-            'fixed': 0
-        }
-        
-        if TinkerUIHandler.report:
-            stats = {
-                'files': TinkerUIHandler.report.total_files,
-                'features': TinkerUIHandler.report.features_detected,
-                'issues': TinkerUIHandler.report.issues_found,
-                'fixed': TinkerUIHandler.report.issues_fixed
-            }
-        
-        self.send_response(200)
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps({'stats': stats}).encode())
+        self.wfile.write(body)
+    
+    def _serve_status(self):
+        """Serve current status as JSON"""
+        self._send_json(200, {'stats': self._stats(TinkerUIHandler.report)})
     
     def _serve_report(self):
         """Serve report as JSON"""
@@ -3131,36 +3173,28 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404, 'No report available')
     
-    def _run_analysis(self):
-        """Run analysis via API"""
-        try:
-            if TinkerUIHandler.analyzer:
-                TinkerUIHandler.analyzer.run()
-                TinkerUIHandler.report = TinkerUIHandler.analyzer.report
-                
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': True,
-                    'stats': {
-                        'files': TinkerUIHandler.report.total_files,
-                        'features': TinkerUIHandler.report.features_detected,
-                        'issues': TinkerUIHandler.report.issues_found,
-                        'fixed': TinkerUIHandler.report.issues_fixed
-                    }
-                }).encode())
+    def _start_job(self, kind: str):
+        """Queue an analysis/fix job and answer with its id"""
+        if not TinkerUIHandler.jobs:
+            self.send_error(500, 'Analyzer not initialized')
+            return
+        job = TinkerUIHandler.jobs.submit(kind)
+        self._send_json(202, {'success': True, 'job': TinkerUIHandler.jobs.snapshot(job.id)})
+    
+    def _serve_job(self, job_id: str, rest: List[str]):
+        """Serve a job's state, or stream it as Server-Sent Events"""
+        if not TinkerUIHandler.jobs:
+            self.send_error(404, 'No jobs')
+        elif rest == ['events']:
+            stream_events(self, TinkerUIHandler.jobs, job_id)
+        elif not rest:
+            snapshot = TinkerUIHandler.jobs.snapshot(job_id)
+            if snapshot:
+                self._send_json(200, snapshot)
             else:
-                self.send_error(500, 'Analyzer not initialized')
-        except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode())
-    
-    def _run_fixes(self):
-        """Run fixes via API"""
-        self._run_analysis()  # Re-run with fixes
+                self.send_error(404, 'Unknown job')
+        else:
+            self.send_error(404)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN PROJECT ANALYZER
@@ -3194,6 +3228,19 @@ class ReactProjectAnalyzer:
         # Results
         self.analyses: List[FileAnalysis] = []
         self.report: Optional[ProjectReport] = None
+        
+        # Optional progress hook: (phase, current, total)
+        self.on_progress: Optional[Callable[[str, int, int], None]] = None
+    
+    def fresh(self, auto_mode: Optional[bool] = None) -> 'ReactProjectAnalyzer':
+        """A new analyzer with these settings; run() accumulates state, so each run needs its own"""
+        return ReactProjectAnalyzer(self.source, self.dest, self.dry_run, self.create_stubs,
+                                    self.max_workers, self.auto_mode if auto_mode is None else auto_mode,
+                                    Logger.verbose)
+    
+    def _progress(self, phase: str, current: int = 0, total: int = 0):
+        if self.on_progress:
+            self.on_progress(phase, current, total)
     
     def run(self) -> ProjectReport:
         """Run complete analysis pipeline"""
@@ -3205,6 +3252,7 @@ class ReactProjectAnalyzer:
         
         # Step 1: Scan project files
         Logger.subheader("Step 1: Scanning Project")
+        self._progress("Scanning project")
         files = self._scan_project()
         Logger.success(f"Found {len(files)} files to analyze")
         
@@ -3213,6 +3261,7 @@ class ReactProjectAnalyzer:
         
         # Step 2: Analyze files
         Logger.subheader("Step 2: Analyzing Files")
+        self._progress("Analyzing files")
         self._analyze_files(files)
         
         # Create checkpoint
@@ -3221,15 +3270,18 @@ class ReactProjectAnalyzer:
         # Step 3: Fix issues (if auto mode)
         if self.auto_mode:
             Logger.subheader("Step 3: Fixing Issues")
+            self._progress("Fixing issues")
             self._fix_files()
             self.backup_manager.create_checkpoint("FIXES", len(self.analyses), 
                                                   self.fixer.fixes_applied, "Fixes applied")
         
         # Step 4: Enhance components
         Logger.subheader("Step 4: Suggesting Enhancements")
+        self._progress("Suggesting enhancements")
         self._enhance_files()
         # Step 5: Detect circular dependencies
         Logger.subheader("Step 5: Detecting Circular Dependencies")
+        self._progress("Detecting circular dependencies")
         circular_deps = CircularDependencyDetector(self.analyses).find_cycles()
         if circular_deps:
             Logger.warning(f"Found {len(circular_deps)} circular dependencies")
@@ -3238,6 +3290,7 @@ class ReactProjectAnalyzer:
         
         # Step 6: Detect unused files
         Logger.subheader("Step 6: Detecting Unused Files")
+        self._progress("Detecting unused files")
         unused_detector = UnusedFileDetector(self.analyses)
         unused_files = unused_detector.detect_unused()
         if unused_files:
@@ -3247,10 +3300,12 @@ class ReactProjectAnalyzer:
         
         # Step 7: Build verification
         Logger.subheader("Step 7: Build Verification")
+        self._progress("Verifying build")
         build_result = self.build_verifier.verify(self.dry_run)
         
         # Step 8: Generate reports
         Logger.subheader("Step 8: Generating Reports")
+        self._progress("Generating reports")
         self._generate_reports(circular_deps, build_result, unused_files)
         
         # Final checkpoint
@@ -3300,6 +3355,7 @@ class ReactProjectAnalyzer:
                     analysis = future.result()
                     self.analyses.append(analysis)
                     Logger.progress("Analyzing", i, total)
+                    self._progress("Analyzing files", i, total)
                 except Exception as e:
                     filepath = futures[future]
                     Logger.error(f"Failed to analyze {filepath.name}: {e}")
@@ -3327,6 +3383,7 @@ class ReactProjectAnalyzer:
         for i, analysis in enumerate(files_with_issues, 1):
             self.fixer.fix_file(analysis)
             Logger.progress("Fixing", i, total)
+            self._progress("Fixing issues", i, total)
         
         Logger.success(f"Applied {self.fixer.fixes_applied} fixes")
         Logger.info(f"Created {len(self.fixer.stubs_created)} stub files")
@@ -3343,6 +3400,7 @@ class ReactProjectAnalyzer:
         for i, analysis in enumerate(components, 1):
             self.enhancer.enhance_file(analysis)
             Logger.progress("Enhancing", i, total)
+            self._progress("Suggesting enhancements", i, total)
         
         total_enhancements = sum(len(a.enhancements) for a in self.analyses)
         Logger.success(f"Generated {total_enhancements} enhancement suggestions")
@@ -3652,14 +3710,14 @@ class InteractiveMenu:
             auto_mode=True
         )
         
-        TinkerUIHandler.analyzer = self.analyzer
+        TinkerUIHandler.attach(self.analyzer)
         
         # Open browser
         webbrowser.open(f"http://localhost:{port}")
         
         # Start server
         try:
-            with socketserver.TCPServer(("", port), TinkerUIHandler) as httpd:
+            with ThreadingHTTPServer(("", port), TinkerUIHandler) as httpd:
                 httpd.serve_forever()
         except KeyboardInterrupt:
             Logger.info("Server stopped")
@@ -3824,14 +3882,14 @@ Examples:
                 verbose=args.verbose
             )
             
-            TinkerUIHandler.analyzer = analyzer
+            TinkerUIHandler.attach(analyzer)
             
             Logger.info(f"Starting server on http://localhost:{args.port}")
             Logger.info("Press Ctrl+C to stop")
             
             webbrowser.open(f"http://localhost:{args.port}")
             
-            with socketserver.TCPServer(("", args.port), TinkerUIHandler) as httpd:
+            with ThreadingHTTPServer(("", args.port), TinkerUIHandler) as httpd:
                 httpd.serve_forever()
         
         elif args.interactive or (not args.auto and sys.stdin.isatty()):
@@ -29,8 +29,6 @@ import os
 import sys
 import json
 import hashlib
-import shutil
-import zipfile
 import argparse
 import time
 import subprocess
@@ -41,12 +39,18 @@ import platform
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple, Optional, Any, Union, Callable
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any, Union, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum, auto
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from difflib import SequenceMatcher
 
+from archive_stream import StreamingArchiveWriter
+from compact_graph import CompactGraph
+from phase_trace import Tracer, count, traced
+from project_watch import ProjectWatcher
+from structural_tokens import TOKENIZER_VERSION, diff_summary as token_diff_summary, structural_hash, tokenize
+
 # Optional: tqdm for progress bars
 try:
     from tqdm import tqdm
@@ -130,6 +134,8 @@ class Config:
     }
     IGNORE_FILES = {'.test.', '.spec.', '.d.ts', '.min.js', '.min.ts'}
     CACHE_FILE = '.gstudio_cache.json'
+    # Bump when _resolve_import rules change so persisted edges are re-resolved
+    EDGE_RESOLVER_VERSION = '2'
     AI_HOOKS = [
         'useGemini', 'useLMStudio', 'useLocalAI', 'useMultiAgent',
         'useAIProvider', 'useOpenAI', 'useAnthropic'
@@ -179,6 +185,9 @@ class Config:
     # File categories & supported extensions
     PY_EXTENSIONS = {'.py'}
     SUPPORTED_EXTENSIONS = VALID_EXTENSIONS | PY_EXTENSIONS
+    # Import resolution order (TypeScript's); a set would pick between
+    # foo.ts and foo.tsx twins by hash order
+    RESOLVE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.py')
     EXCLUDED_EXTENSIONS = {'.md', '.markdown'}
     ASSET_EXTENSIONS = {
         '.css', '.scss', '.sass', '.less', '.json', '.svg',
@@ -215,9 +224,15 @@ class Config:
     MAX_WORKERS_CPU = min(4, (os.cpu_count() or 1))
     CHUNK_SIZE = 100
 
+    # Watch mode
+    WATCH_POLL_INTERVAL = 0.5     # seconds between mtime sweeps without watchdog
+    WATCH_DEBOUNCE = 0.2          # quiet period before a batch of edits is applied
+    WATCH_LATENCY_BUDGET = 1.0    # seconds from applied batch to rewritten JSON
+
     # Archive subdirectories
     ARCHIVES_SUBDIR = 'archives'
     HISTORY_SUBDIR = 'history'
+    ARCHIVE_FORMATS = ('zip', 'tar.zst')   # tar.zst needs the zstandard package
 
 # Merge ignore sets
 Config.IGNORE_DIRS.update(Config.DEFAULT_IGNORE_PATTERNS)
@@ -312,7 +327,23 @@ class UnwiredType(Enum):
 # =============================================================================
 # DATA CLASSES – Merged from v7 and v6
 # =============================================================================
-@dataclass
+# Per-file records (FileInfo and everything it holds) are slotted, so no
+# per-instance __dict__, and intern the strings repeated across files: paths,
+# import sources, export, hook and context names.
+def _intern(value):
+    # None from a partial parse passes through
+    return sys.intern(value) if type(value) is str else value
+
+def _intern_details(details: List[Dict]) -> List[Dict]:
+    """Intern the source and name strings of parser import/export details in place."""
+    for detail in details:
+        if 'source' in detail:
+            detail['source'] = _intern(detail['source'])
+        for name in detail.get('imported') or detail.get('names') or ():
+            name['name'] = _intern(name.get('name'))
+    return details
+
+@dataclass(slots=True)
 class GitHistoryInfo:
     """Git history information for a file – v6."""
     has_history: bool
@@ -321,7 +352,7 @@ class GitHistoryInfo:
     last_commit_date: Optional[str] = None
     authors: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class CodeIssue:
     """Code quality issue – v6."""
     type: IssueType
@@ -330,7 +361,7 @@ class CodeIssue:
     line: Optional[int] = None
     suggestion: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class WiringSuggestion:
     """Wiring suggestion for unwired component – v6."""
     target_file: str
@@ -352,6 +383,12 @@ class DuplicateCluster:
     estimated_savings_lines: int
     confidence: float
 
+@dataclass
+class DeadIsland:
+    """Files unreachable from every entry point, connected only to each other."""
+    files: List[str]
+    total_lines: int
+
 @dataclass
 class ArchiveDecision:
     """Archive recommendation – v6."""
@@ -361,7 +398,7 @@ class ArchiveDecision:
     reasons: List[str]
     blockers: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Complete file analysis metadata – extended from v7 with v6 fields."""
     # ---------- v7 core ----------
@@ -435,6 +472,16 @@ class FileInfo:
     # Issues
     issues: List[CodeIssue] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.path = _intern(self.path)
+        self.relative_path = _intern(self.relative_path)
+        self.imports = [_intern(i) for i in self.imports]
+        self.exports = [_intern(e) for e in self.exports]
+        self.hooks_used = [_intern(h) for h in self.hooks_used]
+        self.contexts_used = [_intern(c) for c in self.contexts_used]
+        _intern_details(self.import_details)
+        _intern_details(self.export_details)
+
 @dataclass
 class ValuableComponent:
     """Unused but valuable component – v7."""
@@ -489,6 +536,7 @@ class AnalysisResult:
     insights: List[ArchitecturalInsight] = field(default_factory=list)
     dependency_graph: Dict[str, List[str]] = field(default_factory=dict)
     layer_stats: Dict[str, int] = field(default_factory=dict)
+    compact_graph: Optional[CompactGraph] = None
 
     # ---------- v6 enterprise extensions ----------
     files: Dict[str, FileInfo] = field(default_factory=dict)
@@ -497,9 +545,13 @@ class AnalysisResult:
     unused_files: List[str] = field(default_factory=list)
     unwired_features: List[str] = field(default_factory=list)
     high_risk_files: List[str] = field(default_factory=list)
+    unreachable_files: List[str] = field(default_factory=list)
+    dead_islands: List[DeadIsland] = field(default_factory=list)
     analysis_duration_seconds: float = 0.0
     cache_hit_rate: float = 0.0
     git_available: bool = False
+    phase_timings: List[Dict[str, Any]] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -588,6 +640,25 @@ class CacheManager:
         if self.use_cache:
             self.cache[str(file_path)] = data
 
+    def get_edges(self, file_path: str, content_hash: str, index_version: str) -> Optional[List[str]]:
+        """Resolved import targets stored for this content under this resolution index."""
+        if not self.use_cache:
+            return None
+        cached = self.cache.get(str(file_path))
+        if not cached or cached.get('hash') != content_hash:
+            return None
+        edges = cached.get('edges')
+        if not edges or edges.get('index') != index_version:
+            return None
+        return edges['targets']
+
+    def set_edges(self, file_path: str, content_hash: str, index_version: str, targets: List[str]):
+        if not self.use_cache:
+            return
+        cached = self.cache.get(str(file_path))
+        if cached and cached.get('hash') == content_hash:
+            cached['edges'] = {'index': index_version, 'targets': targets}
+
     def save(self):
         if not self.use_cache:
             return
@@ -1047,8 +1118,7 @@ class UnifiedParser:
         if self.compute_structural_hash:
             result.cyclomatic_complexity = self._calculate_complexity(node)
             result.any_count = self._count_any(node, content)
-            norm = self._normalize_ast(node)
-            result.structural_hash = compute_hash(norm)
+            result.structural_hash = structural_hash(content)
 
     def _find_identifier_node(self, node: Node) -> Optional[Node]:
         if node.type == 'identifier':
@@ -1105,18 +1175,6 @@ class UnifiedParser:
         walk(node)
         return count
 
-    def _normalize_ast(self, node: Node) -> str:
-        tokens = []
-        def walk(n: Node):
-            if n.type in {'identifier', 'string', 'number', 'template_string'}:
-                tokens.append(n.type)
-            elif n.type not in {'comment', 'whitespace'}:
-                tokens.append(n.type)
-                for child in n.children:
-                    walk(child)
-        walk(node)
-        return '|'.join(sorted(tokens))
-
     # ---------- Python extraction ----------
     def _extract_python_info(self, node: Node, content: str, result: ParsedData):
         def walk(n: Node):
@@ -1229,37 +1287,111 @@ class FileScanner:
             log_info(f"Found {len(files)} source files")
         return files
 
+    def accepts(self, path: Path) -> bool:
+        """Whether ``scan`` would report ``path`` (existence aside)."""
+        try:
+            rel = path.relative_to(self.src_path)
+        except ValueError:
+            return False
+        if any(part in Config.IGNORE_DIRS for part in rel.parts[:-1]):
+            return False
+        if path.suffix not in self.valid_extensions:
+            return False
+        return not any(pattern in path.name for pattern in Config.IGNORE_FILES)
+
 
 # =============================================================================
 # DEPENDENCY ANALYZER (v7 + v6 enhancements)
 # =============================================================================
+# Files the reachability sweep treats as roots when they sit at the source root
+SWEEP_ROOT_STEMS = ('main', 'App', 'app', 'index')
+SWEEP_ROOT_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+
+
 class DependencyAnalyzer:
     """Builds and analyzes dependency graph."""
 
     def __init__(self, project_path: Path, src_path: Path, files: Dict[str, FileInfo],
-                 detect_barrels: bool = False, detect_dynamic: bool = False):
+                 detect_barrels: bool = False, detect_dynamic: bool = False,
+                 cache: Optional[CacheManager] = None):
         self.project_path = project_path
         self.src_path = src_path
         self.files = files
         self.detect_barrels = detect_barrels
         self.detect_dynamic = detect_dynamic
+        self.cache = cache
+        self.resolved_count = 0
+        self.compact: Optional[CompactGraph] = None
+        self.dynamic_targets: Dict[str, List[str]] = {}   # file -> files it import()s
 
     def build_graph(self) -> Dict[str, List[str]]:
-        graph = defaultdict(list)
+        """Build edges, reusing each file's persisted edges when its content
+        and the resolution index are unchanged."""
+        index_version = self.index_version()
         for file_path, file_info in self.files.items():
-            for imp in file_info.imports:
-                resolved = self._resolve_import(file_path, imp)
-                if resolved and resolved in self.files:
-                    file_info.depends_on.append(resolved)
-                    self.files[resolved].dependents.append(file_path)
-                    graph[file_path].append(resolved)
+            self._link_file(file_path, file_info, index_version)
+        return self._link_graph(self.files)
+
+    def relink(self, changed: Iterable[str]) -> Dict[str, List[str]]:
+        """Re-resolve the edges of ``changed`` files only (--watch). Valid while
+        the analyzed path set is unchanged; adding or removing a file changes
+        index_version and needs build_graph."""
+        changed = [p for p in changed if p in self.files]
+        index_version = self.index_version()
+        for file_path in changed:
+            self._link_file(file_path, self.files[file_path], index_version)
+        return self._link_graph(changed)
+
+    def _link_file(self, file_path: str, file_info: FileInfo, index_version: str):
+        targets = None
+        if self.cache:
+            targets = self.cache.get_edges(file_path, file_info.hash, index_version)
+        if targets is None:
+            targets = self._resolve_edges(file_path, file_info)
+            self.resolved_count += 1
+            if self.cache:
+                self.cache.set_edges(file_path, file_info.hash, index_version, targets)
+        file_info.depends_on = [_intern(t) for t in targets if t in self.files]
+
+    def _link_graph(self, rescanned: Iterable[str]) -> Dict[str, List[str]]:
+        """Reverse edges, compact graph and barrel/dynamic marks from every
+        file's depends_on; only ``rescanned`` files are re-read for dynamic imports."""
+        graph = {}
+        reverse: Dict[str, Set[str]] = defaultdict(set)
+        for file_path, file_info in self.files.items():
+            for target in file_info.depends_on:
+                reverse[target].add(file_info.path)
+            if file_info.depends_on:
+                graph[file_path] = file_info.depends_on
+        for file_path, file_info in self.files.items():
+            file_info.dependents = sorted(reverse.get(file_path, ()))
+        self.compact = CompactGraph.from_adjacency(self.files, graph)
         # Optional enhancements
         if self.detect_barrels:
             self._mark_barrel_files()
         if self.detect_dynamic:
-            self._detect_dynamic_imports()
-        return dict(graph)
-
+            self._detect_dynamic_imports(rescanned)
+        return graph
+
+    def index_version(self) -> str:
+        """Fingerprint of everything import resolution depends on besides the
+        importing file itself: the resolver rules, the source root and the set
+        of analyzed paths. Adding or removing a file changes it."""
+        h = hashlib.sha256(Config.EDGE_RESOLVER_VERSION.encode())
+        h.update(str(self.src_path.relative_to(self.project_path)).encode())
+        for path in sorted(self.files):
+            h.update(b'\0' + path.encode())
+        return h.hexdigest()[:16]
+
+    def _resolve_edges(self, file_path: str, file_info: FileInfo) -> List[str]:
+        targets = {}
+        for imp in file_info.imports:
+            resolved = self._resolve_import(file_path, imp)
+            if resolved and resolved in self.files:
+                targets[resolved] = None
+        return list(targets)
+
+    @traced()
     def _resolve_import(self, from_file: str, import_path: str) -> Optional[str]:
         """Resolve relative import to absolute path (v7 logic)."""
         if not import_path.startswith('.') and not import_path.startswith('@/'):
@@ -1272,7 +1404,7 @@ class DependencyAnalyzer:
                 from_dir = Path(from_file).parent
                 base_path = (self.project_path / from_dir / import_path).resolve()
             # Try direct file
-            for ext in Config.SUPPORTED_EXTENSIONS:
+            for ext in Config.RESOLVE_EXTENSIONS:
                 test_path = base_path.with_suffix(ext)
                 try:
                     rel_path = str(test_path.relative_to(self.project_path))
@@ -1281,7 +1413,7 @@ class DependencyAnalyzer:
                 except ValueError:
                     continue
             # Try index file
-            for ext in Config.SUPPORTED_EXTENSIONS:
+            for ext in Config.RESOLVE_EXTENSIONS:
                 test_path = base_path / f'index{ext}'
                 try:
                     rel_path = str(test_path.relative_to(self.project_path))
@@ -1295,25 +1427,68 @@ class DependencyAnalyzer:
 
     def _mark_barrel_files(self):
         """Mark files that re‑export others (index.ts with exports)."""
+        for file_info in self.files.values():
+            file_info.is_barrel_exported = False
         for file_path, file_info in self.files.items():
             if file_info.is_barrel_file:
                 for dep in file_info.depends_on:
                     if dep in self.files:
                         self.files[dep].is_barrel_exported = True
 
-    def _detect_dynamic_imports(self):
-        """Find dynamic import() statements."""
+    def _detect_dynamic_imports(self, paths: Iterable[str]):
+        """Find dynamic import() statements in ``paths``; targets found earlier
+        in the other files are kept."""
         dyn_pattern = re.compile(r'import\s*\(["\']([^"\']+)["\']\)')
-        for file_path, file_info in self.files.items():
+        for file_path in paths:
+            targets = []
             try:
-                full_path = self.project_path / file_info.path
+                full_path = self.project_path / self.files[file_path].path
                 content = full_path.read_text(encoding='utf-8', errors='ignore')
                 for match in dyn_pattern.findall(content):
                     resolved = self._resolve_import(file_path, match)
                     if resolved and resolved in self.files:
-                        self.files[resolved].is_dynamic_imported = True
+                        targets.append(resolved)
             except:
                 pass
+            self.dynamic_targets[file_path] = targets
+        for file_path in list(self.dynamic_targets):
+            if file_path not in self.files:
+                del self.dynamic_targets[file_path]
+        for file_info in self.files.values():
+            file_info.is_dynamic_imported = False
+        for targets in self.dynamic_targets.values():
+            for target in targets:
+                if target in self.files:
+                    self.files[target].is_dynamic_imported = True
+
+    def find_unreachable(self, extra_entries: Iterable[str] = ()) -> Tuple[List[str], List[DeadIsland]]:
+        """Mark-and-sweep: one multi-source BFS from every entry point over the
+        import graph. Whatever it does not reach is dead, including clusters
+        that only import each other; those come back as islands, largest first."""
+        graph = self.compact
+        roots = set(extra_entries)
+        for file_path, file_info in self.files.items():
+            if file_info.is_dynamic_imported or self._is_sweep_root(file_path):
+                roots.add(file_path)
+        reached = graph.reachable(graph.id_of(p) for p in roots if graph.id_of(p) is not None)
+        dead = bytearray(not hit for hit in reached)
+
+        islands = []
+        for component in graph.weak_components(dead):
+            files = sorted(graph.paths_of(component))
+            islands.append(DeadIsland(files=files, total_lines=sum(self.files[p].lines for p in files)))
+        islands.sort(key=lambda island: (-island.total_lines, island.files[0]))
+        unreachable = [path for i, path in enumerate(graph.paths) if dead[i]]
+        return unreachable, islands
+
+    def _is_sweep_root(self, file_path: str) -> bool:
+        """JS/TS main.* / App.* / index.* at the source root only (deeper index
+        files are barrels and must earn reachability; types/app.ts or a
+        main.py elsewhere is no entry point)."""
+        path = Path(file_path)
+        if path.suffix not in SWEEP_ROOT_SUFFIXES or path.stem not in SWEEP_ROOT_STEMS:
+            return False
+        return (self.project_path / path).parent == self.src_path
 
     def find_unused(self) -> List[str]:
         """Files without dependents and not entry points (v7)."""
@@ -1445,6 +1620,7 @@ class WiringIssueDetector:
         low, high = Config.SEVERITY_SCORES[severity.value]
         return (low + high) // 2
 
+    @traced()
     def detect_issues(self, file_path: str, content: str) -> List[WiringIssue]:
         issues = []
         import_pattern = r"import\s+(?:{[^}]+}|[\w\s,*]+)\s+from\s+['\"]([^'\"]+)['\"]"
@@ -1681,9 +1857,11 @@ const data = await mcpService.request('/api/data');""",
 class ArchitecturalAnalyzer:
     """Analyzes architectural patterns and health."""
 
-    def __init__(self, files: Dict[str, FileInfo], project_path: Path):
+    def __init__(self, files: Dict[str, FileInfo], project_path: Path,
+                 graph: Optional[CompactGraph] = None):
         self.files = files
         self.project_path = project_path
+        self.graph = graph
 
     def analyze(self) -> List[ArchitecturalInsight]:
         insights = []
@@ -1703,6 +1881,16 @@ class ArchitecturalAnalyzer:
 
     def _detect_cycles(self) -> Optional[ArchitecturalInsight]:
         """Detect cycles of length 2–5 in the dependency graph."""
+        # Every cycle stays inside one strongly connected component, so with
+        # the compact graph only members of non-trivial SCCs are searched.
+        component_of: Optional[Dict[str, int]] = None
+        if self.graph is not None:
+            component_of = {}
+            for k, component in enumerate(self.graph.strongly_connected_components()):
+                if len(component) > 1:
+                    for path in self.graph.paths_of(component):
+                        component_of[path] = k
+
         def dfs(start: str, current: str, depth: int, path: List[str], visited: Set[str]) -> List[List[str]]:
             cycles = []
             if depth > 5:
@@ -1720,6 +1908,8 @@ class ArchitecturalAnalyzer:
             file_info = self.files.get(current)
             if file_info:
                 for dep in file_info.depends_on:
+                    if component_of is not None and component_of.get(dep) != component_of[current]:
+                        continue
                     if dep in self.files:
                         cycles.extend(dfs(start, dep, depth + 1, path[:], visited))
             return cycles
@@ -1727,6 +1917,8 @@ class ArchitecturalAnalyzer:
         all_cycles = []
         processed = set()
         for file_path in self.files:
+            if component_of is not None and file_path not in component_of:
+                continue
             if file_path not in processed:
                 cycles = dfs(file_path, file_path, 0, [], set())
                 for cycle in cycles:
@@ -2057,9 +2249,11 @@ class ArchitecturalAnalyzer:
 class DuplicateDetector:
     """Detects exact and structural duplicates using Jaccard similarity."""
 
-    def __init__(self, files: Dict[str, FileInfo], threshold: float = 0.85):
+    def __init__(self, files: Dict[str, FileInfo], threshold: float = 0.85,
+                 project_path: Optional[Path] = None):
         self.files = files
         self.threshold = threshold
+        self.project_path = project_path
 
     def detect(self, parallel: bool = True) -> List[DuplicateCluster]:
         exact = self._find_exact_duplicates()
@@ -2145,13 +2339,21 @@ class DuplicateDetector:
             return None
         avg_score = sum(s for _, s in similar) / len(similar)
         cluster_files = [base] + [f for f, _ in similar]
+        summary = f"Structural similarity: {avg_score:.0%}"
+        if self.project_path:
+            try:
+                summary += "; " + token_diff_summary(
+                    tokenize((self.project_path / base).read_text(encoding='utf-8', errors='ignore')),
+                    tokenize((self.project_path / similar[0][0]).read_text(encoding='utf-8', errors='ignore')))
+            except OSError:
+                pass
         return DuplicateCluster(
             cluster_id=f"struct_{self.files[base].structural_hash[:8]}",
             similarity_score=avg_score,
             files=cluster_files,
             base_file=base,
             merge_target=base,
-            diff_summary=f"Structural similarity: {avg_score:.0%}",
+            diff_summary=summary,
             estimated_savings_lines=sum(self.files[f].lines for f in cluster_files[1:]),
             confidence=avg_score * 100
         )
@@ -2395,15 +2597,16 @@ class RecommendationEngine:
 
 
 # =============================================================================
-# ARCHIVE MANAGER (v6)
+# ARCHIVE MANAGER (v6, streaming writer in archive_stream.py)
 # =============================================================================
 class ArchiveManager:
-    """Creates timestamped ZIP archives with metadata."""
+    """Creates timestamped ZIP (or tar.zst) archives with metadata."""
 
-    def __init__(self, project_path: Path, report_dir: Path, dry_run: bool = False):
+    def __init__(self, project_path: Path, report_dir: Path, dry_run: bool = False, fmt: str = 'zip'):
         self.project_path = project_path
         self.report_dir = report_dir
         self.dry_run = dry_run
+        self.fmt = fmt
         self.archives_dir = report_dir / Config.ARCHIVES_SUBDIR
         self.history_dir = report_dir / Config.HISTORY_SUBDIR
 
@@ -2423,21 +2626,30 @@ class ArchiveManager:
         self.history_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        archive_name = f"archive_{timestamp}.zip"
+        archive_name = f"archive_{timestamp}.{self.fmt}"
         archive_path = self.archives_dir / archive_name
 
         try:
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_path in files:
-                    full = self.project_path / file_path
-                    if full.exists():
-                        zf.write(full, file_path)
+            # Stream straight from the project; each file is read once
+            items = [(self.project_path / f, Path(f).as_posix()) for f in files
+                     if (self.project_path / f).exists()]
+            with StreamingArchiveWriter(archive_path, self.fmt, Config.MAX_WORKERS_IO) as writer:
+                for entry in writer.add_files(items):
+                    if 'error' in entry:
+                        log_warning(f"Skipped {entry['arcname']}: {entry['error']}")
+            problems = writer.verify()
+            if problems:
+                raise ValueError(f"{len(problems)} member(s) failed verification: {problems[:3]}")
             # Metadata
             metadata = {
                 'timestamp': timestamp,
                 'reason': reason,
                 'files': files,
-                'count': len(files)
+                'count': len(files),
+                'format': self.fmt,
+                'hashes': {e['arcname']: e['sha256'] for e in writer.entries},
+                'duplicate_of': {e['arcname']: e['duplicate_of'] for e in writer.entries if e['duplicate_of']},
+                **writer.stats()
             }
             meta_path = self.history_dir / f"archive_{timestamp}.json"
             with open(meta_path, 'w') as f:
@@ -2467,6 +2679,8 @@ class HTMLReportGenerator:
             extra_sections += HTMLReportGenerator._build_archive_section(result.archive_candidates)
         if any(f.recommendation != Recommendation.KEEP for f in result.files.values()):
             extra_sections += HTMLReportGenerator._build_recommendation_section(result.files)
+        if result.phase_timings:
+            extra_sections += HTMLReportGenerator._build_performance_section(result)
         # Insert before footer
         final_html = v7_html.replace('</div>\n        \n        <div class="footer">',
                                      f'{extra_sections}</div>\n        \n        <div class="footer">')
@@ -2785,6 +2999,35 @@ class HTMLReportGenerator:
     </table>
 </div>"""
 
+    @staticmethod
+    def _build_performance_section(result: AnalysisResult) -> str:
+        total_ms = result.analysis_duration_seconds * 1000 or 1.0
+        rows = []
+        for t in result.phase_timings:
+            name = t['name'] if t['cat'] == 'phase' else f"<code>{t['name']}</code>"
+            peak = f"{t['peak_kb']:,.0f} KB" if t['peak_kb'] is not None else '–'
+            rows.append(f"""
+<tr>
+    <td>{name}</td>
+    <td>{t['cat']}</td>
+    <td>{t['calls']:,}</td>
+    <td>{t['total_ms']:,.1f}</td>
+    <td>{t['total_ms'] / total_ms:.0%}</td>
+    <td>{t['max_ms']:,.1f}</td>
+    <td>{peak}</td>
+</tr>""")
+        counters = ' · '.join(f"{k.replace('_', ' ')}: <strong>{v:,}</strong>"
+                              for k, v in sorted(result.counters.items()))
+        return f"""
+<div class="section">
+    <h2 class="section-title">⏱️ Performance</h2>
+    <p>{counters}</p>
+    <table class="data-table sortable">
+        <thead><tr><th>Span</th><th>Kind</th><th>Calls</th><th>Total (ms)</th><th>Share</th><th>Max (ms)</th><th>Peak memory</th></tr></thead>
+        <tbody>{''.join(rows)}</tbody>
+    </table>
+</div>"""
+
     @staticmethod
     def _build_archive_section(candidates: List[ArchiveDecision]) -> str:
         rows = []
@@ -2841,7 +3084,7 @@ class HTMLReportGenerator:
 # =============================================================================
 # JSON & CSV EXPORTERS (v7 extended)
 # =============================================================================
-def export_json_report(result: AnalysisResult, output_path: Path):
+def export_json_report(result: AnalysisResult, output_path: Path, quiet: bool = False):
     """Save full analysis as JSON (v7 extended)."""
     data = {
         'version': '7.2.0',
@@ -2858,13 +3101,20 @@ def export_json_report(result: AnalysisResult, output_path: Path):
         'unused_files': result.unused_files,
         'unwired_features': result.unwired_features,
         'high_risk_files': result.high_risk_files,
+        'unreachable_files': result.unreachable_files,
+        'dead_islands': [asdict(i) for i in result.dead_islands],
         'analysis_duration_seconds': result.analysis_duration_seconds,
         'cache_hit_rate': result.cache_hit_rate,
         'git_available': result.git_available,
+        'phase_timings': result.phase_timings,
+        'counters': result.counters,
     }
-    with open(output_path, 'w') as f:
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
         json.dump(data, f, indent=2, default=str)
-    log_success(f"JSON report saved to {output_path}")
+    os.replace(tmp_path, output_path)
+    if not quiet:
+        log_success(f"JSON report saved to {output_path}")
 
 def export_csv_reports(result: AnalysisResult, output_dir: Path):
     """Export valuable_unused, wiring_issues, duplicate_clusters, archive_candidates."""
@@ -2934,10 +3184,14 @@ class GStudioAnalyzer:
                  enable_recommendations: bool = False,
                  archive: bool = False,
                  archive_reason: str = "",
+                 archive_format: str = "zip",
                  git_history: bool = False,
                  use_git_in_scoring: bool = False,
                  detect_barrels: bool = False,
                  detect_dynamic: bool = False,
+                 reachability: bool = False,
+                 trace_path: Optional[Path] = None,
+                 trace_memory: bool = False,
                  ):
 
         self.project_path = project_path
@@ -2956,10 +3210,17 @@ class GStudioAnalyzer:
         self.enable_recommendations = enable_recommendations
         self.archive = archive
         self.archive_reason = archive_reason
+        self.archive_format = archive_format
         self.git_history = git_history
         self.use_git_in_scoring = use_git_in_scoring
         self.detect_barrels = detect_barrels
-        self.detect_dynamic = detect_dynamic
+        # Dynamic import targets are sweep roots, so reachability needs them
+        self.detect_dynamic = detect_dynamic or reachability
+        self.reachability = reachability
+        # Phases are always timed; --trace adds hot-helper spans and a Chrome trace file
+        self.trace_path = trace_path
+        self.trace_memory = trace_memory
+        self.tracer = Tracer()
 
         if not dry_run:
             self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -2984,6 +3245,7 @@ class GStudioAnalyzer:
 
         # Data containers
         self.files: Dict[str, FileInfo] = {}
+        self.dep_analyzer: Optional[DependencyAnalyzer] = None   # kept for --watch
         self.result = AnalysisResult(total_files=0, tsx_percentage=0, total_lines=0)
         self.skipped_files = 0
         self._start_time = 0
@@ -2991,107 +3253,243 @@ class GStudioAnalyzer:
     def analyze(self) -> AnalysisResult:
         log_header("G-STUDIO ENTERPRISE CODE INTELLIGENCE v7.2")
         self._start_time = time.time()
+        self.tracer = Tracer(detail=self.trace_path is not None, memory=self.trace_memory)
+        with self.tracer, self.tracer.span('analyze'):
+            self._run_phases()
+        self.result.phase_timings = self.tracer.summary()
+        self.result.counters = dict(self.tracer.counters)
+        self.result.analysis_duration_seconds = time.time() - self._start_time
+        if self.trace_path:
+            self.tracer.export_chrome_trace(self.trace_path)
+            log_success(f"Chrome trace saved to {self.trace_path}")
+
+        # Save cache
+        if not self.dry_run:
+            self.cache.save()
+
+        return self.result
+
+    def _run_phases(self):
+        span = self.tracer.span
 
         # ---------- Scan ----------
-        log_info("Scanning project files...")
-        file_paths = self.scanner.scan()
-        total_candidates = len(file_paths)
-        log_success(f"Found {total_candidates} source files")
+        with span('scan'):
+            log_info("Scanning project files...")
+            file_paths = self.scanner.scan()
+            total_candidates = len(file_paths)
+            count('files_scanned', total_candidates)
+            log_success(f"Found {total_candidates} source files")
 
         # ---------- Changed only (v7) ----------
         if self.changed_only:
-            log_info("Filtering to files changed since last commit...")
-            changed_set = self.git_helper.get_changed_files_since_last_commit(self.project_path)
-            if changed_set is not None:
-                changed_rel = {str(Path(p).as_posix()) for p in changed_set}
-                original_count = len(file_paths)
-                file_paths = [p for p in file_paths
-                             if str(p.relative_to(self.project_path).as_posix()) in changed_rel]
-                self.skipped_files = original_count - len(file_paths)
-                log_success(f"Keeping {len(file_paths)} changed files, skipped {self.skipped_files} unchanged files")
-            else:
-                log_warning("Could not get changed files from git, proceeding with full scan")
+            with span('changed_only'):
+                log_info("Filtering to files changed since last commit...")
+                changed_set = self.git_helper.get_changed_files_since_last_commit(self.project_path)
+                if changed_set is not None:
+                    changed_rel = {str(Path(p).as_posix()) for p in changed_set}
+                    original_count = len(file_paths)
+                    file_paths = [p for p in file_paths
+                                 if str(p.relative_to(self.project_path).as_posix()) in changed_rel]
+                    self.skipped_files = original_count - len(file_paths)
+                    log_success(f"Keeping {len(file_paths)} changed files, skipped {self.skipped_files} unchanged files")
+                else:
+                    log_warning("Could not get changed files from git, proceeding with full scan")
 
         # ---------- Parse files ----------
-        log_info("Parsing and analyzing files...")
-        self._analyze_files(file_paths)
-        log_success(f"Analyzed {len(self.files)} files")
+        with span('parse'):
+            log_info("Parsing and analyzing files...")
+            self._analyze_files(file_paths)
+            count('files_analyzed', len(self.files))
+            count('cache_hits', self.cache.hits)
+            count('cache_misses', self.cache.misses)
+            log_success(f"Analyzed {len(self.files)} files")
 
         # ---------- Dependency graph ----------
-        log_info("Building dependency graph...")
-        dep_analyzer = DependencyAnalyzer(
-            self.project_path, self.scanner.src_path, self.files,
-            detect_barrels=self.detect_barrels,
-            detect_dynamic=self.detect_dynamic
-        )
-        self.result.dependency_graph = dep_analyzer.build_graph()
-        unused = dep_analyzer.find_unused()
-        self.result.unused_files = unused
-        log_success(f"Found {len(unused)} potentially unused files")
+        with span('dependency_graph'):
+            log_info("Building dependency graph...")
+            dep_analyzer = DependencyAnalyzer(
+                self.project_path, self.scanner.src_path, self.files,
+                detect_barrels=self.detect_barrels,
+                detect_dynamic=self.detect_dynamic,
+                cache=self.cache
+            )
+            self.result.dependency_graph = dep_analyzer.build_graph()
+            self.result.compact_graph = dep_analyzer.compact
+            self.dep_analyzer = dep_analyzer
+            count('edges_resolved', dep_analyzer.resolved_count)
+            if self.verbose:
+                log_info(f"Resolved edges for {dep_analyzer.resolved_count} files, "
+                         f"reused {len(self.files) - dep_analyzer.resolved_count} from cache")
+        with span('unused'):
+            if self.reachability:
+                unused, islands = dep_analyzer.find_unreachable()
+                self.result.unreachable_files = unused
+                self.result.dead_islands = islands
+                log_success(f"Found {len(unused)} files unreachable from entry points "
+                            f"in {len(islands)} dead islands "
+                            f"({sum(i.total_lines for i in islands):,} reclaimable lines)")
+            else:
+                unused = dep_analyzer.find_unused()
+                log_success(f"Found {len(unused)} potentially unused files")
+            self.result.unused_files = unused
 
         # ---------- Valuable unused scoring (v7) ----------
-        log_info("Scoring valuable unused components...")
-        self._find_valuable_unused(unused)
-        log_success(f"Found {len(self.result.valuable_unused)} valuable unused components (min score: {self.min_score})")
+        with span('valuable_unused'):
+            log_info("Scoring valuable unused components...")
+            self._find_valuable_unused(unused)
+            log_success(f"Found {len(self.result.valuable_unused)} valuable unused components (min score: {self.min_score})")
 
         # ---------- Wiring issues (v7) ----------
-        log_info("Detecting wiring issues...")
-        self._detect_wiring_issues()
-        log_success(f"Found {len(self.result.wiring_issues)} wiring issues")
+        with span('wiring_issues'):
+            log_info("Detecting wiring issues...")
+            self._detect_wiring_issues()
+            log_success(f"Found {len(self.result.wiring_issues)} wiring issues")
 
         # ---------- Architectural insights (v7) ----------
-        log_info("Analyzing architecture...")
-        arch_analyzer = ArchitecturalAnalyzer(self.files, self.project_path)
-        self.result.insights = arch_analyzer.analyze()
-        log_success(f"Generated {len(self.result.insights)} architectural insights")
+        with span('architecture'):
+            log_info("Analyzing architecture...")
+            arch_analyzer = ArchitecturalAnalyzer(self.files, self.project_path, self.result.compact_graph)
+            self.result.insights = arch_analyzer.analyze()
+            log_success(f"Generated {len(self.result.insights)} architectural insights")
 
         # ---------- Duplicate detection (enterprise) ----------
         if self.enable_duplicates:
-            log_info("Detecting duplicates...")
-            dup_detector = DuplicateDetector(self.files, Config.STRUCTURAL_SIMILARITY_THRESHOLD)
-            self.result.duplicate_clusters = dup_detector.detect(parallel=self.parallel)
-            log_success(f"Found {len(self.result.duplicate_clusters)} duplicate clusters")
+            with span('duplicates'):
+                log_info("Detecting duplicates...")
+                dup_detector = DuplicateDetector(self.files, Config.STRUCTURAL_SIMILARITY_THRESHOLD, self.project_path)
+                self.result.duplicate_clusters = dup_detector.detect(parallel=self.parallel)
+                log_success(f"Found {len(self.result.duplicate_clusters)} duplicate clusters")
 
         # ---------- Usage analysis (unwired) ----------
         if self.enable_recommendations or self.archive:
-            log_info("Analyzing usage and unwired components...")
-            usage_analyzer = UsageAnalyzer(self.files, self.result.dependency_graph, self.git_analyzer)
-            unused, unwired = usage_analyzer.analyze()
-            self.result.unused_files = unused
-            self.result.unwired_features = unwired
-            log_success(f"Found {len(unwired)} unwired features")
+            with span('usage'):
+                log_info("Analyzing usage and unwired components...")
+                usage_analyzer = UsageAnalyzer(self.files, self.result.dependency_graph, self.git_analyzer)
+                unused, unwired = usage_analyzer.analyze()
+                if not self.reachability:
+                    self.result.unused_files = unused
+                self.result.unwired_features = unwired
+                log_success(f"Found {len(unwired)} unwired features")
 
         # ---------- Recommendations ----------
         if self.enable_recommendations:
-            log_info("Generating recommendations...")
-            rec_engine = RecommendationEngine(
-                self.files, self.result.dependency_graph,
-                self.result.duplicate_clusters, self.result.unwired_features
-            )
-            rec_engine.generate_recommendations()
-            log_success("Recommendations generated")
+            with span('recommendations'):
+                log_info("Generating recommendations...")
+                rec_engine = RecommendationEngine(
+                    self.files, self.result.dependency_graph,
+                    self.result.duplicate_clusters, self.result.unwired_features
+                )
+                rec_engine.generate_recommendations()
+                log_success("Recommendations generated")
 
         # ---------- Archive candidates ----------
         if self.archive:
-            log_info("Selecting archive candidates...")
-            candidates = self._select_archive_candidates()
-            self.result.archive_candidates = candidates
-            log_success(f"Selected {len(candidates)} archive candidates")
-            archive_mgr = ArchiveManager(self.project_path, self.output_dir, self.dry_run)
-            archive_mgr.archive_files([c.file_path for c in candidates], self.archive_reason)
+            with span('archive'):
+                log_info("Selecting archive candidates...")
+                candidates = self._select_archive_candidates()
+                self.result.archive_candidates = candidates
+                log_success(f"Selected {len(candidates)} archive candidates")
+                archive_mgr = ArchiveManager(self.project_path, self.output_dir, self.dry_run, self.archive_format)
+                archive_mgr.archive_files([c.file_path for c in candidates], self.archive_reason)
 
         # ---------- Statistics ----------
-        self._calculate_stats()
-        self.result.files = self.files
-        self.result.cache_hit_rate = self.cache.hit_rate()
-        self.result.git_available = self.git_analyzer.is_git_repo if self.git_analyzer else False
-        self.result.analysis_duration_seconds = time.time() - self._start_time
+        with span('statistics'):
+            self._calculate_stats()
+            self.result.files = self.files
+            self.result.cache_hit_rate = self.cache.hit_rate()
+            self.result.git_available = self.git_analyzer.is_git_repo if self.git_analyzer else False
+
+    def watch(self):
+        """Keep files and graph in memory after ``analyze`` and re-analyze only
+        what each edit batch touches, rewriting the JSON report.
+
+        Wiring issues, insights, duplicates, recommendations and archiving stay
+        as computed by the initial run; they need whole-project passes.
+        """
+        if self.dep_analyzer is None:
+            log_error("Nothing to watch: the initial analysis did not build a graph")
+            return
+        json_path = self.output_dir / 'analysis_report.json'
+        watcher = ProjectWatcher(self.scanner, Config.WATCH_POLL_INTERVAL, Config.WATCH_DEBOUNCE)
+        watcher.start()
+        log_header(f"WATCH MODE ({watcher.backend}) – Ctrl+C to stop")
+        if watcher.fallback_reason:
+            log_info(f"Polling for changes: {watcher.fallback_reason}")
+        try:
+            while True:
+                changed, removed = watcher.wait()
+                started = time.time()
+                changed_rel, removed_rel = self._apply_changes(changed, removed)
+                if not self.dry_run:
+                    export_json_report(self.result, json_path, quiet=True)
+                elapsed = time.time() - started
+                log_success(f"{len(changed_rel)} changed, {len(removed_rel)} removed – "
+                            f"{len(self.result.unused_files)} unused, {len(self.result.unwired_features)} unwired "
+                            f"({elapsed * 1000:.0f} ms)")
+                if elapsed > Config.WATCH_LATENCY_BUDGET:
+                    log_warning(f"Update took {elapsed:.2f}s, over the {Config.WATCH_LATENCY_BUDGET}s budget")
+        except KeyboardInterrupt:
+            log_info("Watch stopped")
+        finally:
+            watcher.stop()
+            if not self.dry_run:
+                self.cache.save()
+
+    def _apply_changes(self, changed: Set[Path], removed: Set[Path]) -> Tuple[Set[str], Set[str]]:
+        changed_rel, removed_rel = set(), set()
+        added = False
+        for file_path in removed:
+            rel_path = str(file_path.relative_to(self.project_path))
+            if self.files.pop(rel_path, None) is not None:
+                removed_rel.add(rel_path)
+        for file_path in changed:
+            rel_path = str(file_path.relative_to(self.project_path))
+            existed = self.files.pop(rel_path, None) is not None
+            self._analyze_single_file(file_path)
+            if rel_path in self.files:
+                changed_rel.add(rel_path)
+                added = added or not existed
+            elif existed:
+                removed_rel.add(rel_path)
+
+        # The analyzed path set feeds import resolution, so additions and
+        # removals re-resolve every file (cached edges miss on index_version).
+        dep_analyzer = self.dep_analyzer
+        if added or removed_rel:
+            self.result.dependency_graph = dep_analyzer.build_graph()
+        else:
+            self.result.dependency_graph = dep_analyzer.relink(changed_rel)
+        self.result.compact_graph = dep_analyzer.compact
 
-        # Save cache
-        if not self.dry_run:
-            self.cache.save()
+        previous_unused = set(self.result.unused_files)
+        if self.reachability:
+            unused, self.result.dead_islands = dep_analyzer.find_unreachable()
+            self.result.unreachable_files = unused
+        else:
+            unused = dep_analyzer.find_unused()
+        if self.enable_recommendations or self.archive:
+            for fi in self.files.values():
+                fi.unwired_type = None
+            usage_unused, self.result.unwired_features = UsageAnalyzer(
+                self.files, self.result.dependency_graph, self.git_analyzer).analyze()
+            if not self.reachability:
+                unused = usage_unused
+        self.result.unused_files = unused
 
-        return self.result
+        # Scores depend only on each file's own content: keep the unchanged ones
+        unused_set = set(unused)
+        rescore = changed_rel | (unused_set ^ previous_unused)
+        self.result.valuable_unused = [c for c in self.result.valuable_unused
+                                       if c.path in unused_set and c.path not in rescore]
+        self._find_valuable_unused([p for p in unused if p in rescore])
+        order = {path: i for i, path in enumerate(unused)}
+        self.result.valuable_unused.sort(key=lambda c: order[c.path])
+        self.result.wiring_issues = [i for i in self.result.wiring_issues if i.file_path not in removed_rel]
+
+        self.result.layer_stats = {}
+        self._calculate_stats()
+        self.result.files = self.files
+        return changed_rel, removed_rel
 
     def _analyze_files(self, file_paths: List[Path]):
         """Parallel or sequential file analysis."""
@@ -3108,20 +3506,26 @@ class GStudioAnalyzer:
             for p in tqdm(file_paths, desc="Analyzing files"):
                 self._analyze_single_file(p)
 
+    @traced()
     def _analyze_single_file(self, file_path: Path):
         """Parse a single file, use cache, build FileInfo."""
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
             content_hash = compute_hash(content)
-            mtime = file_path.stat().st_mtime
+            st = file_path.stat()
+            mtime = st.st_mtime
+            count('bytes_read', st.st_size)
             rel_path = str(file_path.relative_to(self.project_path))
 
             cached = self.cache.get(rel_path, mtime, content_hash)
+            if (cached and self.parser.compute_structural_hash
+                    and cached.get('structural') != TOKENIZER_VERSION):
+                cached = None  # structural hash missing or from another normalizer
             if cached:
-                # Reconstruct FileInfo from cache
-                data = cached['file_info']
+                # Reconstruct FileInfo from cache (copy: the entry is saved again as JSON)
+                data = dict(cached['file_info'])
                 # Ensure all new fields exist (backward compat)
-                for field in ['structural_hash', 'cyclomatic_complexity', 'any_count',
+                for name in ['structural_hash', 'cyclomatic_complexity', 'any_count',
                               'category', 'is_barrel_file', 'is_test_file', 'git_history',
                               'days_since_modified', 'cognitive_complexity', 'comment_ratio',
                               'is_dynamic_imported', 'has_side_effects', 'is_barrel_exported',
@@ -3129,25 +3533,25 @@ class GStudioAnalyzer:
                               'wiring_suggestions', 'stability_score', 'risk_level',
                               'risk_score', 'recommendation', 'recommendation_reasons',
                               'recommendation_confidence', 'issues']:
-                    if field not in data:
-                        if field == 'category':
-                            data[field] = FileCategory.UNKNOWN.value
-                        elif field in ['days_since_modified', 'cognitive_complexity']:
-                            data[field] = 0
-                        elif field == 'comment_ratio':
-                            data[field] = 0.0
-                        elif field == 'risk_level':
-                            data[field] = RiskLevel.LOW.value
-                        elif field == 'recommendation':
-                            data[field] = Recommendation.KEEP.value
-                        elif field in ['structural_duplicates', 'wiring_suggestions', 'issues']:
-                            data[field] = []
-                        elif field in ['unwired_type', 'duplicate_of', 'git_history']:
-                            data[field] = None
-                        elif field in ['is_barrel_exported', 'is_dynamic_imported', 'has_side_effects']:
-                            data[field] = False
+                    if name not in data:
+                        if name == 'category':
+                            data[name] = FileCategory.UNKNOWN.value
+                        elif name in ['days_since_modified', 'cognitive_complexity']:
+                            data[name] = 0
+                        elif name == 'comment_ratio':
+                            data[name] = 0.0
+                        elif name == 'risk_level':
+                            data[name] = RiskLevel.LOW.value
+                        elif name == 'recommendation':
+                            data[name] = Recommendation.KEEP.value
+                        elif name in ['structural_duplicates', 'wiring_suggestions', 'issues']:
+                            data[name] = []
+                        elif name in ['unwired_type', 'duplicate_of', 'git_history']:
+                            data[name] = None
+                        elif name in ['is_barrel_exported', 'is_dynamic_imported', 'has_side_effects']:
+                            data[name] = False
                         else:
-                            data[field] = "" if field == 'structural_hash' else 0
+                            data[name] = "" if name == 'structural_hash' else 0
                 # Convert enum fields
                 if 'layer' in data and isinstance(data['layer'], str):
                     data['layer'] = LayerType(data['layer'])
@@ -3235,11 +3639,14 @@ class GStudioAnalyzer:
                     cache_data['unwired_type'] = cache_data['unwired_type'].value
                 if cache_data['git_history']:
                     cache_data['git_history'] = asdict(cache_data['git_history'])
-                self.cache.set(rel_path, {
+                entry = {
                     'mtime': mtime,
                     'hash': content_hash,
                     'file_info': cache_data
-                })
+                }
+                if self.parser.compute_structural_hash:
+                    entry['structural'] = TOKENIZER_VERSION
+                self.cache.set(rel_path, entry)
 
             self.files[rel_path] = file_info
 
@@ -3485,6 +3892,9 @@ import {{ {name} }} from '@/{imp_path}';
             print(f"{Colors.BOLD}Duplicate Clusters:{Colors.END} {len(self.result.duplicate_clusters)}")
         if self.result.unwired_features:
             print(f"{Colors.BOLD}Unwired Features:{Colors.END} {len(self.result.unwired_features)}")
+        if self.reachability:
+            print(f"{Colors.BOLD}Unreachable Files:{Colors.END} {len(self.result.unreachable_files)} "
+                  f"in {len(self.result.dead_islands)} dead islands")
         print(f"\n{Colors.BOLD}{Colors.CYAN}📊 HTML report:{Colors.END} {self.output_dir / 'analysis_report.html'}")
 
 
@@ -3505,6 +3915,12 @@ Examples:
 
   # Dry run archive
   %(prog)s . --archive --dry-run
+
+  # Dead code by reachability from entry points (finds dead clusters)
+  %(prog)s . --reachability
+
+  # Where does the time go? (per-phase table in the HTML report, plus a Chrome trace)
+  %(prog)s . --trace trace.json --trace-memory
 """
     )
     # ---------- v7 arguments (preserved) ----------
@@ -3525,10 +3941,20 @@ Examples:
     parser.add_argument('--enable-recommendations', action='store_true', help='Generate recommendations')
     parser.add_argument('--archive', action='store_true', help='Archive candidates')
     parser.add_argument('--archive-reason', default='', help='Reason for archive')
+    parser.add_argument('--archive-format', choices=Config.ARCHIVE_FORMATS, default='zip',
+                        help='Archive format (tar.zst compresses on all cores; needs zstandard)')
     parser.add_argument('--git-history', action='store_true', help='Fetch full git history')
     parser.add_argument('--use-git-in-scoring', action='store_true', help='Use git signals in value scoring')
     parser.add_argument('--detect-barrels', action='store_true', help='Mark barrel exports')
     parser.add_argument('--detect-dynamic', action='store_true', help='Detect dynamic imports')
+    parser.add_argument('--reachability', action='store_true',
+                        help='Mark-and-sweep unused detection from entry points (reports dead islands)')
+    parser.add_argument('--watch', '-w', action='store_true',
+                        help='After the run, re-analyze edited files incrementally and rewrite the JSON report')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Also time hot helpers and write a Chrome trace (chrome://tracing, Perfetto)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Record tracemalloc peak per phase (slows analysis)')
 
     return parser.parse_args()
 
@@ -3557,16 +3983,22 @@ def main():
         enable_recommendations=args.enable_recommendations,
         archive=args.archive,
         archive_reason=args.archive_reason,
+        archive_format=args.archive_format,
         git_history=args.git_history,
         use_git_in_scoring=args.use_git_in_scoring,
         detect_barrels=args.detect_barrels,
         detect_dynamic=args.detect_dynamic,
+        reachability=args.reachability,
+        trace_path=Path(args.trace).resolve() if args.trace else None,
+        trace_memory=args.trace_memory,
     )
 
     try:
         result = analyzer.analyze()
         analyzer.generate_report(html_only=args.html_only)
         log_success("Analysis complete!")
+        if args.watch:
+            analyzer.watch()
     except KeyboardInterrupt:
         log_warning("\nInterrupted by user")
         sys.exit(1)
@@ -3,25 +3,17 @@
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
-import os
+from typing import Dict
 
-def read_file_safe(path: str) -> List[str]:
-    """Read file or return empty if doesn't exist"""
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.readlines()
-    except FileNotFoundError:
-        return []
-    except Exception:
-        try:
-            with open(path, 'r', encoding='utf-8-sig') as f:
-                return f.readlines()
-        except:
-            return []
+from barrel_engine import EXPORT_FROM_RE, BarrelIndex
 
-def generate_index_export_patch(plan: Dict) -> Dict:
-    """Generate patch for adding exports to index.ts"""
+def generate_index_export_patch(plan: Dict, barrels: BarrelIndex) -> Dict:
+    """Generate patch for adding exports to index.ts
+
+    Barrels are looked up in the shared symbol table, and each generated patch is
+    queued there too, so several plans targeting one index chain their
+    old/new content instead of each diffing against the original file.
+    """
     component = plan['component']
     files_to_modify = plan.get('files_to_modify', [])
     specific_action = plan.get('specific_action', '')
@@ -31,11 +23,13 @@ def generate_index_export_patch(plan: Dict) -> Dict:
     
     # Get the index file to modify
     index_file = files_to_modify[0]
+    barrel = barrels.get(Path(index_file))
     
     # Check if file exists
-    if not os.path.exists(index_file):
+    if not barrel.exists and not barrel.dirty:
         # Need to create the file
         new_content = f"// Auto-generated barrel export\n{specific_action}\n"
+        barrels.set_text(Path(index_file), new_content)
         return {
             'patch_id': f"patch_{Path(component).stem}",
             'component': component,
@@ -46,33 +40,31 @@ def generate_index_export_patch(plan: Dict) -> Dict:
             'action': specific_action
         }
     
-    # File exists, append export
-    current_lines = read_file_safe(index_file)
-    
     # Extract export line from specific_action
     if 'export' in specific_action:
         export_line = specific_action.replace('Add: ', '').strip()
-        if not export_line.endswith('\n'):
-            export_line += '\n'
-        
-        # Check if already exists
-        export_check = export_line.split('from')[0].strip()
-        already_exists = any(export_check in line for line in current_lines)
+        m = EXPORT_FROM_RE.match(export_line)
+        if not m:
+            return None
+        module = m.group(3)
+        names = [n.split(' as ')[-1].strip() for n in m.group(2).split(',') if n.strip()]
         
-        if already_exists:
+        # Check if already exists (by module or by every exported name)
+        if barrel.exports_module(module) or all(barrel.is_exported(n) for n in names):
             return None  # Skip if already exported
         
         # Generate patch
-        new_lines = current_lines + [export_line]
+        old_content = barrel.render() if barrel.dirty else barrel.text
+        barrel.add_export(module, names, is_type=bool(m.group(1)))
         
         return {
             'patch_id': f"patch_{Path(component).stem}",
             'component': component,
             'target_file': index_file,
             'patch_type': 'append',
-            'old_content': ''.join(current_lines),
-            'new_content': ''.join(new_lines),
-            'diff_line': export_line.strip(),
+            'old_content': old_content,
+            'new_content': barrel.render(),
+            'diff_line': export_line,
             'risk': plan['risk'],
             'action': specific_action
         }
@@ -98,13 +90,14 @@ def main():
         'patches': []
     }
     
+    barrels = BarrelIndex()
     for plan in plans:
         if plan['patch_type'] != 'low-risk':
             continue
         
         # Generate patch for index exports
         if any('index.ts' in f for f in plan.get('files_to_modify', [])):
-            patch = generate_index_export_patch(plan)
+            patch = generate_index_export_patch(plan, barrels)
             if patch:
                 patches.append(patch)
                 
@@ -15,19 +15,29 @@ import os
 import re
 import json
 import hashlib
-import shutil
-import zipfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import Dict, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass, asdict, field
-from difflib import SequenceMatcher
 from enum import Enum
 import csv
 import time
 import sys
 import argparse
+import multiprocessing
+import queue
+import threading
+
+# Shared with the other analyzers; found next to this file even when it is
+# loaded by path (workflow/go.py) rather than run from tools/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    from archive_stream import StreamingArchiveWriter
+    from structural_tokens import file_structural_hash, similarity as token_similarity, tokenize
+finally:
+    sys.path.pop(0)
 
 # ============================================================================
 # CONFIGURATION
@@ -48,6 +58,11 @@ class Config:
     BARREL_EXPORT_THRESHOLD = 3  # Min exports to consider a barrel file
     SHARED_MODULE_BOOST = 2.0  # Stability boost for shared modules
     CRITICAL_DEPENDENCY_THRESHOLD = 10  # Files with 10+ dependents are critical
+    ARCHIVE_FORMAT = "zip"  # "zip" or "tar.zst" (needs zstandard)
+    ARCHIVE_WORKERS = min(8, os.cpu_count() or 1)  # Read-ahead threads for archiving
+    SCAN_JOBS = min(8, os.cpu_count() or 1)  # Analysis processes for a full scan (1 = in-process)
+    SCAN_QUEUE_SIZE = 1024  # Paths the walker may run ahead of analysis
+    SCAN_CHUNK_SIZE = 32  # Files per worker task
 
 # ============================================================================
 # ENUMS
@@ -170,6 +185,47 @@ REACT_LIFECYCLE_METHODS = [
     'getSnapshotBeforeUpdate', 'componentDidCatch'
 ]
 
+# Extractor patterns used by ProjectScanner, compiled once per process
+EXPORT_DECL_RE = re.compile(r'export\s+(?:const|let|var|function|class|interface|type|enum)\s+(\w+)')
+EXPORT_LIST_RE = re.compile(r'export\s+\{([^}]+)\}')
+EXPORT_BRACE_RE = re.compile(r'export\s+\{')
+EXPORT_DEFAULT_RE = re.compile(r'export\s+default')
+IMPORT_FROM_RE = re.compile(r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]')
+REQUIRE_RE = re.compile(r'require\([\'"]([^\'"]+)[\'"]\)')
+COMPONENT_FUNCTION_RE = re.compile(r'function\s+([A-Z]\w+)\s*\([^)]*\)\s*\{[^}]*return\s*\(')
+COMPONENT_ARROW_RE = re.compile(r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>\s*\{?[^}]*return\s*\(')
+COMPONENT_ARROW_DIRECT_RE = re.compile(r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>\s*\(')
+COMPONENT_FUNCTION_NAME_RE = re.compile(r'function\s+([A-Z]\w+)\s*\([^)]*\)')
+COMPONENT_ARROW_NAME_RE = re.compile(r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>')
+COMPONENT_CLASS_RE = re.compile(r'class\s+([A-Z]\w+)\s+extends\s+(?:React\.)?Component')
+CUSTOM_HOOK_DEF_RE = re.compile(r'export\s+(?:const|function)\s+(use[A-Z]\w+)')
+HOOK_CALL_RE = re.compile(r'(use[A-Z]\w+)\s*\(')
+USE_STATE_CALL_RE = re.compile(r'useState\s*\(')
+USE_EFFECT_CALL_RE = re.compile(r'useEffect\s*\(')
+PROPS_INTERFACE_RE = re.compile(r'interface\s+\w*Props\s*\{[^}]+\}')
+# Kept as separate patterns: each has a literal prefix the engine can scan for,
+# which beats a single alternation on files that contain none of them
+DYNAMIC_IMPORT_RES = tuple(re.compile(p) for p in DYNAMIC_IMPORT_PATTERNS)
+
+# should_ignore(): exact path-component matches plus substring matches on the
+# lowercased name, as one set lookup and one regex instead of a loop per pattern
+IGNORE_PARTS = frozenset(IGNORE_PATTERNS)
+IGNORE_NAME_RE = re.compile('|'.join(re.escape(p) for p in sorted(IGNORE_PATTERNS, key=len, reverse=True)))
+
+# Declaration counters fused into one pass. Each alternative starts with its own
+# keyword, so counts only differ from separate findall()s when one keyword
+# directly follows another (e.g. "function type x =" in a comment). The leading
+# lookahead on the first characters lets the engine skip ahead instead of trying
+# all five branches at every position.
+DECLARATION_COUNT_RE = re.compile(
+    r'(?=[:itfc])'
+    r'(?:(?P<any>:\s*any\b)'
+    r'|(?P<interface>\binterface\s+\w+)'
+    r'|(?P<type>\btype\s+\w+\s*=)'
+    r'|(?P<function>\bfunction\s+\w+)'
+    r'|(?P<class>\bclass\s+\w+))'
+)
+
 TEST_FRAMEWORKS = [
     'describe', 'it', 'test', 'expect', 'jest', 'vitest',
     'beforeEach', 'afterEach', 'beforeAll', 'afterAll',
@@ -778,88 +834,267 @@ class RecommendationEngine:
 # FILE SCANNER
 # ============================================================================
 
+# Scanner instance owned by each analysis worker process (see ProjectScanner.scan)
+_worker_scanner: Optional['ProjectScanner'] = None
+
+
+def _init_scan_worker(root: str, scope: str):
+    global _worker_scanner
+    _worker_scanner = ProjectScanner(root, None, scope, jobs=1)
+
+
+def _scan_worker(paths: List[str]) -> List[Tuple[str, Optional['FileInfo'], List['ComponentInfo'], Optional[str]]]:
+    """Analyze a chunk of files; returns (path, info, components, error) per file"""
+    results = []
+    for path in paths:
+        _worker_scanner.components = []
+        try:
+            info = _worker_scanner._analyze_file(Path(path))
+        except Exception as e:
+            results.append((path, None, [], str(e)))
+            continue
+        results.append((path, info, _worker_scanner.components, None))
+    return results
+
+
+def _can_use_process_pool() -> bool:
+    """Workers must be able to resolve this module's classes when unpickling results"""
+    if sys.modules.get(__name__) is None:
+        return False
+    return __name__ == '__main__' or multiprocessing.get_start_method() == 'fork'
+
+
 class ProjectScanner:
     """Scans and catalogs all project files with comprehensive analysis"""
     
-    def __init__(self, root_path: str, logger: AnalysisLogger, scope_path: Optional[str] = None):
+    def __init__(self, root_path: str, logger: AnalysisLogger, scope_path: Optional[str] = None,
+                 jobs: Optional[int] = None):
         self.root = Path(root_path).resolve()
         self.scope = Path(scope_path).resolve() if scope_path else self.root
         self.logger = logger
+        self.jobs = max(1, jobs if jobs is not None else Config.SCAN_JOBS)
         self.files: Dict[str, FileInfo] = {}
         self.components: List[ComponentInfo] = []
+        # Category as classified at scan time (graph building may override it)
+        self.scan_categories: Dict[str, FileCategory] = {}
         
     def should_ignore(self, path: Path) -> bool:
         """Check if path should be ignored"""
-        parts = path.parts
-        return any(pattern in parts or pattern in path.name.lower() 
-                  for pattern in IGNORE_PATTERNS)
+        return not IGNORE_PARTS.isdisjoint(path.parts) or bool(IGNORE_NAME_RE.search(path.name.lower()))
+    
+    @staticmethod
+    def _ignored_name(name: str) -> bool:
+        """should_ignore() for one path component whose ancestors already passed"""
+        return name in IGNORE_PARTS or bool(IGNORE_NAME_RE.search(name.lower()))
+    
+    def _walk(self):
+        """Yield every scannable file path under the scope, in os.walk order"""
+        if not IGNORE_PARTS.isdisjoint(self.scope.parts):
+            return
+        for root, dirs, files in os.walk(self.scope):
+            dirs[:] = [d for d in dirs if not self._ignored_name(d)]
+            for file in files:
+                if os.path.splitext(file)[1] in FILE_EXTENSIONS and not self._ignored_name(file):
+                    yield os.path.join(root, file)
+    
+    def _feed(self, paths: queue.Queue):
+        """Walker thread: push paths into the bounded queue, then a None sentinel"""
+        try:
+            for path in self._walk():
+                paths.put(path)
+        finally:
+            paths.put(None)
+    
+    @staticmethod
+    def _drain(paths: queue.Queue):
+        while True:
+            path = paths.get()
+            if path is None:
+                return
+            yield path
+    
+    def _analyze_serial(self, paths: queue.Queue):
+        for path in self._drain(paths):
+            before = len(self.components)
+            try:
+                info = self._analyze_file(Path(path))
+            except Exception as e:
+                yield path, None, [], str(e)
+                continue
+            # Hand components back with the file so scan() stores both in one place
+            found = self.components[before:]
+            del self.components[before:]
+            yield path, info, found, None
+    
+    def _analyze_parallel(self, paths: queue.Queue):
+        """Analyze queued paths in chunks across a process pool; yield results in walk order"""
+        def chunks():
+            chunk = []
+            for path in self._drain(paths):
+                chunk.append(path)
+                if len(chunk) == Config.SCAN_CHUNK_SIZE:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        
+        source = chunks()
+        pending: Dict[Any, int] = {}
+        finished: Dict[int, list] = {}
+        submitted = emitted = 0
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_scan_worker,
+                                 initargs=(str(self.root), str(self.scope))) as pool:
+            exhausted = False
+            while not exhausted or pending:
+                while not exhausted and len(pending) < self.jobs * 2:
+                    chunk = next(source, None)
+                    if chunk is None:
+                        exhausted = True
+                    else:
+                        pending[pool.submit(_scan_worker, chunk)] = submitted
+                        submitted += 1
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[pending.pop(future)] = future.result()
+                while emitted in finished:
+                    yield from finished.pop(emitted)
+                    emitted += 1
     
     def scan(self) -> Tuple[Dict[str, FileInfo], List[ComponentInfo]]:
-        """Perform complete project scan"""
+        """Perform complete project scan.
+        
+        A walker thread feeds paths through a bounded queue to the analysis
+        stage, which runs in-process (jobs=1) or across a process pool.
+        Results are stored in walk order either way.
+        """
         self.logger.info(f"Scanning project structure from: {self.scope}")
+        start = time.perf_counter()
         
-        for root, dirs, files in os.walk(self.scope):
-            dirs[:] = [d for d in dirs if not self.should_ignore(Path(root) / d)]
-            
-            for file in files:
-                file_path = Path(root) / file
-                
-                if self.should_ignore(file_path):
-                    continue
-                    
-                if file_path.suffix not in FILE_EXTENSIONS:
-                    continue
-                
-                try:
-                    metadata = self._analyze_file(file_path)
-                    self.files[str(file_path)] = metadata
-                except Exception as e:
-                    self.logger.warning(f"Error analyzing {file_path}: {e}")
+        paths: queue.Queue = queue.Queue(maxsize=Config.SCAN_QUEUE_SIZE)
+        walker = threading.Thread(target=self._feed, args=(paths,), daemon=True)
+        walker.start()
         
-        self.logger.info(f"Scanned {len(self.files)} files")
+        jobs = self.jobs if self.jobs > 1 and _can_use_process_pool() else 1
+        results = self._analyze_parallel(paths) if jobs > 1 else self._analyze_serial(paths)
+        
+        total_bytes = 0
+        for path, info, components, error in results:
+            if error is not None:
+                self.logger.warning(f"Error analyzing {path}: {error}")
+                continue
+            self.files[path] = info
+            self.scan_categories[path] = info.category
+            self.components.extend(components)
+            total_bytes += info.size
+        walker.join()
+        
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        self.logger.info(
+            f"Scanned {len(self.files)} files ({total_bytes / 1048576:.1f} MB) in {elapsed:.2f}s - "
+            f"{len(self.files) / elapsed:.0f} files/s, {total_bytes / 1048576 / elapsed:.1f} MB/s, jobs={jobs}"
+        )
         return self.files, self.components
     
+    def _scan_one(self, file_path: Path) -> bool:
+        """Analyze a single file into self.files; returns False on error"""
+        try:
+            metadata = self._analyze_file(file_path)
+        except Exception as e:
+            self.logger.warning(f"Error analyzing {file_path}: {e}")
+            return False
+        self.files[str(file_path)] = metadata
+        self.scan_categories[str(file_path)] = metadata.category
+        return True
+    
+    def _is_scannable(self, file_path: Path) -> bool:
+        """Same filters scan() applies while walking"""
+        try:
+            rel = file_path.relative_to(self.scope)
+        except ValueError:
+            return False
+        if any(self.should_ignore(self.scope.joinpath(*rel.parts[:i + 1])) for i in range(len(rel.parts))):
+            return False
+        return file_path.suffix in FILE_EXTENSIONS and file_path.is_file()
+    
+    def detect_changes(self) -> List[str]:
+        """Walk the tree and return paths that are new, deleted or changed (size/mtime) since the last scan"""
+        changed = []
+        seen = set()
+        for key in self._walk():
+            seen.add(key)
+            meta = self.files.get(key)
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            if meta is None or meta.size != st.st_size or meta.modified != st.st_mtime:
+                changed.append(key)
+        changed.extend(p for p in self.files if p not in seen)
+        return changed
+    
+    def rescan(self, changed_paths: Optional[List[str]] = None) -> List[str]:
+        """Incrementally update self.files, re-analyzing only changed files.
+        
+        changed_paths may be absolute or relative to the project root; when None,
+        changes are detected by comparing size/mtime against the last scan.
+        Derived fields (graph, risk, clusters) are reset on every retained file so
+        the later analysis phases can run again over the warm map.
+        """
+        if changed_paths is None:
+            targets = self.detect_changes()
+        else:
+            targets = []
+            for p in changed_paths:
+                path = Path(p)
+                targets.append(str(path if path.is_absolute() else self.root / path))
+        
+        targets = list(dict.fromkeys(targets))
+        target_set = set(targets)
+        self.components = [c for c in self.components if c.file_path not in target_set]
+        for key in targets:
+            self.files.pop(key, None)
+            self.scan_categories.pop(key, None)
+            path = Path(key)
+            if self._is_scannable(path):
+                self._scan_one(path)
+        
+        for key, meta in self.files.items():
+            self._reset_derived(key, meta)
+        
+        self.logger.info(f"Rescanned {len(targets)} changed files ({len(self.files)} total)")
+        return targets
+    
+    def _reset_derived(self, key: str, meta: FileInfo):
+        """Clear fields written by graph/usage/stability phases"""
+        meta.dependencies = set()
+        meta.dependents = set()
+        meta.dependents_count = 0
+        meta.is_barrel_exported = False
+        meta.duplicate_cluster_id = None
+        meta.risk_level = RiskLevel.LOW
+        meta.recommendation = Recommendation.KEEP_AS_IS
+        meta.short_reason = ""
+        meta.detailed_reasoning = []
+        meta.stability_score = 0.0
+        meta.issues = []
+        meta.category = self.scan_categories.get(key, meta.category)
+    
     def _analyze_file(self, path: Path) -> FileInfo:
         """Extract complete metadata from a file with deep analysis"""
         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
+        st = path.stat()
+        size = st.st_size
+        modified = st.st_mtime
         lines = content.count('\n') + 1
-        size = path.stat().st_size
-        modified = path.stat().st_mtime
-        
-        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-        structural_hash = self._compute_structural_hash(content)
-        
-        exports = self._extract_exports(content)
-        imports = self._extract_imports(content)
         
-        category = self._classify_file(path, content)
+        facts = self._extract_facts(path, content)
         
-        any_count = len(re.findall(r':\s*any\b', content))
-        complexity_estimate = self._compute_complexity(content)
-        
-        is_entry = path.name in ENTRY_POINT_PATTERNS
-        
-        is_react_component, component_type = self._detect_react_component(content)
-        is_custom_hook = self._detect_custom_hook(path.name, content)
-        
-        is_dynamic_imported = self._detect_dynamic_import(content)
-        is_test_file = self._is_test_file(path)
-        
-        has_side_effects = self._detect_side_effects(content)
-        hook_usage = self._extract_hook_usage(content)
-        
-        has_jsx = '<' in content and ('React' in content or path.suffix in {'.tsx', '.jsx'})
-        has_typescript = path.suffix in {'.ts', '.tsx'}
-        
-        interface_count = len(re.findall(r'\binterface\s+\w+', content))
-        type_count = len(re.findall(r'\btype\s+\w+\s*=', content))
-        function_count = len(re.findall(r'\bfunction\s+\w+', content))
-        class_count = len(re.findall(r'\bclass\s+\w+', content))
-        
-        if is_react_component:
-            component_info = self._extract_component_info(path, content)
+        if facts['is_react_component']:
+            component_info = self._extract_component_info(path, content, hooks_used=list(facts['hook_usage']))
             if component_info:
                 self.components.append(component_info)
         
@@ -874,51 +1109,72 @@ class ProjectScanner:
             extension=path.suffix,
             size=size,
             lines=lines,
-            content_hash=content_hash,
-            structural_hash=structural_hash,
             modified=modified,
-            category=category,
-            exports=exports,
-            exported_symbols=exports,
-            imports=imports,
-            is_entry_point=is_entry,
-            any_count=any_count,
-            complexity_estimate=complexity_estimate,
-            is_react_component=is_react_component,
-            is_custom_hook=is_custom_hook,
-            component_type=component_type,
-            is_dynamic_imported=is_dynamic_imported,
-            is_test_file=is_test_file,
+            exported_symbols=facts['exports'],
+            is_entry_point=path.name in ENTRY_POINT_PATTERNS,
+            is_test_file=self._is_test_file(path),
             last_modified_days=last_modified_days,
-            has_side_effects=has_side_effects,
-            hook_usage=hook_usage,
-            has_jsx=has_jsx,
-            has_typescript=has_typescript,
-            interface_count=interface_count,
-            type_count=type_count,
-            function_count=function_count,
-            class_count=class_count
+            has_jsx='<' in content and ('React' in content or path.suffix in {'.tsx', '.jsx'}),
+            has_typescript=path.suffix in {'.ts', '.tsx'},
+            **facts
         )
     
-    def _compute_structural_hash(self, content: str) -> str:
-        """Compute hash of normalized structure"""
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        content = re.sub(r'\s+', ' ', content)
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    def _extract_facts(self, path: Path, content: str) -> Dict[str, Any]:
+        """Run every content extractor once and share intermediate results.
+        
+        Component and custom-hook detection feed both the FileInfo flags and
+        _classify_file, so they are computed here a single time.
+        """
+        is_react_component, component_type = self._detect_react_component(content)
+        is_custom_hook = self._detect_custom_hook(path.name, content)
+        counts = self._count_declarations(content)
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        
+        return {
+            'content_hash': content_hash,
+            'structural_hash': self._compute_structural_hash(path, content, content_hash),
+            'exports': self._extract_exports(content),
+            'imports': self._extract_imports(content),
+            'category': self._classify_file(path, content, react_component=is_react_component,
+                                            custom_hook=is_custom_hook),
+            'any_count': counts['any'],
+            'complexity_estimate': self._compute_complexity(content),
+            'is_react_component': is_react_component,
+            'component_type': component_type,
+            'is_custom_hook': is_custom_hook,
+            'is_dynamic_imported': self._detect_dynamic_import(content),
+            'has_side_effects': self._detect_side_effects(content),
+            'hook_usage': self._extract_hook_usage(content),
+            'interface_count': counts['interface'],
+            'type_count': counts['type'],
+            'function_count': counts['function'],
+            'class_count': counts['class'],
+        }
+    
+    def _count_declarations(self, content: str) -> Dict[str, int]:
+        """Count any-annotations, interfaces, type aliases, functions and classes in one pass"""
+        counts = dict.fromkeys(DECLARATION_COUNT_RE.groupindex, 0)
+        for match in DECLARATION_COUNT_RE.finditer(content):
+            counts[match.lastgroup] += 1
+        return counts
+    
+    def _compute_structural_hash(self, path: Path, content: str, content_hash: Optional[str] = None) -> str:
+        """Compute hash of the normalized token stream for JS/TS, of the
+        comment/whitespace-normalized text for other files (see structural_tokens)"""
+        return file_structural_hash(path.name, content, content_hash)
     
     def _extract_exports(self, content: str) -> List[str]:
         """Extract all exported symbols"""
-        exports = []
+        if 'export' not in content:
+            return []
         
-        for match in re.finditer(r'export\s+(?:const|let|var|function|class|interface|type|enum)\s+(\w+)', content):
-            exports.append(match.group(1))
+        exports = [match.group(1) for match in EXPORT_DECL_RE.finditer(content)]
         
-        for match in re.finditer(r'export\s+\{([^}]+)\}', content):
+        for match in EXPORT_LIST_RE.finditer(content):
             names = match.group(1).split(',')
             exports.extend([n.strip().split()[0] for n in names if n.strip()])
         
-        if re.search(r'export\s+default', content):
+        if EXPORT_DEFAULT_RE.search(content):
             exports.append('default')
         
         return list(set(exports))
@@ -927,16 +1183,21 @@ class ProjectScanner:
         """Extract all import statements"""
         imports = []
         
-        for match in re.finditer(r'import\s+.*?from\s+[\'"]([^\'"]+)[\'"]', content):
-            imports.append(match.group(1))
+        if 'import' in content:
+            imports.extend(match.group(1) for match in IMPORT_FROM_RE.finditer(content))
         
-        for match in re.finditer(r'require\([\'"]([^\'"]+)[\'"]\)', content):
-            imports.append(match.group(1))
+        if 'require(' in content:
+            imports.extend(match.group(1) for match in REQUIRE_RE.finditer(content))
         
         return imports
     
-    def _classify_file(self, path: Path, content: str) -> FileCategory:
-        """Classify file by purpose with enhanced detection"""
+    def _classify_file(self, path: Path, content: str, react_component: Optional[bool] = None,
+                       custom_hook: Optional[bool] = None) -> FileCategory:
+        """Classify file by purpose with enhanced detection.
+        
+        react_component / custom_hook may be passed in when the caller has
+        already run those detectors; otherwise they are computed on demand.
+        """
         rel_path = str(path).lower()
         name = path.name.lower()
         
@@ -950,7 +1211,7 @@ class ProjectScanner:
         
         # Barrel exports
         if name in {'index.ts', 'index.tsx', 'index.js', 'index.jsx'}:
-            export_count = len(re.findall(r'export\s+\{', content))
+            export_count = len(EXPORT_BRACE_RE.findall(content))
             if export_count >= Config.BARREL_EXPORT_THRESHOLD:
                 return FileCategory.BARREL_EXPORT
         
@@ -959,7 +1220,9 @@ class ProjectScanner:
             if any(infra_path in rel_path for infra_path in INFRASTRUCTURE_PATHS):
                 return FileCategory.FRAMEWORK_CORE
         
-        if self._detect_custom_hook(path.name, content):
+        if custom_hook is None:
+            custom_hook = self._detect_custom_hook(path.name, content)
+        if custom_hook:
             return FileCategory.CUSTOM_HOOK
         
         if 'route' in rel_path or 'page' in rel_path or '_app' in name:
@@ -972,7 +1235,9 @@ class ProjectScanner:
             return FileCategory.STORE_OR_STATE
         
         if 'component' in rel_path or path.suffix in {'.tsx', '.jsx'}:
-            if self._detect_react_component(content)[0]:
+            if react_component is None:
+                react_component = self._detect_react_component(content)[0]
+            if react_component:
                 return FileCategory.UI_COMPONENT
         
         if 'service' in rel_path or 'api' in rel_path:
@@ -1021,13 +1286,9 @@ class ProjectScanner:
     
     def _detect_react_component(self, content: str) -> Tuple[bool, str]:
         """Detect if file contains React component"""
-        function_pattern = r'function\s+([A-Z]\w+)\s*\([^)]*\)\s*\{[^}]*return\s*\('
-        arrow_pattern = r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>\s*\{?[^}]*return\s*\('
-        arrow_direct_pattern = r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>\s*\('
-        
-        if re.search(function_pattern, content):
+        if 'function' in content and COMPONENT_FUNCTION_RE.search(content):
             return True, "function"
-        if re.search(arrow_pattern, content) or re.search(arrow_direct_pattern, content):
+        if 'const' in content and (COMPONENT_ARROW_RE.search(content) or COMPONENT_ARROW_DIRECT_RE.search(content)):
             return True, "arrow"
         if 'React.Component' in content or 'Component' in content and 'extends' in content:
             return True, "class"
@@ -1039,12 +1300,11 @@ class ProjectScanner:
         if not filename.startswith('use') and not 'use' in filename.lower():
             return False
         
-        hook_pattern = r'export\s+(?:const|function)\s+(use[A-Z]\w+)'
-        return bool(re.search(hook_pattern, content))
+        return bool(CUSTOM_HOOK_DEF_RE.search(content))
     
     def _detect_dynamic_import(self, content: str) -> bool:
         """Detect dynamic import patterns"""
-        return any(re.search(pattern, content) for pattern in DYNAMIC_IMPORT_PATTERNS)
+        return any(pattern.search(content) for pattern in DYNAMIC_IMPORT_RES)
     
     def _is_test_file(self, path: Path) -> bool:
         """Check if file is a test file"""
@@ -1064,24 +1324,27 @@ class ProjectScanner:
     
     def _extract_hook_usage(self, content: str) -> List[str]:
         """Extract React hooks used in file"""
-        hooks = []
-        for hook in HOOK_PATTERNS:
-            if hook in content:
-                hooks.append(hook)
+        if 'use' not in content:
+            return []
+        
+        hooks = [hook for hook in HOOK_PATTERNS if hook in content]
         
         # Custom hooks
-        for match in re.finditer(r'(use[A-Z]\w+)\s*\(', content):
+        seen = set(hooks)
+        for match in HOOK_CALL_RE.finditer(content):
             hook_name = match.group(1)
-            if hook_name not in hooks:
+            if hook_name not in seen:
+                seen.add(hook_name)
                 hooks.append(hook_name)
         
         return hooks
     
-    def _extract_component_info(self, path: Path, content: str) -> Optional[ComponentInfo]:
+    def _extract_component_info(self, path: Path, content: str,
+                                hooks_used: Optional[List[str]] = None) -> Optional[ComponentInfo]:
         """Extract detailed component information"""
-        function_match = re.search(r'function\s+([A-Z]\w+)\s*\([^)]*\)', content)
-        arrow_match = re.search(r'const\s+([A-Z]\w+)\s*[=:]\s*\([^)]*\)\s*=>', content)
-        class_match = re.search(r'class\s+([A-Z]\w+)\s+extends\s+(?:React\.)?Component', content)
+        function_match = COMPONENT_FUNCTION_NAME_RE.search(content)
+        arrow_match = None if function_match else COMPONENT_ARROW_NAME_RE.search(content)
+        class_match = None if function_match or arrow_match else COMPONENT_CLASS_RE.search(content)
         
         name = None
         is_function = False
@@ -1104,15 +1367,16 @@ class ProjectScanner:
         is_default = 'export default' in content
         is_named = f'export {{{name}}}' in content or f'export const {name}' in content or f'export function {name}' in content
         
-        hooks_used = self._extract_hook_usage(content)
+        if hooks_used is None:
+            hooks_used = self._extract_hook_usage(content)
         
         lifecycle_methods = [m for m in REACT_LIFECYCLE_METHODS if m in content]
         
-        state_variables = len(re.findall(r'useState\s*\(', content))
-        effect_count = len(re.findall(r'useEffect\s*\(', content))
+        state_variables = len(USE_STATE_CALL_RE.findall(content)) if 'useState' in content else 0
+        effect_count = len(USE_EFFECT_CALL_RE.findall(content)) if 'useEffect' in content else 0
         memo_usage = 'useMemo' in content or 'useCallback' in content or 'React.memo' in content
         
-        props_match = re.search(r'interface\s+\w*Props\s*\{[^}]+\}', content)
+        props_match = PROPS_INTERFACE_RE.search(content) if 'Props' in content else None
         props_interface = props_match.group(0) if props_match else None
         
         return ComponentInfo(
@@ -1138,83 +1402,14 @@ class ProjectScanner:
 class StructuralSimilarityAnalyzer:
     """Advanced structural similarity computation"""
     
-    @staticmethod
-    def _normalize_for_comparison(content: str) -> str:
-        """
-        Normalize code for structural comparison.
-        
-        Pipeline:
-        1. Remove comments (single-line, multi-line, JSX)
-        2. Replace string literals with __STR__
-        3. Replace numeric literals with __NUM__
-        4. Normalize whitespace
-        5. Replace variable names with placeholders
-        
-        Args:
-            content: Source code content
-            
-        Returns:
-            Normalized string for comparison
-        """
-        # Remove single-line comments
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        
-        # Remove block comments
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        
-        # Remove JSX comments
-        content = re.sub(r'\{/\*.*?\*/\}', '', content, flags=re.DOTALL)
-        
-        # Replace string literals
-        content = re.sub(r'"(?:[^"\\]|\\.)*"', '__STR__', content)
-        content = re.sub(r"'(?:[^'\\]|\\.)*'", '__STR__', content)
-        content = re.sub(r'`(?:[^`\\]|\\.)*`', '__STR__', content)
-        
-        # Replace numeric literals
-        content = re.sub(r'\b\d+\.?\d*\b', '__NUM__', content)
-        
-        # Normalize whitespace
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'\n+', '\n', content)
-        
-        # Variable name normalization (basic)
-        var_names = re.findall(r'\b[a-z_][a-zA-Z0-9_]*\b', content)
-        var_map = {}
-        var_counter = 0
-        reserved = {'const', 'let', 'var', 'function', 'return', 'if', 'else', 
-                   'for', 'while', 'class', 'import', 'export', 'default'}
-        
-        for name in set(var_names):
-            if name not in reserved:
-                if name not in var_map:
-                    var_map[name] = f'v{var_counter}'
-                    var_counter += 1
-        
-        for original, placeholder in var_map.items():
-            content = re.sub(r'\b' + re.escape(original) + r'\b', placeholder, content)
-        
-        return content.strip()
-    
-    @staticmethod
-    def _tokenize(content: str) -> Tuple[List[str], Set[str]]:
-        """
-        Tokenize normalized content.
-        
-        Returns:
-            Tuple of (token_sequence, token_set)
-        """
-        # Split by whitespace and punctuation
-        tokens = re.findall(r'\w+|[^\w\s]', content)
-        return tokens, set(tokens)
-    
     @staticmethod
     def compute_structural_similarity(file_a: str, file_b: str) -> float:
         """
         Compute structural similarity between two files.
         
         Uses combined metric:
-        - 60% sequence similarity (SequenceMatcher)
-        - 40% Jaccard similarity (token set overlap)
+        - 60% token-sequence similarity (SequenceMatcher)
+        - 40% Jaccard similarity (token shingle overlap)
         
         Args:
             file_a: Path to first file
@@ -1236,31 +1431,13 @@ class StructuralSimilarityAnalyzer:
                 if ratio > Config.SIZE_DIFF_RATIO_THRESHOLD:
                     return 0.0
             
-            # Read and normalize
+            # Read and tokenize (streams are cached by content)
             with open(file_a, 'r', encoding='utf-8', errors='ignore') as f:
-                content_a = f.read()
+                tokens_a = tokenize(f.read())
             with open(file_b, 'r', encoding='utf-8', errors='ignore') as f:
-                content_b = f.read()
-            
-            normalized_a = StructuralSimilarityAnalyzer._normalize_for_comparison(content_a)
-            normalized_b = StructuralSimilarityAnalyzer._normalize_for_comparison(content_b)
+                tokens_b = tokenize(f.read())
             
-            # Tokenize
-            seq_a, set_a = StructuralSimilarityAnalyzer._tokenize(normalized_a)
-            seq_b, set_b = StructuralSimilarityAnalyzer._tokenize(normalized_b)
-            
-            # Sequence similarity
-            sequence_ratio = SequenceMatcher(None, seq_a, seq_b).ratio()
-            
-            # Jaccard similarity
-            intersection = len(set_a & set_b)
-            union = len(set_a | set_b)
-            jaccard_ratio = intersection / union if union > 0 else 0.0
-            
-            # Combined metric
-            similarity = 0.6 * sequence_ratio + 0.4 * jaccard_ratio
-            
-            return similarity
+            return token_similarity(tokens_a, tokens_b)
             
         except Exception:
             return 0.0
@@ -2065,15 +2242,19 @@ class ArchiveBuilder:
         self.report_folder = report_folder
         self.files = files
         self.logger = logger
-        self.archive_dir = report_folder / 'refactor_temp' / 'archived_files'
         
-    def create_safe_archive(self, candidates: List[str], keep_temp: bool = False) -> Optional[str]:
+    def create_safe_archive(self, candidates: List[str], keep_temp: bool = False,
+                            fmt: Optional[str] = None) -> Optional[str]:
         """
         Create safe archive package with verification.
         
+        Files are streamed from the project straight into the archive; there is
+        no staging copy. Byte-identical files are stored once.
+        
         Args:
             candidates: List of file paths to archive
-            keep_temp: Whether to keep temp folder after zipping
+            keep_temp: Unused; kept for compatibility (no temp folder is created)
+            fmt: "zip" or "tar.zst" (default: Config.ARCHIVE_FORMAT)
             
         Returns:
             Path to created archive or None if failed
@@ -2082,17 +2263,15 @@ class ArchiveBuilder:
             self.logger.warning("No files to archive")
             return None
         
+        fmt = fmt or Config.ARCHIVE_FORMAT
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        archive_name = f"refactor_archive_{timestamp}.zip"
+        archive_name = f"refactor_archive_{timestamp}.{fmt}"
         archives_folder = self.report_folder / 'archives'
         archives_folder.mkdir(exist_ok=True)
         archive_path = archives_folder / archive_name
         
         self.logger.info(f"Creating safe archive package: {archive_name}")
         
-        # Create temp directory
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
-        
         # Metadata for archive
         metadata = {
             'timestamp': timestamp,
@@ -2101,73 +2280,64 @@ class ArchiveBuilder:
             'files': []
         }
         
-        # Copy files
-        copied_count = 0
+        keys = []
+        items = []
         for file_path in candidates:
             try:
-                source = Path(file_path)
-                relative = source.relative_to(self.project_path)
-                target = self.archive_dir / relative
-                
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, target)
-                
-                meta = self.files[file_path]
-                metadata['files'].append({
-                    'path': str(relative),
-                    'size': meta.size,
-                    'lines': meta.lines,
-                    'category': meta.category.value,
-                    'risk_level': meta.risk_level.value,
-                    'stability_score': meta.stability_score,
-                    'recommendation': meta.recommendation.value,
-                    'reasoning': meta.short_reason,
-                    'last_modified_days': meta.last_modified_days
-                })
-                
-                copied_count += 1
-                
-            except Exception as e:
+                relative = Path(file_path).relative_to(self.project_path)
+            except ValueError as e:
                 self.logger.error(f"Error archiving {file_path}: {e}")
+                continue
+            keys.append(file_path)
+            items.append((Path(file_path), f"archived_files/{relative.as_posix()}"))
         
-        # Write metadata
-        metadata_path = self.archive_dir.parent / 'metadata.json'
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-        
-        # Create ZIP
+        # Stream files into the archive
+        copied_count = 0
         try:
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(self.archive_dir.parent):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(self.archive_dir.parent)
-                        zipf.write(file_path, arcname)
+            with StreamingArchiveWriter(archive_path, fmt, Config.ARCHIVE_WORKERS) as writer:
+                for file_path, entry in zip(keys, writer.add_files(items)):
+                    if 'error' in entry:
+                        self.logger.error(f"Error archiving {file_path}: {entry['error']}")
+                        continue
+                    meta = self.files[file_path]
+                    metadata['files'].append({
+                        'path': entry['arcname'][len('archived_files/'):],
+                        'size': meta.size,
+                        'lines': meta.lines,
+                        'category': meta.category.value,
+                        'risk_level': meta.risk_level.value,
+                        'stability_score': meta.stability_score,
+                        'recommendation': meta.recommendation.value,
+                        'reasoning': meta.short_reason,
+                        'last_modified_days': meta.last_modified_days,
+                        'sha256': entry['sha256'],
+                        'duplicate_of': entry['duplicate_of'],
+                    })
+                    copied_count += 1
+                
+                metadata['dedup'] = writer.stats()
+                writer.add_bytes('metadata.json', json.dumps(metadata, indent=2).encode('utf-8'))
             
-            # Verify ZIP integrity
-            with zipfile.ZipFile(archive_path, 'r') as zipf:
-                zip_entries = zipf.namelist()
-                assert len(zip_entries) > 0, "ZIP file is empty"
-                self.logger.info(f"ZIP verification passed: {len(zip_entries)} entries")
+            # Verify against hashes from the read pass (no source re-read)
+            problems = writer.verify()
+            if problems:
+                raise ValueError(f"{len(problems)} member(s) failed verification: {problems[:3]}")
+            self.logger.info(f"Archive verification passed: {len(writer.entries)} entries "
+                             f"({writer.stats()['duplicates']} deduplicated)")
             
         except Exception as e:
-            self.logger.error(f"Error creating ZIP: {e}")
+            self.logger.error(f"Error creating archive: {e}")
             return None
         
-        # Clean temp if requested
-        if not keep_temp:
-            try:
-                shutil.rmtree(self.archive_dir.parent)
-            except:
-                pass
-        
         # Create archive metadata summary
         archive_metadata = {
             'archive_file': archive_name,
             'created_at': timestamp,
             'files_archived': copied_count,
             'total_size': sum(self.files[f].size for f in candidates),
-            'archive_path': str(archive_path)
+            'archive_path': str(archive_path),
+            'format': fmt,
+            **writer.stats()
         }
         
         archive_metadata_path = self.report_folder / 'archive_metadata.json'
@@ -2213,11 +2383,9 @@ class ReportGenerator:
         
         self.logger.info(f"Full report: {output_path.name}")
     
-    def generate_summary_json(self):
-        """Generate summary_report.json"""
-        output_path = self.report_folder / 'summary_report.json'
-        
-        summary = {
+    def build_summary(self) -> Dict[str, Any]:
+        """Summary dict written to summary_report.json"""
+        return {
             'metadata': self.report.metadata,
             'totals': {
                 'files': len(self.report.files),
@@ -2230,6 +2398,11 @@ class ReportGenerator:
             'risk_distribution': self.report.risk_distribution,
             'quality_metrics': self.report.quality_metrics
         }
+    
+    def generate_summary_json(self):
+        """Generate summary_report.json"""
+        output_path = self.report_folder / 'summary_report.json'
+        summary = self.build_summary()
         
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2)
@@ -4037,18 +4210,68 @@ window.dashboardAPI = {
 class CodeIntelligencePlatform:
     """Main orchestrator for comprehensive analysis"""
     
-    def __init__(self, project_path: str, scope_path: Optional[str] = None, report_folder_override: Optional[str] = None):
+    def __init__(self, project_path: str, scope_path: Optional[str] = None, report_folder_override: Optional[str] = None,
+                 jobs: Optional[int] = None):
         self.project_path = Path(project_path).resolve()
         self.scope_path = scope_path
+        self.jobs = jobs
         self.report_folder_override = report_folder_override
         self.report_folder: Optional[Path] = None
         self.logger: Optional[AnalysisLogger] = None
         self.files: Dict[str, FileInfo] = {}
         self.components: List[ComponentInfo] = []
         self.report: Optional[AnalysisReport] = None
+        # Kept between runs so refresh() only re-analyzes changed files
+        self.scanner: Optional[ProjectScanner] = None
         
     def analyze(self) -> AnalysisReport:
         """Perform complete comprehensive analysis"""
+        self._start_run()
+        start_time = datetime.now()
+        
+        try:
+            # Phase 1: Scan
+            self.logger.info("Phase 1: Project scanning...")
+            self.scanner = ProjectScanner(str(self.project_path), self.logger, self.scope_path, jobs=self.jobs)
+            self.files, self.components = self.scanner.scan()
+            return self._run_phases(start_time)
+        except Exception as e:
+            self.logger.error(f"Analysis failed: {e}")
+            self.logger.finalize()
+            raise
+    
+    def refresh(self, changed_paths: Optional[List[str]] = None) -> AnalysisReport:
+        """Re-run the analysis over the warm files map.
+        
+        Library entry point for the workflow orchestrator: only files in
+        changed_paths (or, when None, files whose size/mtime changed since the
+        last scan) are re-read and re-parsed; graph, usage, risk and reports are
+        recomputed for the whole project. Falls back to analyze() when nothing
+        has been scanned yet in this process.
+        """
+        if self.scanner is None:
+            return self.analyze()
+        
+        self._start_run()
+        start_time = datetime.now()
+        
+        try:
+            self.logger.info("Phase 1: Incremental rescan...")
+            self.scanner.logger = self.logger
+            self.scanner.rescan(changed_paths)
+            self.files, self.components = self.scanner.files, self.scanner.components
+            return self._run_phases(start_time)
+        except Exception as e:
+            self.logger.error(f"Analysis failed: {e}")
+            self.logger.finalize()
+            raise
+    
+    def summary(self) -> Dict[str, Any]:
+        """Same dict as summary_report.json, without the disk round-trip"""
+        return ReportGenerator(self.report, self.report_folder, self.logger).build_summary()
+    
+    def _start_run(self):
+        """Prepare report folder and a fresh logger for one analysis run"""
         # Create report folder (static override supported)
         if self.report_folder_override:
             rf = Path(self.report_folder_override)
@@ -4070,145 +4293,134 @@ class CodeIntelligencePlatform:
         self.logger.info("="*70)
         self.logger.info(f"Scan root: {self.project_path}")
         self.logger.info(f"Report folder: {self.report_folder}")
+    
+    def _run_phases(self, start_time: datetime) -> AnalysisReport:
+        """Phases 2-8 and report generation over self.files"""
+        # Phase 2: Build dependency graph
+        self.logger.info("Phase 2: Building dependency graph...")
+        graph_builder = DependencyGraphBuilder(self.files, self.logger)
+        graph_builder.build()
+        
+        # Phase 3: Detect duplicates
+        self.logger.info("Phase 3: Detecting duplicates...")
+        duplicate_detector = DuplicateDetector(self.files, self.logger)
+        duplicates = duplicate_detector.analyze()
+        
+        # Phase 4: Usage analysis
+        self.logger.info("Phase 4: Analyzing usage patterns...")
+        usage_analyzer = UsageAnalyzer(self.files, self.logger)
+        usage_analyzer.analyze()
+        
+        # Phase 5: Stability & risk
+        self.logger.info("Phase 5: Computing stability and risk...")
+        stability_calc = StabilityCalculator(self.files, self.logger)
+        stability_calc.calculate()
+        
+        # Phase 6: Generate comprehensive recommendations
+        self.logger.info("Phase 6: Generating professional recommendations...")
+        recommendations = self._generate_comprehensive_recommendations(duplicates)
+        
+        # Phase 7: Archive eligibility
+        self.logger.info("Phase 7: Evaluating archive candidates...")
+        archive_engine = ArchiveDecisionEngine(self.files, self.logger)
+        archive_candidates = []
         
-        start_time = datetime.now()
+        for path, meta in self.files.items():
+            decision = archive_engine.evaluate_archive_candidate(meta)
+            if decision.decision == Recommendation.SAFE_TO_ARCHIVE:
+                archive_candidates.append(path)
+        
+        # Phase 8: Calculate quality metrics
+        self.logger.info("Phase 8: Computing quality metrics...")
+        quality_metrics = self._calculate_quality_metrics()
+        
+        end_time = datetime.now()
+        
+        # Build comprehensive report
+        self.report = AnalysisReport(
+            metadata={
+                'tool_version': Config.TOOL_VERSION,
+                'scan_root': str(self.project_path),
+                'ignored_folders': list(IGNORE_PATTERNS),
+                'start_time': start_time.isoformat(),
+                'end_time': end_time.isoformat(),
+                'report_folder': str(self.report_folder),
+                'warnings': self.logger.warnings,
+                'errors': self.logger.errors
+            },
+            files={
+                path: {
+                    'path': meta.path,
+                    'relative_path': meta.relative_path,
+                    'size': meta.size,
+                    'lines': meta.lines,
+                    'category': meta.category.value,
+                    'content_hash': meta.content_hash,
+                    'structural_hash': meta.structural_hash,
+                    'exported_symbols': meta.exported_symbols,
+                    'dependents_count': meta.dependents_count,
+                    'dependents': list(meta.dependents),
+                    'stability_score': meta.stability_score,
+                    'risk_level': meta.risk_level.value,
+                    'recommendation': meta.recommendation.value,
+                    'short_reason': meta.short_reason,
+                    'last_modified_days': meta.last_modified_days,
+                    'complexity_estimate': meta.complexity_estimate,
+                    'any_count': meta.any_count,
+                    'is_dynamic_imported': meta.is_dynamic_imported,
+                    'is_test_file': meta.is_test_file,
+                    'duplicate_cluster_id': meta.duplicate_cluster_id,
+                    'has_jsx': meta.has_jsx,
+                    'has_typescript': meta.has_typescript,
+                    'interface_count': meta.interface_count,
+                    'type_count': meta.type_count
+                }
+                for path, meta in self.files.items()
+            },
+            duplicate_clusters=[
+                {
+                    'cluster_id': c.cluster_id,
+                    'files': c.files,
+                    'cluster_size': c.cluster_size,
+                    'similarity_score': c.similarity_score,
+                    'exported_files_count': c.exported_files_count,
+                    'recent_files_count': c.recent_files_count,
+                    'suggested_base_file': c.suggested_base_file,
+                    'suggested_merge_target': c.suggested_merge_target,
+                    'diff_summary': c.diff_summary,
+                    'risk_level': c.risk_level.value,
+                    'recommendation': c.recommendation.value,
+                    'confidence_score': c.confidence_score,
+                    'type': c.type,
+                    'estimated_savings': c.estimated_savings
+                }
+                for c in duplicates
+            ],
+            same_name_conflicts=[],
+            unused_candidates=usage_analyzer.unused,
+            unwired_candidates=usage_analyzer.unwired,
+            merge_suggestions=[],
+            archive_candidates=archive_candidates,
+            category_distribution=dict(Counter(f.category.value for f in self.files.values())),
+            risk_distribution=dict(Counter(f.risk_level.value for f in self.files.values())),
+            issues=[],
+            recommendations=recommendations,
+            optimization_opportunities=[],
+            quality_metrics=quality_metrics
+        )
         
-        try:
-            # Phase 1: Scan
-            self.logger.info("Phase 1: Project scanning...")
-            scanner = ProjectScanner(str(self.project_path), self.logger, self.scope_path)
-            self.files, self.components = scanner.scan()
-            
-            # Phase 2: Build dependency graph
-            self.logger.info("Phase 2: Building dependency graph...")
-            graph_builder = DependencyGraphBuilder(self.files, self.logger)
-            graph_builder.build()
-            
-            # Phase 3: Detect duplicates
-            self.logger.info("Phase 3: Detecting duplicates...")
-            duplicate_detector = DuplicateDetector(self.files, self.logger)
-            duplicates = duplicate_detector.analyze()
-            
-            # Phase 4: Usage analysis
-            self.logger.info("Phase 4: Analyzing usage patterns...")
-            usage_analyzer = UsageAnalyzer(self.files, self.logger)
-            usage_analyzer.analyze()
-            
-            # Phase 5: Stability & risk
-            self.logger.info("Phase 5: Computing stability and risk...")
-            stability_calc = StabilityCalculator(self.files, self.logger)
-            stability_calc.calculate()
-            
-            # Phase 6: Generate comprehensive recommendations
-            self.logger.info("Phase 6: Generating professional recommendations...")
-            recommendations = self._generate_comprehensive_recommendations(duplicates)
-            
-            # Phase 7: Archive eligibility
-            self.logger.info("Phase 7: Evaluating archive candidates...")
-            archive_engine = ArchiveDecisionEngine(self.files, self.logger)
-            archive_candidates = []
-            
-            for path, meta in self.files.items():
-                decision = archive_engine.evaluate_archive_candidate(meta)
-                if decision.decision == Recommendation.SAFE_TO_ARCHIVE:
-                    archive_candidates.append(path)
-            
-            # Phase 8: Calculate quality metrics
-            self.logger.info("Phase 8: Computing quality metrics...")
-            quality_metrics = self._calculate_quality_metrics()
-            
-            end_time = datetime.now()
-            
-            # Build comprehensive report
-            self.report = AnalysisReport(
-                metadata={
-                    'tool_version': Config.TOOL_VERSION,
-                    'scan_root': str(self.project_path),
-                    'ignored_folders': list(IGNORE_PATTERNS),
-                    'start_time': start_time.isoformat(),
-                    'end_time': end_time.isoformat(),
-                    'report_folder': str(self.report_folder),
-                    'warnings': self.logger.warnings,
-                    'errors': self.logger.errors
-                },
-                files={
-                    path: {
-                        'path': meta.path,
-                        'relative_path': meta.relative_path,
-                        'size': meta.size,
-                        'lines': meta.lines,
-                        'category': meta.category.value,
-                        'content_hash': meta.content_hash,
-                        'structural_hash': meta.structural_hash,
-                        'exported_symbols': meta.exported_symbols,
-                        'dependents_count': meta.dependents_count,
-                        'dependents': list(meta.dependents),
-                        'stability_score': meta.stability_score,
-                        'risk_level': meta.risk_level.value,
-                        'recommendation': meta.recommendation.value,
-                        'short_reason': meta.short_reason,
-                        'last_modified_days': meta.last_modified_days,
-                        'complexity_estimate': meta.complexity_estimate,
-                        'any_count': meta.any_count,
-                        'is_dynamic_imported': meta.is_dynamic_imported,
-                        'is_test_file': meta.is_test_file,
-                        'duplicate_cluster_id': meta.duplicate_cluster_id,
-                        'has_jsx': meta.has_jsx,
-                        'has_typescript': meta.has_typescript,
-                        'interface_count': meta.interface_count,
-                        'type_count': meta.type_count
-                    }
-                    for path, meta in self.files.items()
-                },
-                duplicate_clusters=[
-                    {
-                        'cluster_id': c.cluster_id,
-                        'files': c.files,
-                        'cluster_size': c.cluster_size,
-                        'similarity_score': c.similarity_score,
-                        'exported_files_count': c.exported_files_count,
-                        'recent_files_count': c.recent_files_count,
-                        'suggested_base_file': c.suggested_base_file,
-                        'suggested_merge_target': c.suggested_merge_target,
-                        'diff_summary': c.diff_summary,
-                        'risk_level': c.risk_level.value,
-                        'recommendation': c.recommendation.value,
-                        'confidence_score': c.confidence_score,
-                        'type': c.type,
-                        'estimated_savings': c.estimated_savings
-                    }
-                    for c in duplicates
-                ],
-                same_name_conflicts=[],
-                unused_candidates=usage_analyzer.unused,
-                unwired_candidates=usage_analyzer.unwired,
-                merge_suggestions=[],
-                archive_candidates=archive_candidates,
-                category_distribution=dict(Counter(f.category.value for f in self.files.values())),
-                risk_distribution=dict(Counter(f.risk_level.value for f in self.files.values())),
-                issues=[],
-                recommendations=recommendations,
-                optimization_opportunities=[],
-                quality_metrics=quality_metrics
-            )
-            
-            # Generate reports
-            report_gen = ReportGenerator(self.report, self.report_folder, self.logger)
-            report_gen.generate_all()
-            
-            self.logger.info("="*70)
-            self.logger.info("ANALYSIS COMPLETE")
-            self.logger.info("="*70)
-            
-            self.logger.finalize()
-            
-            return self.report
-            
-        except Exception as e:
-            self.logger.error(f"Analysis failed: {e}")
-            self.logger.finalize()
-            raise
-    
+        # Generate reports
+        report_gen = ReportGenerator(self.report, self.report_folder, self.logger)
+        report_gen.generate_all()
+        
+        self.logger.info("="*70)
+        self.logger.info("ANALYSIS COMPLETE")
+        self.logger.info("="*70)
+        
+        self.logger.finalize()
+        
+        return self.report
+
     def _generate_comprehensive_recommendations(self, duplicates: List[DuplicateCluster]) -> List[Dict[str, Any]]:
         """Generate comprehensive professional recommendations"""
         recommendations = []
@@ -4724,6 +4936,12 @@ def main():
         action='store_true',
         help='Dry run mode - show what would be done without making changes'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help=f'Analysis processes for the file scan (default: {Config.SCAN_JOBS}, 1 = in-process)'
+    )
     parser.add_argument(
         '--verbose',
         '-v',
@@ -4745,7 +4963,8 @@ def main():
         print(f"{Colors.FAIL}Error: Path does not exist: {project_path}{Colors.ENDC}")
         sys.exit(1)
     
-    platform = CodeIntelligencePlatform(project_path, scope_path, report_folder_override=args.report_folder)
+    platform = CodeIntelligencePlatform(project_path, scope_path, report_folder_override=args.report_folder,
+                                        jobs=args.jobs)
     
     # Set verbose mode if requested
     if args.verbose:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Phase tracing — spans and counters for the analyzers
+(g_studio_intelligence_v10.py, Debugger/gstudio_analyzer-9.py).
+
+  tracer = Tracer(detail=True, memory=True)
+  with tracer:                           # becomes the active tracer
+      with tracer.span("parse"):
+          ...
+          count("bytes_read", len(data))   # module-level, no-op when inactive
+  tracer.summary()                       # rows: calls, total/max ms, peak memory
+  tracer.export_chrome_trace(path)       # open in chrome://tracing or Perfetto
+
+Phase spans are always recorded. Hot helpers wrapped with ``@traced`` only
+record while the active tracer has ``detail=True``, so an untraced run pays a
+global lookup per call. Helper calls are aggregated; an individual trace event
+is kept only when a call takes at least ``min_event_ms``, which keeps traces of
+100k-call helpers small.
+
+With ``memory=True`` tracemalloc runs for the tracer's lifetime and each phase
+records its peak above the memory in use when it started. Peaks are per phase
+only: nested phases reset the tracemalloc peak, so the parent folds its
+children's peaks back in. Work done in child processes is not seen.
+
+Subprocess spawns are counted through the ``subprocess.Popen`` audit event, so
+call sites need no changes.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+_active: Optional['Tracer'] = None
+_audit_installed = False
+
+
+def _audit(event: str, args) -> None:
+    if event == 'subprocess.Popen' and _active is not None:
+        _active.count('subprocesses')
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start', 'mem_start', 'mem_peak')
+
+    def __init__(self, tracer: 'Tracer', name: str, cat: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> '_Span':
+        if self.cat == 'phase' and self.tracer.memory and tracemalloc.is_tracing():
+            self.tracer._push_memory(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter_ns()
+        peak = None
+        if self.cat == 'phase' and self.tracer.memory and tracemalloc.is_tracing():
+            peak = self.tracer._pop_memory(self)
+        self.tracer._record(self, end, peak, failed=exc_type is not None)
+
+
+class Tracer:
+    """Collects spans and counters for one analysis run."""
+
+    def __init__(self, detail: bool = False, memory: bool = False, min_event_ms: float = 1.0):
+        self.detail = detail
+        self.memory = memory
+        self.min_event_ns = int(min_event_ms * 1e6)
+        self.counters: Dict[str, int] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._threads: Dict[int, str] = {}
+        self._memory_stack: List[_Span] = []
+        self._started_tracemalloc = False
+        self._previous: Optional['Tracer'] = None
+
+    # ---------- activation ----------
+    def __enter__(self) -> 'Tracer':
+        global _active, _audit_installed
+        if not _audit_installed:
+            sys.addaudithook(_audit)
+            _audit_installed = True
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global _active
+        _active = self._previous
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # ---------- recording ----------
+    def span(self, name: str, cat: str = 'phase', **args) -> _Span:
+        """Context manager timing ``name``. ``cat`` is 'phase' or 'helper'."""
+        return _Span(self, name, cat, args)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def _push_memory(self, span: _Span) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent.mem_peak = max(parent.mem_peak, peak)
+        tracemalloc.reset_peak()
+        span.mem_start = current
+        span.mem_peak = current
+        self._memory_stack.append(span)
+
+    def _pop_memory(self, span: _Span) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(span.mem_peak, peak)
+        self._memory_stack.pop()
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent.mem_peak = max(parent.mem_peak, peak)
+        return peak - span.mem_start
+
+    def _record(self, span: _Span, end: int, peak: Optional[int], failed: bool) -> None:
+        dur = end - span.start
+        tid = threading.get_ident()
+        with self._lock:
+            if tid not in self._threads:
+                self._threads[tid] = threading.current_thread().name
+            stat = self.stats.get(span.name)
+            if stat is None:
+                stat = self.stats[span.name] = {
+                    'name': span.name, 'cat': span.cat, 'calls': 0, 'total_ns': 0,
+                    'max_ns': 0, 'first_ns': span.start, 'peak_bytes': None,
+                }
+            stat['calls'] += 1
+            stat['total_ns'] += dur
+            stat['max_ns'] = max(stat['max_ns'], dur)
+            if peak is not None:
+                stat['peak_bytes'] = max(stat['peak_bytes'] or 0, peak)
+            if span.cat == 'phase' or dur >= self.min_event_ns:
+                args = dict(span.args)
+                if peak is not None:
+                    args['peak_kb'] = round(peak / 1024, 1)
+                if failed:
+                    args['error'] = True
+                self.events.append({
+                    'name': span.name, 'cat': span.cat, 'ph': 'X',
+                    'ts': (span.start - self._origin) / 1000, 'dur': dur / 1000,
+                    'pid': os.getpid(), 'tid': tid, 'args': args,
+                })
+                if span.cat == 'phase' and self.counters:
+                    self.events.append({
+                        'name': 'counters', 'ph': 'C', 'ts': (end - self._origin) / 1000,
+                        'pid': os.getpid(), 'tid': tid, 'args': dict(self.counters),
+                    })
+
+    # ---------- reporting ----------
+    def summary(self) -> List[Dict[str, Any]]:
+        """Phases in start order, then helpers by total time."""
+        with self._lock:
+            stats = [dict(s) for s in self.stats.values()]
+        phases = sorted((s for s in stats if s['cat'] == 'phase'), key=lambda s: s['first_ns'])
+        helpers = sorted((s for s in stats if s['cat'] != 'phase'), key=lambda s: -s['total_ns'])
+        return [{
+            'name': s['name'], 'cat': s['cat'], 'calls': s['calls'],
+            'total_ms': round(s['total_ns'] / 1e6, 3),
+            'max_ms': round(s['max_ns'] / 1e6, 3),
+            'peak_kb': None if s['peak_bytes'] is None else round(s['peak_bytes'] / 1024, 1),
+        } for s in phases + helpers]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+            counters = dict(self.counters)
+        meta = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                 'args': {'name': Path(sys.argv[0]).name or 'python'}}]
+        meta += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                 for tid, name in threads.items()]
+        return {
+            'traceEvents': meta + sorted(events, key=lambda e: e['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {'counters': counters, 'summary': self.summary()},
+        }
+
+    def export_chrome_trace(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def current() -> Optional[Tracer]:
+    return _active
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add ``n`` to counter ``name`` on the active tracer, if any."""
+    tracer = _active
+    if tracer is not None:
+        tracer.count(name, n)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator recording each call as a helper span while detail tracing is on."""
+    def decorate(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _active
+            if tracer is None or not tracer.detail:
+                return fn(*args, **kwargs)
+            with _Span(tracer, label, 'helper', {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
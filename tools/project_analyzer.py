@@ -4,24 +4,23 @@ Advanced Project Analysis and Refactoring Agent
 Deep architectural analysis with intelligent recommendations
 """
 
-import os
 import json
-import ast
-import hashlib
 import difflib
-import re
 import sys
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, List, Set, Optional, Any
 from collections import defaultdict
 import statistics
-import math
+import zlib
+from array import array
 
+from scan_core import Snapshot, scan_project
 
-@dataclass
+
+@dataclass(slots=True)
 class FileInfo:
-    """Complete metadata for a file"""
+    """Complete metadata for a file (content is not kept; see LineHashIndex)"""
     path: str
     full_path: Path
     type: str
@@ -39,14 +38,62 @@ class FileInfo:
     dependencies: Set[str] = field(default_factory=set)
     dependents: Set[str] = field(default_factory=set)
     last_modified: float = 0
-    content: str = ""
+    has_styling: bool = False  # mentions style/className (UI impact checks)
+
+
+class LineHashIndex:
+    """Similarity backend over per-file line-hash arrays.
+
+    Content is read from disk only when a file is first compared, reduced to
+    an array of normalized line hashes, and cached by content hash. Comparing
+    two files is then a SequenceMatcher over a few hundred ints instead of
+    hundreds of thousands of characters.
+    """
+
+    def __init__(self):
+        self._cache: Dict[str, array] = {}
+
+    @staticmethod
+    def read(file_info: FileInfo) -> str:
+        with open(file_info.full_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+
+    def line_hashes(self, file_info: FileInfo) -> array:
+        cached = self._cache.get(file_info.hash)
+        if cached is None:
+            lines = (' '.join(line.split()) for line in self.read(file_info).splitlines())
+            cached = array('L', (zlib.crc32(line.encode()) for line in lines if line))
+            self._cache[file_info.hash] = cached
+        return cached
+
+    def ratio(self, file1: FileInfo, file2: FileInfo) -> float:
+        if file1.hash == file2.hash:
+            return 1.0
+        a = self.line_hashes(file1)
+        b = self.line_hashes(file2)
+        if not a and not b:
+            return 1.0
+        return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+class CharDiffIndex(LineHashIndex):
+    """Legacy character-level similarity (slow); content is loaded per comparison"""
+
+    def ratio(self, file1: FileInfo, file2: FileInfo) -> float:
+        return difflib.SequenceMatcher(None, self.read(file1), self.read(file2)).ratio()
+
+
+SIMILARITY_BACKENDS = {'lines': LineHashIndex, 'chars': CharDiffIndex}
 
 
 class ProjectAnalyzer:
     """Advanced analysis engine for codebase optimization"""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, similarity: str = 'lines', use_snapshot: bool = True):
         self.project_root = Path(project_root).resolve()
+        self.similarity = SIMILARITY_BACKENDS[similarity]()
+        self.use_snapshot = use_snapshot
+        self.snapshot: Optional[Snapshot] = None
         self.file_map: Dict[str, FileInfo] = {}
         self.import_graph: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_graph: Dict[str, Set[str]] = defaultdict(set)
@@ -160,73 +207,41 @@ class ProjectAnalyzer:
         return report
     
     def _scan_project(self) -> List[FileInfo]:
-        """Deep recursive scan of project"""
+        """Build FileInfo views over the shared scan snapshot"""
+        self.snapshot = scan_project(self.project_root, use_snapshot=self.use_snapshot, verbose=True)
         file_infos = []
-        excluded_dirs = {'.git', 'node_modules', '__pycache__', '.next', '.nuxt', 
-                        'dist', 'build', 'out', '.cache', '.idea', '.vscode'}
-        excluded_files = {'.DS_Store', 'Thumbs.db', '.env.local'}
         
-        for root, dirs, files in os.walk(self.project_root):
-            # Filter directories
-            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        for rel_path, record in self.snapshot.records.items():
+            file_info = FileInfo(
+                path=rel_path,
+                full_path=self.project_root / rel_path,
+                type=self._detect_file_type(Path(rel_path)),
+                size=record.size,
+                lines=record.lines,
+                imports=record.imports,
+                exports=record.exports,
+                functions=record.functions,
+                classes=record.classes,
+                hooks=record.hooks,
+                components=record.components,
+                hash=record.hash,
+                complexity=record.complexity,
+                maintainability=record.maintainability,
+                last_modified=record.mtime,
+                has_styling=record.has_styling
+            )
             
-            for filename in files:
-                if filename in excluded_files:
-                    continue
-                    
-                filepath = Path(root) / filename
-                rel_path = str(filepath.relative_to(self.project_root))
-                
-                try:
-                    # Read file content
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Detect file type
-                    file_type = self._detect_file_type(filepath)
-                    
-                    # Parse file based on type
-                    imports, exports = self._parse_file(content, file_type, rel_path)
-                    functions, classes = self._extract_definitions(content, file_type)
-                    hooks, components = self._extract_react_elements(content, file_type)
-                    
-                    # Calculate metrics
-                    complexity = self._calculate_complexity(content, file_type)
-                    maintainability = self._calculate_maintainability(content, complexity)
-                    
-                    file_info = FileInfo(
-                        path=rel_path,
-                        full_path=filepath,
-                        type=file_type,
-                        size=len(content),
-                        lines=content.count('\n') + 1,
-                        imports=imports,
-                        exports=exports,
-                        functions=functions,
-                        classes=classes,
-                        hooks=hooks,
-                        components=components,
-                        hash=hashlib.md5(content.encode()).hexdigest(),
-                        complexity=complexity,
-                        maintainability=maintainability,
-                        last_modified=filepath.stat().st_mtime,
-                        content=content
-                    )
-                    
-                    file_infos.append(file_info)
-                    self.file_map[rel_path] = file_info
-                    
-                    # Register special elements
-                    for hook in hooks:
-                        self.hook_registry[hook].append(rel_path)
-                    for component in components:
-                        self.component_registry[component].append(rel_path)
-                    if 'service' in rel_path.lower() or 'api' in rel_path.lower():
-                        for export in exports:
-                            self.service_registry[export].append(rel_path)
-                            
-                except Exception as e:
-                    print(f"⚠️ Could not analyze {rel_path}: {e}")
+            file_infos.append(file_info)
+            self.file_map[rel_path] = file_info
+            
+            # Register special elements
+            for hook in record.hooks:
+                self.hook_registry[hook].append(rel_path)
+            for component in record.components:
+                self.component_registry[component].append(rel_path)
+            if 'service' in rel_path.lower() or 'api' in rel_path.lower():
+                for export in record.exports:
+                    self.service_registry[export].append(rel_path)
         
         return file_infos
     
@@ -255,233 +270,16 @@ class ProjectAnalyzer:
         }
         return mapping.get(ext, 'unknown')
     
-    def _parse_file(self, content: str, file_type: str, filepath: str) -> Tuple[List[str], List[str]]:
-        """Parse imports and exports from file"""
-        imports, exports = [], []
-        
-        if file_type in ['javascript', 'typescript', 'react', 'react_typescript']:
-            # ES6 imports
-            import_patterns = [
-                r'import\s+.*from\s+[\'"]([^"\']+)[\'"]',
-                r'require\([\'"]([^"\']+)[\'"]\)',
-                r'import\([\'"]([^"\']+)[\'"]\)',
-                r'from\s+[\'"]([^"\']+)[\'"]'
-            ]
-            
-            for pattern in import_patterns:
-                imports.extend(re.findall(pattern, content))
-            
-            # Exports
-            export_patterns = [
-                r'export\s+(?:const|let|var|function|class|default|async\s+function)?\s*([a-zA-Z_$][\w$]*)',
-                r'export\s*\{([^}]+)\}',
-                r'export\s+default\s+([a-zA-Z_$][\w$]*)'
-            ]
-            
-            for pattern in export_patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    if isinstance(match, str):
-                        if ',' in match:
-                            exports.extend([e.strip() for e in match.split(',')])
-                        else:
-                            exports.append(match.strip())
-        
-        elif file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                
-                # Imports
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        imports.extend([alias.name for alias in node.names])
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-                
-                # Exports (from __all__)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Assign):
-                        for target in node.targets:
-                            if isinstance(target, ast.Name) and target.id == '__all__':
-                                if isinstance(node.value, ast.List):
-                                    exports.extend([
-                                        e.s for e in node.value.elts 
-                                        if isinstance(e, ast.Str) or (hasattr(e, 'value') and isinstance(e.value, str))
-                                    ])
-            except:
-                pass
-        
-        # Clean imports (remove relative paths, keep package names)
-        clean_imports = []
-        for imp in imports:
-            if imp.startswith('.'):
-                # Resolve relative import
-                base_dir = str(Path(filepath).parent)
-                resolved = str((Path(base_dir) / imp).resolve().relative_to(self.project_root))
-                clean_imports.append(resolved)
-            else:
-                clean_imports.append(imp.split('/')[0])  # Keep only package name
-        
-        return clean_imports, list(set(exports))
-    
-    def _extract_definitions(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        """Extract function and class definitions"""
-        functions, classes = [], []
-        
-        if file_type in ['javascript', 'typescript', 'react', 'react_typescript']:
-            # Function definitions
-            func_patterns = [
-                r'function\s+([a-zA-Z_$][\w$]*)\s*\(',
-                r'const\s+([a-zA-Z_$][\w$]*)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>',
-                r'([a-zA-Z_$][\w$]*)\s*\([^)]*\)\s*\{'
-            ]
-            
-            for pattern in func_patterns:
-                functions.extend(re.findall(pattern, content))
-            
-            # Class definitions
-            class_matches = re.findall(r'class\s+([a-zA-Z_$][\w$]*)', content)
-            classes.extend(class_matches)
-        
-        elif file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        functions.append(node.name)
-                    elif isinstance(node, ast.AsyncFunctionDef):
-                        functions.append(node.name)
-                    elif isinstance(node, ast.ClassDef):
-                        classes.append(node.name)
-            except:
-                pass
-        
-        return list(set(functions)), list(set(classes))
-    
-    def _extract_react_elements(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        """Extract React hooks and components"""
-        hooks, components = [], []
-        
-        if file_type in ['react', 'react_typescript', 'javascript', 'typescript']:
-            # React hooks (useXXX)
-            hook_matches = re.findall(r'const\s+([uU]se[A-Z][a-zA-Z]*)\s*=', content)
-            hooks.extend([h for h in hook_matches if h.lower().startswith('use')])
-            
-            # React components
-            comp_patterns = [
-                r'const\s+([A-Z][a-zA-Z]*)\s*=\s*(?:\([^)]*\)\s*=>|function)',
-                r'function\s+([A-Z][a-zA-Z]*)\s*\([^)]*\)\s*\{',
-                r'class\s+([A-Z][a-zA-Z]*)\s+extends\s+(?:Component|React\.Component)'
-            ]
-            
-            for pattern in comp_patterns:
-                components.extend(re.findall(pattern, content))
-        
-        return list(set(hooks)), list(set(components))
-    
-    def _calculate_complexity(self, content: str, file_type: str) -> int:
-        """Calculate cyclomatic complexity approximation"""
-        lines = content.split('\n')
-        complexity = 0
-        
-        complexity_keywords = {
-            'if', 'else', 'elif', 'case', 'default', 'for', 'while', 'do',
-            'catch', 'finally', '&&', '||', '?', '??', '?.', 'try', 'throw'
-        }
-        
-        for line in lines:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith(('//', '#', '/*', '*', '*/')):
-                continue
-            
-            # Count decision points
-            for keyword in complexity_keywords:
-                if keyword in line:
-                    complexity += 1
-            
-            # Count nesting
-            complexity += line.count('{') + line.count('(') + line.count('[')
-        
-        return complexity
-    
-    def _calculate_maintainability(self, content: str, complexity: int) -> float:
-        """Calculate maintainability index (0-100)"""
-        lines = content.count('\n') + 1
-        if lines == 0 or complexity == 0:
-            return 100.0
-        
-        # Simplified maintainability index
-        halstead_volume = lines * math.log2(len(set(content.split())) + 1)
-        maintainability = max(0, min(100, 
-            171 - 5.2 * math.log(halstead_volume) - 0.23 * complexity - 16.2 * math.log(lines)
-        ))
-        
-        return round(maintainability, 2)
-    
     def _build_dependency_graph(self, file_infos: List[FileInfo]):
-        """Build comprehensive dependency graph"""
-        # First pass: map files by name and path
-        file_by_name = {}
-        for info in file_infos:
-            filename = Path(info.path).name
-            file_by_name[filename] = info.path
-            file_by_name[Path(info.path).stem] = info.path
-        
-        # Build graph
+        """Copy the snapshot's resolved import edges onto the file views"""
         for info in file_infos:
             source = info.path
-            for imp in info.imports:
-                # Try to resolve import
-                target = self._resolve_import(imp, source, file_by_name, file_infos)
-                if target:
-                    self.import_graph[source].add(target)
-                    self.reverse_graph[target].add(source)
-                    info.dependencies.add(target)
-                    if target in self.file_map:
-                        self.file_map[target].dependents.add(source)
-    
-    def _resolve_import(self, imp: str, source: str, file_by_name: Dict, 
-                       file_infos: List[FileInfo]) -> Optional[str]:
-        """Resolve import to actual file path"""
-        source_dir = str(Path(source).parent)
-        
-        # Check direct match
-        if imp in self.file_map:
-            return imp
-        
-        # Check by filename
-        if imp in file_by_name:
-            return file_by_name[imp]
-        
-        # Check relative paths
-        if imp.startswith('.'):
-            # Try to resolve relative path
-            try:
-                abs_path = (Path(self.project_root) / source_dir / imp).resolve()
-                rel_path = str(abs_path.relative_to(self.project_root))
-                
-                # Try with extensions
-                for ext in ['', '.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte']:
-                    test_path = rel_path + ext
-                    if test_path in self.file_map:
-                        return test_path
-                    
-                    # Also check index files
-                    test_path_index = str(Path(rel_path) / f"index{ext}")
-                    if test_path_index in self.file_map:
-                        return test_path_index
-            except:
-                pass
-        
-        # Fuzzy match by stem
-        imp_stem = Path(imp).stem
-        for info in file_infos:
-            if Path(info.path).stem == imp_stem:
-                return info.path
-        
-        return None
+            for target in self.snapshot.edges.get(source, ()):
+                self.import_graph[source].add(target)
+                self.reverse_graph[target].add(source)
+                info.dependencies.add(target)
+                if target in self.file_map:
+                    self.file_map[target].dependents.add(source)
     
     def _find_unused_files(self) -> List[FileInfo]:
         """Find files not imported by any other file"""
@@ -642,8 +440,7 @@ class ProjectAnalyzer:
     def _compare_files(self, file1: FileInfo, file2: FileInfo) -> float:
         """Calculate similarity between two files"""
         # Content similarity
-        seq_matcher = difflib.SequenceMatcher(None, file1.content, file2.content)
-        content_similarity = seq_matcher.ratio()
+        content_similarity = self.similarity.ratio(file1, file2)
         
         # Structure similarity
         struct_similarity = self._compare_structure(file1, file2)
@@ -714,7 +511,7 @@ class ProjectAnalyzer:
             return "No UI impact (non-visual files)"
         
         # Check for inline styles or CSS
-        has_styles = any('style' in f.content.lower() or 'className' in f.content for f in files)
+        has_styles = any(f.has_styling for f in files)
         
         if has_styles:
             return "Medium UI impact (contains styling)"
@@ -787,7 +584,7 @@ class ProjectAnalyzer:
                                 'replace': other.path,
                                 'with': best.path,
                                 'improvement': round(best.maintainability - other.maintainability, 1),
-                                'ui_impact': 'Low' if 'style' not in other.content else 'Review needed'
+                                'ui_impact': 'Review needed' if other.has_styling else 'Low'
                             })
         
         return recommendations
@@ -1026,12 +823,17 @@ def main():
                        help="Project root path (default: current directory)")
     parser.add_argument("--output", "-o", default="analysis_report.json",
                        help="Output JSON file path")
+    parser.add_argument("--similarity", choices=sorted(SIMILARITY_BACKENDS), default="lines",
+                       help="Merge similarity backend: line hashes (fast) or characters (legacy)")
+    parser.add_argument("--no-snapshot", action="store_true",
+                       help="Re-parse every file instead of reusing the shared scan snapshot")
     
     args = parser.parse_args()
     
     try:
         # Initialize analyzer
-        analyzer = ProjectAnalyzer(args.path)
+        analyzer = ProjectAnalyzer(args.path, similarity=args.similarity,
+                                   use_snapshot=not args.no_snapshot)
         
         # Run analysis
         report = analyzer.analyze()
@@ -5,17 +5,15 @@
 Project Architect: Smart Codebase Analysis & Refactoring Tool
 """
 
-import os
 import json
-import hashlib
-import re
-import ast
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, List, Set, Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 import statistics
 
+from scan_core import Snapshot, scan_project
+
 
 @dataclass
 class FileInfo:
@@ -41,8 +39,10 @@ class FileInfo:
 class Architect:
     """تحلیلگر اصلی معماری پروژه"""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, use_snapshot: bool = True):
         self.root = Path(project_root).resolve()
+        self.use_snapshot = use_snapshot
+        self.snapshot: Optional[Snapshot] = None
         self.files: Dict[str, FileInfo] = {}
         self.imports: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_imports: Dict[str, Set[str]] = defaultdict(set)
@@ -81,68 +81,39 @@ class Architect:
         return report
     
     def _scan(self) -> List[FileInfo]:
-        """اسکن کامل پروژه"""
+        """اسکن کامل پروژه (از اسنپ‌شات مشترک scan_core)"""
         all_files = []
+        self.snapshot = scan_project(self.root, use_snapshot=self.use_snapshot, verbose=True)
         
-        for root, dirs, files in os.walk(self.root):
-            # نادیده گرفتن دایرکتوری‌های سیستم
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in {
-                'node_modules', '__pycache__', '.git', 'dist', 'build'
-            }]
+        for rel_path, record in self.snapshot.records.items():
+            parts = Path(rel_path).parts
+            # نادیده گرفتن دایرکتوری‌ها و فایل‌های مخفی
+            if any(d.startswith('.') for d in parts[:-1]):
+                continue
+            if parts[-1].startswith('.') or parts[-1].endswith(('.pyc', '.map')):
+                continue
             
-            for file in files:
-                if file.startswith('.') or file.endswith(('.pyc', '.map')):
-                    continue
-                    
-                path = Path(root) / file
-                rel_path = str(path.relative_to(self.root))
-                
-                try:
-                    info = self._analyze_file(path, rel_path)
-                    all_files.append(info)
-                    self.files[rel_path] = info
-                except Exception as e:
-                    print(f"⚠️ خطا در تحلیل {rel_path}: {e}")
+            info = FileInfo(
+                path=rel_path,
+                full_path=self.root / rel_path,
+                type=self._detect_type(Path(rel_path)),
+                size=record.size,
+                lines=record.lines,
+                imports=record.imports,
+                exports=record.exports,
+                functions=record.functions,
+                classes=record.classes,
+                components=record.components,
+                hooks=record.hooks,
+                complexity=record.complexity,
+                hash=record.hash,
+                last_modified=record.mtime
+            )
+            all_files.append(info)
+            self.files[rel_path] = info
         
         return all_files
     
-    def _analyze_file(self, path: Path, rel_path: str) -> FileInfo:
-        """تحلیل یک فایل"""
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # تشخیص نوع فایل
-        file_type = self._detect_type(path)
-        
-        # استخراج اطلاعات
-        imports = self._extract_imports(content, file_type)
-        exports = self._extract_exports(content, file_type)
-        functions, classes = self._extract_definitions(content, file_type)
-        components, hooks = self._extract_react(content, file_type)
-        
-        # محاسبه پیچیدگی
-        complexity = self._calculate_complexity(content)
-        
-        # هش محتوا
-        file_hash = hashlib.md5(content.encode()).hexdigest()
-        
-        return FileInfo(
-            path=rel_path,
-            full_path=path,
-            type=file_type,
-            size=len(content),
-            lines=content.count('\n') + 1,
-            imports=imports,
-            exports=exports,
-            functions=functions,
-            classes=classes,
-            components=components,
-            hooks=hooks,
-            complexity=complexity,
-            hash=file_hash,
-            last_modified=path.stat().st_mtime
-        )
-    
     def _detect_type(self, path: Path) -> str:
         """تشخیص نوع فایل"""
         ext = path.suffix.lower()
@@ -160,125 +131,17 @@ class Architect:
         }
         return types.get(ext, 'other')
     
-    def _extract_imports(self, content: str, file_type: str) -> List[str]:
-        """استخراج importها"""
-        imports = []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            # importهای ES6
-            patterns = [
-                r'from\s+[\'"]([^"\']+)[\'"]',
-                r'require\([\'"]([^"\']+)[\'"]\)',
-                r'import\s+.*from\s+[\'"]([^"\']+)[\'"]'
-            ]
-            for pattern in patterns:
-                imports.extend(re.findall(pattern, content))
-        
-        elif file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-            except:
-                pass
-        
-        return list(set(imports))
-    
-    def _extract_exports(self, content: str, file_type: str) -> List[str]:
-        """استخراج exportها"""
-        exports = []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            patterns = [
-                r'export\s+(?:const|let|var|function|class|default)?\s*([A-Za-z_$][\w$]*)',
-                r'export\s*\{([^}]+)\}'
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    if isinstance(match, str):
-                        if ',' in match:
-                            exports.extend([e.strip() for e in match.split(',')])
-                        else:
-                            exports.append(match)
-        
-        return list(set(exports))
-    
-    def _extract_definitions(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        """استخراج توابع و کلاس‌ها"""
-        functions, classes = [], []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            functions = re.findall(r'function\s+([A-Za-z_$][\w$]*)|const\s+([A-Za-z_$][\w$]*)\s*=\s*(?:\([^)]*\)|[^=]*)\s*=>', content)
-            functions = [f[0] or f[1] for f in functions if any(f)]
-            classes = re.findall(r'class\s+([A-Za-z_$][\w$]*)', content)
-        
-        elif file_type == 'python':
-            functions = re.findall(r'def\s+([A-Za-z_][\w]*)', content)
-            classes = re.findall(r'class\s+([A-Za-z_][\w]*)', content)
-        
-        return list(set(functions)), list(set(classes))
-    
-    def _extract_react(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        """استخراج کامپوننت‌ها و هوک‌های ری‌اکت"""
-        components, hooks = [], []
-        
-        if file_type in ['react', 'react-ts', 'javascript', 'typescript']:
-            # کامپوننت‌ها (با حرف بزرگ شروع می‌شوند)
-            components = re.findall(r'const\s+([A-Z][A-Za-z]*)\s*=|function\s+([A-Z][A-Za-z]*)\s*\(', content)
-            components = [c[0] or c[1] for c in components if any(c)]
-            
-            # هوک‌ها (با use شروع می‌شوند)
-            hooks = re.findall(r'const\s+([uU]se[A-Z][A-Za-z]*)\s*=', content)
-        
-        return list(set(components)), list(set(hooks))
-    
-    def _calculate_complexity(self, content: str) -> int:
-        """محاسبه پیچیدگی کد"""
-        lines = content.split('\n')
-        score = 0
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith(('//', '#', '/*')):
-                continue
-            
-            # شمارش ساختارهای کنترلی
-            keywords = ['if', 'else', 'for', 'while', 'switch', 'case', 'catch', '&&', '||', '?']
-            score += sum(1 for kw in keywords if kw in line)
-            
-            # شمارش توابع و کلاس‌ها
-            if any(x in line for x in ['function', 'def ', 'class ', '=>']):
-                score += 2
-        
-        return score
-    
     def _build_graph(self, files: List[FileInfo]):
-        """ساخت گراف وابستگی"""
-        # نگاشت نام فایل به مسیر کامل
-        name_to_path = {}
-        for info in files:
-            name = Path(info.path).name
-            stem = Path(info.path).stem
-            name_to_path[name] = info.path
-            name_to_path[stem] = info.path
-        
-        # ساخت گراف
+        """ساخت گراف وابستگی (یال‌های حل‌شده اسنپ‌شات)"""
         for info in files:
             source = info.path
-            for imp in info.imports:
-                target = self._resolve_import(imp, source, name_to_path)
-                if target:
-                    self.imports[source].add(target)
-                    self.reverse_imports[target].add(source)
-                    info.dependencies.add(target)
-                    if target in self.files:
-                        self.files[target].dependents.add(source)
+            for target in self.snapshot.edges.get(source, ()):
+                if target not in self.files:
+                    continue
+                self.imports[source].add(target)
+                self.reverse_imports[target].add(source)
+                info.dependencies.add(target)
+                self.files[target].dependents.add(source)
         
         # ثبت کامپوننت‌ها و هوک‌ها
         for path, info in self.files.items():
@@ -287,29 +150,6 @@ class Architect:
             for hook in info.hooks:
                 self.hook_map[hook].append(path)
     
-    def _resolve_import(self, imp: str, source: str, name_map: Dict) -> Optional[str]:
-        """تبدیل import به مسیر فایل"""
-        # جستجوی مستقیم
-        if imp in self.files:
-            return imp
-        
-        # جستجوی با نام فایل
-        if imp in name_map:
-            return name_map[imp]
-        
-        # جستجوی نسبی
-        if imp.startswith('.'):
-            base = Path(source).parent
-            target = (self.root / base / imp).resolve()
-            try:
-                rel = str(target.relative_to(self.root))
-                if rel in self.files:
-                    return rel
-            except:
-                pass
-        
-        return None
-    
     def _find_unused(self) -> List[Dict]:
         """پیدا کردن فایل‌های استفاده نشده"""
         unused = []
@@ -1039,16 +879,16 @@ class Architect:
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
-        project_path = sys.argv[1]
-    else:
-        project_path = "."
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    project_path = args[0] if args else "."
+    # --no-snapshot: همه فایل‌ها دوباره پارس شوند
+    use_snapshot = '--no-snapshot' not in sys.argv
     
     print("🏗️  تحلیلگر معماری پروژه")
     print("=" * 50)
     
     try:
-        architect = Architect(project_path)
+        architect = Architect(project_path, use_snapshot=use_snapshot)
         report = architect.run()
         
         print("\n🎉 تحلیل کامل شد!")
@@ -1,18 +1,17 @@
 #!/usr/bin/env python3
-import os
 import json
-import hashlib
 import re
-import ast
 import sys
 import shutil
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, List, Set, Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 from datetime import datetime
 import statistics
 
+from scan_core import FileRecord, Snapshot, scan_project
+
 
 @dataclass
 class FileInfo:
@@ -36,8 +35,10 @@ class FileInfo:
 
 
 class ProjectOptimizer:
-    def __init__(self, project_root: str, reports_base: str = "reports"):
+    def __init__(self, project_root: str, reports_base: str = "reports", use_snapshot: bool = True):
         self.root = Path(project_root).resolve()
+        self.use_snapshot = use_snapshot
+        self.snapshot: Optional[Snapshot] = None
         self.files: Dict[str, FileInfo] = {}
         self.imports: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_imports: Dict[str, Set[str]] = defaultdict(set)
@@ -79,62 +80,45 @@ class ProjectOptimizer:
             'backups', 'backup', '.backup'
         }
         
-        exclude_patterns = [
-            r'\.backup$', r'\.bak$', r'~$', r'\.swp$',
-            r'backup_\d+', r'_backup', r'\.old$'
-        ]
+        exclude_patterns = re.compile(
+            r'\.backup$|\.bak$|~$|\.swp$|backup_\d+|_backup|\.old$'
+        )
+        
+        self.snapshot = scan_project(self.root, use_snapshot=self.use_snapshot, verbose=True)
         
-        for root, dirs, files in os.walk(self.root):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in exclude_dirs]
+        for rel_path, record in self.snapshot.records.items():
+            parts = Path(rel_path).parts
+            file = parts[-1]
+            if any(d.startswith('.') or d in exclude_dirs for d in parts[:-1]):
+                continue
+            if file.startswith('.') or file.endswith(('.pyc', '.map')):
+                continue
+            if exclude_patterns.search(file):
+                continue
             
-            for file in files:
-                if file.startswith('.') or file.endswith(('.pyc', '.map')):
-                    continue
-                
-                if any(re.search(pattern, file) for pattern in exclude_patterns):
-                    continue
-                    
-                path = Path(root) / file
-                rel_path = str(path.relative_to(self.root))
-                
-                try:
-                    info = self._analyze_file(path, rel_path)
-                    all_files.append(info)
-                    self.files[rel_path] = info
-                except Exception as e:
-                    print(f"⚠️ Error analyzing {rel_path}: {e}")
+            info = self._file_info(record)
+            all_files.append(info)
+            self.files[rel_path] = info
         
         return all_files
     
-    def _analyze_file(self, path: Path, rel_path: str) -> FileInfo:
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        file_type = self._detect_type(path)
-        imports = self._extract_imports(content, file_type)
-        exports = self._extract_exports(content, file_type)
-        functions, classes = self._extract_definitions(content, file_type)
-        components, hooks = self._extract_react(content, file_type)
-        complexity = self._calculate_complexity(content)
-        maintainability = self._calculate_maintainability(content, complexity)
-        file_hash = hashlib.md5(content.encode()).hexdigest()
-        
+    def _file_info(self, record: FileRecord) -> FileInfo:
         return FileInfo(
-            path=rel_path,
-            full_path=path,
-            type=file_type,
-            size=len(content),
-            lines=content.count('\n') + 1,
-            imports=imports,
-            exports=exports,
-            functions=functions,
-            classes=classes,
-            components=components,
-            hooks=hooks,
-            complexity=complexity,
-            hash=file_hash,
-            last_modified=path.stat().st_mtime,
-            maintainability=maintainability
+            path=record.path,
+            full_path=self.root / record.path,
+            type=self._detect_type(Path(record.path)),
+            size=record.size,
+            lines=record.lines,
+            imports=record.imports,
+            exports=record.exports,
+            functions=record.functions,
+            classes=record.classes,
+            components=record.components,
+            hooks=record.hooks,
+            complexity=record.complexity,
+            hash=record.hash,
+            last_modified=record.mtime,
+            maintainability=record.maintainability
         )
     
     def _detect_type(self, path: Path) -> str:
@@ -146,127 +130,15 @@ class ProjectOptimizer:
         }
         return types.get(ext, 'other')
     
-    def _extract_imports(self, content: str, file_type: str) -> List[str]:
-        imports = []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            patterns = [
-                r'from\s+[\'"]([^"\']+)[\'"]',
-                r'require\([\'"]([^"\']+)[\'"]\)',
-                r'import\s+.*from\s+[\'"]([^"\']+)[\'"]'
-            ]
-            for pattern in patterns:
-                imports.extend(re.findall(pattern, content))
-        
-        elif file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-            except:
-                pass
-        
-        return list(set(imports))
-    
-    def _extract_exports(self, content: str, file_type: str) -> List[str]:
-        exports = []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            patterns = [
-                r'export\s+(?:const|let|var|function|class|default)?\s*([A-Za-z_$][\w$]*)',
-                r'export\s*\{([^}]+)\}'
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    if isinstance(match, str):
-                        if ',' in match:
-                            exports.extend([e.strip() for e in match.split(',')])
-                        else:
-                            exports.append(match)
-        
-        return list(set(exports))
-    
-    def _extract_definitions(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        functions, classes = [], []
-        
-        if file_type in ['javascript', 'react', 'typescript', 'react-ts']:
-            functions = list(set(re.findall(r'(?:function|const|let|var)\s+([A-Z_a-z$][\w$]*)\s*(?:=|:|\()', content)))
-            classes = list(set(re.findall(r'class\s+([A-Z][\w]*)', content)))
-        
-        elif file_type == 'python':
-            try:
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        functions.append(node.name)
-                    elif isinstance(node, ast.ClassDef):
-                        classes.append(node.name)
-            except:
-                pass
-        
-        return functions, classes
-    
-    def _extract_react(self, content: str, file_type: str) -> Tuple[List[str], List[str]]:
-        components, hooks = [], []
-        
-        if file_type in ['react', 'react-ts']:
-            components = list(set(re.findall(r'(?:function|const)\s+([A-Z][\w]*)\s*[=:]?\s*(?:\(|React\.FC)', content)))
-            hooks = list(set(re.findall(r'use([A-Z][\w]*)', content)))
-        
-        return components, hooks
-    
-    def _calculate_complexity(self, content: str) -> int:
-        complexity = 1
-        complexity += content.count('if ')
-        complexity += content.count('else')
-        complexity += content.count('for ')
-        complexity += content.count('while ')
-        complexity += content.count('&&')
-        complexity += content.count('||')
-        complexity += content.count('case ')
-        complexity += content.count('catch')
-        complexity += content.count('?')
-        return complexity
-    
-    def _calculate_maintainability(self, content: str, complexity: int) -> float:
-        lines = content.count('\n') + 1
-        volume = len(content)
-        
-        if lines == 0:
-            return 100
-        
-        effort = volume * complexity
-        maintainability = max(0, min(100, 171 - 5.2 * (effort ** 0.23) - 0.23 * complexity - 16.2 * (lines ** 0.5)))
-        return round(maintainability, 1)
-    
     def _build_graph(self, files: List[FileInfo]):
         for file in files:
-            for imp in file.imports:
-                resolved = self._resolve_import(imp, file.path)
-                if resolved and resolved in self.files:
+            for resolved in self.snapshot.edges.get(file.path, ()):
+                if resolved in self.files:
                     self.imports[file.path].add(resolved)
                     self.reverse_imports[resolved].add(file.path)
                     file.dependencies.add(resolved)
                     self.files[resolved].dependents.add(file.path)
     
-    def _resolve_import(self, imp: str, from_file: str) -> Optional[str]:
-        if imp.startswith('.'):
-            base_dir = Path(from_file).parent
-            resolved = (base_dir / imp).resolve()
-            
-            for ext in ['', '.js', '.jsx', '.ts', '.tsx', '.py', '/index.js', '/index.tsx']:
-                check_path = str(resolved.with_suffix('')) + ext
-                rel_path = str(Path(check_path).relative_to(self.root))
-                if rel_path in self.files:
-                    return rel_path
-        return None
-    
     def _find_unused(self) -> List[FileInfo]:
         unused = []
         entry_patterns = ['index', 'main', 'app', '__init__', 'setup']
@@ -597,11 +469,12 @@ def main():
     parser = argparse.ArgumentParser(description="Project Optimizer - Find unused and duplicate code")
     parser.add_argument('path', nargs='?', default='.', help='Project path')
     parser.add_argument('--reports', default='reports', help='Reports base directory')
+    parser.add_argument('--no-snapshot', action='store_true', help='Re-parse every file instead of reusing the shared scan snapshot')
     
     args = parser.parse_args()
     
     try:
-        optimizer = ProjectOptimizer(args.path, args.reports)
+        optimizer = ProjectOptimizer(args.path, args.reports, use_snapshot=not args.no_snapshot)
         report = optimizer.run()
         
         print("\n" + "="*60)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Project watch — report batches of changed and removed source files for the
+analyzers' --watch modes (g_studio_intelligence_v10.py,
+Debugger/gstudio_analyzer-9.py).
+
+  watcher = ProjectWatcher(scanner)      # anything with scan(), accepts(path), src_path
+  watcher.start()
+  changed, removed = watcher.wait()      # blocks until a debounced batch is ready
+  watcher.stop()
+
+Uses watchdog (inotify on Linux) when it is installed and falls back to
+polling mtimes otherwise; fallback_reason says why watchdog is not in use.
+Either way a file counts as changed only when its (mtime_ns, size) differs
+from the last batch, so editor save dances collapse into one edit.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+POLL_INTERVAL = 0.5     # seconds between mtime sweeps without watchdog
+DEBOUNCE = 0.2          # quiet period before a batch of edits is reported
+
+
+def _watchdog_handler(watcher: 'ProjectWatcher'):
+    """Event handler forwarding watchdog events to ``watcher`` (watchdog is
+    imported only once a watcher starts)."""
+    from watchdog.events import FileSystemEventHandler
+
+    class _WatchdogHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                # A directory appearing, vanishing or moving can hide many
+                # file events; plain "modified" just echoes its children.
+                if event.event_type != 'modified':
+                    watcher.notify(None)
+                return
+            watcher.notify(Path(event.src_path))
+            dest = getattr(event, 'dest_path', None)
+            if dest:
+                watcher.notify(Path(dest))
+
+    return _WatchdogHandler()
+
+
+class ProjectWatcher:
+    def __init__(self, scanner, poll_interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE):
+        self.scanner = scanner
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.snapshot: Dict[Path, Tuple[int, int]] = {}
+        self.fallback_reason: Optional[str] = None
+        self._pending: Set[Path] = set()
+        self._rescan = False
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._observer = None
+
+    @property
+    def backend(self) -> str:
+        return 'watchdog' if self._observer else 'polling'
+
+    def start(self):
+        self.snapshot = self._stat_all()
+        try:
+            from watchdog.observers import Observer
+        except ImportError:
+            self.fallback_reason = "watchdog is not installed"
+            return
+        try:
+            self._observer = Observer()
+            self._observer.schedule(_watchdog_handler(self), str(self.scanner.src_path), recursive=True)
+            self._observer.start()
+        except Exception as e:
+            self.fallback_reason = f"watchdog unavailable ({e})"
+            self._observer = None
+
+    def stop(self):
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def notify(self, path: Optional[Path]):
+        """Record a touched file; ``None`` requests a full rescan."""
+        with self._lock:
+            if path is None:
+                self._rescan = True
+            elif self.scanner.accepts(path):
+                self._pending.add(path)
+            else:
+                return
+        self._event.set()
+
+    def wait(self) -> Tuple[Set[Path], Set[Path]]:
+        """Block until source files change; return (changed, removed)."""
+        while True:
+            if self._observer:
+                if not self._event.wait(self.poll_interval):
+                    continue
+                # Debounce: editors save in several steps, batch them.
+                while True:
+                    self._event.clear()
+                    if not self._event.wait(self.debounce):
+                        break
+                with self._lock:
+                    pending, self._pending = self._pending, set()
+                    rescan, self._rescan = self._rescan, False
+            else:
+                time.sleep(self.poll_interval)
+                pending, rescan = set(), True
+
+            changed, removed = self._diff(pending, rescan)
+            if changed or removed:
+                return changed, removed
+
+    def _stat_all(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for path in self.scanner.scan():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _diff(self, candidates: Set[Path], rescan: bool) -> Tuple[Set[Path], Set[Path]]:
+        if rescan:
+            current = self._stat_all()
+            changed = {p for p, sig in current.items() if self.snapshot.get(p) != sig}
+            removed = set(self.snapshot) - set(current)
+            self.snapshot = current
+            return changed, removed
+
+        changed, removed = set(), set()
+        for path in candidates:
+            try:
+                st = path.stat()
+            except OSError:
+                if self.snapshot.pop(path, None) is not None:
+                    removed.add(path)
+                continue
+            sig = (st.st_mtime_ns, st.st_size)
+            if self.snapshot.get(path) != sig:
+                self.snapshot[path] = sig
+                changed.add(path)
+        return changed, removed
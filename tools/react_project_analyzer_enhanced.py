@@ -73,16 +73,17 @@ import socket
 import webbrowser
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Optional, Any, Union
+from typing import Dict, List, Tuple, Set, Optional, Any, Union, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, Thread
+from threading import Lock
 from html import escape
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
-import socketserver
+
+from analysis_jobs import Job, JobRunner, job_paths, stream_events, tree_fingerprint
 
 VERSION = "8.0.0"
 
@@ -1644,8 +1645,20 @@ class EnhancedReactProjectAnalyzer:
         self.directories: List[DirectoryAnalysis] = []
         self.report_html: Optional[str] = None
         
+        # Optional progress hook: (phase, current, total)
+        self.on_progress: Optional[Callable[[str, int, int], None]] = None
+        
         CONFIG['fixes']['auto_apply_safe'] = auto_mode
     
+    def fresh(self) -> 'EnhancedReactProjectAnalyzer':
+        """A new analyzer with these settings; run() accumulates state, so each run needs its own"""
+        return EnhancedReactProjectAnalyzer(self.source, self.dest, self.dry_run, self.create_stubs,
+                                            self.max_workers, self.auto_mode)
+    
+    def _progress(self, phase: str, current: int = 0, total: int = 0):
+        if self.on_progress:
+            self.on_progress(phase, current, total)
+    
     def run(self):
         """Run complete analysis"""
         Logger.header("ENHANCED REACT PROJECT ANALYZER")
@@ -1655,24 +1668,29 @@ class EnhancedReactProjectAnalyzer:
         Logger.info(f"Dry Run: {'YES' if self.dry_run else 'NO'}")
         
         # Scan project
+        self._progress("Scanning project")
         files = self._scan_project()
         
         # Cache files for fuzzy matching
         self.resolver.cache_all_files(files)
         
         # Analyze files
+        self._progress("Analyzing files", 0, len(files))
         self._analyze_files(files)
         
         # Create checkpoints
         self._create_final_checkpoint()
         
         # Detect circular dependencies
+        self._progress("Detecting circular dependencies")
         circular_deps = self._detect_circular_dependencies()
         
         # Build verification
+        self._progress("Verifying build")
         build_result = self.build_verifier.verify(self.dry_run)
         
         # Generate reports
+        self._progress("Generating reports")
         self._generate_report(circular_deps, build_result)
         
         # Generate changelog
@@ -1721,6 +1739,7 @@ class EnhancedReactProjectAnalyzer:
                     self.analyses.append(analysis)
                     
                     Logger.progress("Analyzing", i, len(files))
+                    self._progress("Analyzing files", i, len(files))
                     
                     # Create checkpoint at intervals
                     if i % checkpoint_interval == 0:
@@ -1902,9 +1921,47 @@ Generated: {datetime.now().isoformat()}
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TinkerUIHandler(BaseHTTPRequestHandler):
-    """HTTP handler for Tinker UI"""
+    """HTTP handler for Tinker UI
+    
+    Analyses run as background jobs; POST /api/analyze returns a job id and
+    progress streams from /api/jobs/<id>/events. ``analyzer`` is the most
+    recently started run, so status and report follow it.
+    """
     
     analyzer: 'EnhancedReactProjectAnalyzer' = None
+    jobs: Optional[JobRunner] = None
+    
+    @classmethod
+    def attach(cls, analyzer: 'EnhancedReactProjectAnalyzer'):
+        """Run UI jobs with ``analyzer``'s settings"""
+        cls.analyzer = analyzer
+        cls.jobs = JobRunner(cls._run_job, fingerprint=cls._job_fingerprint, on_result=cls._job_finished)
+    
+    @classmethod
+    def _run_job(cls, kind: str, progress: Callable[[str, int, int], None]):
+        analyzer = cls.analyzer.fresh()
+        analyzer.on_progress = progress
+        cls.analyzer = analyzer
+        analyzer.run()
+        return analyzer, cls._stats(analyzer)
+    
+    @classmethod
+    def _job_fingerprint(cls, kind: str) -> str:
+        analyzer = cls.analyzer
+        return tree_fingerprint(analyzer._scan_project(), kind, analyzer.dry_run,
+                                analyzer.create_stubs, analyzer.auto_mode)
+    
+    @classmethod
+    def _job_finished(cls, job: Job):
+        cls.analyzer = job.result
+    
+    @staticmethod
+    def _stats(analyzer: 'EnhancedReactProjectAnalyzer') -> Dict[str, Any]:
+        return {
+            'status': 'complete' if analyzer.report_html else 'analyzing',
+            'files_analyzed': len(analyzer.analyses),
+            'features_detected': sum(len(a.features) for a in analyzer.analyses)
+        }
     
     def log_message(self, format, *args):
         """Suppress default logging"""
@@ -1920,9 +1977,38 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
             self._serve_status()
         elif parsed.path == '/api/report':
             self._serve_report()
+        elif job_paths(parsed.path):
+            self._serve_job(*job_paths(parsed.path))
+        else:
+            self.send_error(404)
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        if urlparse(self.path).path == '/api/analyze' and self.jobs:
+            job = self.jobs.submit('analyze')
+            self._send_json(202, {'success': True, 'job': self.jobs.snapshot(job.id)})
         else:
             self.send_error(404)
     
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _serve_job(self, job_id: str, rest: List[str]):
+        """Serve a job's state, or stream it as Server-Sent Events"""
+        if not self.jobs:
+            self.send_error(404, 'No jobs')
+        elif rest == ['events']:
+            stream_events(self, self.jobs, job_id)
+        elif not rest and self.jobs.snapshot(job_id):
+            self._send_json(200, self.jobs.snapshot(job_id))
+        else:
+            self.send_error(404, 'Unknown job')
+    
     def _serve_dashboard(self):
         """Serve main dashboard"""
         html = '''<!DOCTYPE html>
@@ -1978,6 +2064,7 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
             <h2>Analysis Status</h2>
             <p id="status">Checking...</p>
             <button class="btn" onclick="loadReport()">View Report</button>
+            <button class="btn" onclick="reanalyze()">Re-analyze</button>
             <button class="btn" onclick="location.reload()">Refresh</button>
         </div>
         <div id="content">
@@ -2008,6 +2095,27 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
             }
         }
         
+        async function reanalyze() {
+            const res = await fetch('/api/analyze', { method: 'POST' });
+            const data = await res.json();
+            const events = new EventSource(`/api/jobs/${data.job.id}/events`);
+            const status = document.getElementById('status');
+            events.addEventListener('progress', e => {
+                const state = JSON.parse(e.data);
+                const count = state.total ? ` (${state.current}/${state.total})` : '';
+                status.innerHTML = `<strong>Status:</strong> ${state.phase}${count}`;
+            });
+            events.addEventListener('done', e => {
+                events.close();
+                checkStatus();
+                loadReport();
+            });
+            events.addEventListener('failed', e => {
+                events.close();
+                status.textContent = 'Analysis failed: ' + JSON.parse(e.data).error;
+            });
+        }
+        
         // Auto-check status every 2 seconds
         setInterval(checkStatus, 2000);
         checkStatus();
@@ -2029,16 +2137,7 @@ class TinkerUIHandler(BaseHTTPRequestHandler):
     
     def _serve_status(self):
         """Serve analysis status"""
-        status = {
-            'status': 'complete' if self.analyzer.report_html else 'analyzing',
-            'files_analyzed': len(self.analyzer.analyses),
-            'features_detected': sum(len(a.features) for a in self.analyzer.analyses)
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(status).encode())
+        self._send_json(200, self._stats(self.analyzer))
     
     def _serve_report(self):
         """Serve generated report"""
@@ -2061,10 +2160,11 @@ class TinkerUIServer:
     
     def start(self):
         """Start the UI server"""
-        TinkerUIHandler.analyzer = self.analyzer
+        TinkerUIHandler.attach(self.analyzer)
+        TinkerUIHandler.jobs.submit('analyze')
         
         try:
-            with socketserver.TCPServer(("", self.port), TinkerUIHandler) as httpd:
+            with ThreadingHTTPServer(("", self.port), TinkerUIHandler) as httpd:
                 url = f"http://localhost:{self.port}"
                 Logger.success(f"Tinker UI started at {url}")
                 
@@ -2213,11 +2313,7 @@ Features:
             # Run in UI mode
             Logger.info("Starting in UI mode...")
             
-            # Run analysis in background thread
-            analysis_thread = Thread(target=analyzer.run, daemon=True)
-            analysis_thread.start()
-            
-            # Start UI server
+            # Start UI server; it runs the analysis as a background job
             server = TinkerUIServer(analyzer, args.port)
             server.start()
         else:
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Scan core — one walk and parse of a project, shared by project_analyzer.py,
+project_optimizer.py, project_architect.py and analyze_project.py.
+
+  snap = scan_project("src")
+  snap.records["components/Button.tsx"]   # FileRecord: metrics, imports, exports, ...
+  snap.edges["App.tsx"]                   # internal files App.tsx imports
+  snap.reverse["components/Button.tsx"]   # files importing Button.tsx
+
+The snapshot is persisted under reports/.scan_snapshot/ keyed by project root.
+A later scan re-walks the tree (one stat per file) and re-parses only files
+whose size or mtime changed, so running all four tools back to back parses
+the tree once. Only source and text files (TEXT_EXTENSIONS) are recorded, and
+the snapshot directory itself is never walked. Each tool applies its own path
+filters on top of the records.
+"""
+import ast
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / 'reports' / '.scan_snapshot'
+
+EXCLUDED_DIRS = {
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv', '.next', '.nuxt', '.vite',
+    'dist', 'build', 'out', '.cache', '.idea', '.vscode',
+}
+EXCLUDED_FILES = {'.DS_Store', 'Thumbs.db', '.env.local'}
+
+JS_EXTENSIONS = {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.vue', '.svelte'}
+PY_EXTENSIONS = {'.py'}
+# The only files walked; binaries and assets are never read or hashed
+TEXT_EXTENSIONS = JS_EXTENSIONS | PY_EXTENSIONS | {
+    '.css', '.scss', '.sass', '.less', '.html', '.htm', '.json', '.md', '.txt',
+    '.yml', '.yaml', '.graphql', '.gql', '.svg', '.xml', '.sh', '.ps1',
+}
+RESOLVE_SUFFIXES = ('', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.vue', '.svelte', '.py')
+INDEX_NAMES = ('index.ts', 'index.tsx', 'index.js', 'index.jsx', '__init__.py')
+
+IMPORT_RE = re.compile(
+    r'''(?:\bfrom\s*|\bimport\s*\(\s*|\brequire\s*\(\s*|^\s*import\s+)['"]([^'"\n]+)['"]''',
+    re.MULTILINE,
+)
+EXPORT_NAME_RE = re.compile(
+    r'export\s+(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?'
+    r'(?:const|let|var|function\*?|class|interface|type|enum)?\s*([A-Za-z_$][\w$]*)'
+)
+EXPORT_LIST_RE = re.compile(r'export\s+(?:type\s+)?\{([^}]+)\}')
+FUNCTION_RE = re.compile(
+    r'function\s+([A-Za-z_$][\w$]*)\s*\('
+    r'|(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?(?:\([^)]*\)|[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>'
+)
+CLASS_RE = re.compile(r'class\s+([A-Za-z_$][\w$]*)')
+HOOK_RE = re.compile(r'(?:const|function)\s+(use[A-Z]\w*)')
+COMPONENT_RE = re.compile(
+    r'(?:const|let)\s+([A-Z]\w*)\s*(?::\s*[\w.<>]+\s*)?=\s*(?:React\.)?(?:memo\(|forwardRef\(|\([^)]*\)\s*=>|function)'
+    r'|function\s+([A-Z]\w*)\s*\('
+    r'|class\s+([A-Z]\w*)\s+extends\s+(?:React\.)?(?:Pure)?Component'
+)
+COMPLEXITY_RE = re.compile(r'\b(?:if|else|elif|case|for|while|do|catch|finally|try|throw)\b|&&|\|\||\?\?|\?\.?')
+WORD_RE = re.compile(r'\S+')
+
+
+@dataclass(slots=True)
+class FileRecord:
+    """Everything the analyzers derive from one file's content"""
+    path: str                    # relative to the scan root (native separators)
+    size: int
+    mtime_ns: int
+    hash: str                    # md5 of the raw bytes
+    lines: int = 0
+    imports: List[str] = field(default_factory=list)     # raw specifiers
+    exports: List[str] = field(default_factory=list)
+    functions: List[str] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)
+    components: List[str] = field(default_factory=list)
+    hooks: List[str] = field(default_factory=list)
+    complexity: int = 0
+    maintainability: float = 100.0
+    has_styling: bool = False
+
+    @property
+    def ext(self) -> str:
+        return os.path.splitext(self.path)[1].lower()
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+_RECORD_FIELDS = [f.name for f in fields(FileRecord)]
+
+
+def _unique(items) -> List[str]:
+    return sorted({i.strip() for i in items if i and i.strip()})
+
+
+def _parse_js(content: str) -> dict:
+    exports = [m.group(1) for m in EXPORT_NAME_RE.finditer(content)]
+    for block in EXPORT_LIST_RE.findall(content):
+        exports.extend(spec.split(' as ')[-1] for spec in block.split(','))
+    return {
+        'imports': _unique(IMPORT_RE.findall(content)),
+        'exports': _unique(e for e in exports if e not in ('default', 'type', 'from')),
+        'functions': _unique(a or b for a, b in FUNCTION_RE.findall(content)),
+        'classes': _unique(CLASS_RE.findall(content)),
+        'components': _unique(a or b or c for a, b, c in COMPONENT_RE.findall(content)),
+        'hooks': _unique(HOOK_RE.findall(content)),
+    }
+
+
+def _parse_py(content: str) -> dict:
+    out = {'imports': [], 'exports': [], 'functions': [], 'classes': [], 'components': [], 'hooks': []}
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return out
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            out['imports'].extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            out['imports'].append('.' * node.level + (node.module or ''))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            out['functions'].append(node.name)
+        elif isinstance(node, ast.ClassDef):
+            out['classes'].append(node.name)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, (ast.List, ast.Tuple)):
+            if any(isinstance(t, ast.Name) and t.id == '__all__' for t in node.targets):
+                out['exports'].extend(e.value for e in node.value.elts
+                                      if isinstance(e, ast.Constant) and isinstance(e.value, str))
+    return {k: _unique(v) for k, v in out.items()}
+
+
+def complexity_of(content: str) -> int:
+    """Decision points plus nesting brackets over non-comment lines"""
+    score = 0
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line or line.startswith(('//', '#', '/*', '*')):
+            continue
+        score += len(COMPLEXITY_RE.findall(line))
+        score += line.count('{') + line.count('(') + line.count('[')
+    return score
+
+
+def maintainability_of(content: str, lines: int, complexity: int) -> float:
+    """Simplified maintainability index (0-100)"""
+    if lines <= 1 or complexity == 0:
+        return 100.0
+    volume = lines * math.log2(len(set(WORD_RE.findall(content))) + 1)
+    value = 171 - 5.2 * math.log(max(volume, 1)) - 0.23 * complexity - 16.2 * math.log(lines)
+    return round(max(0.0, min(100.0, value)), 2)
+
+
+def parse_file(full_path: Path, rel_path: str, st: os.stat_result) -> FileRecord:
+    """Read a file once and derive every field of its record"""
+    data = full_path.read_bytes()
+    record = FileRecord(path=rel_path, size=len(data), mtime_ns=st.st_mtime_ns,
+                        hash=hashlib.md5(data).hexdigest())
+    ext = record.ext
+    content = data.decode('utf-8', errors='ignore')
+    record.lines = content.count('\n') + 1
+    if ext in JS_EXTENSIONS:
+        parsed = _parse_js(content)
+    elif ext in PY_EXTENSIONS:
+        parsed = _parse_py(content)
+    else:
+        return record
+    for key, value in parsed.items():
+        setattr(record, key, value)
+    record.complexity = complexity_of(content)
+    record.maintainability = maintainability_of(content, record.lines, record.complexity)
+    record.has_styling = 'style' in content.lower() or 'className' in content
+    return record
+
+
+class Snapshot:
+    """File records plus the resolved internal import graph"""
+
+    def __init__(self, root: Path, records: Dict[str, FileRecord]):
+        self.root = root
+        self.records = records
+        self.edges: Dict[str, Set[str]] = {}
+        self.reverse: Dict[str, Set[str]] = {}
+        self.stats = {'files': len(records), 'parsed': 0, 'reused': 0, 'seconds': 0.0}
+        self._by_noext: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    # Import resolution
+    # ------------------------------------------------------------------
+    def _index_paths(self):
+        self._by_noext = {}
+        for path in self.records:
+            posix = path.replace(os.sep, '/')
+            self._by_noext.setdefault(posix, path)
+            stem, ext = os.path.splitext(posix)
+            if ext in RESOLVE_SUFFIXES:
+                self._by_noext.setdefault(stem, path)
+
+    def _lookup(self, posix: str) -> Optional[str]:
+        posix = posix.rstrip('/')
+        hit = self._by_noext.get(posix)
+        if hit:
+            return hit
+        for name in INDEX_NAMES:
+            hit = self._by_noext.get(f"{posix}/{name}")
+            if hit:
+                return hit
+        return None
+
+    def resolve(self, spec: str, source: str) -> Optional[str]:
+        """Internal file an import specifier refers to, or None for packages"""
+        source_dir = os.path.dirname(source).replace(os.sep, '/')
+        if source.endswith('.py') and not spec.startswith(('./', '../')):
+            if not spec.startswith('.'):
+                return self._lookup(spec.replace('.', '/'))
+            level = len(spec) - len(spec.lstrip('.'))
+            base = source_dir
+            for _ in range(level - 1):
+                base = os.path.dirname(base)
+            rest = spec[level:].replace('.', '/')
+            return self._lookup(f"{base}/{rest}".strip('/') if rest else base)
+        if spec.startswith('.'):
+            target = os.path.normpath(os.path.join(source_dir, spec)).replace(os.sep, '/')
+            if target == '..' or target.startswith('../'):
+                return None
+            return self._lookup('' if target == '.' else target)
+        if spec.startswith('@/'):
+            rest = spec[2:]
+            if self.root.name == 'src':
+                return self._lookup(rest)
+            return self._lookup(f"src/{rest}") or self._lookup(rest)
+        return None
+
+    def build_graph(self):
+        self._index_paths()
+        self.edges = {path: set() for path in self.records}
+        self.reverse = {path: set() for path in self.records}
+        for path, record in self.records.items():
+            for spec in record.imports:
+                target = self.resolve(spec, path)
+                if target and target != path:
+                    self.edges[path].add(target)
+                    self.reverse[target].add(path)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    @staticmethod
+    def path_for(root: Path) -> Path:
+        key = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]
+        return SNAPSHOT_DIR / f"{root.name or 'root'}_{key}.json"
+
+    def save(self, path: Optional[Path] = None):
+        path = path or self.path_for(self.root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': SNAPSHOT_VERSION,
+            'root': str(self.root),
+            'fields': _RECORD_FIELDS,
+            'records': [[getattr(r, f) for f in _RECORD_FIELDS] for r in self.records.values()],
+        }
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, root: Path, path: Optional[Path] = None) -> Optional['Snapshot']:
+        path = path or cls.path_for(root)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get('version') != SNAPSHOT_VERSION or payload.get('fields') != _RECORD_FIELDS:
+            return None
+        records = {}
+        for row in payload.get('records', []):
+            record = FileRecord(**dict(zip(_RECORD_FIELDS, row)))
+            records[record.path] = record
+        return cls(root, records)
+
+
+def walk(root: Path):
+    """Yield (full path, relative path, stat) for every source/text file"""
+    snapshot_dir = str(SNAPSHOT_DIR)
+    for dirpath, dirs, files in os.walk(root):
+        # Pruned by full path: a bare 'reports' name would also drop src/features/reports/
+        dirs[:] = [d for d in dirs
+                   if d not in EXCLUDED_DIRS and os.path.join(dirpath, d) != snapshot_dir]
+        for name in files:
+            if name in EXCLUDED_FILES or os.path.splitext(name)[1].lower() not in TEXT_EXTENSIONS:
+                continue
+            full = Path(dirpath) / name
+            try:
+                st = full.stat()
+            except OSError:
+                continue
+            yield full, str(full.relative_to(root)), st
+
+
+def scan_project(project_root, use_snapshot: bool = True, verbose: bool = False) -> Snapshot:
+    """Scan a project, reusing the persisted snapshot for unchanged files"""
+    start = time.time()
+    root = Path(project_root).resolve()
+    previous = Snapshot.load(root) if use_snapshot else None
+    old = previous.records if previous else {}
+
+    records: Dict[str, FileRecord] = {}
+    parsed = reused = 0
+    for full, rel, st in walk(root):
+        cached = old.get(rel)
+        if cached is not None and cached.size == st.st_size and cached.mtime_ns == st.st_mtime_ns:
+            records[rel] = cached
+            reused += 1
+            continue
+        try:
+            records[rel] = parse_file(full, rel, st)
+            parsed += 1
+        except OSError as e:
+            if verbose:
+                print(f"⚠️ Could not read {rel}: {e}")
+
+    snapshot = Snapshot(root, records)
+    snapshot.build_graph()
+    if use_snapshot and (parsed or len(records) != len(old)):
+        snapshot.save()
+    snapshot.stats.update(parsed=parsed, reused=reused, seconds=round(time.time() - start, 3))
+    if verbose:
+        print(f"📦 Snapshot: {len(records)} files ({parsed} parsed, {reused} reused) "
+              f"in {snapshot.stats['seconds']}s")
+    return snapshot
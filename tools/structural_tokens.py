@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Structural tokens — one lexer pass per TS/JS file, shared by every structural
+comparison in the analyzers (g_studio_intelligence_v10.py, main-fixer-9.v3.py,
+Debugger/gstudio_analyzer-9.py, ...).
+
+  ts = tokenize(content, content_hash)  # TokenStream, cached by content hash
+  ts.ids                                # array('I'): keywords/punctuation keep
+                                        # their own id; identifiers, strings and
+                                        # numbers collapse to ID / STR / NUM
+  ts.structural_hash()                  # renaming- and formatting-insensitive,
+                                        # but string literals count
+  ts.shingles()                         # k-grams of ids, for Jaccard
+  ts.feature_text()                     # shingles as words, for TF-IDF
+  similarity(a, b)                      # 0.6 sequence + 0.4 shingle Jaccard
+  diff_summary(a, b)                    # one line for duplicate reports
+  file_structural_hash(path, content)   # the above for JS/TS, text_hash otherwise
+
+Comments and whitespace never reach the stream. The lexer is a single
+compiled regex; string literals do not span lines (so a regex literal holding
+a quote only disturbs its own line) and regex literals lex as punctuation.
+Token ids are fixed tables, not first-seen order, so hashes are stable across
+runs, processes and tools. Bump TOKENIZER_VERSION whenever the ids or the
+hash inputs change; callers persisting hashes key their caches on it.
+
+The hash also covers the text of every string literal: module specifiers are
+what tell two barrels or re-export files apart. Similarity and shingles still
+see only STR, so clones differing in literals still score as near-duplicates.
+"""
+import hashlib
+import os
+import re
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import FrozenSet, List, Optional, Tuple
+
+TOKENIZER_VERSION = 2
+SHINGLE_SIZE = 4
+CACHE_SIZE = 4096
+
+ID, STR, NUM = 0, 1, 2
+
+# Only these are lexed; other files get text_hash
+TOKENIZED_SUFFIXES = frozenset({'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.mts', '.cts'})
+
+KEYWORDS = (
+    'abstract', 'any', 'as', 'asserts', 'async', 'await', 'bigint', 'boolean', 'break',
+    'case', 'catch', 'class', 'const', 'continue', 'debugger', 'declare', 'default',
+    'delete', 'do', 'else', 'enum', 'export', 'extends', 'false', 'finally', 'for',
+    'from', 'function', 'get', 'if', 'implements', 'import', 'in', 'infer',
+    'instanceof', 'interface', 'is', 'keyof', 'let', 'namespace', 'never', 'new',
+    'null', 'number', 'object', 'of', 'override', 'private', 'protected', 'public',
+    'readonly', 'return', 'satisfies', 'set', 'static', 'string', 'super', 'switch',
+    'symbol', 'this', 'throw', 'true', 'try', 'type', 'typeof', 'undefined', 'unknown',
+    'var', 'void', 'while', 'with', 'yield',
+)
+PUNCTUATORS = (
+    '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>', '&&=', '||=', '??=',
+    '=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--', '+=', '-=',
+    '*=', '/=', '%=', '&=', '|=', '^=', '**', '<<', '>>',
+    '{', '}', '(', ')', '[', ']', ';', ',', '<', '>', '.', '?', ':', '=', '+', '-',
+    '*', '/', '%', '&', '|', '^', '!', '~', '@', '#',
+)
+_VOCAB = {text: i for i, text in enumerate(KEYWORDS + PUNCTUATORS, start=16)}
+_OTHER = 0x10000  # any other symbol: _OTHER + code point
+
+# One capture group: findall yields each token's text, '' for comments. The
+# kind is recovered from the first character, which keeps the per-token
+# Python work to a dict lookup for the common case (keywords, punctuation).
+_TOKEN_RE = re.compile(r'''\s*(?:
+    //[^\n]*|/\*.*?(?:\*/|\Z)                                   # comment
+  | (   "(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`  # string
+      | (?:0[xXoObB][0-9a-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?  # number
+      | [^\W\d][\w$]*|\$[\w$]*                                  # name
+      | ''' + '|'.join(re.escape(p) for p in PUNCTUATORS) + r'''|[^\s\w]  # punctuation
+    )
+)''', re.X | re.S)
+_QUOTES = frozenset('"\'`')
+_LINE_COMMENT_RE = re.compile(r'//.*?$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class TokenStream:
+    """Normalized token ids of one file plus the identifier names and string
+    literal bodies they replaced."""
+    __slots__ = ('ids', 'names', 'strings', '_hash', '_shingles')
+
+    def __init__(self, ids: array, names: List[str], strings: List[str]):
+        self.ids = ids
+        self.names = names
+        self.strings = strings
+        self._hash: Optional[str] = None
+        self._shingles: Optional[FrozenSet[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def structural_hash(self) -> str:
+        if self._hash is None:
+            ids = self.ids
+            if sys.byteorder == 'big':
+                ids = array('I', ids)
+                ids.byteswap()
+            h = hashlib.sha256(b'tokens%d:' % TOKENIZER_VERSION)
+            h.update(ids.tobytes())
+            for text in self.strings:
+                h.update(b'\0' + text.encode('utf-8', 'surrogatepass'))
+            self._hash = h.hexdigest()
+        return self._hash
+
+    def shingles(self) -> FrozenSet[int]:
+        """Hashes of every SHINGLE_SIZE-gram of ids (the whole stream if shorter)."""
+        if self._shingles is None:
+            ids = self.ids
+            if len(ids) < SHINGLE_SIZE:
+                self._shingles = frozenset([hash(tuple(ids))]) if ids else frozenset()
+            else:
+                self._shingles = frozenset(map(hash, zip(*(ids[i:] for i in range(SHINGLE_SIZE)))))
+        return self._shingles
+
+    def feature_text(self) -> str:
+        """Shingles as words, for bag-of-words vectorizers (TF-IDF)."""
+        return ' '.join(f'k{h & 0xffffffff:08x}' for h in self.shingles())
+
+
+def _lex(content: str) -> TokenStream:
+    ids = array('I')
+    names = []
+    strings = []
+    append = ids.append
+    vocab_get = _VOCAB.get
+    for text in _TOKEN_RE.findall(content):
+        tid = vocab_get(text)
+        if tid is not None:
+            append(tid)
+            continue
+        if not text:
+            continue  # comment
+        c = text[0]
+        if c in _QUOTES:
+            append(STR)
+            strings.append(text[1:-1])  # 'x' and "x" are the same literal
+        elif c.isdigit() or (c == '.' and len(text) > 1):
+            append(NUM)
+        elif c.isalpha() or c == '_' or c == '$':
+            append(ID)
+            names.append(text)
+        else:
+            append(_OTHER + ord(c))
+    return TokenStream(ids, names, strings)
+
+
+_cache: 'OrderedDict[str, TokenStream]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def tokenize(content: str, content_hash: Optional[str] = None) -> TokenStream:
+    """Token stream of ``content``, memoized by ``content_hash`` (computed when
+    the caller has none). Streams are shared: treat them as read-only."""
+    key = content_hash or hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    with _cache_lock:
+        stream = _cache.get(key)
+        if stream is not None:
+            _cache.move_to_end(key)
+            return stream
+    stream = _lex(content)
+    with _cache_lock:
+        _cache[key] = stream
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return stream
+
+
+def structural_hash(content: str, content_hash: Optional[str] = None) -> str:
+    return tokenize(content, content_hash).structural_hash()
+
+
+def text_hash(content: str) -> str:
+    """sha256 of the content with // and /* */ comments dropped and whitespace
+    runs collapsed; the structural hash of files that are not JS/TS."""
+    if '//' in content:
+        content = _LINE_COMMENT_RE.sub('', content)
+    if '/*' in content:
+        content = _BLOCK_COMMENT_RE.sub('', content)
+    return hashlib.sha256(_WHITESPACE_RE.sub(' ', content).encode('utf-8')).hexdigest()
+
+
+def file_structural_hash(path: str, content: str, content_hash: Optional[str] = None) -> str:
+    """structural_hash for JS/TS files, text_hash for anything else (markdown,
+    JSON and CSS have no token structure worth matching)."""
+    if os.path.splitext(path)[1].lower() in TOKENIZED_SUFFIXES:
+        return structural_hash(content, content_hash)
+    return text_hash(content)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def similarity(a: TokenStream, b: TokenStream) -> float:
+    """0.6 x token-sequence ratio + 0.4 x shingle Jaccard, in [0, 1]."""
+    if a.ids == b.ids:
+        return 1.0
+    sequence = SequenceMatcher(None, a.ids, b.ids, autojunk=False).ratio()
+    return 0.6 * sequence + 0.4 * jaccard(a.shingles(), b.shingles())
+
+
+def _renames(a: TokenStream, b: TokenStream) -> List[Tuple[str, str]]:
+    """Identifier pairs that differ between two streams of identical structure."""
+    return list(dict.fromkeys((x, y) for x, y in zip(a.names, b.names) if x != y))
+
+
+def diff_summary(a: TokenStream, b: TokenStream, limit: int = 3) -> str:
+    """What separates ``b`` from ``a``, structurally, in one line."""
+    if a.ids == b.ids:
+        renames = _renames(a, b)
+        if not renames:
+            return "Same tokens; differs only in literals, comments or formatting"
+        shown = ', '.join(f"{x}→{y}" for x, y in renames[:limit])
+        more = f" (+{len(renames) - limit} more)" if len(renames) > limit else ""
+        return f"Same structure; {len(renames)} identifier(s) renamed: {shown}{more}"
+    matcher = SequenceMatcher(None, a.ids, b.ids, autojunk=False)
+    added = removed = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            removed += i2 - i1
+            added += j2 - j1
+    return f"{matcher.ratio():.0%} token overlap; +{added}/-{removed} tokens"
@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+"""
+Synthetic TypeScript/React project generator for benchmarking the analyzers.
+
+  python tools/synth_project.py /tmp/synth-5k --files 5000 --seed 7
+
+The same (files, seed, rates) always produce byte-identical trees, so timings
+taken on different days or machines compare like for like. The layout mirrors
+this repo's src/:
+
+  src/main.tsx, src/App.tsx         entry point; App lazy-loads some pages
+  src/pages/*.tsx                   routes, imported by App
+  src/features/<name>/{components,hooks,services}/ with index.ts barrels
+  src/shared/{components,hooks,services,stores,utils,types}/ with barrels
+
+Imports flow down the layers (page -> component -> hook -> service/store ->
+util -> type) with Zipf-skewed popularity, so a few utils and types become
+hubs. Specifiers mix relative paths, '@/' aliases and barrel imports. On top
+of the live graph the generator plants, and records in synth-manifest.json:
+
+  cycles        back-edges that close import cycles
+  dead_islands  groups of files that import each other but nothing live reaches
+  duplicates    exact copies and identifier-renamed clones of live files
+
+``files`` counts every module under src/, barrels and entry points included.
+Type modules are only ever imported with ``import type``; sweeps that follow
+runtime imports alone will report them unreachable too.
+"""
+import argparse
+import json
+import random
+import shutil
+import sys
+from dataclasses import dataclass, field, asdict
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+GENERATOR_VERSION = 1
+MANIFEST = 'synth-manifest.json'
+
+# kind -> (layer, share of live modules)
+KINDS = {
+    'page': (0, 0.04),
+    'component': (1, 0.40),
+    'hook': (2, 0.18),
+    'service': (3, 0.12),
+    'store': (3, 0.04),
+    'util': (4, 0.16),
+    'type': (5, 0.06),
+}
+FEATURE_KINDS = ('component', 'hook', 'service')
+SHARED_DIRS = {'component': 'components', 'hook': 'hooks', 'service': 'services',
+               'store': 'stores', 'util': 'utils', 'type': 'types'}
+
+WORDS = ('user', 'profile', 'order', 'cart', 'invoice', 'payment', 'account', 'session', 'report',
+         'chart', 'table', 'filter', 'search', 'upload', 'media', 'gallery', 'message', 'thread',
+         'channel', 'team', 'project', 'task', 'board', 'calendar', 'event', 'ticket', 'agent',
+         'model', 'prompt', 'token', 'metric', 'alert', 'audit', 'policy', 'role', 'setting',
+         'theme', 'layout', 'panel', 'dialog', 'toast', 'menu', 'tab', 'step', 'wizard', 'form',
+         'field', 'schema', 'cache', 'queue', 'stream', 'sync', 'export', 'import', 'billing',
+         'plan', 'usage', 'quota', 'note', 'draft', 'comment', 'review', 'tag', 'label', 'status')
+SUFFIXES = {
+    'page': ('Page', 'View', 'Screen'),
+    'component': ('Card', 'List', 'Item', 'Panel', 'Header', 'Row', 'Badge', 'Modal', 'Form', 'Button'),
+    'hook': ('', 'State', 'Query', 'Effect', 'Data'),
+    'service': ('Service', 'Client', 'Api'),
+    'store': ('Store',),
+    'util': ('Utils', 'Helpers', 'Format', 'Parser', 'Mapper'),
+    'type': ('', 'Model', 'Record', 'Shape'),
+}
+
+
+@dataclass
+class SynthConfig:
+    files: int = 1000
+    seed: int = 0
+    fanout: float = 4.0          # mean imports per live module
+    zipf: float = 1.1            # popularity skew of import targets
+    alias_rate: float = 0.4      # share of specifiers using '@/'
+    barrel_rate: float = 0.25    # share of imports going through a directory barrel
+    lazy_rate: float = 0.3       # share of pages App loads with React.lazy
+    cycle_rate: float = 0.004    # cycles per module
+    island_rate: float = 0.03    # share of modules in dead islands
+    duplicate_rate: float = 0.03 # share of modules that are copies
+    min_lines: int = 25
+    max_lines: int = 400
+
+
+@dataclass
+class Module:
+    path: str                    # posix, relative to the project root
+    kind: str
+    name: str                    # main export
+    dir: str
+    layer: int
+    helpers: List[str] = field(default_factory=list)
+    imports: List[Tuple[int, str]] = field(default_factory=list)  # (target id, style)
+    body_lines: int = 40
+    live: bool = True
+    alias_only: bool = False     # render every import with '@/' (exact duplicate sources)
+
+
+def _pascal(*parts: str) -> str:
+    return ''.join(p[:1].upper() + p[1:] for p in parts if p)
+
+
+class ProjectGenerator:
+    def __init__(self, config: SynthConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.modules: List[Module] = []
+        self.barrels: Dict[str, List[int]] = {}  # dir -> exported module ids
+        self.features: List[str] = []
+        self._names: set = set()
+        self.cycles: List[List[str]] = []
+        self.islands: List[List[str]] = []
+        self.duplicates: List[Dict[str, str]] = []
+        self.lazy_pages: List[int] = []
+
+    # ---------- planning ----------
+    def plan(self):
+        cfg = self.config
+        n_features = max(2, cfg.files // 120)
+        self.features = self._unique_words(n_features)
+        for feature in self.features:
+            self.barrels[f'src/features/{feature}'] = []
+            for kind in FEATURE_KINDS:
+                self.barrels[f'src/features/{feature}/{SHARED_DIRS[kind]}'] = []
+        for sub in SHARED_DIRS.values():
+            self.barrels[f'src/shared/{sub}'] = []
+
+        fixed = 2  # main.tsx, App.tsx
+        budget = cfg.files - fixed - len(self.barrels)
+        if budget < 20:
+            raise ValueError(f"--files {cfg.files} is too small for {n_features} features; use at least "
+                             f"{cfg.files - budget + 20}")
+        n_islands = int(budget * cfg.island_rate)
+        n_dups = int(budget * cfg.duplicate_rate)
+        n_live = budget - n_islands - n_dups
+
+        kinds = []
+        for kind, (_, share) in KINDS.items():
+            kinds.extend([kind] * max(1, round(n_live * share)))
+        self.rng.shuffle(kinds)
+        kinds = (kinds + ['component'] * n_live)[:n_live]
+        kinds.sort(key=lambda k: KINDS[k][0])
+        for kind in kinds:
+            self._add_module(kind)
+
+        self._wire_live()
+        self._plant_cycles(max(1, int(cfg.files * cfg.cycle_rate)))
+        self._plant_islands(n_islands)
+        self._plant_duplicates(n_dups)
+
+    def _unique_words(self, n: int) -> List[str]:
+        words = []
+        for i in range(n):
+            word = WORDS[i % len(WORDS)]
+            words.append(word if i < len(WORDS) else f'{word}{i // len(WORDS)}')
+        self.rng.shuffle(words)
+        return words
+
+    def _new_name(self, kind: str) -> str:
+        rng = self.rng
+        a, b = rng.choice(WORDS), rng.choice(WORDS)
+        suffix = rng.choice(SUFFIXES[kind])
+        if kind == 'hook':
+            name = 'use' + _pascal(a, b, suffix)
+        elif kind in ('service', 'store', 'util'):
+            name = a + _pascal(b, suffix)
+        else:
+            name = _pascal(a, b, suffix)
+        if name in self._names:
+            name = f'{name}{len(self._names)}'
+        self._names.add(name)
+        return name
+
+    def _place(self, kind: str) -> str:
+        if kind == 'page':
+            return 'src/pages'
+        if kind in FEATURE_KINDS and self.rng.random() < 0.6:
+            return f'src/features/{self.rng.choice(self.features)}/{SHARED_DIRS[kind]}'
+        return f'src/shared/{SHARED_DIRS[kind]}'
+
+    def _body_lines(self) -> int:
+        cfg = self.config
+        lines = int(self.rng.lognormvariate(4.0, 0.6))
+        return max(cfg.min_lines, min(cfg.max_lines, lines))
+
+    def _add_module(self, kind: str, directory: Optional[str] = None, live: bool = True) -> int:
+        name = self._new_name(kind)
+        directory = directory or self._place(kind)
+        ext = '.tsx' if kind in ('page', 'component') else '.ts'
+        stem = f'{name[:1].lower()}{name[1:]}.types' if kind == 'type' else name
+        module = Module(path=f'{directory}/{stem}{ext}', kind=kind, name=name, dir=directory,
+                        layer=KINDS[kind][0], body_lines=self._body_lines(), live=live)
+        module.helpers = [f'{name[:1].lower()}{name[1:]}{h}' for h in
+                          self.rng.sample(('Defaults', 'Keys', 'Guard', 'Limits', 'Labels'), self.rng.randint(0, 2))]
+        self.modules.append(module)
+        if live and directory in self.barrels:
+            self.barrels[directory].append(len(self.modules) - 1)
+        return len(self.modules) - 1
+
+    def _wire_live(self):
+        cfg, rng = self.config, self.rng
+        by_layer: Dict[int, List[int]] = {}
+        for i, m in enumerate(self.modules):
+            by_layer.setdefault(m.layer, []).append(i)
+        # Zipf popularity within each layer, over a shuffled order
+        cum: Dict[int, List[float]] = {}
+        for layer, ids in by_layer.items():
+            rng.shuffle(ids)
+            total, weights = 0.0, []
+            for rank in range(len(ids)):
+                total += 1.0 / (rank + 1) ** cfg.zipf
+                weights.append(total)
+            cum[layer] = weights
+        layers = sorted(by_layer)
+
+        imported = set()
+        for i, m in enumerate(self.modules):
+            lower = [l for l in layers if l > m.layer]
+            if not lower:
+                continue
+            k = min(12, int(rng.expovariate(1.0 / cfg.fanout)) + 1)
+            targets = set()
+            for _ in range(k):
+                layer = lower[0] if rng.random() < 0.6 or len(lower) == 1 else rng.choice(lower[1:])
+                targets.add(rng.choices(by_layer[layer], cum_weights=cum[layer])[0])
+            for t in sorted(targets):
+                m.imports.append((t, self._style(m, self.modules[t])))
+                imported.add(t)
+
+        # Every live module gets at least one importer from the layer above it
+        for layer in layers[1:]:
+            upper = [l for l in layers if l < layer]
+            for t in by_layer[layer]:
+                if t not in imported:
+                    src = rng.choice(by_layer[upper[-1]])
+                    self.modules[src].imports.append((t, self._style(self.modules[src], self.modules[t])))
+                    imported.add(t)
+
+        pages = by_layer.get(0, [])
+        self.lazy_pages = sorted(rng.sample(pages, int(len(pages) * cfg.lazy_rate)))
+
+    def _style(self, src: Module, dst: Module) -> str:
+        r = self.rng.random()
+        if dst.dir in self.barrels and dst.dir != src.dir and r < self.config.barrel_rate:
+            return 'barrel'
+        if dst.dir == src.dir or r > 1 - self.config.alias_rate:
+            return 'relative' if dst.dir == src.dir else 'alias'
+        return 'relative'
+
+    def _plant_cycles(self, count: int):
+        rng = self.rng
+        candidates = [i for i, m in enumerate(self.modules) if m.imports and m.kind in ('component', 'hook')]
+        for _ in range(min(count, len(candidates))):
+            a = rng.choice(candidates)
+            path = [a]
+            # Follow one to three import hops, then close the loop back to a
+            for _ in range(rng.randint(1, 3)):
+                nxt = [t for t, _ in self.modules[path[-1]].imports
+                       if t not in path and self.modules[t].kind not in ('type', 'util')]
+                if not nxt:
+                    break
+                path.append(rng.choice(nxt))
+            if len(path) < 2:
+                continue
+            last = self.modules[path[-1]]
+            last.imports.append((a, 'relative' if last.dir == self.modules[a].dir else 'alias'))
+            self.cycles.append([self.modules[i].path for i in path])
+
+    def _plant_islands(self, count: int):
+        rng = self.rng
+        live = [i for i, m in enumerate(self.modules) if m.live and m.kind in ('util', 'type', 'service')]
+        remaining = count
+        while remaining > 0:
+            size = min(remaining, rng.randint(2, 6))
+            members = []
+            for _ in range(size):
+                kind = rng.choice(('component', 'component', 'hook', 'util'))
+                members.append(self._add_module(kind, live=False))
+            members.sort(key=lambda i: self.modules[i].layer)
+            for a, b in zip(members, members[1:]):
+                if self.modules[a].layer < self.modules[b].layer or a < b:
+                    self.modules[a].imports.append((b, 'relative'))
+            # Islands still lean on live code; that does not make them reachable
+            for i in members:
+                if live and rng.random() < 0.7:
+                    self.modules[i].imports.append((rng.choice(live), 'alias'))
+            self.islands.append([self.modules[i].path for i in members])
+            remaining -= size
+
+    def _plant_duplicates(self, count: int):
+        rng = self.rng
+        sources = [i for i, m in enumerate(self.modules) if m.live and m.kind in ('component', 'hook', 'util')]
+        taken = {m.path for m in self.modules}
+        for _ in range(min(count, len(sources))):
+            src = self.modules[rng.choice(sources)]
+            exact = rng.random() < 0.5
+            copy = Module(path='', kind=src.kind, name=src.name, dir=self._place(src.kind), layer=src.layer,
+                          helpers=list(src.helpers), imports=list(src.imports), body_lines=src.body_lines,
+                          live=False, alias_only=True)
+            if exact:
+                src.alias_only = True
+                stem = f'{Path(src.path).stem}.copy'
+            else:
+                copy.name = self._new_name(src.kind)
+                copy.helpers = [h.replace(src.name[:1].lower() + src.name[1:],
+                                          copy.name[:1].lower() + copy.name[1:]) for h in src.helpers]
+                stem = copy.name
+            if f'{copy.dir}/{stem}{Path(src.path).suffix}' in taken:
+                stem = f'{stem}{len(self.modules)}'
+            copy.path = f'{copy.dir}/{stem}{Path(src.path).suffix}'
+            self.modules.append(copy)
+            taken.add(copy.path)
+            self.duplicates.append({'source': src.path, 'copy': copy.path, 'kind': 'exact' if exact else 'renamed'})
+
+    # ---------- rendering ----------
+    def _specifier(self, src: Module, dst: Module, style: str, rng: random.Random) -> str:
+        if style == 'barrel' and not src.alias_only:
+            target = dst.dir
+            # Feature modules are often imported through the feature's root barrel
+            if target.startswith('src/features/') and not src.dir.startswith(target.rsplit('/', 1)[0]) \
+                    and rng.random() < 0.5:
+                target = target.rsplit('/', 1)[0]
+        else:
+            target = str(PurePosixPath(dst.path).with_suffix(''))
+        if style == 'alias' or src.alias_only or (style == 'barrel' and rng.random() < 0.5):
+            return '@/' + target[len('src/'):]
+        rel = _relpath(target, src.dir)
+        return rel if rel.startswith('.') else './' + rel
+
+    def render(self, index: int) -> str:
+        m = self.modules[index]
+        rng = random.Random(f'{self.config.seed}:{m.name}:{m.body_lines}')
+        out = ['/**', f' * {m.name} ({m.kind}).', ' */']
+        react = m.kind in ('page', 'component')
+        if react or m.kind == 'hook':
+            out.append("import React, { useState, useEffect, useMemo } from 'react';")
+        uses = []
+        for t, style in m.imports:
+            dst = self.modules[t]
+            spec = self._specifier(m, dst, style, rng)
+            if dst.kind == 'type':
+                out.append(f"import type {{ {dst.name} }} from '{spec}';")
+            elif style != 'barrel' and dst.kind == 'component' and not m.alias_only and rng.random() < 0.2:
+                out.append(f"import {dst.name} from '{spec}';")
+            else:
+                out.append(f"import {{ {dst.name} }} from '{spec}';")
+            uses.append(dst)
+        out.append('')
+
+        for helper in m.helpers:
+            out.append(f'export const {helper} = {{ enabled: true, limit: {rng.randint(5, 500)} }};')
+        if m.helpers:
+            out.append('')
+
+        filler = max(0, m.body_lines - len(out) - 12)
+        n_funcs = max(1, filler // 12)
+        for f in range(n_funcs):
+            out.extend(_filler_function(rng, f'{m.name[:1].lower()}{m.name[1:]}Step{f}'))
+
+        out.extend(_main_export(m, uses, rng))
+        return '\n'.join(out) + '\n'
+
+    def render_barrel(self, directory: str) -> str:
+        lines = [f"export * from './{Path(self.modules[i].path).stem}';" for i in self.barrels[directory]]
+        if directory.count('/') == 2 and directory.startswith('src/features/'):
+            lines = [f"export * from './{SHARED_DIRS[k]}';" for k in FEATURE_KINDS]
+        return '\n'.join(lines or ['export {};']) + '\n'
+
+    def render_app(self) -> str:
+        pages = [i for i, m in enumerate(self.modules) if m.kind == 'page' and m.live]
+        lazy = set(self.lazy_pages)
+        out = ["import React, { lazy, Suspense } from 'react';"]
+        for i in pages:
+            if i not in lazy:
+                m = self.modules[i]
+                out.append(f"import {{ {m.name} }} from './pages/{Path(m.path).stem}';")
+        out.append('')
+        for i in pages:
+            if i in lazy:
+                m = self.modules[i]
+                out.append(f"const {m.name} = lazy(() => import('./pages/{Path(m.path).stem}')"
+                           f".then((mod) => ({{ default: mod.{m.name} }})));")
+        out.append('')
+        out.append('export const App: React.FC = () => (')
+        out.append('  <Suspense fallback={null}>')
+        for i in pages:
+            out.append(f'    <{self.modules[i].name} />')
+        out.append('  </Suspense>')
+        out.append(');')
+        out.append('')
+        out.append('export default App;')
+        return '\n'.join(out) + '\n'
+
+    # ---------- output ----------
+    def write(self, root: Path) -> Dict:
+        src_dirs = {m.dir for m in self.modules} | set(self.barrels)
+        for d in sorted(src_dirs):
+            (root / d).mkdir(parents=True, exist_ok=True)
+        for i, m in enumerate(self.modules):
+            (root / m.path).write_text(self.render(i), encoding='utf-8')
+        for d in self.barrels:
+            (root / d / 'index.ts').write_text(self.render_barrel(d), encoding='utf-8')
+        (root / 'src/App.tsx').write_text(self.render_app(), encoding='utf-8')
+        (root / 'src/main.tsx').write_text(
+            "import React from 'react';\nimport ReactDOM from 'react-dom/client';\nimport App from './App';\n\n"
+            "ReactDOM.createRoot(document.getElementById('root')!).render(<App />);\n", encoding='utf-8')
+        for name, text in _config_files().items():
+            (root / name).write_text(text, encoding='utf-8')
+
+        manifest = {
+            'generator_version': GENERATOR_VERSION,
+            'config': asdict(self.config),
+            'counts': {
+                'modules': len(self.modules) + len(self.barrels) + 2,
+                'live': sum(1 for m in self.modules if m.live) + 2,
+                'barrels': len(self.barrels),
+                'island_files': sum(len(i) for i in self.islands),
+                'duplicates': len(self.duplicates),
+                'import_edges': sum(len(m.imports) for m in self.modules),
+            },
+            'entry_points': ['src/main.tsx'],
+            'lazy_pages': [self.modules[i].path for i in self.lazy_pages],
+            'cycles': self.cycles,
+            'dead_islands': self.islands,
+            'duplicates': self.duplicates,
+        }
+        (root / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        return manifest
+
+
+def _relpath(target: str, start: str) -> str:
+    t, s = PurePosixPath(target).parts, PurePosixPath(start).parts
+    common = 0
+    while common < min(len(t), len(s)) and t[common] == s[common]:
+        common += 1
+    return '/'.join(['..'] * (len(s) - common) + list(t[common:])) or '.'
+
+
+def _filler_function(rng: random.Random, name: str) -> List[str]:
+    op = rng.choice(('+', '-', '*'))
+    limit = rng.randint(2, 99)
+    return [
+        f'// {rng.choice(WORDS)} {rng.choice(WORDS)} handling',
+        f'function {name}(items: number[], factor = {rng.randint(1, 9)}): number {{',
+        '  let total = 0;',
+        '  for (const item of items) {',
+        f'    if (item > {limit}) {{',
+        f'      total = total {op} item * factor;',
+        '    } else {',
+        '      total += 1;',
+        '    }',
+        '  }',
+        '  return total;',
+        '}',
+        '',
+    ]
+
+
+def _use(dst: Module, i: int) -> str:
+    if dst.kind == 'hook':
+        return f'  const dep{i} = {dst.name}();'
+    if dst.kind == 'type':
+        return f'  const dep{i}: {dst.name} | null = null;'
+    if dst.kind in ('component', 'page'):
+        return f'  const dep{i} = {dst.name};'
+    if dst.kind in ('service', 'store'):
+        return f'  const dep{i} = {dst.name}.get(String({i}));'
+    return f'  const dep{i} = {dst.name}({i});'
+
+
+def _main_export(m: Module, uses: List[Module], rng: random.Random) -> List[str]:
+    deps = [_use(d, i) for i, d in enumerate(uses)]
+    if m.kind in ('page', 'component'):
+        return [
+            f'export interface {m.name}Props {{',
+            '  id?: string;',
+            '  label?: string;',
+            '}',
+            '',
+            f'export const {m.name}: React.FC<{m.name}Props> = ({{ id = "{m.name}", label }}) => {{',
+            '  const [count, setCount] = useState<number>(0);',
+            *deps,
+            '  useEffect(() => {',
+            '    setCount((value) => value + 1);',
+            '  }, [id]);',
+            f'  const summary = useMemo(() => [{", ".join(f"dep{i}" for i in range(len(uses))) or "count"}], [count]);',
+            '  return (',
+            f'    <section className="{m.name.lower()}" data-id={{id}}>',
+            '      <h2>{label}</h2>',
+            '      <span>{summary.length}</span>',
+            '    </section>',
+            '  );',
+            '};',
+            '',
+            f'export default {m.name};',
+        ]
+    if m.kind == 'hook':
+        return [
+            f'export function {m.name}(initial = {rng.randint(0, 9)}) {{',
+            '  const [value, setValue] = useState(initial);',
+            *deps,
+            '  useEffect(() => {',
+            '    setValue((current) => current + 1);',
+            '  }, []);',
+            '  return { value, setValue };',
+            '}',
+        ]
+    if m.kind in ('service', 'store'):
+        return [
+            f'const {m.name}Cache = new Map<string, unknown>();',
+            '',
+            f'export const {m.name} = {{',
+            '  get(key: string): unknown {',
+            *['  ' + d for d in deps],
+            f'    return {m.name}Cache.get(key);',
+            '  },',
+            '  set(key: string, value: unknown): void {',
+            f'    {m.name}Cache.set(key, value);',
+            '  },',
+            '};',
+        ]
+    if m.kind == 'type':
+        return [
+            f'export interface {m.name} {{',
+            '  id: string;',
+            '  createdAt: number;',
+            f'  kind: "{rng.choice(WORDS)}" | "{rng.choice(WORDS)}";',
+            '}',
+            '',
+            f'export type {m.name}Id = {m.name}["id"];',
+        ]
+    return [
+        f'export function {m.name}(input: number): number {{',
+        *deps,
+        f'  return input * {rng.randint(2, 9)};',
+        '}',
+    ]
+
+
+def _config_files() -> Dict[str, str]:
+    package = {
+        'name': 'synthetic-app', 'private': True, 'version': '0.0.0', 'type': 'module',
+        'scripts': {'dev': 'vite', 'build': 'tsc && vite build'},
+        'dependencies': {'react': '^18.2.0', 'react-dom': '^18.2.0'},
+        'devDependencies': {'typescript': '^5.4.0', 'vite': '^5.2.0', '@types/react': '^18.2.0'},
+    }
+    tsconfig = {
+        'compilerOptions': {
+            'target': 'ES2020', 'module': 'ESNext', 'jsx': 'react-jsx', 'strict': True,
+            'moduleResolution': 'bundler', 'baseUrl': '.', 'paths': {'@/*': ['./src/*']},
+        },
+        'include': ['src'],
+    }
+    return {
+        'package.json': json.dumps(package, indent=2) + '\n',
+        'tsconfig.json': json.dumps(tsconfig, indent=2) + '\n',
+        'vite.config.ts': ("import { defineConfig } from 'vite';\nimport path from 'path';\n\n"
+                           "export default defineConfig({\n"
+                           "  resolve: { alias: { '@': path.resolve(__dirname, './src') } },\n});\n"),
+    }
+
+
+def generate_project(root: Path, config: SynthConfig, force: bool = False) -> Dict:
+    """Write a synthetic project to ``root`` and return its manifest."""
+    root = Path(root)
+    if root.exists() and any(root.iterdir()):
+        if not force:
+            raise FileExistsError(f"{root} is not empty (use force=True / --force to replace it)")
+        shutil.rmtree(root)
+    root.mkdir(parents=True, exist_ok=True)
+    generator = ProjectGenerator(config)
+    generator.plan()
+    return generator.write(root)
+
+
+def ensure_project(root: Path, config: SynthConfig) -> Dict:
+    """Reuse ``root`` if it already holds this exact configuration, else (re)generate it."""
+    manifest_path = Path(root) / MANIFEST
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+            if (manifest.get('generator_version') == GENERATOR_VERSION
+                    and manifest.get('config') == asdict(config)):
+                return manifest
+        except (OSError, ValueError):
+            pass
+    return generate_project(root, config, force=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic TS/React project")
+    parser.add_argument("output", help="Directory to create")
+    defaults = SynthConfig()
+    parser.add_argument("--files", type=int, default=defaults.files, help=f"Modules under src/ (default: {defaults.files})")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed (default: 0)")
+    parser.add_argument("--fanout", type=float, default=defaults.fanout, help="Mean imports per module")
+    parser.add_argument("--cycle-rate", type=float, default=defaults.cycle_rate, help="Planted cycles per module")
+    parser.add_argument("--island-rate", type=float, default=defaults.island_rate, help="Share of modules in dead islands")
+    parser.add_argument("--duplicate-rate", type=float, default=defaults.duplicate_rate, help="Share of duplicated modules")
+    parser.add_argument("--force", action="store_true", help="Replace OUTPUT if it is not empty")
+    args = parser.parse_args()
+
+    config = SynthConfig(files=args.files, seed=args.seed, fanout=args.fanout, cycle_rate=args.cycle_rate,
+                         island_rate=args.island_rate, duplicate_rate=args.duplicate_rate)
+    try:
+        manifest = generate_project(Path(args.output), config, force=args.force)
+    except (FileExistsError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    counts = manifest['counts']
+    print(f"{args.output}: {counts['modules']} modules ({counts['live']} live, {counts['barrels']} barrels, "
+          f"{counts['island_files']} in {len(manifest['dead_islands'])} dead islands, "
+          f"{counts['duplicates']} duplicates), {counts['import_edges']} imports, {len(manifest['cycles'])} cycles")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,3 +31,21 @@ MAIN_FIXER_SCRIPT = TOOLS_DIR / "main-fixer-9.v3.py"
 
 # Default report postprocessor
 REPORT_POSTPROCESS_SCRIPT = TOOLS_DIR / "report_postprocess.py"
+
+# Max workflow steps running concurrently (independent read-only steps such as
+# typecheck, lint and smoke build run in parallel up to this cap)
+DEFAULT_JOBS = 3
+
+# Step cache — content-addressed artifact store for skipping unchanged steps.
+# Lives under reports/ so main-fixer's scan ignores it.
+CACHE_DIR = REPORTS_DIR / ".step_cache"
+
+# Source tree fingerprint: same extensions main-fixer scans, minus generated dirs
+FINGERPRINT_EXTENSIONS = {
+    ".ts", ".tsx", ".js", ".jsx", ".json", ".css", ".scss",
+    ".html", ".md", ".yml", ".yaml", ".env",
+}
+FINGERPRINT_IGNORE_DIRS = {
+    "node_modules", ".git", "dist", "build", "coverage", ".next", "out",
+    "reports", "__pycache__", ".pytest_cache", ".mypy_cache", ".vscode",
+}
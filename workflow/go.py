@@ -18,14 +18,21 @@ Workflow state saved to: workflow/workflow_state.json + mcp-audit.log
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
 import json
 import os
 import re
 import subprocess
 import sys
 import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 # Import config from same folder
 from config import (
@@ -37,7 +44,9 @@ from config import (
     STATE_FILE,
     MAIN_FIXER_SCRIPT,
     REPORT_POSTPROCESS_SCRIPT,
+    DEFAULT_JOBS,
 )
+from step_cache import ArtifactStore, changed_files, compute_key, snapshot_dir, tree_fingerprint
 
 def ts_compact():
     return datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -108,11 +117,278 @@ def load_workflow_state() -> dict:
             pass
     return {}
 
+# ---------------------------------------------------------------------------
+# Streaming subprocess helpers
+# ---------------------------------------------------------------------------
+# Lines kept per step for reporting (output_tail, error messages)
+TAIL_LINES = 40
+
+# Echo child output live (set by --verbose)
+ECHO_OUTPUT = False
+
+
+class StepFailed(RuntimeError):
+    """Raised by a step when the workflow cannot continue."""
+
+
+class JsonLineSink:
+    """on_line callback that keeps the last output line parsing as a JSON object."""
+
+    def __init__(self):
+        self.value: dict = {}
+
+    def __call__(self, line: str):
+        line = line.strip()
+        if not line.startswith("{"):
+            return
+        try:
+            self.value = json.loads(line)
+        except Exception:
+            pass
+
+
+async def run_stream(cmd, on_line: Callable[[str], None] | None = None, cwd: Path | None = None,
+                     timeout: int = 300, label: str = "", env: dict | None = None):
+    """Run a command asynchronously, handing each output line to on_line as it arrives.
+
+    stdout and stderr are merged. Returns (exit_code, tail) where tail holds the
+    last TAIL_LINES lines; nothing else is buffered.
+    """
+    cmd = [str(c) for c in cmd]
+    tail: deque = deque(maxlen=TAIL_LINES)
+    kwargs = dict(
+        cwd=str(cwd or ROOT),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env,
+        limit=1 << 20,
+    )
+    try:
+        if os.name == "nt":
+            # npx/npm are .cmd shims on Windows and need the shell (same as run())
+            proc = await asyncio.create_subprocess_shell(subprocess.list2cmdline(cmd), **kwargs)
+        else:
+            proc = await asyncio.create_subprocess_exec(*cmd, **kwargs)
+    except Exception as e:
+        return -1, [str(e)]
+
+    async def pump():
+        async for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            tail.append(line)
+            if ECHO_OUTPUT:
+                say(f"  [{label}] {line}")
+            if on_line:
+                on_line(line)
+        return await proc.wait()
+
+    try:
+        code = await asyncio.wait_for(pump(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        tail.append("TIMEOUT")
+        return -1, list(tail)
+    return code, list(tail)
+
+
+async def py_stream(*args, on_line: Callable[[str], None] | None = None, timeout: int = 120, label: str = ""):
+    """Run a python script with unbuffered UTF-8 output, streaming lines to on_line."""
+    env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+    cmd = [sys.executable] + [str(a) for a in args]
+    return await run_stream(cmd, on_line=on_line, timeout=timeout, label=label, env=env)
+
+
+async def py_json(*args, timeout: int = 120, label: str = "") -> tuple[int, dict]:
+    """Run a python tool that prints a JSON summary line; return (exit_code, last JSON object)."""
+    sink = JsonLineSink()
+    code, _ = await py_stream(*args, on_line=sink, timeout=timeout, label=label)
+    return code, sink.value
+
+# ---------------------------------------------------------------------------
+# main-fixer invocation
+# ---------------------------------------------------------------------------
+# Run main-fixer in-process (set False by --fixer-subprocess)
+IN_PROCESS_FIXER = True
+
+_fixer_platform = None
+
+
+def get_fixer_platform(report_dir: Path):
+    """Import main-fixer-9.v3.py once and keep a single CodeIntelligencePlatform warm.
+
+    The platform's scanned files map survives between scan and rescan, so the
+    rescan only re-parses files changed by apply_activation/fix_barrels_v3.
+    """
+    global _fixer_platform
+    if _fixer_platform is None:
+        spec = importlib.util.spec_from_file_location("main_fixer", MAIN_FIXER_SCRIPT)
+        mod = importlib.util.module_from_spec(spec)
+        # Registered so main-fixer's scan worker processes can unpickle its classes
+        sys.modules[spec.name] = mod
+        spec.loader.exec_module(mod)
+        _fixer_platform = mod.CodeIntelligencePlatform(str(ROOT), report_folder_override=str(report_dir))
+    return _fixer_platform
+
+
+def _fixer_refresh(report_dir: Path) -> dict:
+    platform = get_fixer_platform(report_dir)
+    # main-fixer logs to stdout; keep it quiet unless --verbose (scan/rescan never overlap other steps)
+    sink = contextlib.nullcontext() if ECHO_OUTPUT else contextlib.redirect_stdout(io.StringIO())
+    with sink:
+        platform.refresh()
+    return platform.summary()
+
+
+async def run_fixer(report_dir: Path, dry_run: bool, label: str) -> dict | None:
+    """Run main-fixer analysis into report_dir and return the summary dict.
+
+    In-process by default; with --fixer-subprocess the script is run as before and
+    summary_report.json is read back (None if it was not produced).
+    """
+    if IN_PROCESS_FIXER:
+        try:
+            return await asyncio.to_thread(_fixer_refresh, report_dir)
+        except Exception as e:
+            say(f"  WARNING: main-fixer failed: {e}")
+            audit(f"{label.upper()} WARNING: main-fixer failed: {e}")
+            return None
+
+    args = [MAIN_FIXER_SCRIPT, "--analyze-only", "--report-folder", report_dir]
+    if dry_run:
+        # main-fixer --analyze-only is already non-destructive; add --dry-run for consistency
+        args.append("--dry-run")
+    code, _ = await py_stream(*args, timeout=300, label=label)
+    if code != 0:
+        say(f"  WARNING: main-fixer exited {code}")
+        audit(f"{label.upper()} WARNING: main-fixer exited {code}")
+    summary_path = report_dir / "summary_report.json"
+    return load_json(summary_path) if summary_path.exists() else None
+
+# ---------------------------------------------------------------------------
+# Step DAG scheduler
+# ---------------------------------------------------------------------------
+@dataclass
+class Step:
+    """A workflow step with the resources it reads and writes.
+
+    Resources are plain names ("src", "report:scan", ...). A step depends on every
+    earlier step that writes something it reads or writes, or that reads something
+    it writes, so declaration order only matters between conflicting steps.
+    """
+    name: str
+    func: Callable[[dict], Awaitable[Any]]
+    reads: frozenset = field(default_factory=frozenset)
+    writes: frozenset = field(default_factory=frozenset)
+    deps: list = field(default_factory=list)
+    # Cache key material; only steps whose outputs are report files/results are cacheable
+    cacheable: bool = False
+    tools: tuple = ()
+    flags: tuple = ()
+
+
+def resolve_deps(steps: list[Step]) -> list[Step]:
+    """Fill in Step.deps from declared reads/writes (RAW, WAR and WAW hazards)."""
+    for i, step in enumerate(steps):
+        step.deps = [
+            prev.name
+            for prev in steps[:i]
+            if (prev.writes & (step.reads | step.writes)) or (prev.reads & step.writes)
+        ]
+    return steps
+
+
+def step_key(step: Step, versions: dict) -> str:
+    """Cache key for a step: tools + flags + the current version of each resource it reads.
+
+    "src" is versioned by the source tree fingerprint (recomputed after any step
+    that writes src); report resources by the key of the step that last wrote them.
+    """
+    inputs = {}
+    for res in sorted(step.reads):
+        if res == "src" and versions.get("src") is None:
+            versions["src"] = tree_fingerprint()
+        inputs[res] = versions.get(res) or "initial"
+    return compute_key(list(step.tools), list(step.flags), inputs)
+
+
+async def run_steps(steps: list[Step], jobs: int, store: ArtifactStore | None = None,
+                    out_dir: Path | None = None) -> tuple[dict, dict]:
+    """Run steps as soon as their dependencies finish, at most `jobs` at a time.
+
+    Each step function receives the results dict of finished steps, so upstream
+    data is passed in memory rather than re-read from report files. With a store,
+    cacheable steps whose inputs are unchanged are skipped and their outputs in
+    out_dir restored. Returns (results, timings).
+    """
+    resolve_deps(steps)
+    sem = asyncio.Semaphore(max(1, jobs))
+    results: dict = {}
+    timings: dict = {}
+    tasks: dict = {}
+    versions: dict = {}
+    t_start = time.perf_counter()
+
+    async def run_cached(step: Step):
+        key = await asyncio.to_thread(step_key, step, versions)
+        manifest = store.lookup(key)
+        if manifest is not None:
+            n = await asyncio.to_thread(store.restore, manifest, out_dir)
+            say(f"  [{step.name}] inputs unchanged - restored {n} cached artifacts")
+            audit(f"STEP {step.name} CACHED: key {key[:12]}, {n} artifacts restored")
+            return key, manifest["result"], True
+        before = await asyncio.to_thread(snapshot_dir, out_dir)
+        result = await step.func(results)
+        # Don't cache timeouts/spawn failures; they say nothing about the inputs
+        if not (isinstance(result, dict) and result.get("exit_code") == -1):
+            after = await asyncio.to_thread(snapshot_dir, out_dir)
+            await asyncio.to_thread(store.record, key, step.name, result, out_dir, changed_files(before, after))
+        return key, result, False
+
+    async def run_one(step: Step):
+        for dep in step.deps:
+            await tasks[dep]
+        async with sem:
+            started = time.perf_counter()
+            cached = False
+            try:
+                key = None
+                if store is not None and step.cacheable:
+                    key, results[step.name], cached = await run_cached(step)
+                else:
+                    results[step.name] = await step.func(results)
+                for res in step.writes:
+                    # src is re-fingerprinted lazily; uncached writers make their outputs volatile
+                    versions[res] = None if res == "src" else (key or f"volatile:{time.time_ns()}")
+                status = "ok"
+            except BaseException:
+                status = "failed"
+                raise
+            finally:
+                timings[step.name] = {
+                    "status": status,
+                    "cached": cached,
+                    "deps": step.deps,
+                    "start_offset_s": round(started - t_start, 3),
+                    "duration_s": round(time.perf_counter() - started, 3),
+                }
+
+    for step in steps:
+        tasks[step.name] = asyncio.ensure_future(run_one(step))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for t in tasks.values():
+            t.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results, timings
+
 # ---------------------------------------------------------------------------
 # Step implementations
 # ---------------------------------------------------------------------------
 
-def step_scan(report_dir: Path, resume: bool, dry_run: bool):
+async def step_scan(report_dir: Path, resume: bool, dry_run: bool):
     """Step 1 - Run main-fixer-9.v3.py (workflow input), write into reports/latest/."""
     audit("STEP 1/10: Running main-fixer-9.v3.py (workflow input)...")
     say("STEP 1/10  Running main-fixer-9.v3.py...")
@@ -124,21 +400,12 @@ def step_scan(report_dir: Path, resume: bool, dry_run: bool):
         summary = load_json(summary_path)
         return summary
 
-    args = [MAIN_FIXER_SCRIPT, "--analyze-only", "--report-folder", report_dir]
-    if dry_run:
-        # main-fixer --analyze-only is already non-destructive; add --dry-run for consistency
-        args.append("--dry-run")
-    code, out, err = py(*args, timeout=300)
-    if code != 0:
-        say(f"  WARNING: main-fixer exited {code}")
-        audit(f"STEP 1 WARNING: main-fixer exited {code}")
-
-    if not summary_path.exists():
+    summary = await run_fixer(report_dir, dry_run=dry_run, label="step 1")
+    if summary is None:
         say("  ERROR: No summary_report.json generated in reports/latest/")
         audit("STEP 1 ERROR: No summary_report.json generated")
-        sys.exit(1)
+        raise StepFailed("No summary_report.json generated")
 
-    summary = load_json(summary_path)
     unused = summary["totals"]["unused"]
     files  = summary["totals"]["files"]
     say(f"  -> Report: latest | {files} files, {unused} unused")
@@ -146,40 +413,28 @@ def step_scan(report_dir: Path, resume: bool, dry_run: bool):
     return summary
 
 
-def step_extract(report_dir: Path):
+async def step_extract(report_dir: Path):
     """Step 2 - Extract medium candidates from report folder."""
     audit("STEP 2/10: Extracting candidates from report...")
     say("STEP 2/10  Extracting candidates...")
-    code, out, _ = py(TOOLS_DIR / "extract_medium_candidates.py", str(report_dir))
-    info = {}
-    for line in (out or "").strip().splitlines():
-        try:
-            info = json.loads(line)
-        except Exception:
-            pass
+    _, info = await py_json(TOOLS_DIR / "extract_medium_candidates.py", str(report_dir), label="extract")
     count = info.get("count", "?")
     say(f"  -> {count} candidates extracted")
     audit(f"STEP 2 DONE: {count} candidates extracted")
     return count
 
 
-def step_plan(report_dir: Path):
+async def step_plan(report_dir: Path):
     """Step 3 - Build activation plan from report."""
     audit("STEP 3/10: Building activation plan...")
     say("STEP 3/10  Building activation plan...")
-    code, out, _ = py(TOOLS_DIR / "activation_plan.py", str(report_dir))
-    info = {}
-    for line in (out or "").strip().splitlines():
-        try:
-            info = json.loads(line)
-        except Exception:
-            pass
+    _, info = await py_json(TOOLS_DIR / "activation_plan.py", str(report_dir), label="plan")
     say(f"  -> L:{info.get('low','?')} M:{info.get('medium','?')} H:{info.get('high','?')}")
     audit(f"STEP 3 DONE: L:{info.get('low','?')} M:{info.get('medium','?')} H:{info.get('high','?')}")
     return info
 
 
-def step_apply(report_dir: Path, dry_run: bool, verify_only: bool):
+async def step_apply(report_dir: Path, dry_run: bool, verify_only: bool):
     """Step 4 - Apply LOW + MEDIUM components (or simulate if --dry-run/--verify-only)."""
     if verify_only:
         audit("STEP 4/10: VERIFY-ONLY - skipping apply (simulating)...")
@@ -191,13 +446,7 @@ def step_apply(report_dir: Path, dry_run: bool, verify_only: bool):
     cmd = [TOOLS_DIR / "apply_activation.py", str(report_dir), "--include-medium"]
     if dry_run or verify_only:
         cmd.append("--dry-run")
-    code, out, _ = py(*cmd)
-    info = {}
-    for line in (out or "").strip().splitlines():
-        try:
-            info = json.loads(line)
-        except Exception:
-            pass
+    _, info = await py_json(*cmd, label="apply")
     applied_count = info.get("applied", 0)
     would_apply_count = info.get("would_apply", applied_count)
     if dry_run or verify_only:
@@ -209,21 +458,15 @@ def step_apply(report_dir: Path, dry_run: bool, verify_only: bool):
     return info
 
 
-def step_rescan(report_dir: Path, dry_run: bool):
+async def step_rescan(report_dir: Path, dry_run: bool):
     """Step 5 - Re-run main-fixer to verify impact (writes into reports/latest/)."""
     audit("STEP 5/10: Re-scanning (main-fixer) to verify impact...")
     say("STEP 5/10  Re-scanning...")
-    args = [MAIN_FIXER_SCRIPT, "--analyze-only", "--report-folder", report_dir]
-    if dry_run:
-        args.append("--dry-run")
-    code, out, err = py(*args, timeout=300)
-
-    summary_path = report_dir / "summary_report.json"
-    if not summary_path.exists():
+    summary2 = await run_fixer(report_dir, dry_run=dry_run, label="step 5")
+    if summary2 is None:
         say("  ERROR: No summary_report.json after rescan")
         audit("STEP 5 ERROR: No summary_report.json after rescan")
-        sys.exit(1)
-    summary2 = load_json(summary_path)
+        raise StepFailed("No summary_report.json after rescan")
     unused2 = summary2["totals"]["unused"]
     files2  = summary2["totals"]["files"]
     say(f"  -> Report: latest | {files2} files, {unused2} unused")
@@ -231,7 +474,7 @@ def step_rescan(report_dir: Path, dry_run: bool):
     return summary2
 
 
-def step_fix_barrels(report_dir: Path, dry_run: bool, verify_only: bool):
+async def step_fix_barrels(report_dir: Path, dry_run: bool, verify_only: bool):
     """Step 6 - Fix duplicate exports in barrel index files."""
     if verify_only:
         audit("STEP 6/10: VERIFY-ONLY - skipping barrel fixes (simulating)...")
@@ -243,15 +486,16 @@ def step_fix_barrels(report_dir: Path, dry_run: bool, verify_only: bool):
     cmd = [TOOLS_DIR / "fix_barrels_v3.py", "--report-folder", str(report_dir)]
     if dry_run or verify_only:
         cmd.append("--dry-run")
-    code, out, _ = py(*cmd)
     fixes = 0
-    for line in (out or "").strip().splitlines():
+
+    def on_line(line: str):
+        nonlocal fixes
         if "Total:" in line:
-            try:
-                fixes = int(re.search(r"(\d+)", line).group(1))
-            except Exception:
-                pass
-            break
+            m = re.search(r"(\d+)", line)
+            if m:
+                fixes = int(m.group(1))
+
+    await py_stream(*cmd, on_line=on_line, label="barrels")
     say(f"  -> {fixes} duplicate symbols removed")
     if dry_run or verify_only:
         audit(f"STEP 6 DONE: {fixes} duplicates would be removed from barrels")
@@ -260,7 +504,7 @@ def step_fix_barrels(report_dir: Path, dry_run: bool, verify_only: bool):
     return fixes
 
 
-def step_autofix():
+async def step_autofix():
     """Step 7 - Auto-fix known deterministic issues.
     NOTE: .ts->.tsx rename disabled (was too aggressive, caused false positives).
     Only fix_barrels and other safe fixes run here.
@@ -274,16 +518,20 @@ def step_autofix():
     return fixes
 
 
-def step_typecheck(enabled: bool):
+async def step_typecheck(enabled: bool):
     """Step 8 - TypeScript type-check (read-only)."""
     if not enabled:
         audit("STEP 8/10: TypeScript type-check skipped (disabled by flags)")
         return {"enabled": False, "skipped": True}
     audit("STEP 8/10: Running TypeScript type-check...")
     say("STEP 8/10  Running TypeScript type-check (tsc --noEmit)...")
-    code, out, err = run(["npx", "tsc", "--noEmit"], timeout=120)
-    combined = (out or "") + (err or "")
-    error_lines = [l for l in combined.splitlines() if ": error TS" in l]
+    error_lines = []
+
+    def on_line(line: str):
+        if ": error TS" in line:
+            error_lines.append(line)
+
+    code, _ = await run_stream(["npx", "tsc", "--noEmit"], on_line=on_line, timeout=120, label="tsc")
     n_errors = len(error_lines)
     if code == 0:
         say(f"  -> PASSED (0 errors)")
@@ -300,29 +548,29 @@ def step_typecheck(enabled: bool):
     }
 
 
-def step_lint(enabled: bool):
+async def step_lint(enabled: bool):
     """Lint (read-only)."""
     if not enabled:
         audit("LINT: skipped (disabled by flags)")
         return {"enabled": False, "skipped": True}
     audit("LINT: Running ESLint...")
     say("LINT     Running ESLint (npm run lint)...")
-    code, out, err = run(["npm", "run", "lint"], timeout=240)
-    combined = (out or "") + (err or "")
+    code, tail = await run_stream(["npm", "run", "lint"], timeout=240, label="lint")
+    combined = "\n".join(tail)
     passed = code == 0
     audit(f"LINT: {'PASSED' if passed else 'FAILED'} (exit {code})")
     return {"enabled": True, "exit_code": code, "passed": passed, "output_tail": combined.strip()[-500:]}
 
 
-def step_smoke_test(enabled: bool):
+async def step_smoke_test(enabled: bool):
     """Step 9 - Smoke test (build). Note: may create dist/ but does not modify source."""
     if not enabled:
         audit("STEP 9/10: Smoke test skipped (disabled by flags)")
         return {"enabled": False, "skipped": True}
     audit("STEP 9/10: Running smoke test (npm run build)...")
     say("STEP 9/10  Running smoke test (npm run build)...")
-    code, out, err = run(["npm", "run", "build"], timeout=180)
-    combined = (out or "") + (err or "")
+    code, tail = await run_stream(["npm", "run", "build"], timeout=180, label="smoke")
+    combined = "\n".join(tail)
     if code == 0:
         say(f"  -> PASSED")
         audit("STEP 9 DONE: Smoke test PASSED")
@@ -620,6 +868,71 @@ if __name__ == "__main__":
     return report
 
 
+# ---------------------------------------------------------------------------
+# Step graph
+# ---------------------------------------------------------------------------
+def build_steps(report_dir: Path, run_ts: str, args) -> list[Step]:
+    """Declare the workflow steps in canonical order with their reads/writes.
+
+    typecheck, lint and smoke only read src/, so they run concurrently once the
+    source-modifying steps have finished. Steps that only produce report files or
+    results are cacheable; apply/fix_barrels (modify src) and smoke (writes dist/)
+    always run.
+    """
+    read_only = args.dry_run or args.verify_only
+    cache = not args.no_cache
+    fixer_flags = ("--analyze-only", "--dry-run") if read_only else ("--analyze-only",)
+
+    async def report(r: dict):
+        return await asyncio.to_thread(
+            write_workflow_artifacts,
+            report_dir=report_dir,
+            run_ts=run_ts,
+            summary_before=r["scan"],
+            summary_after=r["rescan"],
+            plan_info=r["plan"],
+            apply_info=r["apply"],
+            ts_result=r["typecheck"],
+            lint_result=r["lint"],
+            smoke_result=r["smoke"],
+            dry_run=args.dry_run,
+            verify_only=args.verify_only,
+        )
+
+    return [
+        Step("scan", lambda r: step_scan(report_dir, resume=args.resume, dry_run=read_only),
+             reads=frozenset({"src"}), writes=frozenset({"report:scan"}),
+             cacheable=cache and not args.resume, tools=(MAIN_FIXER_SCRIPT,), flags=fixer_flags),
+        Step("extract", lambda r: step_extract(report_dir),
+             reads=frozenset({"report:scan"}), writes=frozenset({"report:candidates"}),
+             cacheable=cache, tools=(TOOLS_DIR / "extract_medium_candidates.py",)),
+        Step("plan", lambda r: step_plan(report_dir),
+             reads=frozenset({"report:scan", "report:candidates"}), writes=frozenset({"report:plan"}),
+             cacheable=cache, tools=(TOOLS_DIR / "activation_plan.py",)),
+        Step("apply", lambda r: step_apply(report_dir, dry_run=args.dry_run, verify_only=args.verify_only),
+             reads=frozenset({"report:scan", "report:plan"}), writes=frozenset({"src", "report:plan"})),
+        Step("rescan", lambda r: step_rescan(report_dir, dry_run=read_only),
+             reads=frozenset({"src"}), writes=frozenset({"report:scan"}),
+             cacheable=cache, tools=(MAIN_FIXER_SCRIPT,), flags=fixer_flags),
+        Step("fix_barrels", lambda r: step_fix_barrels(report_dir, dry_run=args.dry_run, verify_only=args.verify_only),
+             reads=frozenset({"src"}), writes=frozenset({"src", "report:barrels"})),
+        Step("autofix", lambda r: step_autofix(),
+             reads=frozenset({"src"}), writes=frozenset({"src"})),
+        Step("typecheck", lambda r: step_typecheck(enabled=not args.skip_ts),
+             reads=frozenset({"src"}), writes=frozenset({"verify:ts"}),
+             cacheable=cache and not args.skip_ts, flags=("npx", "tsc", "--noEmit")),
+        Step("lint", lambda r: step_lint(enabled=not args.skip_lint),
+             reads=frozenset({"src"}), writes=frozenset({"verify:lint"}),
+             cacheable=cache and not args.skip_lint, flags=("npm", "run", "lint")),
+        Step("smoke", lambda r: step_smoke_test(enabled=not args.skip_smoke),
+             reads=frozenset({"src"}), writes=frozenset({"dist", "verify:smoke"})),
+        Step("report", report,
+             reads=frozenset({"report:scan", "report:plan", "report:barrels",
+                              "verify:ts", "verify:lint", "verify:smoke"}),
+             writes=frozenset({"report:final", "state"})),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -631,8 +944,16 @@ def main():
     parser.add_argument("--skip-ts", action="store_true", help="Skip TypeScript check.")
     parser.add_argument("--skip-lint", action="store_true", help="Skip ESLint.")
     parser.add_argument("--skip-smoke", action="store_true", help="Skip smoke build.")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help=f"Max steps running concurrently (default: {DEFAULT_JOBS}; 1 = sequential).")
+    parser.add_argument("--verbose", action="store_true", help="Echo tool output live while steps run.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every step even if its inputs are unchanged.")
+    parser.add_argument("--fixer-subprocess", action="store_true", help="Run main-fixer as a subprocess instead of in-process.")
     args = parser.parse_args()
 
+    global ECHO_OUTPUT, IN_PROCESS_FIXER
+    ECHO_OUTPUT = args.verbose
+    IN_PROCESS_FIXER = not args.fixer_subprocess
+
     run_timestamp = ts_compact()
     t0 = time.time()
     report_dir = ensure_latest_dir()
@@ -645,53 +966,27 @@ def main():
     say("GO - Master Orchestrator (workflow/)")
     say(f"  Input: {MAIN_FIXER_SCRIPT.name}")
     say(f"  Reports: {report_dir}")
-    say(f"  Mode: dry_run={args.dry_run} verify_only={args.verify_only} resume={args.resume}")
+    say(f"  Mode: dry_run={args.dry_run} verify_only={args.verify_only} resume={args.resume} jobs={args.jobs}")
     say("=" * 70)
 
-    # 1. Scan (main-fixer-9.v3.py)
-    summary1 = step_scan(report_dir, resume=args.resume, dry_run=args.dry_run or args.verify_only)
-
-    # 2. Extract
-    step_extract(report_dir)
-
-    # 3. Plan
-    plan_info = step_plan(report_dir)
-
-    # 4. Apply
-    apply_info = step_apply(report_dir, dry_run=args.dry_run, verify_only=args.verify_only)
-
-    # 5. Re-scan
-    summary2 = step_rescan(report_dir, dry_run=args.dry_run or args.verify_only)
-
-    # 6. Fix barrels
-    step_fix_barrels(report_dir, dry_run=args.dry_run, verify_only=args.verify_only)
-
-    # 7. Auto-fix
-    step_autofix()
-
-    # 8. TypeScript check (read-only)
-    ts_result = step_typecheck(enabled=not args.skip_ts)
-
-    # Lint (read-only)
-    lint_result = step_lint(enabled=not args.skip_lint)
-
-    # 9. Smoke test (may create dist/)
-    smoke_result = step_smoke_test(enabled=not args.skip_smoke)
-
-    # 10. Report
-    report = write_workflow_artifacts(
-        report_dir=report_dir,
-        run_ts=run_timestamp,
-        summary_before=summary1,
-        summary_after=summary2,
-        plan_info=plan_info,
-        apply_info=apply_info,
-        ts_result=ts_result,
-        lint_result=lint_result,
-        smoke_result=smoke_result,
-        dry_run=args.dry_run,
-        verify_only=args.verify_only,
-    )
+    steps = build_steps(report_dir, run_timestamp, args)
+    try:
+        store = None if args.no_cache else ArtifactStore()
+        results, timings = asyncio.run(run_steps(steps, jobs=args.jobs, store=store, out_dir=report_dir))
+    except StepFailed as e:
+        say(f"  ABORTED: {e}")
+        audit(f"WORKFLOW ABORTED: {e}")
+        return 1
+    report = results["report"]
+    ts_result = results["typecheck"]
+    lint_result = results["lint"]
+    smoke_result = results["smoke"]
+
+    # Per-step timing (recorded after the report step so it covers every step)
+    state = load_workflow_state()
+    state["step_timings"] = timings
+    state["parallel_jobs"] = args.jobs
+    save_workflow_state(state)
 
     elapsed = round(time.time() - t0, 1)
 
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Step Cache — content-addressed skipping for workflow steps.
+
+Each cacheable step is keyed by a hash of its inputs: the source tree
+fingerprint, the tool scripts it runs, its flags, and the keys of the steps
+that produced the report files it reads. Files a step writes into the report
+folder are stored as content-addressed blobs, so an unchanged step is skipped
+and its previous outputs are restored instead of re-running the tool.
+
+Layout (under CACHE_DIR):
+  blobs/<aa>/<sha256>     — file contents, stored once per unique hash
+  steps/<key>.json        — manifest: step name, result, {relpath: sha256}
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from config import CACHE_DIR, FINGERPRINT_EXTENSIONS, FINGERPRINT_IGNORE_DIRS, ROOT, STATE_FILE
+
+# Bump when the key material or manifest layout changes
+CACHE_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tree_fingerprint(root: Path = ROOT) -> str:
+    """Fingerprint of every source file main-fixer/tsc could read.
+
+    Uses (relative path, size, mtime_ns) rather than file contents so a full
+    tree check costs one stat per file. Workflow-owned state (STATE_FILE) is
+    excluded, otherwise every run would invalidate the next one.
+    """
+    h = hashlib.sha256()
+    excluded = {STATE_FILE.resolve()}
+    entries = []
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in FINGERPRINT_IGNORE_DIRS]
+        for name in files:
+            if os.path.splitext(name)[1] not in FINGERPRINT_EXTENSIONS:
+                continue
+            p = Path(dirpath) / name
+            if p in excluded:
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append(f"{p.relative_to(root).as_posix()}\0{st.st_size}\0{st.st_mtime_ns}")
+    for e in sorted(entries):
+        h.update(e.encode("utf-8", errors="surrogateescape"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def snapshot_dir(folder: Path) -> dict:
+    """Map relpath -> (size, mtime_ns) for every file under folder."""
+    snap = {}
+    if not folder.exists():
+        return snap
+    for p in folder.rglob("*"):
+        if p.is_file():
+            st = p.stat()
+            snap[p.relative_to(folder).as_posix()] = (st.st_size, st.st_mtime_ns)
+    return snap
+
+
+def changed_files(before: dict, after: dict) -> list[str]:
+    """Relative paths created or modified between two snapshot_dir() calls."""
+    return sorted(rel for rel, sig in after.items() if before.get(rel) != sig)
+
+
+def compute_key(tools: list[Path], flags: list, inputs: dict) -> str:
+    """Hash the key material for one step run.
+
+    The step name is deliberately not part of the key: scan and rescan run the
+    same command, so a rescan over an unchanged tree reuses the scan outputs.
+    """
+    material = {
+        "v": CACHE_VERSION,
+        "tools": {str(Path(t).name): file_digest(Path(t)) for t in tools if Path(t).exists()},
+        "flags": [str(f) for f in flags],
+        "inputs": dict(sorted(inputs.items())),
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ArtifactStore:
+    """Content-addressed store of step outputs keyed by step input hash."""
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = root
+        self.blobs = root / "blobs"
+        self.steps = root / "steps"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs / digest[:2] / digest
+
+    def _write_atomic(self, dest: Path, data: bytes):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, dest)
+
+    def put_file(self, path: Path) -> str:
+        """Store a file's bytes (once per unique content); return its digest."""
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            self._write_atomic(blob, data)
+        return digest
+
+    def lookup(self, key: str) -> dict | None:
+        """Return the manifest for key if every referenced blob is still present."""
+        mp = self.steps / f"{key}.json"
+        if not mp.exists():
+            return None
+        try:
+            manifest = json.loads(mp.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if not all(self._blob_path(d).exists() for d in manifest.get("outputs", {}).values()):
+            return None
+        return manifest
+
+    def record(self, key: str, step: str, result, out_dir: Path, outputs: list[str]):
+        """Store the outputs a step wrote into out_dir plus its JSON result."""
+        manifest = {
+            "step": step,
+            "key": key,
+            "result": result,
+            "outputs": {rel: self.put_file(out_dir / rel) for rel in outputs if (out_dir / rel).is_file()},
+        }
+        self._write_atomic(self.steps / f"{key}.json", json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+        return manifest
+
+    def restore(self, manifest: dict, out_dir: Path) -> int:
+        """Copy a manifest's blobs back into out_dir; return number of files restored."""
+        for rel, digest in manifest.get("outputs", {}).items():
+            dest = out_dir / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._blob_path(digest), dest)
+        return len(manifest.get("outputs", {}))